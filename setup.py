@@ -79,5 +79,10 @@ setup(
     options={
         'py2app': PY2APP_OPTIONS
     },
+    entry_points={
+        'console_scripts': [
+            'umldiagrammer-batch=umldiagrammer.batch.UmlDiagrammerBatch:main',
+        ],
+    },
     setup_requires=['py2app'],
 )
@@ -0,0 +1,60 @@
+from typing import Any
+
+from logging import Logger
+from logging import getLogger
+
+NOT_SHADOWED: object = object()
+
+
+class AttributeShadow:
+    """
+    Temporarily shadows a method of an object with an instance attribute.  Restoring puts
+    back whatever instance attribute was there before, so shadows nest;  e.g. a bulk insertion
+    shadowing a refresh that a damage tracker already shadows
+    """
+    def __init__(self, owner: Any, name: str):
+        """
+
+        Args:
+            owner:  The object whose attribute is shadowed
+            name:   The attribute name
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._owner:    Any    = owner
+        self._name:     str    = name
+        self._previous: object = NOT_SHADOWED
+        self._shadowed: bool   = False
+
+    @property
+    def shadowed(self) -> bool:
+        return self._shadowed
+
+    def shadow(self, replacement: Any):
+        """
+        Does nothing if already shadowed
+
+        Args:
+            replacement:  Answers for the attribute until restored
+        """
+        if self._shadowed is True:
+            return
+
+        self._previous = self._owner.__dict__.get(self._name, NOT_SHADOWED)
+        setattr(self._owner, self._name, replacement)
+        self._shadowed = True
+
+    def restore(self):
+        """
+        Does nothing if not shadowed
+        """
+        if self._shadowed is False:
+            return
+
+        if self._previous is NOT_SHADOWED:
+            self._owner.__dict__.pop(self._name, None)
+        else:
+            setattr(self._owner, self._name, self._previous)
+
+        self._previous = NOT_SHADOWED
+        self._shadowed = False
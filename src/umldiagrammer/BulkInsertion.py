@@ -0,0 +1,88 @@
+
+from logging import Logger
+from logging import getLogger
+
+from umlshapes.frames.DiagramFrame import DiagramFrame
+
+from umldiagrammer.AttributeShadow import AttributeShadow
+
+
+class BulkInsertion:
+    """
+    A transaction for adding many shapes to a diagram frame.  While it is open the frame
+    is frozen and its refreshes are deferred, so neither the shapes nor the links between
+    them are drawn one at a time;  The frame is repainted once when the outermost
+    transaction commits.
+
+    Use it as a context manager or with begin() and commit().  Transactions nest.
+
+    The refreshes issued by UML Shapes itself, for example by the paste commands, are
+    deferred by temporarily shadowing the frame's refresh method.  Committing restores
+    the refresh that was there before, which may itself be a shadow;  See DamageTracker
+    """
+    def __init__(self, diagramFrame: DiagramFrame):
+        """
+
+        Args:
+            diagramFrame:   The frame the shapes are added to
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame:    DiagramFrame    = diagramFrame
+        self._refreshShadow:   AttributeShadow = AttributeShadow(owner=diagramFrame, name='refresh')
+        self._depth:           int             = 0
+        self._deferredCount:   int             = 0
+
+    @property
+    def active(self) -> bool:
+        return self._depth > 0
+
+    @property
+    def deferredCount(self) -> int:
+        """
+        The number of refreshes deferred by the open transaction
+        """
+        return self._deferredCount
+
+    def begin(self):
+
+        if self._depth == 0:
+            self._deferredCount = 0
+            self._diagramFrame.Freeze()
+            self._refreshShadow.shadow(replacement=self._deferRefresh)
+        self._depth += 1
+
+    def commit(self):
+        """
+        Only the outermost commit repaints.  Committing without a matching begin does nothing
+        """
+        if self._depth == 0:
+            return
+
+        self._depth -= 1
+        if self._depth == 0:
+            self._refreshShadow.restore()
+            if self._diagramFrame.IsFrozen() is True:
+                self._diagramFrame.Thaw()
+            self.logger.debug(f'Committed;  Deferred {self._deferredCount} refreshes')
+            self._diagramFrame.refresh()
+
+    def refresh(self):
+        """
+        Refresh the frame now, unless a transaction is open
+        """
+        if self.active is True:
+            self._deferRefresh()
+        else:
+            self._diagramFrame.refresh()
+
+    def __enter__(self) -> 'BulkInsertion':
+        self.begin()
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        self.commit()
+        return False
+
+    def _deferRefresh(self):
+        self._deferredCount += 1
@@ -0,0 +1,100 @@
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from umldiagrammer.SpatialIndex import Bounds
+
+MAX_RECTANGLES: int = 8     # More than this and the repaint costs more in blits than it saves
+
+
+class DamageRegion:
+    """
+    The parts of a diagram that must be repainted;  A few rectangles in diagram coordinates.
+    Overlapping rectangles are merged.  When there are too many the two that waste the
+    least area when merged are merged
+    """
+    def __init__(self, maxRectangles: int = MAX_RECTANGLES):
+        """
+
+        Args:
+            maxRectangles:  The region never has more rectangles than this
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxRectangles: int          = maxRectangles
+        self._rectangles:    List[Bounds] = []
+
+    @property
+    def empty(self) -> bool:
+        return len(self._rectangles) == 0
+
+    @property
+    def rectangles(self) -> List[Bounds]:
+        return list(self._rectangles)
+
+    @property
+    def area(self) -> int:
+        """
+        Returns:  The area of the rectangles;  They do not overlap
+        """
+        return sum(rectangle.area for rectangle in self._rectangles)
+
+    @property
+    def extent(self) -> Optional[Bounds]:
+        """
+        Returns:  The bounds of the whole region;  None when it is empty
+        """
+        if self.empty is True:
+            return None
+
+        extent: Bounds = self._rectangles[0]
+        for rectangle in self._rectangles[1:]:
+            extent = extent.union(rectangle)
+
+        return extent
+
+    def add(self, bounds: Bounds):
+        """
+        Args:
+            bounds:  Damaged;  Merged with the rectangles it overlaps
+        """
+        merged: Bounds = bounds
+        while True:
+            overlapping: List[Bounds] = [rectangle for rectangle in self._rectangles if rectangle.intersects(merged)]
+            if len(overlapping) == 0:
+                break
+            for rectangle in overlapping:
+                self._rectangles.remove(rectangle)
+                merged = merged.union(rectangle)
+
+        self._rectangles.append(merged)
+
+        if len(self._rectangles) > self._maxRectangles:
+            self._mergeCheapest()
+
+    def clear(self):
+        self._rectangles = []
+
+    def _mergeCheapest(self):
+        """
+        Merge the pair of rectangles whose union covers the least area that was not damaged
+        """
+        cheapestWaste: int             = -1
+        cheapestPair:  Tuple[int, int] = (0, 1)
+        for i, first in enumerate(self._rectangles):
+            for j in range(i + 1, len(self._rectangles)):
+                second: Bounds = self._rectangles[j]
+                waste:  int    = first.union(second).area - first.area - second.area
+                if cheapestWaste == -1 or waste < cheapestWaste:
+                    cheapestWaste = waste
+                    cheapestPair  = (i, j)
+
+        i, j = cheapestPair
+        second = self._rectangles.pop(j)
+        first  = self._rectangles.pop(i)
+
+        self.add(first.union(second))
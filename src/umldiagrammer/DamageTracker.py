@@ -0,0 +1,242 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import DEBUG
+from logging import Logger
+from logging import getLogger
+
+from wx import Brush
+from wx import ClientDC
+from wx import MemoryDC
+from wx import TRANSPARENT_PEN
+
+from wx import Bitmap
+
+from umlshapes.lib.ogl import Shape
+
+from umlshapes.frames.UmlFrame import UmlFrame
+
+from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
+from umlshapes.pubsubengine.UmlMessageType import UmlMessageType
+
+from umldiagrammer.DamageRegion import DamageRegion
+from umldiagrammer.DetailRenderer import DetailRenderer
+from umldiagrammer.FramePainting import FramePainting
+from umldiagrammer.PaintOverlay import PaintOverlay
+from umldiagrammer.DiagrammerTypes import UmlShapeGenre
+from umldiagrammer.ShapeLocator import ShapeLocator
+from umldiagrammer.ShapeLocator import shapeBounds
+from umldiagrammer.SpatialIndex import Bounds
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+
+SHAPE_MARGIN: int = 8       # Selection handles are drawn outside a shape
+LINK_MARGIN:  int = 16      # Arrow heads, diamonds and the labels near the ends of a link
+
+FULL_REPAINT_FRACTION: float = 0.5      # Of the viewport;  A bigger repaint is done in full
+
+
+class DamageTracker:
+    """
+    Repaints only what a drag damaged:  The old and new bounds of the shapes being moved
+    and of their links.  UML Shapes repaints the whole frame on every mouse motion of
+    a drag;  On a dense diagram that is every shape, every motion.
+
+    The tracker takes over the frame's refresh by shadowing it.  The shapes that intersect
+    the damage are found with the frame's shape locator and drawn, back to front, into the
+    frame's double buffering bitmap clipped to each damaged rectangle, with the grid drawn
+    over them as the frame's own refresh does;  Only those rectangles are copied to the
+    screen.  The frame's painting internals are reached through FramePainting;  When it is
+    not available every refresh is in full.  Any other refresh, or a drag whose damage covers
+    most of the viewport, repaints the frame in full as before.
+
+    Both kinds of repaint are timed as 'frame.paint' spans;  The mode field tells them apart.
+    They are logged at DEBUG;  PaintStatistics aggregates them for the paint overlay
+    """
+    def __init__(self, diagramFrame: UmlFrame, shapeLocator: ShapeLocator, detailRenderer: DetailRenderer, paintOverlay: PaintOverlay, umlPubSubEngine: IUmlPubSubEngine):
+        """
+
+        Args:
+            diagramFrame:       The frame to repaint
+            shapeLocator:       The frame's shape locator
+            detailRenderer:     Draws the frame's shapes
+            paintOverlay:       Told when a repaint completes
+            umlPubSubEngine:    To learn when the frame is modified
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame:   UmlFrame       = diagramFrame
+        self._shapeLocator:   ShapeLocator   = shapeLocator
+        self._detailRenderer: DetailRenderer = detailRenderer
+        self._paintOverlay:   PaintOverlay   = paintOverlay
+        self._framePainting:  FramePainting  = FramePainting(diagramFrame=diagramFrame)
+
+        self._damageRegion: DamageRegion      = DamageRegion()
+        self._lastBounds:   Dict[int, Bounds] = {}      # By Python id;  What the previous repaint drew
+
+        self._fullRefresh: Callable[[], None] = diagramFrame.refresh
+
+        umlPubSubEngine.subscribe(messageType=UmlMessageType.FRAME_MODIFIED, frameId=diagramFrame.id, listener=self._frameModifiedListener)
+
+        diagramFrame.refresh = self.refresh     # type: ignore
+
+    def refresh(self):
+        """
+        Repaint the damage of the shapes being dragged
+        """
+        movingShapes: List[UmlShapeGenre] = [shapeMoveInfo.umlShape for shapeMoveInfo in self._diagramFrame.movedShapes.values()]
+        if len(movingShapes) == 0:
+            self._lastBounds.clear()
+            self._repaintAll(reason='notDragging')
+            return
+        if self._framePainting.available is False:
+            self._repaintAll(reason='unsupported')
+            return
+
+        viewport:      Bounds            = self._viewport()
+        currentBounds: Dict[int, Bounds] = {}
+
+        self._damageRegion.clear()
+        if self._collectDamage(movingShapes=movingShapes, currentBounds=currentBounds) is False:
+            self._repaintAll(reason='unknown')
+        elif self._damageRegion.area > viewport.area * FULL_REPAINT_FRACTION:
+            self._repaintAll(reason='large')
+        else:
+            self._repaintDamage(viewport=viewport)
+
+        self._lastBounds = currentBounds
+
+    def _repaintAll(self, reason: str):
+
+        with TimingSpan('frame.paint', logLevel=DEBUG, mode='full', reason=reason) as paintSpan:
+            self._fullRefresh()
+
+        self._paintOverlay.paintComplete(seconds=paintSpan.elapsedSeconds, mode='full')
+
+    def _repaintDamage(self, viewport: Bounds):
+
+        frame:         UmlFrame = self._diagramFrame
+        workingBitmap: Bitmap   = self._framePainting.workingBitmap
+        width, height = frame.GetSize()
+        if workingBitmap.IsOk() is False or workingBitmap.GetSize() != (width, height):
+            self._repaintAll(reason='resized')
+            return
+
+        with TimingSpan('frame.paint', logLevel=DEBUG, mode='damaged', rectangles=len(self._damageRegion.rectangles), area=self._damageRegion.area) as paintSpan:
+
+            memoryDC: MemoryDC = MemoryDC(workingBitmap)
+            frame.PrepareDC(memoryDC)
+            clientDC: ClientDC = ClientDC(frame)
+            startX, startY = frame.CalcUnscrolledPosition(0, 0)
+
+            drawnCount: int = 0
+            for damaged in self._damageRegion.rectangles:
+                if damaged.intersects(viewport) is False:
+                    continue
+                clipped: Bounds = Bounds(left=max(damaged.left, viewport.left),
+                                         top=max(damaged.top, viewport.top),
+                                         right=min(damaged.right, viewport.right),
+                                         bottom=min(damaged.bottom, viewport.bottom)
+                                         )
+                clipWidth:  int = clipped.right - clipped.left
+                clipHeight: int = clipped.bottom - clipped.top
+
+                memoryDC.SetClippingRegion(clipped.left, clipped.top, clipWidth, clipHeight)
+                memoryDC.SetPen(TRANSPARENT_PEN)
+                memoryDC.SetBrush(Brush(frame.GetBackgroundColour()))
+                memoryDC.DrawRectangle(clipped.left, clipped.top, clipWidth, clipHeight)
+
+                for shape in self._shapeLocator.shapesToDraw(bounds=clipped):
+                    if shape.IsShown() is True:
+                        self._detailRenderer.drawShape(dc=memoryDC, shape=shape)
+                        drawnCount += 1
+
+                if self._framePainting.gridEnabled is True:        # Over the shapes, as DiagramFrame.refresh draws it
+                    self._framePainting.drawGrid(dc=memoryDC, width=width, height=height, startX=startX, startY=startY)
+
+                memoryDC.DestroyClippingRegion()
+                clientDC.Blit(clipped.left - startX, clipped.top - startY, clipWidth, clipHeight, memoryDC, clipped.left, clipped.top)
+
+            paintSpan.set(shapes=drawnCount)
+
+        self._paintOverlay.paintComplete(seconds=paintSpan.elapsedSeconds, mode='damaged')
+
+    def _collectDamage(self, movingShapes: List[UmlShapeGenre], currentBounds: Dict[int, Bounds]) -> bool:
+        """
+        The damage is where the shapes and their links were at the previous repaint and
+        where they are now.  For the first repaint of a drag, where a shape was is where the
+        shape locator last filed it;  Where a link was is estimated from its ends
+
+        Args:
+            movingShapes:   The shapes being dragged
+            currentBounds:  Filled in with where the shapes and their links are now;  By Python id
+
+        Returns:  False if where a shape or link was is not known
+        """
+        known:          bool              = True
+        previousBounds: Dict[int, Bounds] = {}
+        for umlShape in movingShapes:
+            currentBounds[id(umlShape)] = shapeBounds(shape=umlShape)
+
+            previous: Optional[Bounds] = self._lastBounds.get(id(umlShape))
+            if previous is None:
+                previous = self._shapeLocator.filedBounds(umlShape=umlShape)
+            if previous is None:
+                known = False
+            else:
+                previousBounds[id(umlShape)] = previous
+                self._damageRegion.add(previous.inflate(SHAPE_MARGIN))
+                self._damageRegion.add(currentBounds[id(umlShape)].inflate(SHAPE_MARGIN))
+
+        for umlShape in movingShapes:
+            for link in umlShape.GetLines():
+                if id(link) in currentBounds:
+                    continue
+                currentBounds[id(link)] = shapeBounds(shape=link)
+
+                previous = self._lastBounds.get(id(link))
+                if previous is None:
+                    previous = self._previousLinkBounds(link=link, previousBounds=previousBounds)
+                if previous is None:
+                    known = False
+                else:
+                    self._damageRegion.add(previous.inflate(LINK_MARGIN))
+                    self._damageRegion.add(currentBounds[id(link)].inflate(LINK_MARGIN))
+
+        return known
+
+    def _previousLinkBounds(self, link: Shape, previousBounds: Dict[int, Bounds]) -> Optional[Bounds]:
+        """
+        A link lies within its ends' shapes and its control points.  The ends that are
+        not moving are where they were
+        """
+        bounds: Optional[Bounds] = None
+        for end in (link.GetFrom(), link.GetTo()):
+            if end is None:
+                return None
+            endBounds: Optional[Bounds] = previousBounds.get(id(end))
+            if endBounds is None:
+                endBounds = shapeBounds(shape=end)
+            bounds = endBounds if bounds is None else bounds.union(endBounds)
+
+        for x, y in link.GetLineControlPoints()[1:-1]:
+            point: Bounds = Bounds(left=round(x), top=round(y), right=round(x), bottom=round(y))
+            bounds = point if bounds is None else bounds.union(point)
+
+        return bounds
+
+    def _viewport(self) -> Bounds:
+
+        startX, startY = self._diagramFrame.CalcUnscrolledPosition(0, 0)
+        width,  height = self._diagramFrame.GetSize()
+
+        return Bounds(left=startX, top=startY, right=startX + width, bottom=startY + height)
+
+    def _frameModifiedListener(self, modifiedFrameId):
+        """
+        A drag begins with a modification;  What the previous drag drew is no longer known
+        """
+        self._lastBounds.clear()
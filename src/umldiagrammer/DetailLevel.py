@@ -0,0 +1,56 @@
+
+from enum import Enum
+
+from dataclasses import dataclass
+
+
+class DetailLevel(Enum):
+    """
+    How much of a shape is drawn
+    """
+    FULL    = 'Full'        # As UML Shapes draws it
+    OUTLINE = 'Outline'     # Its outline;  No text that cannot be read
+
+
+@dataclass(frozen=True)
+class DetailThresholds:
+    """
+    On screen sizes in pixels;  Zero turns a threshold off
+    """
+    readableTextHeight: int = 6     # Smaller text is not drawn
+    minimumShapeSize:   int = 16    # Smaller shapes are outlined
+
+
+def textDetailLevel(fontSize: int, scale: float, detailThresholds: DetailThresholds) -> DetailLevel:
+    """
+    Args:
+        fontSize:           Of the text, in diagram units
+        scale:              Pixels per diagram unit
+        detailThresholds:
+
+    Returns:  Whether text at this scale can be read
+    """
+    if fontSize * scale < detailThresholds.readableTextHeight:
+        return DetailLevel.OUTLINE
+
+    return DetailLevel.FULL
+
+
+def shapeDetailLevel(width: float, height: float, fontSize: int, scale: float, detailThresholds: DetailThresholds) -> DetailLevel:
+    """
+    A shape is outlined when its text cannot be read or it is too small on screen to
+    hold any
+
+    Args:
+        width:              Of the shape, in diagram units
+        height:             Of the shape, in diagram units
+        fontSize:           Of the shape's text, in diagram units
+        scale:              Pixels per diagram unit
+        detailThresholds:
+
+    Returns:  The detail level of the shape at this scale
+    """
+    if min(width, height) * scale < detailThresholds.minimumShapeSize:
+        return DetailLevel.OUTLINE
+
+    return textDetailLevel(fontSize=fontSize, scale=scale, detailThresholds=detailThresholds)
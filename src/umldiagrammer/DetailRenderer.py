@@ -0,0 +1,220 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from wx import FONTFAMILY_SWISS
+from wx import FONTSTYLE_NORMAL
+from wx import FONTWEIGHT_BOLD
+from wx import LIGHT_GREY_BRUSH
+from wx import TRANSPARENT_PEN
+
+from wx import DC
+from wx import Font
+from wx import Size
+
+from umlshapes.lib.ogl import Shape
+from umlshapes.lib.ogl import LineShape
+
+from umlshapes.frames.DiagramFrame import DiagramFrame
+
+from umlshapes.links.UmlLink import UmlLink
+from umlshapes.links.UmlLinkLabel import UmlLinkLabel
+
+from umlshapes.preferences.UmlPreferences import UmlPreferences
+
+from umlshapes.shapes.UmlClass import UmlClass
+from umlshapes.shapes.UmlNote import UmlNote
+from umlshapes.shapes.UmlText import UmlText
+
+from umlshapes.types.Common import Rectangle
+
+from umldiagrammer.DetailLevel import DetailLevel
+from umldiagrammer.DetailLevel import DetailThresholds
+from umldiagrammer.DetailLevel import shapeDetailLevel
+from umldiagrammer.DetailLevel import textDetailLevel
+
+from umldiagrammer.performance.PaintStatistics import PaintStatistics
+from umldiagrammer.performance.TimingSpan import TimingSpan
+
+TITLE_MARGIN: int = 2       # Pixels, on screen
+
+
+class DetailRenderer:
+    """
+    Draws the shapes of a diagram frame at a level of detail chosen by their size on
+    screen.  Text that would be too small to read is neither measured nor drawn:
+
+    * Classes are drawn as boxes, titled when the title fits
+    * Notes and texts are drawn as placeholders
+    * Links are drawn as straight segments, without their labels
+
+    The renderer takes over the drawing of the frame's diagram by shadowing its Redraw.
+    The size on screen is the size on the diagram times the scale of the device context,
+    so a frame drawn at its natural size draws everything but the tiniest shapes in full
+    """
+    def __init__(self, diagramFrame: DiagramFrame, detailThresholds: DetailThresholds, paintStatistics: PaintStatistics):
+        """
+
+        Args:
+            diagramFrame:       The frame whose diagram is drawn
+            detailThresholds:   Below these sizes shapes are outlined
+            paintStatistics:    Counts the shapes and links drawn
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame:     DiagramFrame     = diagramFrame
+        self._detailThresholds: DetailThresholds = detailThresholds
+        self._paintStatistics:  PaintStatistics  = paintStatistics
+        self._fontSize:         int              = UmlPreferences().textFontSize
+
+        self._titleFonts: Dict[int, Font] = {}     # By pixel height
+
+        self._diagramRedraw: Callable[[DC], None] = diagramFrame.umlDiagram.Redraw
+
+        diagramFrame.umlDiagram.Redraw = self.redraw    # type: ignore
+
+    def redraw(self, dc: DC):
+        """
+        Draw every shape of the diagram, back most first
+
+        Args:
+            dc:
+        """
+        if dc is None:
+            self._diagramRedraw(dc)
+            return
+
+        shapes:        List[Shape] = self._diagramFrame.umlDiagram.GetShapeList()
+        outlinedCount: int         = 0
+        for shape in shapes:
+            if self.drawShape(dc=dc, shape=shape) is DetailLevel.OUTLINE:
+                outlinedCount += 1
+
+        timingSpan = TimingSpan.current()
+        if timingSpan is not None and outlinedCount > 0:
+            timingSpan.set(outlined=outlinedCount)
+
+    def drawShape(self, dc: DC, shape: Shape) -> DetailLevel:
+        """
+        Draw a single shape at its level of detail
+
+        Args:
+            dc:
+            shape:
+
+        Returns:  The level it was drawn at
+        """
+        if shape.IsShown() is False:
+            return DetailLevel.FULL
+
+        if isinstance(shape, LineShape):
+            self._paintStatistics.countDrawn(links=1)
+        else:
+            self._paintStatistics.countDrawn(shapes=1)
+
+        scale: float = _scale(dc=dc)
+        if isinstance(shape, (UmlClass, UmlNote, UmlText)):
+            rectangle:   Rectangle   = shape.rectangle
+            detailLevel: DetailLevel = shapeDetailLevel(width=rectangle.right - rectangle.left,
+                                                        height=rectangle.bottom - rectangle.top,
+                                                        fontSize=self._fontSize,
+                                                        scale=scale,
+                                                        detailThresholds=self._detailThresholds
+                                                        )
+        elif isinstance(shape, (UmlLink, UmlLinkLabel)):
+            detailLevel = textDetailLevel(fontSize=self._fontSize, scale=scale, detailThresholds=self._detailThresholds)
+        else:
+            detailLevel = DetailLevel.FULL
+
+        if detailLevel is DetailLevel.FULL:
+            shape.Draw(dc)
+        elif isinstance(shape, UmlClass):
+            self._drawTitledBox(dc=dc, umlClass=shape, scale=scale)
+        elif isinstance(shape, (UmlNote, UmlText)):
+            self._drawPlaceholder(dc=dc, shape=shape)
+        elif isinstance(shape, UmlLink):
+            self._drawSegment(dc=dc, umlLink=shape)
+        #
+        # Link labels are not drawn
+        #
+        return detailLevel
+
+    def _drawTitledBox(self, dc: DC, umlClass: UmlClass, scale: float):
+
+        rectangle: Rectangle = umlClass.rectangle
+        left:      int       = round(rectangle.left)
+        top:       int       = round(rectangle.top)
+        width:     int       = round(rectangle.right - rectangle.left)
+        height:    int       = round(rectangle.bottom - rectangle.top)
+
+        dc.SetPen(umlClass.GetPen())
+        dc.SetBrush(umlClass.GetBrush())
+        dc.DrawRectangle(left, top, width, height)
+        #
+        # The title is drawn readable;  Its font is not scaled down with the diagram
+        #
+        titleHeight: int = self._detailThresholds.readableTextHeight
+        margin:      int = round(TITLE_MARGIN / scale)
+        fontHeight:  int = max(1, round(titleHeight / scale))
+        if titleHeight > 0 and height * scale >= titleHeight + 2 * TITLE_MARGIN:
+            clipLeft, clipTop, clipWidth, clipHeight = dc.GetClippingBox()
+
+            dc.SetClippingRegion(left, top, width, height)
+            dc.SetFont(self._titleFont(pixelHeight=fontHeight))
+            dc.SetTextForeground(umlClass.GetPen().GetColour())
+            dc.DrawText(umlClass.modelClass.name, left + margin, top + margin)
+            dc.DestroyClippingRegion()
+
+            if clipWidth > 0 and clipHeight > 0:
+                dc.SetClippingRegion(clipLeft, clipTop, clipWidth, clipHeight)
+
+        umlClass.GetEventHandler().OnDrawControlPoints(dc)
+
+    def _drawPlaceholder(self, dc: DC, shape: UmlNote | UmlText):
+
+        rectangle: Rectangle = shape.rectangle
+
+        if isinstance(shape, UmlNote):
+            dc.SetPen(shape.GetPen())
+            dc.SetBrush(shape.GetBrush())
+        else:
+            dc.SetPen(TRANSPARENT_PEN)
+            dc.SetBrush(LIGHT_GREY_BRUSH)
+
+        dc.DrawRectangle(round(rectangle.left), round(rectangle.top), round(rectangle.right - rectangle.left), round(rectangle.bottom - rectangle.top))
+
+        shape.GetEventHandler().OnDrawControlPoints(dc)
+
+    def _drawSegment(self, dc: DC, umlLink: UmlLink):
+
+        controlPoints = umlLink.GetLineControlPoints()
+        if len(controlPoints) < 2:
+            return
+
+        (fromX, fromY), (toX, toY) = controlPoints[0], controlPoints[-1]
+
+        dc.SetPen(umlLink.GetPen())
+        dc.DrawLine(round(fromX), round(fromY), round(toX), round(toY))
+
+    def _titleFont(self, pixelHeight: int) -> Font:
+
+        titleFont: Optional[Font] = self._titleFonts.get(pixelHeight)
+        if titleFont is None:
+            titleFont = Font(Size(0, pixelHeight), FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_BOLD)
+            self._titleFonts[pixelHeight] = titleFont
+
+        return titleFont
+
+
+def _scale(dc: DC) -> float:
+    """
+    Returns:  Pixels per diagram unit
+    """
+    scaleX, scaleY = dc.GetUserScale()
+
+    return min(scaleX, scaleY)
@@ -0,0 +1,71 @@
+
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+
+from wx import Bitmap
+
+from umlshapes import __version__ as umlShapesVersion
+
+from umlshapes.frames.UmlFrame import UmlFrame
+
+#
+# UML Shapes has no public hooks for painting part of a frame;  These are the releases whose
+# frame internals this adapter was written against
+#
+SUPPORTED_UML_SHAPES_MAJOR: str = '3'
+
+FRAME_INTERNALS: Tuple[str, ...] = ('_workingBitmap', '_umlPreferences', '_drawGrid')
+
+
+class FramePainting:
+    """
+    The only place that reaches into a UML Shapes diagram frame's private painting state:
+    its double buffering bitmap and its background grid.  When the installed UML Shapes is
+    not a release this was written against, or the frame lacks what it needs, the adapter
+    is not available and callers repaint the frame in full
+    """
+    def __init__(self, diagramFrame: UmlFrame):
+        """
+
+        Args:
+            diagramFrame:   The frame to paint
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame: UmlFrame = diagramFrame
+
+        self._available: bool = umlShapesVersion.split('.')[0] == SUPPORTED_UML_SHAPES_MAJOR and all(hasattr(diagramFrame, name) for name in FRAME_INTERNALS)
+        if self._available is False:
+            self.logger.warning(f'UML Shapes {umlShapesVersion} is not supported;  Frames are always repainted in full')
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    @property
+    def workingBitmap(self) -> Bitmap:
+        """
+        Returns:  The bitmap the frame renders into before copying it to the screen
+        """
+        return self._diagramFrame._workingBitmap      # noqa
+
+    @property
+    def gridEnabled(self) -> bool:
+        return self._diagramFrame._umlPreferences.backGroundGridEnabled     # noqa
+
+    def drawGrid(self, dc: DC, width: int, height: int, startX: int, startY: int):
+        """
+        Draws the background grid the way the frame does
+
+        Args:
+            dc:         A device context prepared for the frame's scrolling
+            width:      Of the frame
+            height:     Of the frame
+            startX:     The unscrolled position of the frame's left edge
+            startY:     The unscrolled position of the frame's top edge
+        """
+        self._diagramFrame._drawGrid(memDC=dc, width=width, height=height, startX=startX, startY=startY)     # noqa
@@ -0,0 +1,101 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+
+from umlshapes.lib.ogl import LineShape
+
+from umlshapes.frames.UmlFrame import UmlFrame
+
+from umldiagrammer.BulkInsertion import BulkInsertion
+from umldiagrammer.DiagrammerTypes import UmlShapeGenre
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+
+
+class LinkGeometry:
+    """
+    Recomputes where links attach to the shapes they connect, for example after an extension
+    added or moved shapes without dragging them.  Only the links that need it are recomputed;
+    They are drawn off screen and the frame repaints once.  Recomputed links are saved
+    differently, so the frame is marked modified
+    """
+    def __init__(self, umlFrame: UmlFrame, bulkInsertion: BulkInsertion):
+        """
+
+        Args:
+            umlFrame:       The frame with the links
+            bulkInsertion:  The frame's bulk insertion;  Defers the repaint
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._umlFrame:      UmlFrame      = umlFrame
+        self._bulkInsertion: BulkInsertion = bulkInsertion
+
+    def recompute(self, umlShapes: Optional[List[UmlShapeGenre]] = None) -> int:
+        """
+        Recompute the links of the changed shapes.  When the changed shapes are not known,
+        the links whose ends no longer meet their shapes are recomputed
+
+        Args:
+            umlShapes:  The shapes that changed;  None to find the stale links
+
+        Returns:  The number of links recomputed
+        """
+        with TimingSpan('links.recompute') as recomputeSpan:
+            if umlShapes is None:
+                links: List[LineShape] = self._staleLinks()
+            else:
+                links = self._shapeLinks(umlShapes=umlShapes)
+
+            if len(links) > 0:
+                dc: DC = self._umlFrame.createDC()
+                with self._bulkInsertion:
+                    for link in links:
+                        link.GetEventHandler().OnMoveLink(dc)
+                    self._bulkInsertion.refresh()
+
+                self._umlFrame.frameModified = True
+
+            recomputeSpan.set(links=len(links))
+
+        self.logger.debug(f'Recomputed {len(links)} link(s)')
+
+        return len(links)
+
+    def _shapeLinks(self, umlShapes: List[UmlShapeGenre]) -> List[LineShape]:
+        """
+        Returns:  The links attached to the shapes;  Each only once
+        """
+        links: Dict[int, LineShape] = {}
+        for umlShape in umlShapes:
+            for link in umlShape.GetLines():
+                links[id(link)] = link
+
+        return list(links.values())
+
+    def _staleLinks(self) -> List[LineShape]:
+        """
+        Returns:  The links on the diagram whose ends are not where their shapes say they should be
+        """
+        staleLinks: List[LineShape] = []
+        for shape in self._umlFrame.umlDiagram.GetShapeList():
+            if isinstance(shape, LineShape) and _isStale(link=shape) is True:
+                staleLinks.append(shape)
+
+        return staleLinks
+
+
+def _isStale(link: LineShape) -> bool:
+
+    if link.GetFrom() is None or link.GetTo() is None or len(link.GetLineControlPoints()) < 2:
+        return False
+
+    endX, endY, otherEndX, otherEndY = link.FindLineEndPoints()
+
+    return link.GetEnds() != (round(endX), round(endY), round(otherEndX), round(otherEndY))
@@ -0,0 +1,146 @@
+
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from typing import cast
+
+from dataclasses import dataclass
+
+from umlshapes.links.UmlLink import UmlLink
+from umlshapes.links.UmlNoteLink import UmlNoteLink
+from umlshapes.links.UmlInterface import UmlInterface
+from umlshapes.links.UmlAssociation import UmlAssociation
+from umlshapes.links.UmlInheritance import UmlInheritance
+
+from umlshapes.links.eventhandlers.UmlLinkEventHandler import UmlLinkEventHandler
+from umlshapes.links.eventhandlers.UmlNoteLinkEventHandler import UmlNoteLinkEventHandler
+from umlshapes.links.eventhandlers.UmlAssociationEventHandler import UmlAssociationEventHandler
+
+from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
+
+from umldiagrammer.DiagrammerTypes import UmlShapeGenre
+
+LinkEnds    = Callable[[UmlLink], Tuple[UmlShapeGenre, UmlShapeGenre]]
+LinkConnect = Callable[[UmlLink, IUmlPubSubEngine], None]
+LinkWire    = Callable[[UmlLink, IUmlPubSubEngine], None]
+
+
+@dataclass
+class LinkRealizer:
+    """
+    How a type of link is realized on a diagram
+    """
+    ends:    LinkEnds       # The two shapes the link connects;  The links name them differently
+    connect: LinkConnect    # Attaches the link to its ends
+    wire:    LinkWire       # Attaches its event handler
+
+
+def _inheritanceEnds(umlLink: UmlLink) -> Tuple[UmlShapeGenre, UmlShapeGenre]:
+    umlInheritance: UmlInheritance = cast(UmlInheritance, umlLink)
+    return umlInheritance.subClass, umlInheritance.baseClass
+
+
+def _noteLinkEnds(umlLink: UmlLink) -> Tuple[UmlShapeGenre, UmlShapeGenre]:
+    umlNoteLink: UmlNoteLink = cast(UmlNoteLink, umlLink)
+    return umlNoteLink.sourceNote, umlNoteLink.destinationClass
+
+
+def _interfaceEnds(umlLink: UmlLink) -> Tuple[UmlShapeGenre, UmlShapeGenre]:
+    umlInterface: UmlInterface = cast(UmlInterface, umlLink)
+    return umlInterface.implementingClass, umlInterface.interfaceClass
+
+
+def _associationEnds(umlLink: UmlLink) -> Tuple[UmlShapeGenre, UmlShapeGenre]:
+    return umlLink.sourceShape, umlLink.destinationShape
+
+
+def _connectInheritance(umlLink: UmlLink, umlPubSubEngine: IUmlPubSubEngine):
+    umlInheritance: UmlInheritance = cast(UmlInheritance, umlLink)
+    umlInheritance.umlPubSubEngine = umlPubSubEngine
+    umlInheritance.subClass.addLink(umlLink=umlInheritance, destinationClass=umlInheritance.baseClass)
+
+
+def _connectNoteLink(umlLink: UmlLink, umlPubSubEngine: IUmlPubSubEngine):
+    umlNoteLink: UmlNoteLink = cast(UmlNoteLink, umlLink)
+    umlNoteLink.sourceNote.addLink(umlNoteLink=umlNoteLink, umlClass=umlNoteLink.destinationClass)
+
+
+def _connectInterface(umlLink: UmlLink, umlPubSubEngine: IUmlPubSubEngine):
+    umlInterface: UmlInterface = cast(UmlInterface, umlLink)
+    umlInterface.implementingClass.addLink(umlLink=umlInterface, destinationClass=umlInterface.interfaceClass)
+
+
+def _connectAssociation(umlLink: UmlLink, umlPubSubEngine: IUmlPubSubEngine):
+    """
+    Associations, compositions and aggregations;  The source may be a class or an actor.
+    The pub sub engine must be set first;  Adding the link creates its labels
+    """
+    umlLink.umlPubSubEngine = umlPubSubEngine
+    umlLink.sourceShape.addLink(umlLink, umlLink.destinationShape)     # type: ignore
+
+
+def _wireLink(umlLink: UmlLink, umlPubSubEngine: IUmlPubSubEngine):
+    umlLinkEventHandler: UmlLinkEventHandler = UmlLinkEventHandler(umlLink=umlLink, previousEventHandler=umlLink.GetEventHandler())
+    umlLinkEventHandler.umlPubSubEngine = umlPubSubEngine
+    umlLink.SetEventHandler(umlLinkEventHandler)
+
+
+def _wireNoteLink(umlLink: UmlLink, umlPubSubEngine: IUmlPubSubEngine):
+    umlNoteLink:  UmlNoteLink             = cast(UmlNoteLink, umlLink)
+    eventHandler: UmlNoteLinkEventHandler = UmlNoteLinkEventHandler(umlNoteLink=umlNoteLink, previousEventHandler=umlNoteLink.GetEventHandler())
+    eventHandler.umlPubSubEngine = umlPubSubEngine
+    umlNoteLink.SetEventHandler(eventHandler)
+
+
+def _wireAssociation(umlLink: UmlLink, umlPubSubEngine: IUmlPubSubEngine):
+    """
+    The association event handler installs itself
+    """
+    UmlAssociationEventHandler(umlAssociation=cast(UmlAssociation, umlLink), umlPubSubEngine=umlPubSubEngine)
+
+
+#
+# Keyed by link type;  Subclasses, like compositions and aggregations, use the entry of the nearest registered base class
+#
+LINK_REALIZERS: Dict[type, LinkRealizer] = {
+    UmlInheritance: LinkRealizer(ends=_inheritanceEnds,   connect=_connectInheritance, wire=_wireLink),
+    UmlNoteLink:    LinkRealizer(ends=_noteLinkEnds,      connect=_connectNoteLink,    wire=_wireNoteLink),
+    UmlInterface:   LinkRealizer(ends=_interfaceEnds,     connect=_connectInterface,   wire=_wireLink),
+    UmlAssociation: LinkRealizer(ends=_associationEnds,   connect=_connectAssociation, wire=_wireAssociation),
+}
+
+
+def linkRealizer(umlLink: UmlLink) -> LinkRealizer:
+    """
+
+    Args:
+        umlLink:
+
+    Returns:  The realizer registered for the link's type or its nearest base class;  None if there is none
+    """
+    linkType: type = type(umlLink)
+    if linkType not in LINK_REALIZERS:
+        for baseType in linkType.__mro__[1:]:
+            if baseType in LINK_REALIZERS:
+                LINK_REALIZERS[linkType] = LINK_REALIZERS[baseType]
+                break
+        else:
+            return cast(LinkRealizer, None)
+
+    return LINK_REALIZERS[linkType]
+
+
+def linkEnds(umlLink: UmlLink) -> Tuple[UmlShapeGenre, UmlShapeGenre]:
+    """
+    The links name their ends differently
+
+    Args:
+        umlLink:
+
+    Returns:  The two shapes the link connects
+    """
+    realizer: LinkRealizer = linkRealizer(umlLink=umlLink)
+    if realizer is None:
+        return _associationEnds(umlLink=umlLink)
+
+    return realizer.ends(umlLink)
@@ -0,0 +1,163 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from json import dumps as jsonDumps
+
+from time import monotonic
+
+from wx import EVT_MOUSE_EVENTS
+from wx import EVT_TIMER
+from wx import FONTFAMILY_TELETYPE
+from wx import FONTSTYLE_NORMAL
+from wx import FONTWEIGHT_NORMAL
+from wx import BLACK_PEN
+
+from wx import Brush
+from wx import ClientDC
+from wx import Colour
+from wx import Font
+from wx import MouseEvent
+from wx import Timer
+from wx import TimerEvent
+
+from umlshapes.frames.DiagramFrame import DiagramFrame
+
+from umldiagrammer.performance.PaintStatistics import PaintStatistics
+from umldiagrammer.performance.TimingSpan import PERFORMANCE_LOGGER_NAME
+
+UPDATE_INTERVAL_MS:   int   = 1000
+LOG_INTERVAL_SECONDS: float = 10.0
+
+OVERLAY_MARGIN:      int    = 4
+OVERLAY_LINE_HEIGHT: int    = 14
+OVERLAY_WIDTH:       int    = 260
+OVERLAY_COLOUR:      Colour = Colour(255, 255, 210)
+
+
+class PaintOverlay:
+    """
+    A debug overlay in the corner of a diagram frame with how long its paints take, how
+    much they draw, and how many paints and input events it sees per second.  While the
+    overlay is shown the rolling statistics are written to the performance logger every
+    few seconds, so they can be attached to a bug report.
+
+    The frame's paints report to the overlay when they complete;  It records them whether
+    it is shown or not
+    """
+    def __init__(self, diagramFrame: DiagramFrame, paintStatistics: PaintStatistics, shown: bool = False):
+        """
+
+        Args:
+            diagramFrame:       The frame to instrument
+            paintStatistics:    Where the frame's paints are recorded
+            shown:              Show it now
+        """
+        self.logger:            Logger = getLogger(__name__)
+        self._performanceLogger: Logger = getLogger(PERFORMANCE_LOGGER_NAME)
+
+        self._diagramFrame:    DiagramFrame    = diagramFrame
+        self._paintStatistics: PaintStatistics = paintStatistics
+
+        self._shown:     bool  = False
+        self._lastLogAt: float = 0.0
+        self._font:      Font  = Font(9, FONTFAMILY_TELETYPE, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
+
+        self._timer: Timer = Timer(diagramFrame)
+
+        diagramFrame.Bind(EVT_MOUSE_EVENTS, self._onMouseEvent)
+        diagramFrame.Bind(EVT_TIMER,        self._onTimer, self._timer)
+
+        if shown is True:
+            self.shown = True
+
+    @property
+    def paintStatistics(self) -> PaintStatistics:
+        return self._paintStatistics
+
+    @property
+    def shown(self) -> bool:
+        return self._shown
+
+    @shown.setter
+    def shown(self, shown: bool):
+
+        self._shown = shown
+        if shown is True:
+            self._lastLogAt = monotonic()
+            self._timer.Start(UPDATE_INTERVAL_MS)
+        else:
+            self._timer.Stop()
+
+        self._diagramFrame.Refresh(False)
+
+    def paintComplete(self, seconds: float, mode: str):
+        """
+        A paint of the frame completed;  The overlay is drawn over it
+
+        Args:
+            seconds:    How long it took
+            mode:       How it painted
+        """
+        self._paintStatistics.recordPaint(seconds=seconds, mode=mode)
+        if self._shown is True:
+            self._draw()
+
+    def _onMouseEvent(self, event: MouseEvent):
+
+        event.Skip(True)
+        if self._shown is True:
+            self._paintStatistics.recordEvent()
+
+    # noinspection PyUnusedLocal
+    def _onTimer(self, event: TimerEvent):
+
+        self._draw()
+
+        now: float = monotonic()
+        if now - self._lastLogAt >= LOG_INTERVAL_SECONDS:
+            self._lastLogAt = now
+            self._log()
+
+    def _draw(self):
+
+        lines: List[str] = _overlayLines(summary=self._paintStatistics.summary())
+
+        dc: ClientDC = ClientDC(self._diagramFrame)
+        dc.SetFont(self._font)
+        dc.SetPen(BLACK_PEN)
+        dc.SetBrush(Brush(OVERLAY_COLOUR))
+        dc.DrawRectangle(OVERLAY_MARGIN, OVERLAY_MARGIN, OVERLAY_WIDTH, len(lines) * OVERLAY_LINE_HEIGHT + 2 * OVERLAY_MARGIN)
+
+        for lineNumber, line in enumerate(lines):
+            dc.DrawText(line, 2 * OVERLAY_MARGIN, 2 * OVERLAY_MARGIN + lineNumber * OVERLAY_LINE_HEIGHT)
+
+    def _log(self):
+
+        summary: Dict[str, Any] = self._paintStatistics.summary()
+        if summary['paints'] == 0 and summary['eventsPerSecond'] == 0:
+            return
+
+        record: Dict[str, Any] = {'phase': 'paint.statistics', 'frame': self._diagramFrame.id}
+        record.update(summary)
+
+        self._performanceLogger.info(jsonDumps(record, default=str))
+
+
+def _overlayLines(summary: Dict[str, Any]) -> List[str]:
+
+    lines: List[str] = []
+    if summary['paints'] == 0:
+        lines.append('paint       -')
+    else:
+        lines.append(f'paint {summary["lastPaintMs"]:8.1f} ms  {summary["lastPaintMode"]}')
+        lines.append(f'mean  {summary["meanPaintMs"]:8.1f} ms  p95 {summary["p95PaintMs"]:.1f}')
+        lines.append(f'drawn {summary["shapesDrawn"]:5d} shapes {summary["linksDrawn"]:5d} links')
+
+    lines.append(f'{summary["paintsPerSecond"]:5.1f} paints/s {summary["eventsPerSecond"]:6.1f} events/s')
+
+    return lines
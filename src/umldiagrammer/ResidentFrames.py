@@ -0,0 +1,108 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+FRAME_BYTES: int = 8 * 1024 * 1024      # The frame window, its double buffering bitmap and its viewport snapshot
+SHAPE_BYTES: int = 16 * 1024            # A shape, its model and its event handler
+
+NO_LIMIT: int = 0
+
+#
+# Asked to tear down a frame;  Returns False if the frame must stay resident
+#
+FrameEvictor = Callable[[str], bool]
+
+
+def estimateFrameBytes(shapeCount: int) -> int:
+    """
+    A rough estimate;  Only used to compare against the memory budget
+
+    Args:
+        shapeCount: The number of shapes and links on the frame
+
+    Returns:  The estimated resident size of a diagram frame
+    """
+    return FRAME_BYTES + shapeCount * SHAPE_BYTES
+
+
+@dataclass
+class ResidentFrame:
+    frameId:        str
+    estimatedBytes: int
+    evictor:        FrameEvictor
+
+
+class ResidentFrames(metaclass=SingletonV3):
+    """
+    Keeps the diagram frames of all open projects within a budget.  The diagram managers
+    report each frame as it is viewed;  When the frames are over budget the least
+    recently viewed ones are offered to their diagram manager for eviction.  A manager
+    may refuse, for example when the frame is modified
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+        self._frames: Dict[str, ResidentFrame] = {}     # Least recently viewed first
+
+    @property
+    def frameCount(self) -> int:
+        return len(self._frames)
+
+    @property
+    def estimatedBytes(self) -> int:
+        return sum(residentFrame.estimatedBytes for residentFrame in self._frames.values())
+
+    def viewed(self, frameId: str, estimatedBytes: int, evictor: FrameEvictor, frameLimit: int = NO_LIMIT, byteLimit: int = NO_LIMIT) -> List[str]:
+        """
+        Make the frame the most recently viewed one;  Then evict frames until within budget
+
+        Args:
+            frameId:        The viewed frame
+            estimatedBytes: Its estimated size
+            evictor:        Tears the frame down when it is least recently viewed
+            frameLimit:     The maximum number of resident frames;  NO_LIMIT for any number
+            byteLimit:      The maximum estimated bytes of resident frames;  NO_LIMIT for any size
+
+        Returns:  The ids of the evicted frames
+        """
+        self._frames.pop(frameId, None)
+        self._frames[frameId] = ResidentFrame(frameId=frameId, estimatedBytes=estimatedBytes, evictor=evictor)
+
+        evictedFrameIds: List[str] = []
+        for candidate in list(self._frames.values())[:-1]:
+            if self._withinBudget(frameLimit=frameLimit, byteLimit=byteLimit) is True:
+                break
+            if candidate.evictor(candidate.frameId) is True:
+                self._frames.pop(candidate.frameId)
+                evictedFrameIds.append(candidate.frameId)
+
+        if len(evictedFrameIds) > 0:
+            self.logger.info(f'Evicted {len(evictedFrameIds)} frame(s);  {self.frameCount} resident, about {self.estimatedBytes} bytes')
+
+        return evictedFrameIds
+
+    def remove(self, frameId: str):
+        """
+        The frame was destroyed by its owner
+
+        Args:
+            frameId:
+        """
+        self._frames.pop(frameId, None)
+
+    def _withinBudget(self, frameLimit: int, byteLimit: int) -> bool:
+
+        if frameLimit != NO_LIMIT and self.frameCount > frameLimit:
+            return False
+        if byteLimit != NO_LIMIT and self.estimatedBytes > byteLimit:
+            return False
+
+        return True
@@ -0,0 +1,50 @@
+
+from logging import Logger
+from logging import getLogger
+
+from wx import EVT_LEFT_UP
+
+from wx import MouseEvent
+
+from wx import CallAfter as wxCallAfter
+
+from umlshapes.lib.ogl import ControlPoint
+
+from umlshapes.lib.ogl.canvas import ContinueDraggingLeft
+
+from umlshapes.frames.UmlFrame import UmlFrame
+
+
+class ResizeWatcher:
+    """
+    OGL resizes a shape when one of its sizing handles is dropped;  UML Shapes does not
+    report that as a modification of the frame.  So a save would not know the diagram
+    changed.
+
+    The watcher sees the handle being dropped before OGL does and marks the frame
+    modified once OGL is done with the resize
+    """
+    def __init__(self, diagramFrame: UmlFrame):
+        """
+
+        Args:
+            diagramFrame:   The frame to watch
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame: UmlFrame = diagramFrame
+
+        diagramFrame.Bind(EVT_LEFT_UP, self._onLeftUp)
+
+    def _onLeftUp(self, event: MouseEvent):
+
+        event.Skip(True)
+
+        frame: UmlFrame = self._diagramFrame
+        if isinstance(frame._draggedShape, ControlPoint) and frame._dragState == ContinueDraggingLeft:     # noqa
+            wxCallAfter(self._resized)
+
+    def _resized(self):
+
+        self.logger.debug(f'Shape resized on frame {self._diagramFrame.id}')
+        self._diagramFrame.frameModified = True
@@ -0,0 +1,345 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from umlshapes.lib.ogl import Shape
+from umlshapes.lib.ogl import LineShape
+from umlshapes.lib.ogl import DivisionShape
+from umlshapes.lib.ogl import CompositeShape
+from umlshapes.lib.ogl import WhollyContains
+
+from umlshapes.frames.UmlFrame import Ltrb
+from umlshapes.frames.UmlFrame import UmlFrame
+from umlshapes.frames.UmlFrame import BOUNDARY_TOP_MARGIN
+from umlshapes.frames.UmlFrame import BOUNDARY_LEFT_MARGIN
+from umlshapes.frames.UmlFrame import BOUNDARY_RIGHT_MARGIN
+from umlshapes.frames.UmlFrame import BOUNDARY_BOTTOM_MARGIN
+from umlshapes.frames.DiagramFrame import DiagramFrame
+from umlshapes.frames.ShapeMoveInfo import MovedShapes
+
+from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
+from umlshapes.pubsubengine.UmlMessageType import UmlMessageType
+
+from umlshapes.types.Common import Rectangle
+
+from umldiagrammer.DiagrammerTypes import UmlShapeGenre
+from umldiagrammer.SpatialIndex import Bounds
+from umldiagrammer.SpatialIndex import SpatialIndex
+
+HIT_ALLOWANCE: int = 4      # OGL allows 2 pixels around a shape for inaccurate mousing;  Be generous
+
+
+class ShapeLocator:
+    """
+    Keeps a spatial index of the shapes on a diagram frame so that finding the shape under
+    the mouse and the boundaries of the diagram do not scan every shape.
+
+    UML Shapes moves, resizes, adds and deletes shapes itself;  The locator marks its index
+    stale when the frame is modified, which includes the end of a resize, or when the UML
+    shapes on the diagram change, and resynchronizes it on the next query.  While shapes
+    are dragged only the shapes being moved are refiled.
+
+    The locator takes over the frame's FindShape by shadowing it.  Only the shapes
+    whose bounds are near the point are hit tested.  Links, control points and other shapes
+    that are not UML shapes are not indexed;  They are always hit tested
+    """
+    def __init__(self, diagramFrame: DiagramFrame, umlPubSubEngine: IUmlPubSubEngine):
+        """
+
+        Args:
+            diagramFrame:       The frame to index
+            umlPubSubEngine:    To learn of the changes to the frame
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame: DiagramFrame = diagramFrame
+
+        self._spatialIndex:  SpatialIndex[int]       = SpatialIndex[int]()
+        self._indexedShapes: Dict[int, UmlShapeGenre] = {}          # By Python id of the shape
+        self._otherShapes:   List[Shape]              = []
+        self._zOrder:        Dict[int, int]           = {}          # Position in the diagram's shape list
+
+        self._stale:     bool     = True
+        self._movedKeys: Set[int] = set()       # Shapes moved since the last query
+
+        umlPubSubEngine.subscribe(messageType=UmlMessageType.FRAME_MODIFIED, frameId=diagramFrame.id, listener=self._frameModifiedListener)
+        umlPubSubEngine.subscribe(messageType=UmlMessageType.SHAPE_MOVING,   frameId=diagramFrame.id, listener=self._shapeMovingListener)
+
+        diagramFrame.FindShape = self.findShape     # type: ignore
+
+    @property
+    def shapeBoundaries(self) -> Ltrb:
+        """
+        The same boundaries as the frame's shapeBoundaries without looking at every shape
+
+        Returns:  The boundaries of the UML shapes on the diagram, with the UML Shapes margins
+        """
+        extent: Optional[Bounds] = self.extent
+        if extent is None:
+            return self._diagramFrame.shapeBoundaries
+
+        return extentBoundaries(extent=extent)
+
+    @property
+    def extent(self) -> Optional[Bounds]:
+        """
+        Returns:  The bounds of all the UML shapes on the diagram;  None if there are none
+        """
+        self._synchronize()
+
+        return self._spatialIndex.extent()
+
+    def shapesAt(self, x: int, y: int) -> List[UmlShapeGenre]:
+        """
+
+        Args:
+            x:
+            y:
+
+        Returns:  The UML shapes whose bounds are within the hit allowance of the point
+        """
+        self._synchronize()
+
+        return self._indexedAt(x=x, y=y)
+
+    def shapesIn(self, rectangle: Rectangle) -> List[UmlShapeGenre]:
+        """
+
+        Args:
+            rectangle:
+
+        Returns:  The UML shapes whose bounds intersect the rectangle
+        """
+        self._synchronize()
+
+        bounds: Bounds = Bounds(left=rectangle.left, top=rectangle.top, right=rectangle.right, bottom=rectangle.bottom)
+
+        return [self._indexedShapes[key] for key in self._spatialIndex.queryRectangle(bounds=bounds)]
+
+    def filedBounds(self, umlShape: UmlShapeGenre) -> Optional[Bounds]:
+        """
+        Where the index last saw the shape;  Does not synchronize, so while a shape is
+        dragged this is where it was before the drag moved it
+
+        Args:
+            umlShape:
+
+        Returns:  The bounds;  None if the shape is not indexed
+        """
+        key: int = id(umlShape)
+        if key not in self._spatialIndex:
+            return None
+
+        return self._spatialIndex.bounds(key=key)
+
+    def shapesToDraw(self, bounds: Bounds) -> List[Shape]:
+        """
+
+        Args:
+            bounds:
+
+        Returns:  The shapes that intersect the bounds, back most first
+        """
+        self._synchronize()
+
+        shapes: List[Shape] = [self._indexedShapes[key] for key in self._spatialIndex.queryRectangle(bounds=bounds)]
+        shapes.extend(shape for shape in self._otherShapes if shapeBounds(shape=shape).intersects(bounds))
+
+        shapes.sort(key=lambda shape: self._zOrder[id(shape)])
+
+        return shapes
+
+    def findShape(self, x, y, info=None, notObject=None) -> Tuple[Shape, int]:
+        """
+        OGL's FindShape over the shapes near the point;  Same two passes, same front to back order
+
+        Args:
+            x:
+            y:
+            info:       Only shapes of this class
+            notObject:  Ignore the shapes that are descendants of this shape
+
+        Returns:  The nearest shape and its attachment;  None and 0 if there is none
+        """
+        candidates:        List[Shape] = self._candidates(x=x, y=y)
+        nearest:           float       = 100000.0
+        nearestAttachment: int         = 0
+        nearestShape:      Shape       = None       # type: ignore
+
+        for shape in candidates:
+            if isinstance(shape, LineShape) and self._eligible(shape=shape, x=x, y=y, info=info, notObject=notObject) is True:
+                attachment, distance = shape.HitTest(x, y)
+                if distance < nearest:
+                    nearest           = distance
+                    nearestShape      = shape
+                    nearestAttachment = attachment
+
+        for shape in candidates:
+            if (isinstance(shape, DivisionShape) or not isinstance(shape, CompositeShape)) and self._eligible(shape=shape, x=x, y=y, info=info, notObject=notObject) is True:
+                attachment, distance = shape.HitTest(x, y)
+                if not isinstance(shape, LineShape):
+                    if not nearestShape or not (isinstance(shape, DivisionShape) or WhollyContains(shape, nearestShape)):
+                        nearestShape      = shape
+                        nearestAttachment = attachment
+                        break
+
+        return nearestShape, nearestAttachment
+
+    def _candidates(self, x: int, y: int) -> List[Shape]:
+        """
+        Synchronize first;  It replaces the shapes that are not indexed and their order
+
+        Returns:  The shapes near the point and the shapes that are not indexed, front most first
+        """
+        self._synchronize()
+
+        candidates: List[Shape] = self._otherShapes + self._indexedAt(x=x, y=y)
+
+        candidates.sort(key=lambda shape: self._zOrder[id(shape)], reverse=True)
+
+        return candidates
+
+    def _indexedAt(self, x: int, y: int) -> List[UmlShapeGenre]:
+        return [self._indexedShapes[key] for key in self._spatialIndex.queryRectangle(bounds=_around(x=x, y=y))]
+
+    def _eligible(self, shape: Shape, x: int, y: int, info, notObject) -> bool:
+
+        return bool(shape.IsShown() and
+                    shape.HitTest(x, y) and
+                    (info is None or isinstance(shape, info)) and
+                    (not notObject or not notObject.HasDescendant(shape))
+                    )
+
+    def _synchronize(self):
+        """
+        The shapes that are not indexed and the z-order are rebuilt on every query;  Selection
+        adds and removes control points and the z-order changes without a modification.  Only
+        the UML shapes' grid is kept;  It is rebuilt when stale or when the UML shapes on the
+        diagram are not the ones indexed, else only the moved shapes are refiled
+        """
+        shapeList:   List[Shape]    = self._diagramFrame.GetDiagram().GetShapeList()
+        otherShapes: List[Shape]    = []
+        zOrder:      Dict[int, int] = {}
+        umlCount:    int            = 0
+        unindexed:   bool           = False
+        for position, shape in enumerate(shapeList):
+            zOrder[id(shape)] = position
+            if isinstance(shape, UmlShapeGenre):
+                umlCount += 1
+                if id(shape) not in self._indexedShapes:
+                    unindexed = True
+            else:
+                otherShapes.append(shape)
+
+        self._otherShapes = otherShapes
+        self._zOrder      = zOrder
+
+        if self._stale is False and unindexed is False and umlCount == len(self._indexedShapes):
+            self._refileMoved()
+        else:
+            self._reindex(shapeList=shapeList)
+
+    def _reindex(self, shapeList: List[Shape]):
+        """
+        Refile the UML shapes, add the new ones and drop the deleted ones
+
+        Args:
+            shapeList:  The diagram's shapes
+        """
+        presentKeys:  Set[int] = set()
+        refiledCount: int      = 0
+        for shape in shapeList:
+            if isinstance(shape, UmlShapeGenre):
+                key: int = id(shape)
+                presentKeys.add(key)
+                self._indexedShapes[key] = shape
+                if self._spatialIndex.update(key=key, bounds=_bounds(umlShape=shape)) is True:
+                    refiledCount += 1
+
+        for key in [key for key in self._indexedShapes if key not in presentKeys]:
+            self._spatialIndex.remove(key=key)
+            del self._indexedShapes[key]
+
+        self._stale = False
+        self._movedKeys.clear()
+
+        self.logger.debug(f'Synchronized;  {len(self._spatialIndex)} indexed, {refiledCount} refiled, {len(self._otherShapes)} not indexed')
+
+    def _refileMoved(self):
+
+        for key in self._movedKeys:
+            umlShape: Optional[UmlShapeGenre] = self._indexedShapes.get(key)
+            if umlShape is not None:
+                self._spatialIndex.update(key=key, bounds=_bounds(umlShape=umlShape))
+
+        self._movedKeys.clear()
+
+    def _frameModifiedListener(self, modifiedFrameId):
+        self._stale = True
+
+    def _shapeMovingListener(self, deltaXY):
+        """
+        The shapes are refiled on the next query;  By then they are where the drag put them
+        """
+        movedShapes: MovedShapes = cast(UmlFrame, self._diagramFrame).movedShapes
+
+        self._movedKeys.update(id(shapeMoveInfo.umlShape) for shapeMoveInfo in movedShapes.values())
+
+
+def extentBoundaries(extent: Bounds) -> Ltrb:
+    """
+
+    Args:
+        extent:  The bounds of a set of shapes
+
+    Returns:  The boundaries of the shapes with the UML Shapes margins
+    """
+    return Ltrb(left=extent.left - BOUNDARY_LEFT_MARGIN,
+                top=extent.top - BOUNDARY_TOP_MARGIN,
+                right=extent.right + BOUNDARY_RIGHT_MARGIN,
+                bottom=extent.bottom + BOUNDARY_BOTTOM_MARGIN
+                )
+
+
+def shapeBounds(shape: Shape) -> Bounds:
+    """
+    The bounds of any shape;  A UML shape's are those it is indexed by, a line's are
+    those of its control points
+
+    Args:
+        shape:
+
+    Returns:  The bounds in diagram coordinates
+    """
+    if isinstance(shape, UmlShapeGenre):
+        return _bounds(umlShape=shape)
+    if isinstance(shape, LineShape):
+        points = shape.GetLineControlPoints()
+        if len(points) > 0:
+            xs: List[int] = [round(point[0]) for point in points]
+            ys: List[int] = [round(point[1]) for point in points]
+            return Bounds(left=min(xs), top=min(ys), right=max(xs), bottom=max(ys))
+
+    width, height = shape.GetBoundingBoxMax()
+    x:     float  = shape.GetX()
+    y:     float  = shape.GetY()
+
+    return Bounds(left=round(x - width / 2), top=round(y - height / 2), right=round(x + width / 2), bottom=round(y + height / 2))
+
+
+def _bounds(umlShape: UmlShapeGenre) -> Bounds:
+
+    rectangle: Rectangle = umlShape.rectangle
+
+    return Bounds(left=round(rectangle.left), top=round(rectangle.top), right=round(rectangle.right), bottom=round(rectangle.bottom))
+
+
+def _around(x: int, y: int) -> Bounds:
+    return Bounds(left=x - HIT_ALLOWANCE, top=y - HIT_ALLOWANCE, right=x + HIT_ALLOWANCE, bottom=y + HIT_ALLOWANCE)
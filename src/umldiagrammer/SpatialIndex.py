@@ -0,0 +1,239 @@
+
+from typing import Dict
+from typing import Generic
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+
+from dataclasses import dataclass
+
+DEFAULT_CELL_SIZE: int = 256        # Pixels;  About the size of a class shape
+
+Key = TypeVar('Key', bound=Hashable)
+
+Cell = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Bounds:
+    left:   int
+    top:    int
+    right:  int
+    bottom: int
+
+    def intersects(self, other: 'Bounds') -> bool:
+        return self.left <= other.right and self.right >= other.left and self.top <= other.bottom and self.bottom >= other.top
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.left <= x <= self.right and self.top <= y <= self.bottom
+
+    def union(self, other: 'Bounds') -> 'Bounds':
+        return Bounds(left=min(self.left, other.left), top=min(self.top, other.top), right=max(self.right, other.right), bottom=max(self.bottom, other.bottom))
+
+    def inflate(self, margin: int) -> 'Bounds':
+        return Bounds(left=self.left - margin, top=self.top - margin, right=self.right + margin, bottom=self.bottom + margin)
+
+    @property
+    def area(self) -> int:
+        return (self.right - self.left) * (self.bottom - self.top)
+
+
+class SpatialIndex(Generic[Key]):
+    """
+    A uniform grid of the bounding boxes of the shapes on a diagram.  Each entry is
+    filed in every cell its bounds overlap.  Point and rectangle queries only look at
+    the cells they cover, so they cost the same for 100 or 10,000 shapes spread over
+    the diagram.
+
+    The extent of all the entries is kept as entries are added;  It is only recomputed
+    after an entry on its edge moves inward or is removed
+    """
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE):
+        """
+
+        Args:
+            cellSize:   The width and height of a grid cell in pixels
+        """
+        self._cellSize: int                  = cellSize
+        self._cells:    Dict[Cell, Set[Key]] = {}
+        self._entries:  Dict[Key, Bounds]    = {}
+
+        self._extent:      Optional[Bounds] = None
+        self._extentStale: bool             = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._entries)
+
+    def bounds(self, key: Key) -> Bounds:
+        return self._entries[key]
+
+    def insert(self, key: Key, bounds: Bounds):
+        """
+        Adds the entry;  Replaces it if the key is already indexed
+
+        Args:
+            key:
+            bounds:
+        """
+        if key in self._entries:
+            self.update(key=key, bounds=bounds)
+            return
+
+        self._entries[key] = bounds
+        for cell in self._coveredCells(bounds=bounds):
+            self._cells.setdefault(cell, set()).add(key)
+
+        self._extendExtent(bounds=bounds)
+
+    def update(self, key: Key, bounds: Bounds) -> bool:
+        """
+        Moves or resizes an entry
+
+        Args:
+            key:
+            bounds:     The new bounds
+
+        Returns:  False if the bounds did not change
+        """
+        oldBounds: Optional[Bounds] = self._entries.get(key)
+        if oldBounds is None:
+            self.insert(key=key, bounds=bounds)
+            return True
+        if oldBounds == bounds:
+            return False
+
+        oldCells: Set[Cell] = set(self._coveredCells(bounds=oldBounds))
+        newCells: Set[Cell] = set(self._coveredCells(bounds=bounds))
+
+        for cell in oldCells - newCells:
+            self._discard(cell=cell, key=key)
+        for cell in newCells - oldCells:
+            self._cells.setdefault(cell, set()).add(key)
+
+        self._entries[key] = bounds
+        self._shrinkExtent(bounds=oldBounds)
+        self._extendExtent(bounds=bounds)
+
+        return True
+
+    def remove(self, key: Key):
+        """
+        Does nothing if the key is not indexed
+
+        Args:
+            key:
+        """
+        bounds: Optional[Bounds] = self._entries.pop(key, None)
+        if bounds is None:
+            return
+
+        for cell in self._coveredCells(bounds=bounds):
+            self._discard(cell=cell, key=key)
+
+        self._shrinkExtent(bounds=bounds)
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+        self._extent      = None
+        self._extentStale = False
+
+    def queryPoint(self, x: int, y: int) -> List[Key]:
+        """
+
+        Args:
+            x:
+            y:
+
+        Returns:  The entries whose bounds contain the point
+        """
+        cell: Cell = (x // self._cellSize, y // self._cellSize)
+
+        return [key for key in self._cells.get(cell, ()) if self._entries[key].contains(x, y)]
+
+    def candidateCount(self, x: int, y: int) -> int:
+        """
+        Args:
+            x:
+            y:
+
+        Returns:  The number of entries a point query examines
+        """
+        return len(self._cells.get((x // self._cellSize, y // self._cellSize), ()))
+
+    def queryRectangle(self, bounds: Bounds) -> List[Key]:
+        """
+
+        Args:
+            bounds:
+
+        Returns:  The entries whose bounds intersect the rectangle
+        """
+        found: Set[Key] = set()
+        for cell in self._coveredCells(bounds=bounds):
+            for key in self._cells.get(cell, ()):
+                if key not in found and self._entries[key].intersects(bounds):
+                    found.add(key)
+
+        return list(found)
+
+    def extent(self) -> Optional[Bounds]:
+        """
+        Returns:  The bounds of all the entries;  None when the index is empty
+        """
+        if self._extentStale is True:
+            self._extent      = None
+            self._extentStale = False
+            for bounds in self._entries.values():
+                self._extendExtent(bounds=bounds)
+
+        return self._extent
+
+    def _coveredCells(self, bounds: Bounds) -> Iterator[Cell]:
+
+        cellSize: int = self._cellSize
+        for cellX in range(bounds.left // cellSize, bounds.right // cellSize + 1):
+            for cellY in range(bounds.top // cellSize, bounds.bottom // cellSize + 1):
+                yield cellX, cellY
+
+    def _discard(self, cell: Cell, key: Key):
+
+        keys: Optional[Set[Key]] = self._cells.get(cell)
+        if keys is not None:
+            keys.discard(key)
+            if len(keys) == 0:
+                del self._cells[cell]
+
+    def _extendExtent(self, bounds: Bounds):
+
+        if self._extentStale is True:
+            return
+        if self._extent is None:
+            self._extent = bounds
+        else:
+            extent: Bounds = self._extent
+            self._extent = Bounds(left=min(extent.left, bounds.left),
+                                  top=min(extent.top, bounds.top),
+                                  right=max(extent.right, bounds.right),
+                                  bottom=max(extent.bottom, bounds.bottom)
+                                  )
+
+    def _shrinkExtent(self, bounds: Bounds):
+        """
+        Only an entry on the edge of the extent can shrink it
+        """
+        extent: Optional[Bounds] = self._extent
+        if extent is None:
+            return
+        if bounds.left == extent.left or bounds.top == extent.top or bounds.right == extent.right or bounds.bottom == extent.bottom:
+            self._extentStale = True
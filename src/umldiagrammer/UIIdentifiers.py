@@ -17,13 +17,14 @@ class UIIdentifiers:
         ID_MENU_FILE_NEW_CLASS_DIAGRAM, ID_MENU_FILE_NEW_SEQUENCE_DIAGRAM,
         ID_MENU_FILE_NEW_USECASE_DIAGRAM,
         ID_MENU_FILE_DELETE_DIAGRAM,
+        ID_MENU_FILE_CANCEL_PROJECT_LOAD,
 
         ID_MENU_EDIT_ADD_UML_MODEL_DIAGRAM,
         ID_MENU_EDIT_ADD_UML_SHAPES_DIAGRAM,
         ID_MENU_GRAPHIC_ERROR_VIEW, ID_MENU_TEXT_ERROR_VIEW, ID_MENU_RAISE_ERROR_VIEW,
         ID_MENU_EDIT_SHOW_TOOLBAR,
 
-        ID_MENU_HELP_VERSION, ID_MENU_HELP_WEB, ID_MENU_HELP_LOGGING_CONTROL, ID_MENU_HELP_PUB_SUB_ENGINE,
+        ID_MENU_HELP_VERSION, ID_MENU_HELP_WEB, ID_MENU_HELP_LOGGING_CONTROL, ID_MENU_HELP_PUB_SUB_ENGINE, ID_MENU_HELP_PAINT_STATISTICS,
 
         ID_SD_INSTANCE, ID_SD_MESSAGE,
         ID_ARROW, ID_CLASS,
@@ -32,4 +33,4 @@ class UIIdentifiers:
         ID_TEXT,
         ID_RELATIONSHIP_NOTE, ID_RELATIONSHIP_INHERITANCE, ID_RELATIONSHIP_REALIZATION, ID_RELATIONSHIP_COMPOSITION, ID_RELATIONSHIP_AGGREGATION, ID_RELATIONSHIP_ASSOCIATION,
 
-    ] = wxNewIdRef(39)
+    ] = wxNewIdRef(41)
@@ -30,6 +30,8 @@ from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 from umldiagrammer.menuHandlers.FileMenuHandler import FileMenuHandler
 from umldiagrammer.UIIdentifiers import UIIdentifiers
 
+from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
+
 
 class UIMenuCreator:
     """
@@ -129,6 +131,7 @@ class UIMenuCreator:
         # Use stock identifier and properties
         fileMenu.Append(ID_OPEN)
         fileMenu.Append(UIIdentifiers.ID_FILE_MENU_OPEN_XML_PROJECT, 'Open XML Project', 'Open XML Project')
+        fileMenu.Append(UIIdentifiers.ID_MENU_FILE_CANCEL_PROJECT_LOAD, 'Cancel Project Open', 'Stop opening the projects being loaded')
         fileMenu.Append(ID_SAVE)
         fileMenu.Append(ID_SAVEAS)
         fileMenu.Append(UIIdentifiers.ID_MENU_FILE_PROJECT_CLOSE,  "&Close project\tCtrl-W", "Close current project")
@@ -174,4 +177,6 @@ class UIMenuCreator:
         helpMenu: Menu = self._helpMenu
 
         helpMenu.Append(UIIdentifiers.ID_MENU_HELP_PUB_SUB_ENGINE, 'Debug App Pub Sub', 'Pub Sub Engine Diagnostics')
+        helpMenu.AppendCheckItem(UIIdentifiers.ID_MENU_HELP_PAINT_STATISTICS, 'Debug Paint Statistics', 'Paint time and frame rate overlay')
+        helpMenu.Check(UIIdentifiers.ID_MENU_HELP_PAINT_STATISTICS, DiagrammerPreferences().paintStatistics)
         helpMenu.Append(ID_ABOUT, '&About', 'Uml Diagrammer Information')
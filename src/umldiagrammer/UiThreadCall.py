@@ -0,0 +1,64 @@
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from threading import Event
+
+from wx import App
+from wx import IsMainThread
+
+from wx import CallAfter as wxCallAfter
+
+WAIT_INTERVAL: float = 0.5      # Seconds;  How often a waiting worker checks that the UI is still running
+
+
+class UiThreadCall:
+    """
+    Runs a function on the UI thread and waits for it;  Lets a worker thread hand off the work
+    that creates wx objects one piece at a time, so it never gets ahead of the UI.  Called
+    on the UI thread, it simply runs the function
+    """
+    def __init__(self, function: Callable[..., Any]):
+        """
+
+        Args:
+            function:   What to run on the UI thread
+        """
+        self._function: Callable[..., Any] = function
+
+    def __call__(self, **kwargs) -> Any:
+        """
+        An exception raised by the function is raised again on the calling thread
+
+        Args:
+            **kwargs:   Passed to the function
+
+        Returns:  What the function returns
+        """
+        if IsMainThread() is True:
+            return self._function(**kwargs)
+
+        done:      Event               = Event()
+        results:   List[Any]           = []
+        exception: List[BaseException] = []
+
+        def run():
+            try:
+                results.append(self._function(**kwargs))
+            except Exception as e:
+                exception.append(e)
+            finally:
+                done.set()
+
+        wxCallAfter(run)
+
+        while done.wait(WAIT_INTERVAL) is False:
+            if App.IsMainLoopRunning() is False:
+                raise RuntimeError('The UI stopped before the call completed')
+
+        firstException: Optional[BaseException] = exception[0] if len(exception) > 0 else None
+        if firstException is not None:
+            raise firstException
+
+        return results[0]
@@ -1,9 +1,20 @@
 
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from time import perf_counter
+
+from functools import partial
+
+from xml.etree.ElementTree import Element
+
 from wx import Menu
 from wx import Window
 from wx import Simplebook
@@ -16,6 +27,7 @@ from umlshapes.UmlDiagram import UmlDiagram
 
 from umlshapes.types.UmlPosition import UmlPosition
 
+from umlshapes.frames.UmlFrame import Ltrb
 from umlshapes.frames.UmlFrame import UmlFrame
 from umlshapes.frames.DiagramFrame import FrameId
 from umlshapes.frames.DiagramFrame import DiagramFrame
@@ -43,13 +55,8 @@ from umlshapes.links.UmlNoteLink import UmlNoteLink
 from umlshapes.links.UmlInterface import UmlInterface
 from umlshapes.links.UmlAssociation import UmlAssociation
 from umlshapes.links.UmlInheritance import UmlInheritance
-from umlshapes.links.UmlComposition import UmlComposition
-from umlshapes.links.UmlAggregation import UmlAggregation
 from umlshapes.links.UmlLollipopInterface import UmlLollipopInterface
 
-from umlshapes.links.eventhandlers.UmlLinkEventHandler import UmlLinkEventHandler
-from umlshapes.links.eventhandlers.UmlNoteLinkEventHandler import UmlNoteLinkEventHandler
-from umlshapes.links.eventhandlers.UmlAssociationEventHandler import UmlAssociationEventHandler
 from umlshapes.links.eventhandlers.UmlLollipopInterfaceEventHandler import UmlLollipopInterfaceEventHandler
 
 from umlshapes.preferences.UmlPreferences import UmlPreferences
@@ -69,22 +76,54 @@ from umlio.IOTypes import UmlUseCases
 from umlio.IOTypes import UmlDocumentTitle
 from umlio.IOTypes import UmlLollipopInterfaces
 
+from umldiagrammer.BulkInsertion import BulkInsertion
+from umldiagrammer.LinkRealizers import LinkRealizer
+from umldiagrammer.LinkRealizers import linkRealizer
 from umldiagrammer.DiagrammerTypes import APPLICATION_FRAME_ID
+from umldiagrammer.DiagrammerTypes import NOTEBOOK_ID
 from umldiagrammer.DiagrammerTypes import FrameIdMap
 from umldiagrammer.DiagrammerTypes import UmlShapeGenre
+from umldiagrammer.ResidentFrames import ResidentFrames
+from umldiagrammer.ResidentFrames import estimateFrameBytes
+from umldiagrammer.ResizeWatcher import ResizeWatcher
+from umldiagrammer.ShapeLocator import ShapeLocator
+from umldiagrammer.ShapeLocator import extentBoundaries
+from umldiagrammer.SpatialIndex import Bounds
+from umldiagrammer.DamageTracker import DamageTracker
+from umldiagrammer.DetailLevel import DetailThresholds
+from umldiagrammer.DetailRenderer import DetailRenderer
+from umldiagrammer.PaintOverlay import PaintOverlay
+from umldiagrammer.ViewportCuller import ViewportCuller
+from umldiagrammer.ViewportSnapshot import ViewportSnapshot
 from umldiagrammer.UniqueNameGenerator import NameList
 from umldiagrammer.UniqueNameGenerator import createUniqueName
+from umldiagrammer.data.FrameServices import FrameServices
+from umldiagrammer.data.LazyUmlDocument import LazyUmlDocument
 from umldiagrammer.data.LollipopCreationData import LollipopCreationData
 
 from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
 
+from umldiagrammer.projectio.FragmentedUmlShapesToXml import DocumentFragments
+from umldiagrammer.projectio.FragmentedUmlShapesToXml import FragmentedUmlShapesToXml
+from umldiagrammer.projectio.UntangledXmlToUmlShapes import UntangledXmlToUmlShapes
+from umldiagrammer.projectio.XmlDiagramStream import untangleElement
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+from umldiagrammer.performance.TimingSpan import addSpanDuration
+from umldiagrammer.performance.DocumentCounts import linkCount
+from umldiagrammer.performance.DocumentCounts import shapeCount
+from umldiagrammer.performance.PaintStatistics import PaintStatistics
+
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 from umldiagrammer.pubsubengine.IAppPubSubEngine import UniqueId
 from umldiagrammer.pubsubengine.MessageType import MessageType
+from umldiagrammer.pubsubengine.DiagrammerUmlPubSubEngine import DiagrammerUmlPubSubEngine
 
 # TODO:  This might belong in umlshapes
 DiagramFrameType = ClassDiagramFrame | UseCaseDiagramFrame | SequenceDiagramFrame
 
+NO_PAGE: int = -1
+
 class UmlDiagramManager(Simplebook):
     def __init__(self, parent: Window, umlDocuments: UmlDocuments, appPubSubEngine: IAppPubSubEngine, umlPubSubEngine: IUmlPubSubEngine, editMenu: Menu):
         """
@@ -110,56 +149,141 @@ class UmlDiagramManager(Simplebook):
         self._editMenu:        Menu             = editMenu
 
         self._frameIdMap: FrameIdMap = FrameIdMap({})
+        #
+        # Frames whose cached document fragment is stale;  Along with the cache, allows
+        # saves to re-serialize only the modified diagrams
+        #
+        self._dirtyFrameIds: Set[FrameId]           = set()
+        self._fragmentCache: Dict[FrameId, Element] = {}
+        #
+        # The helpers attached to each diagram frame
+        #
+        self._frameServices: Dict[FrameId, FrameServices] = {}
+        #
+        # The documents re-read from the frames' shapes;  A frame's document is re-read only
+        # after the frame is modified.  Resizes and extension edits reach it through the same
+        # modification as the fragment cache.  The shape count at the read catches any change
+        # in membership that was not reported
+        #
+        self._documentCache:       Dict[FrameId, UmlDocument] = {}
+        self._documentShapeCounts: Dict[FrameId, int]         = {}
+        #
+        # Documents whose shapes are built the first time they are displayed
+        #
+        self._lazyDocuments: Dict[FrameId, LazyUmlDocument] = {}
+        #
+        # Documents whose diagram frame is built the first time they are displayed;  Until
+        # then they have no page and no window
+        #
+        self._placeholders: Dict[UmlDocumentTitle, UmlDocument] = {}
+        #
+        # Frames viewed least recently are torn down to placeholders to stay within the memory
+        # budget;  Only the frames unmodified since the last save
+        #
+        self._residentFrames:  ResidentFrames = ResidentFrames()
+        self._unsavedFrameIds: Set[FrameId]   = set()
 
         # doing any effect should be an application preference
         # self.SetEffect(effect=SHOW_EFFECT_SLIDE_TO_RIGHT)               # TODO:  Should be an application preference
         # self.SetEffectTimeout(timeout=200)                              # TODO:  Should be an application preference
 
         self._createDiagramPages()
-        self.SetSelection(0)
+        if len(self._placeholders) > 0:
+            firstTitle: UmlDocumentTitle = next(iter(self._placeholders))
+            self._buildDiagramFrame(documentTitle=firstTitle, announce=False)
+            self.SetSelection(0)
+            self._loadLazyDocument(pageIdx=0)
+            self._frameViewed(pageIdx=0)
 
     @property
     def umlDocuments(self) -> UmlDocuments:
         """
         The input document at UI creation may be out of date.  So recreate it by
         re-reading the shapes from the frames;  Update the internal variable and
-        return it
+        return it.  Only the frames modified since the last request are re-read;  The
+        cached documents of the others are reused with their title and scroll position
+        refreshed
 
         Returns:  The updated UML Documents
 
         """
         umlDocuments: UmlDocuments = UmlDocuments({})
-        pageCount: int = self.GetPageCount()
-
-        for pageIdx in range(0, pageCount):
-
-            umlDocument: UmlDocument = UmlDocument()
-            page:         Window = self.GetPage(pageIdx)
-            currentTitle: str    = self.GetPageText(pageIdx)
-
-            if isinstance(page, ClassDiagramFrame):
-                classDiagramFrame: ClassDiagramFrame = page
-                umlDocument.documentType = UmlDocumentType.CLASS_DOCUMENT
-                umlDocument = self._toBasicUmlDocument(umlDocument=umlDocument, documentTitle=currentTitle, diagramFrame=classDiagramFrame)
-            elif isinstance(page, UseCaseDiagramFrame):
-                useCaseDiagramFrame: UseCaseDiagramFrame = page
-                umlDocument.documentType = UmlDocumentType.USE_CASE_DOCUMENT
-                umlDocument = self._toBasicUmlDocument(umlDocument=umlDocument, documentTitle=currentTitle, diagramFrame=useCaseDiagramFrame)
-                self.logger.warning('Not yet implemented')
-            elif isinstance(page, SequenceDiagramFrame):
-                umlDocument.documentType = UmlDocumentType.SEQUENCE_DOCUMENT
-                sequenceDiagramFrame: SequenceDiagramFrame = page
-                umlDocument = self._toBasicUmlDocument(umlDocument=umlDocument, documentTitle=currentTitle, diagramFrame=sequenceDiagramFrame)
-                self.logger.warning('Not yet implemented')
+        rereadCount:  int          = 0
+
+        for documentTitle in self._umlDocuments.keys():
+
+            if documentTitle in self._placeholders:
+                umlDocuments[documentTitle] = self._placeholders[documentTitle]
+                continue
+
+            pageIdx: int     = self._pageIndex(documentTitle=documentTitle)
+            page:    Window  = self.GetPage(pageIdx)
+            frameId: FrameId = cast(UmlFrame, page).id
+
+            if frameId in self._lazyDocuments:
+                umlDocument: UmlDocument = self._lazyDocuments[frameId]
             else:
-                assert False, 'No such frame type'
+                umlDocument, reused = self._cachedUmlDocument(pageIdx=pageIdx)
+                if reused is False:
+                    rereadCount += 1
 
-            umlDocument = self._populateUmlDocument(page=page, umlDocument=umlDocument)
             umlDocuments[umlDocument.documentTitle] = umlDocument
 
+        self.logger.debug(f'Re-read {rereadCount} diagram(s) of {len(umlDocuments)}')
+
         self._umlDocuments = umlDocuments
         return self._umlDocuments
 
+    @property
+    def documentTitles(self) -> List[UmlDocumentTitle]:
+        """
+        Unlike .umlDocuments the documents are not rebuilt
+
+        Returns:  The document titles in document order
+        """
+        return list(self._umlDocuments.keys())
+
+    @property
+    def documentFragments(self) -> DocumentFragments:
+        """
+        Only the diagrams modified since the last request are re-serialized;  The cached
+        fragments of the others are reused with their title and scroll attributes refreshed.
+        Diagrams that were never displayed are written as they were read
+
+        Returns:  The serialized UML documents in document order
+        """
+        documentFragments: DocumentFragments        = DocumentFragments([])
+        serializer:        FragmentedUmlShapesToXml = FragmentedUmlShapesToXml()
+        documentCount:     int                      = len(self._umlDocuments)
+        reusedCount:       int                      = 0
+
+        for documentTitle in self._umlDocuments.keys():
+            documentFragment, reused = self._documentFragment(serializer=serializer, documentTitle=documentTitle)
+            if reused is True:
+                reusedCount += 1
+
+            documentFragments.append(documentFragment)
+
+        self.logger.info(f'Serialized {documentCount - reusedCount} diagram(s), reused {reusedCount} cached')
+
+        return documentFragments
+
+    def documentFragment(self, documentTitle: UmlDocumentTitle) -> Element:
+        """
+        A single document serialized the same way as documentFragments
+
+        Args:
+            documentTitle:
+
+        Returns:  The serialized UML document;  None if there is no such document
+        """
+        if documentTitle not in self._umlDocuments:
+            return cast(Element, None)
+
+        documentFragment, _ = self._documentFragment(serializer=FragmentedUmlShapesToXml(), documentTitle=documentTitle)
+
+        return documentFragment
+
     @property
     def frameIdMap(self) -> FrameIdMap:
         return self._frameIdMap
@@ -181,25 +305,38 @@ class UmlDiagramManager(Simplebook):
 
     def switchToDocumentDiagram(self, umlDocument: UmlDocument):
         """
-        Handles selection within SimpleBook;
+        Handles selection within SimpleBook;  The diagram frame is built the first
+        time the document is displayed
 
         Args:
             umlDocument:
         """
-        pageCount:     int = self.GetPageCount()
-        documentTitle: str = umlDocument.documentTitle
-        for idx in range(pageCount):
-            currentTitle: str = self.GetPageText(idx)
-            if documentTitle == currentTitle:
-                self.SetSelection(idx)
-                break
+        documentTitle: UmlDocumentTitle = umlDocument.documentTitle
+        if documentTitle in self._placeholders:
+            self._buildDiagramFrame(documentTitle=documentTitle)
+
+        pageIdx: int = self._pageIndex(documentTitle=documentTitle)
+        if pageIdx != NO_PAGE:
+            self._loadLazyDocument(pageIdx=pageIdx)
+            if pageIdx != self.GetSelection():
+                diagramFrame: DiagramFrameType = self.GetPage(pageIdx)
+                self._frameServices[diagramFrame.id].viewportSnapshot.switchingTo()
+            self.SetSelection(pageIdx)
+            self._frameViewed(pageIdx=pageIdx)
 
     def renameDiagram(self, oldDocumentTitle: UmlDocumentTitle, newDocumentTitle: UmlDocumentTitle):
         # This is probably not necessary
         changedDocument: UmlDocument = self._umlDocuments[oldDocumentTitle]
-        del self._umlDocuments[oldDocumentTitle]
         changedDocument.documentTitle = newDocumentTitle
-        self._umlDocuments[newDocumentTitle] = changedDocument
+        #
+        # Keep the document order;  It is the order the diagrams are saved in
+        #
+        self._umlDocuments = UmlDocuments({
+            (newDocumentTitle if documentTitle == oldDocumentTitle else documentTitle): umlDocument
+            for documentTitle, umlDocument in self._umlDocuments.items()
+        })
+        if oldDocumentTitle in self._placeholders:
+            self._placeholders[newDocumentTitle] = self._placeholders.pop(oldDocumentTitle)
 
         pageCount:     int = self.GetPageCount()
         for idx in range(pageCount):
@@ -248,18 +385,90 @@ class UmlDiagramManager(Simplebook):
             diagramName:
 
         """
+        if diagramName in self._placeholders:
+            self._placeholders.pop(UmlDocumentTitle(diagramName))
+            self._umlDocuments.pop(UmlDocumentTitle(diagramName))
+            return
+
         for pageIdx in range(self.GetPageCount()):
             currentName: str = self.GetPageText(pageIdx)
             if currentName == diagramName:
+                frameId: FrameId = cast(UmlFrame, self.GetPage(pageIdx)).id
                 self.DeletePage(pageIdx)
                 self._umlDocuments.pop(UmlDocumentTitle(diagramName))
+                self._forgetFrame(frameId=frameId)
+                self._residentFrames.remove(frameId=frameId)
                 break
 
+    def bulkInsertion(self, frameId: FrameId) -> BulkInsertion:
+        """
+        Wrap the insertion of many shapes in the returned transaction;  The frame
+        repaints once when it commits
+
+        Args:
+            frameId:    The frame the shapes are added to
+
+        Returns:  The frame's bulk insertion transaction
+        """
+        return self._frameServices[frameId].bulkInsertion
+
+    def shapeLocator(self, frameId: FrameId) -> ShapeLocator:
+        """
+
+        Args:
+            frameId:
+
+        Returns:  Finds the shapes on the frame by their position
+        """
+        return self._frameServices[frameId].shapeLocator
+
+    def shapeBoundaries(self, frameId: FrameId) -> Ltrb:
+        """
+        The shapes that a viewport culler keeps off the diagram are included
+
+        Args:
+            frameId:
+
+        Returns:  The boundaries of all the frame's UML shapes, with the UML Shapes margins
+        """
+        frameServices:  FrameServices            = self._frameServices[frameId]
+        viewportCuller: Optional[ViewportCuller] = frameServices.viewportCuller
+        if viewportCuller is None:
+            return frameServices.shapeLocator.shapeBoundaries
+
+        extent:       Optional[Bounds] = frameServices.shapeLocator.extent
+        culledExtent: Optional[Bounds] = viewportCuller.culledExtent
+        if culledExtent is None:
+            return frameServices.shapeLocator.shapeBoundaries
+        if extent is not None:
+            culledExtent = extent.union(culledExtent)
+
+        return extentBoundaries(extent=culledExtent)
+
+    def showPaintStatistics(self, shown: bool):
+        """
+        Show or hide the paint statistics overlay of every diagram frame
+
+        Args:
+            shown:
+        """
+        for frameServices in self._frameServices.values():
+            frameServices.paintOverlay.shown = shown
+
     def markFramesSaved(self):
         for frameId, frame in self._frameIdMap.items():
             umlFrame: UmlFrame = cast(UmlFrame, frame)
             umlFrame.markFrameSaved()
 
+        self._unsavedFrameIds.clear()
+
+    def releaseResidentFrames(self):
+        """
+        Call before the project is closed;  Its frames are no longer candidates for eviction
+        """
+        for frameId in self._frameIdMap.keys():
+            self._residentFrames.remove(frameId=frameId)
+
     def _createLollipopInterfaceListener(self,
                                          requestingFrame:    ClassDiagramFrame,
                                          requestingUmlClass: UmlClass,
@@ -285,6 +494,28 @@ class UmlDiagramManager(Simplebook):
 
         self._appPubSubEngine.sendMessage(MessageType.LOLLIPOP_CREATION_REQUEST, uniqueId=APPLICATION_FRAME_ID, lollipopCreationData=lollipopCreationData)
 
+    def _frameModifiedListener(self, modifiedFrameId: FrameId):
+        self._invalidateFrame(frameId=modifiedFrameId)
+
+    def _invalidateFrame(self, frameId: FrameId):
+        """
+        Both the cached fragment and the cached document are stale
+
+        Args:
+            frameId:    The modified frame
+        """
+        self._dirtyFrameIds.add(frameId)
+        self._documentCache.pop(frameId, None)
+        self._documentShapeCounts.pop(frameId, None)
+        self._unsavedFrameIds.add(frameId)
+
+    def _pasteShapesListener(self, frameId: FrameId):
+        """
+        UML Shapes refreshes the frame for every pasted shape
+        """
+        with self._frameServices[frameId].bulkInsertion:
+            self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.PASTE_SHAPES, frameId=frameId)
+
     def _updateEditMenuListener(self):
         """
         The 'selected' project has changed;
@@ -293,16 +524,288 @@ class UmlDiagramManager(Simplebook):
         umlFrame.commandProcessor.SetMenuStrings()
 
     def _createDiagramPages(self):
+        """
+        Every document starts as a placeholder;  See switchToDocumentDiagram
+        """
+        with TimingSpan('diagram.pages', documents=len(self._umlDocuments)) as pagesSpan:
+            for umlDocumentTitle, umlDocument in self._umlDocuments.items():
+                self._placeholders[umlDocumentTitle] = umlDocument
+
+            pagesSpan.set(lazyDocuments=len([umlDocument for umlDocument in self._placeholders.values() if isinstance(umlDocument, LazyUmlDocument)]))
+
+    def _buildDiagramFrame(self, documentTitle: UmlDocumentTitle, announce: bool = True):
+        """
+        Replace a placeholder with its diagram frame.  Frames built after the project is
+        opened are announced, so that the application and the notebook listen to them as
+        they do to the frames that existed at open
 
-        for umlDocumentTitle, umlDocument in self._umlDocuments.items():
+        Args:
+            documentTitle:  The placeholder's document
+            announce:       If True send REGISTER_NEW_FRAME
+        """
+        umlDocument: UmlDocument = self._placeholders.pop(documentTitle)
 
-            documentType: UmlDocumentType  = umlDocument.documentType
-            diagramFrame: DiagramFrameType = self._createDiagramFrame(documentType=documentType)
+        with TimingSpan('diagram.frame', document=documentTitle) as frameSpan:
+            frameStart:   float            = perf_counter()
+            diagramFrame: DiagramFrameType = self._createDiagramFrame(documentType=umlDocument.documentType)
+            frameSpan.addDuration(field='frameCreationMs', seconds=perf_counter() - frameStart)
 
-            self.AddPage(diagramFrame, umlDocumentTitle)
+            self.InsertPage(self._documentPageIndex(documentTitle=documentTitle), diagramFrame, documentTitle)
             self._frameIdMap[diagramFrame.id] = diagramFrame
 
-            self._layoutShapes(diagramFrame=diagramFrame, umlDocument=umlDocument)
+            if isinstance(umlDocument, LazyUmlDocument):
+                self._lazyDocuments[diagramFrame.id] = umlDocument
+            else:
+                self._layoutShapes(diagramFrame=diagramFrame, umlDocument=umlDocument)
+
+        if announce is True:
+            self._appPubSubEngine.sendMessage(MessageType.REGISTER_NEW_FRAME, uniqueId=APPLICATION_FRAME_ID, frameId=diagramFrame.id)
+            self._appPubSubEngine.sendMessage(MessageType.REGISTER_NEW_FRAME, uniqueId=NOTEBOOK_ID,          frameId=diagramFrame.id)
+
+        self.logger.info(f'Built diagram frame for {documentTitle}')
+
+    def _frameViewed(self, pageIdx: int):
+        """
+        Report the displayed frame to the resident frames;  May evict other frames
+
+        Args:
+            pageIdx:    The page index of the displayed diagram frame
+        """
+        diagramFrame: DiagramFrameType = self.GetPage(pageIdx)
+
+        self._residentFrames.viewed(frameId=diagramFrame.id,
+                                    estimatedBytes=estimateFrameBytes(shapeCount=len(diagramFrame.umlDiagram.shapes)),
+                                    evictor=self._evictFrame,
+                                    frameLimit=self._preferences.residentFrameLimit,
+                                    byteLimit=self._preferences.residentBytesLimit
+                                    )
+
+    def _evictFrame(self, frameId: str) -> bool:
+        """
+        Tear a frame down to a placeholder;  Its fragment becomes the placeholder's document
+        source.  The frame is rebuilt the next time its document is displayed.  Frames with
+        command history are not evicted, since the commands refer to the frame's shapes
+
+        Args:
+            frameId:    The least recently viewed frame
+
+        Returns:  False if the frame must stay resident
+        """
+        diagramFrame: DiagramFrameType = self._frameIdMap.get(FrameId(frameId), cast(DiagramFrameType, None))
+        if diagramFrame is None:
+            return True
+
+        pageIdx: int = self.FindPage(diagramFrame)
+        if pageIdx == self.GetSelection():
+            return False
+        if diagramFrame.id in self._unsavedFrameIds or len(diagramFrame.commandProcessor.GetCommands()) > 0:
+            return False
+
+        documentTitle: UmlDocumentTitle = UmlDocumentTitle(self.GetPageText(pageIdx))
+
+        if diagramFrame.id in self._lazyDocuments:
+            placeholder: UmlDocument = self._lazyDocuments.pop(diagramFrame.id)
+        else:
+            #
+            # Not every modification marks the frame dirty;  The shapes are the only source
+            # the placeholder can trust
+            #
+            serializer:       FragmentedUmlShapesToXml = FragmentedUmlShapesToXml()
+            umlDocument:      UmlDocument              = self._populateUmlDocument(page=diagramFrame, umlDocument=self._toBasicUmlDocument(pageIdx=pageIdx))
+            documentFragment: Element                  = serializer.serializeFragment(umlDocument=umlDocument)
+
+            lazyUmlDocument: LazyUmlDocument = LazyUmlDocument.fromDocumentSource(documentSource=documentFragment)
+            lazyUmlDocument.evicted = True
+            placeholder = lazyUmlDocument
+
+        self.DeletePage(pageIdx)
+
+        self._forgetFrame(frameId=diagramFrame.id)
+
+        self._placeholders[documentTitle] = placeholder
+        self._umlDocuments[documentTitle] = placeholder
+
+        self.logger.info(f'Evicted the diagram frame of {documentTitle}')
+
+        return True
+
+    def _forgetFrame(self, frameId: FrameId):
+        """
+        Drop everything kept for a destroyed frame;  Its listeners included
+
+        Args:
+            frameId:    The destroyed frame
+        """
+        self._frameIdMap.pop(frameId, None)
+        self._frameServices.pop(frameId, None)
+        self._fragmentCache.pop(frameId, None)
+        self._documentCache.pop(frameId, None)
+        self._documentShapeCounts.pop(frameId, None)
+        self._lazyDocuments.pop(frameId, None)
+        self._dirtyFrameIds.discard(frameId)
+        self._unsavedFrameIds.discard(frameId)
+
+        self._deleteFrameTopics(frameId=frameId)
+
+    def _deleteFrameTopics(self, frameId: FrameId):
+        """
+        Drop the listeners of a destroyed frame;  Those subscribed here, and those that the
+        application and the notebook subscribed when the frame was registered
+
+        Args:
+            frameId:    The destroyed frame
+        """
+        self._appPubSubEngine.deleteTopics(uniqueId=cast(UniqueId, frameId))
+        cast(DiagrammerUmlPubSubEngine, self._umlPubSubEngine).deleteFrameTopics(frameId=frameId)
+
+    def _documentPageIndex(self, documentTitle: UmlDocumentTitle) -> int:
+        """
+        The pages are kept in document order;  A frame rebuilt after eviction goes back where it was
+
+        Args:
+            documentTitle:  A document whose frame is being built
+
+        Returns:  The page index for the document's frame;  The number of built documents before it
+        """
+        pageIdx: int = 0
+        for title in self._umlDocuments.keys():
+            if title == documentTitle:
+                break
+            if title not in self._placeholders:
+                pageIdx += 1
+
+        return pageIdx
+
+    def _pageIndex(self, documentTitle: UmlDocumentTitle) -> int:
+        """
+
+        Args:
+            documentTitle:
+
+        Returns:  The page index of the document's diagram frame;  NO_PAGE if it is not built
+        """
+        for pageIdx in range(self.GetPageCount()):
+            if self.GetPageText(pageIdx) == documentTitle:
+                return pageIdx
+
+        return NO_PAGE
+
+    def _placeholderFragment(self, serializer: FragmentedUmlShapesToXml, umlDocument: UmlDocument) -> Element:
+        """
+        A document that was never displayed is written as it was read
+
+        Args:
+            serializer:
+            umlDocument:    A placeholder's document
+
+        Returns:  The document fragment
+        """
+        if isinstance(umlDocument, LazyUmlDocument):
+            return serializer.sourceFragment(lazyUmlDocument=umlDocument)
+
+        return serializer.serializeFragment(umlDocument=umlDocument)
+
+    def _documentFragment(self, serializer: FragmentedUmlShapesToXml, documentTitle: UmlDocumentTitle) -> Tuple[Element, bool]:
+        """
+        Only a diagram modified since it was last serialized is serialized again
+
+        Args:
+            serializer:
+            documentTitle:
+
+        Returns:  The serialized UML document and whether it was reused
+        """
+        if documentTitle in self._placeholders:
+            return self._placeholderFragment(serializer=serializer, umlDocument=self._placeholders[documentTitle]), True
+
+        pageIdx: int     = self._pageIndex(documentTitle=documentTitle)
+        page:    Window  = self.GetPage(pageIdx)
+        frameId: FrameId = cast(UmlFrame, page).id
+
+        if frameId in self._lazyDocuments:
+            return serializer.sourceFragment(lazyUmlDocument=self._lazyDocuments[frameId]), True
+
+        umlDocument: UmlDocument = self._toBasicUmlDocument(pageIdx=pageIdx)
+
+        if frameId in self._dirtyFrameIds or frameId not in self._fragmentCache:
+            umlDocument = self._populateUmlDocument(page=page, umlDocument=umlDocument)
+            documentFragment: Element = serializer.serializeFragment(umlDocument=umlDocument)
+
+            self._fragmentCache[frameId] = documentFragment
+            self._dirtyFrameIds.discard(frameId)
+
+            return documentFragment, False
+
+        return serializer.refreshFragment(documentFragment=self._fragmentCache[frameId], umlDocument=umlDocument), True
+
+    def _cachedUmlDocument(self, pageIdx: int) -> Tuple[UmlDocument, bool]:
+        """
+        Only a diagram modified since it was last read is read again.  The title and scroll
+        position are not part of the modification;  They are always copied from the frame
+
+        Args:
+            pageIdx:    The page index of the associated diagram frame
+
+        Returns:  The UML document and whether it was reused
+        """
+        basicDocument: UmlDocument = self._toBasicUmlDocument(pageIdx=pageIdx)
+        umlFrame:      UmlFrame    = cast(UmlFrame, self.GetPage(pageIdx))
+
+        shapeCount: int = self._shapeCount(umlFrame=umlFrame)
+        if self._documentShapeCounts.get(umlFrame.id, shapeCount) != shapeCount:
+            self.logger.warning(f'Unreported modification of {basicDocument.documentTitle}')
+            self._invalidateFrame(frameId=umlFrame.id)
+
+        umlDocument: UmlDocument = self._documentCache.get(umlFrame.id, cast(UmlDocument, None))
+        if umlDocument is None:
+            umlDocument = self._populateUmlDocument(page=umlFrame, umlDocument=basicDocument)
+            self._documentCache[umlFrame.id]       = umlDocument
+            self._documentShapeCounts[umlFrame.id] = shapeCount
+
+            return umlDocument, False
+
+        umlDocument.documentTitle   = basicDocument.documentTitle
+        umlDocument.scrollPositionX = basicDocument.scrollPositionX
+        umlDocument.scrollPositionY = basicDocument.scrollPositionY
+        umlDocument.pixelsPerUnitX  = basicDocument.pixelsPerUnitX
+        umlDocument.pixelsPerUnitY  = basicDocument.pixelsPerUnitY
+
+        return umlDocument, True
+
+    def _loadLazyDocument(self, pageIdx: int):
+        """
+        Build and lay out the shapes of a document the first time it is displayed.  The
+        document source stays cached as the document's fragment until the diagram is modified
+
+        Args:
+            pageIdx:    The page index of the associated diagram frame
+        """
+        if pageIdx >= self.GetPageCount():
+            return
+
+        diagramFrame: DiagramFrameType = self.GetPage(pageIdx)
+        frameId:      FrameId          = diagramFrame.id
+
+        lazyUmlDocument: LazyUmlDocument = self._lazyDocuments.pop(frameId, cast(LazyUmlDocument, None))
+        if lazyUmlDocument is not None:
+
+            with TimingSpan('diagram.load', document=lazyUmlDocument.documentTitle):
+                with TimingSpan('open.model') as modelSpan:
+                    xmlToUmlShapes: UntangledXmlToUmlShapes = UntangledXmlToUmlShapes()
+                    umlDocument:    UmlDocument             = xmlToUmlShapes.deserializeDocument(umlDiagramElement=untangleElement(lazyUmlDocument.loadSource()))
+                    modelSpan.set(shapes=shapeCount(umlDocument), links=linkCount(umlDocument))
+
+                umlDocument.documentTitle = lazyUmlDocument.documentTitle
+
+                self._layoutShapes(diagramFrame=diagramFrame, umlDocument=umlDocument)
+
+                if lazyUmlDocument.evicted is True:
+                    diagramFrame.Scroll(lazyUmlDocument.scrollPositionX, lazyUmlDocument.scrollPositionY)
+
+            self._fragmentCache[frameId] = FragmentedUmlShapesToXml().sourceFragment(lazyUmlDocument=lazyUmlDocument)
+            self._umlDocuments[umlDocument.documentTitle] = umlDocument
+
+            self.logger.info(f'Loaded diagram {umlDocument.documentTitle}')
 
     def _createDiagramFrame(self, documentType: UmlDocumentType) -> DiagramFrameType:
         """
@@ -334,6 +837,8 @@ class UmlDiagramManager(Simplebook):
 
         diagramFrame.commandProcessor.SetEditMenu(self._editMenu)
         self._appPubSubEngine.subscribe(MessageType.UPDATE_EDIT_MENU, uniqueId=cast(UniqueId, diagramFrame.id), listener=self._updateEditMenuListener)
+        self._appPubSubEngine.subscribe(MessageType.PASTE_SHAPES,     uniqueId=cast(UniqueId, diagramFrame.id), listener=self._pasteShapesListener)
+        self._umlPubSubEngine.subscribe(UmlMessageType.FRAME_MODIFIED, frameId=diagramFrame.id, listener=self._frameModifiedListener)
 
         umlDiagram: UmlDiagram = diagramFrame.umlDiagram
         if self._umlPreferences.snapToGrid is True:
@@ -342,17 +847,91 @@ class UmlDiagramManager(Simplebook):
         else:
             umlDiagram.SetSnapToGrid(snap=False)
 
+        shapeLocator:   ShapeLocator   = ShapeLocator(diagramFrame=diagramFrame, umlPubSubEngine=self._umlPubSubEngine)
+        paintOverlay:   PaintOverlay   = PaintOverlay(diagramFrame=diagramFrame, paintStatistics=PaintStatistics(), shown=self._preferences.paintStatistics)
+        detailRenderer: DetailRenderer = DetailRenderer(diagramFrame=diagramFrame,
+                                                        detailThresholds=DetailThresholds(readableTextHeight=self._preferences.readableTextHeight,
+                                                                                          minimumShapeSize=self._preferences.minimumDetailSize),
+                                                        paintStatistics=paintOverlay.paintStatistics
+                                                        )
+        self._frameServices[diagramFrame.id] = FrameServices(
+            resizeWatcher=ResizeWatcher(diagramFrame=diagramFrame),
+            bulkInsertion=BulkInsertion(diagramFrame=diagramFrame),
+            shapeLocator=shapeLocator,
+            paintOverlay=paintOverlay,
+            viewportSnapshot=ViewportSnapshot(diagramFrame=diagramFrame, paintOverlay=paintOverlay, umlPubSubEngine=self._umlPubSubEngine),
+            detailRenderer=detailRenderer,
+            damageTracker=DamageTracker(diagramFrame=diagramFrame,
+                                        shapeLocator=shapeLocator,
+                                        detailRenderer=detailRenderer,
+                                        paintOverlay=paintOverlay,
+                                        umlPubSubEngine=self._umlPubSubEngine
+                                        )
+        )
+
         return diagramFrame
 
     def _layoutShapes(self, diagramFrame: ClassDiagramFrame | UseCaseDiagramFrame, umlDocument: UmlDocument):
+        """
+        The shapes and links are added in a single bulk insertion.  The time spent wiring
+        event handlers is added up in the span as eventWiringMs
 
-        self._layoutClasses(diagramFrame, umlDocument.umlClasses)
-        self._layoutNotes(diagramFrame, umlDocument.umlNotes)
-        self._layoutTexts(diagramFrame, umlDocument.umlTexts)
-        self._layoutActors(diagramFrame, umlDocument.umlActors)
-        self._layoutUseCases(diagramFrame, umlDocument.umlUseCases)
-        self._layoutLinks(diagramFrame, umlDocument.umlLinks)
-        self._layoutLollipops(diagramFrame, umlDocument.umlLollipopInterfaces)
+        Args:
+            diagramFrame:
+            umlDocument:
+        """
+        documentShapeCount: int = shapeCount(umlDocument)
+        cullingThreshold:   int = self._preferences.viewportCullingThreshold
+
+        if cullingThreshold != 0 and documentShapeCount >= cullingThreshold:
+            self._layoutCulledShapes(diagramFrame=diagramFrame, umlDocument=umlDocument)
+            return
+
+        with TimingSpan('layout.shapes', document=umlDocument.documentTitle, shapes=documentShapeCount, links=linkCount(umlDocument)):
+            with self._frameServices[diagramFrame.id].bulkInsertion:
+                self._layoutClasses(diagramFrame, umlDocument.umlClasses)
+                self._layoutNotes(diagramFrame, umlDocument.umlNotes)
+                self._layoutTexts(diagramFrame, umlDocument.umlTexts)
+                self._layoutActors(diagramFrame, umlDocument.umlActors)
+                self._layoutUseCases(diagramFrame, umlDocument.umlUseCases)
+                self._layoutLinks(diagramFrame, umlDocument.umlLinks)
+                self._layoutLollipops(diagramFrame, umlDocument.umlLollipopInterfaces)
+
+    def _layoutCulledShapes(self, diagramFrame: ClassDiagramFrame | UseCaseDiagramFrame, umlDocument: UmlDocument):
+        """
+        The shapes are handed to a viewport culler;  Only those near the visible region are
+        laid out now
+
+        Args:
+            diagramFrame:
+            umlDocument:
+        """
+        with TimingSpan('layout.culled', document=umlDocument.documentTitle, shapes=shapeCount(umlDocument), links=linkCount(umlDocument)):
+            viewportCuller: ViewportCuller = ViewportCuller(diagramFrame=diagramFrame,
+                                                            bulkInsertion=self._frameServices[diagramFrame.id].bulkInsertion,
+                                                            shapeLayout=partial(self._layoutShape, diagramFrame=diagramFrame),
+                                                            linkLayout=partial(self._realizeLinks, diagramFrame),
+                                                            lollipopLayout=partial(self._layoutLollipops, diagramFrame),
+                                                            margin=self._preferences.viewportCullingMargin
+                                                            )
+            for umlClass in umlDocument.umlClasses:
+                viewportCuller.addShape(umlShape=umlClass, eventHandlerClass=UmlClassEventHandler)
+            for umlNote in umlDocument.umlNotes:
+                viewportCuller.addShape(umlShape=umlNote, eventHandlerClass=UmlNoteEventHandler)
+            for umlText in umlDocument.umlTexts:
+                viewportCuller.addShape(umlShape=umlText, eventHandlerClass=UmlTextEventHandler)
+            for umlActor in umlDocument.umlActors:
+                viewportCuller.addShape(umlShape=umlActor, eventHandlerClass=UmlActorEventHandler)
+            for umlUseCase in umlDocument.umlUseCases:
+                viewportCuller.addShape(umlShape=umlUseCase, eventHandlerClass=UmlUseCaseEventHandler)
+            for umlLink in umlDocument.umlLinks:
+                viewportCuller.addLink(umlLink=umlLink)
+            for umlLollipop in umlDocument.umlLollipopInterfaces:
+                viewportCuller.addLollipop(umlLollipop=cast(UmlLollipopInterface, umlLollipop))
+
+            self._frameServices[diagramFrame.id].viewportCuller = viewportCuller
+
+            viewportCuller.cull()
 
     def _layoutClasses(self, diagramFrame: ClassDiagramFrame, umlClasses: UmlClasses):
         for umlClass in umlClasses:
@@ -398,62 +977,42 @@ class UmlDiagramManager(Simplebook):
             )
 
     def _layoutLinks(self, diagramFrame: ClassDiagramFrame | UseCaseDiagramFrame, umlLinks: UmlLinks):
-        for umlLink in umlLinks:
-            umlLink.umlFrame = diagramFrame
-            if isinstance(umlLink, UmlInheritance):
-                umlInheritance: UmlInheritance = umlLink
-                subClass  = umlInheritance.subClass
-                baseClass = umlInheritance.baseClass
-                umlInheritance.umlPubSubEngine = self._umlPubSubEngine
-
-                subClass.addLink(umlLink=umlInheritance, destinationClass=baseClass)
-
-                diagramFrame.umlDiagram.AddShape(umlInheritance)
-                umlInheritance.Show(True)
-
-                umlLinkEventHandler: UmlLinkEventHandler = UmlLinkEventHandler(umlLink=umlLink, previousEventHandler=umlLink.GetEventHandler())
-                umlLinkEventHandler.umlPubSubEngine = self._umlPubSubEngine
-
-                umlLink.SetEventHandler(umlLinkEventHandler)
-
-            elif isinstance(umlLink, UmlNoteLink):
-                umlNoteLink:      UmlNoteLink = umlLink
-                sourceNote:       UmlNote     = umlNoteLink.sourceNote
-                destinationClass: UmlClass    = umlNoteLink.destinationClass
+        with TimingSpan('layout.links', links=len(umlLinks)):
+            self._realizeLinks(diagramFrame=diagramFrame, umlLinks=umlLinks)
 
-                sourceNote.addLink(umlNoteLink=umlNoteLink, umlClass=destinationClass)
-
-                diagramFrame.umlDiagram.AddShape(umlNoteLink)
-                umlNoteLink.Show(True)
-                eventHandler: UmlNoteLinkEventHandler = UmlNoteLinkEventHandler(umlNoteLink=umlNoteLink, previousEventHandler=umlNoteLink.GetEventHandler())
-                eventHandler.umlPubSubEngine = self._umlPubSubEngine
-                umlNoteLink.SetEventHandler(eventHandler)
-            elif isinstance(umlLink, (UmlAssociation, UmlComposition, UmlAggregation)):
+    def _realizeLinks(self, diagramFrame: ClassDiagramFrame | UseCaseDiagramFrame, umlLinks: List[UmlLink]):
+        """
+        Realize the links in passes, each driven by the link realizer registered for the link's type.
+        All the links are connected to their ends, then wired to their event handlers, and
+        finally added to the diagram in one pass and drawn with a single refresh.  Both ends
+        of each link must already be on the diagram
 
-                source      = umlLink.sourceShape
-                destination = umlLink.destinationShape
+        Args:
+            diagramFrame:
+            umlLinks:
+        """
+        realizations: List[Tuple[UmlLink, LinkRealizer]] = []
+        for umlLink in umlLinks:
+            realizer: LinkRealizer = linkRealizer(umlLink=umlLink)
+            if realizer is None:
+                self.logger.warning(f'No link realizer for {type(umlLink).__name__};  Not laid out')
+            else:
+                realizations.append((umlLink, realizer))
 
-                umlLink.umlPubSubEngine = self._umlPubSubEngine
+        with self._frameServices[diagramFrame.id].bulkInsertion as bulkInsertion:
+            for umlLink, realizer in realizations:
+                umlLink.umlFrame = diagramFrame
+                realizer.connect(umlLink, self._umlPubSubEngine)
 
-                source.addLink(umlLink, destination)  # type: ignore
+            for umlLink, realizer in realizations:
+                realizer.wire(umlLink, self._umlPubSubEngine)
 
-                diagramFrame.umlDiagram.AddShape(umlLink)
+            diagram: UmlDiagram = diagramFrame.umlDiagram
+            for umlLink, _ in realizations:
+                diagram.AddShape(umlLink)
                 umlLink.Show(True)
-                # noinspection PyUnusedLocal
-                umlAssociationEventHandler: UmlAssociationEventHandler = UmlAssociationEventHandler(umlAssociation=umlLink, umlPubSubEngine=self._umlPubSubEngine)
-            elif isinstance(umlLink, UmlInterface):
-                umlInterface: UmlInterface = umlLink
-                implementingClass: UmlClass = umlInterface.implementingClass
-                interfaceClass:    UmlClass = umlInterface.interfaceClass
 
-                implementingClass.addLink(umlLink=umlInterface, destinationClass=interfaceClass)
-                diagramFrame.umlDiagram.AddShape(umlInterface)
-                umlInterface.Show(True)
-                umlLinkEventHandler = UmlLinkEventHandler(umlLink=umlInterface, previousEventHandler=umlInterface.GetEventHandler())
-
-                umlLinkEventHandler.umlPubSubEngine = self._umlPubSubEngine
-
-                umlInterface.SetEventHandler(umlLinkEventHandler)
+            bulkInsertion.refresh()
 
     def _layoutLollipops(self, diagramFrame: ClassDiagramFrame, umlLollipops: UmlLollipopInterfaces):
 
@@ -481,26 +1040,42 @@ class UmlDiagramManager(Simplebook):
         umlShape.umlFrame = diagramFrame
         diagram: UmlDiagram = diagramFrame.umlDiagram
 
+        wiringStart: float = perf_counter()
         eventHandler: UmlBaseEventHandler = eventHandlerClass(previousEventHandler=umlShape.GetEventHandler())
         eventHandler.SetShape(umlShape)
         eventHandler.umlPubSubEngine = self._umlPubSubEngine
         umlShape.SetEventHandler(eventHandler)
+        addSpanDuration(field='eventWiringMs', seconds=perf_counter() - wiringStart)
 
         diagram.AddShape(umlShape)
         umlShape.Show(True)
 
-        diagramFrame.refresh()
+        self._frameServices[diagramFrame.id].bulkInsertion.refresh()
 
-    def _toBasicUmlDocument(self, umlDocument: UmlDocument, documentTitle: str, diagramFrame: DiagramFrame) -> UmlDocument:
+    def _toBasicUmlDocument(self, pageIdx: int) -> UmlDocument:
         """
-        Document type set by caller
+        The document type and meta-data;  No shapes
+
         Args:
-            umlDocument:    Partial UML Document
-            documentTitle:  The string from the tab (Not visible but maintained)
-            diagramFrame:   The associated diagram frame
+            pageIdx:    The page index of the associated diagram frame
 
-        Returns:  The updated UML Document (additional meta data)
+        Returns:  A partial UML Document
         """
+        page:          Window      = self.GetPage(pageIdx)
+        documentTitle: str         = self.GetPageText(pageIdx)
+        umlDocument:   UmlDocument = UmlDocument()
+
+        if isinstance(page, ClassDiagramFrame):
+            umlDocument.documentType = UmlDocumentType.CLASS_DOCUMENT
+        elif isinstance(page, UseCaseDiagramFrame):
+            umlDocument.documentType = UmlDocumentType.USE_CASE_DOCUMENT
+        elif isinstance(page, SequenceDiagramFrame):
+            umlDocument.documentType = UmlDocumentType.SEQUENCE_DOCUMENT
+        else:
+            assert False, 'No such frame type'
+
+        diagramFrame: DiagramFrame = page
+
         scrollPosX, scrollPosY = diagramFrame.GetViewStart()
 
         xUnit, yUnit = diagramFrame.GetScrollPixelsPerUnit()
@@ -513,11 +1088,31 @@ class UmlDiagramManager(Simplebook):
 
         return umlDocument
 
+    def _shapeCount(self, umlFrame: UmlFrame) -> int:
+        """
+        Realizing or releasing culled shapes does not change the count.  Neither does selection;
+        Control points and other selection handles are not counted
+
+        Args:
+            umlFrame:   A diagram frame
+
+        Returns:  The number of shapes in the frame's document
+        """
+        shapeCount:     int                      = sum(1 for umlShape in umlFrame.umlShapes if isinstance(umlShape, (UmlShapeGenre, UmlLink, UmlLollipopInterface)))
+        viewportCuller: Optional[ViewportCuller] = self._frameServices[umlFrame.id].viewportCuller
+        if viewportCuller is not None:
+            shapeCount += len(viewportCuller.culledShapes) + len(viewportCuller.culledLollipops) + len(viewportCuller.pendingLinks)
+
+        return shapeCount
+
     def _populateUmlDocument(self, page: Window, umlDocument: UmlDocument) -> UmlDocument:
 
         umlFrame: UmlFrame = cast(UmlFrame, page)
 
-        umlShapes: UmlShapes = umlFrame.umlShapes
+        umlShapes:      UmlShapes                = umlFrame.umlShapes
+        viewportCuller: Optional[ViewportCuller] = self._frameServices[umlFrame.id].viewportCuller
+        if viewportCuller is not None:
+            umlShapes = UmlShapes(umlShapes + viewportCuller.culledShapes + viewportCuller.culledLollipops + viewportCuller.pendingLinks)
 
         for umlShape in umlShapes:
             # noinspection PyUnusedLocal
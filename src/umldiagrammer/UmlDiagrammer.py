@@ -11,7 +11,14 @@ from os import sep as osSep
 
 from json import load as jsonLoad
 
+from wx import ID_YES
+from wx import YES_NO
+from wx import ICON_QUESTION
+
 from wx import App
+from wx import MessageDialog
+
+from wx import CallAfter as wxCallAfter
 
 from codeallybasic.ResourceManager import ResourceManager
 
@@ -26,6 +33,9 @@ from umldiagrammer.DependencyVersions import DependencyVersions
 from umldiagrammer.UmlDiagrammerAppFrame import UmlDiagrammerAppFrame
 from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
 
+from umldiagrammer.projectio.AutoSaveJournal import AutoSaveJournal
+from umldiagrammer.projectio.AutoSaveJournal import JournalEntries
+
 
 class UmlDiagrammer(App):
 
@@ -61,8 +71,6 @@ class UmlDiagrammer(App):
         self.SetTopWindow(self._wxFrame)
 
         if self._preferences.debugOpenFiles:
-            from wx import CallAfter as wxCallAfter
-
             wxCallAfter(self.MacOpenFiles, [self._preferences.debugOpenFilePath])
         else:
             if self._preferences.loadLastOpenedProject is True:
@@ -70,6 +78,8 @@ class UmlDiagrammer(App):
             else:
                 self._wxFrame.loadEmptyProject()
 
+        wxCallAfter(self._offerProjectRecovery)
+
         return True
 
     def MacOpenFiles(self, fileNames: List[str]):
@@ -83,8 +93,26 @@ class UmlDiagrammer(App):
         #
         appFrame: UmlDiagrammerAppFrame = self._wxFrame
         #
-        for fileName in fileNames:
-            appFrame.loadProjectByFilename(fileName)
+        appFrame.loadProjectsByFilename(fileNames)
+
+    def _offerProjectRecovery(self):
+        """
+        Recovery snapshots only survive when the diagrammer did not shut down cleanly
+        """
+        journal:        AutoSaveJournal = AutoSaveJournal(recoveryDirectory=self._preferences.recoveryDirectory)
+        journalEntries: JournalEntries  = journal.entries()
+
+        if len(journalEntries) > 0:
+            projectNames: str = '\n'.join([f'{entry.projectPath.stem}  ({entry.savedAt})' for entry in journalEntries])
+            message:      str = f'The UML Diagrammer did not shut down cleanly.  Recover these projects?\n\n{projectNames}'
+
+            with MessageDialog(self._wxFrame, message, 'Recover Projects', YES_NO | ICON_QUESTION) as dlg:
+                if dlg.ShowModal() == ID_YES:
+                    self.logger.info(f'Recovering {len(journalEntries)} project(s)')
+                    self._wxFrame.recoverProjects(journalEntries=journalEntries)
+                else:
+                    for journalEntry in journalEntries:
+                        journal.discard(projectPath=journalEntry.projectPath)
 
     def _setupApplicationLogging(self):
 
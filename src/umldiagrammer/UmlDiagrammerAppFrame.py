@@ -6,6 +6,8 @@ from typing import NewType
 from logging import Logger
 from logging import getLogger
 
+from pathlib import Path
+
 from wx import BOTH
 from wx import ID_FILE1
 from wx import EVT_CLOSE
@@ -36,7 +38,6 @@ from umlshapes.preferences.UmlPreferences import UmlPreferences
 
 from umlshapes.frames.DiagramFrame import FrameId
 
-from umlshapes.pubsubengine.UmlPubSubEngine import UmlPubSubEngine
 from umlshapes.pubsubengine.UmlMessageType import UmlMessageType
 from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
 
@@ -68,11 +69,16 @@ from umldiagrammer.actionsupervisor.ActionSupervisor import ActionSupervisor
 from umldiagrammer.data.LollipopCreationData import LollipopCreationData
 from umldiagrammer.data.ProjectDossier import ProjectDossier
 
+from umldiagrammer.projectio.ProjectLoader import ProjectLoader
+from umldiagrammer.projectio.ProjectSaver import ProjectSaver
+from umldiagrammer.projectio.AutoSaveJournal import JournalEntries
+
 from umldiagrammer.menuHandlers.DiagrammerFileDropTarget import DiagrammerFileDropTarget
 from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
 from umldiagrammer.preferences.ProjectHistoryDisplayType import ProjectHistoryDisplayType
 
 from umldiagrammer.pubsubengine.AppPubSubEngine import AppPubSubEngine
+from umldiagrammer.pubsubengine.DiagrammerUmlPubSubEngine import DiagrammerUmlPubSubEngine
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 from umldiagrammer.pubsubengine.MessageType import MessageType
 
@@ -119,7 +125,8 @@ class UmlDiagrammerAppFrame(SizedFrame):
         self._umlNotebook: UmlNotebook = cast(UmlNotebook, None)
 
         self._appPubSubEngine: IAppPubSubEngine = AppPubSubEngine()
-        self._umlPubSubEngine: IUmlPubSubEngine  = UmlPubSubEngine()
+        self._umlPubSubEngine: IUmlPubSubEngine  = DiagrammerUmlPubSubEngine()
+        self._projectLoader:   ProjectLoader     = ProjectLoader(appPubSubEngine=self._appPubSubEngine)
 
         uiMenuCreator: UIMenuCreator = self._createApplicationMenuBar()
 
@@ -173,8 +180,11 @@ class UmlDiagrammerAppFrame(SizedFrame):
         Closing handler overload. Save files and ask for confirmation.
         """
         # Close all files
+        self._projectLoader.shutdown()
         if self._umlNotebook is not None:
             self._umlNotebook.handleUnsavedProjects()
+            self._umlNotebook.stopAutoSave()
+        ProjectSaver(appPubSubEngine=self._appPubSubEngine).waitForPendingSaves()
         if self._overrideProgramExitPosition is False:
             # Only save position we are not in full screen
             if self._preferences.centerAppOnStartup is False:
@@ -233,25 +243,43 @@ class UmlDiagrammerAppFrame(SizedFrame):
         """
         self._loadProjectByName(fileName=fileName)
 
+    def loadProjectsByFilename(self, fileNames: List[str]):
+        """
+        Used by the App when the OS passes several file names;  They are parsed in parallel
+
+        Args:
+            fileNames:
+        """
+        self._projectLoader.loadProjects(fileNames=[Path(fileName) for fileName in fileNames])
+
     def loadLastOpenedProject(self):
 
         lastOpenFileName: str = self._projectHistory.GetHistoryFile(0)
         self._loadProjectByName(fileName=lastOpenFileName)
 
+    def recoverProjects(self, journalEntries: JournalEntries):
+        """
+        Load the crash recovery snapshots;  The projects keep their original file names
+
+        Args:
+            journalEntries:  The snapshots to restore
+        """
+        for journalEntry in journalEntries:
+            self._projectLoader.loadProject(fileName=journalEntry.journalFile, projectFileName=journalEntry.projectPath)
+
     def loadEmptyProject(self):
         umlProject: UmlProject = UmlProject.emptyProject()
         self._displayProject(umlProject=umlProject)
 
     def _loadProjectByName(self, fileName: str):
         """
-        DRY
+        DRY;  The loader reads the project in the background and posts it as an
+        OPEN_PROJECT message when it is ready
+
         Args:
             fileName:   File name to open
         """
-        umlProjectIO: UmlProjectIO = UmlProjectIO(appPubSubEngine=self._appPubSubEngine)
-        umlProject:   UmlProject   = umlProjectIO.readProject(fileToOpen=fileName)
-
-        self._displayProject(umlProject=umlProject)
+        self._projectLoader.loadProject(fileName=Path(fileName))
 
     def _createApplicationMenuBar(self):
 
@@ -334,21 +362,30 @@ class UmlDiagrammerAppFrame(SizedFrame):
         self._toolBarCreator.enableToolBar()
         self._uiMenuCreator.enableMenus()
 
+    def _loadProjectFileListener(self, fileName: Path):
+        self._projectLoader.loadProject(fileName=fileName)
+
+    def _loadProjectFilesListener(self, fileNames: List[Path]):
+        self._projectLoader.loadProjects(fileNames=fileNames)
+
+    def _cancelProjectLoadListener(self):
+        self._projectLoader.cancel()
+
     def _saveProjectListener(self):
         """
         Saves the current project
         """
-        projectDossier: ProjectDossier = self._umlNotebook.currentProject
+        projectDossier: ProjectDossier = self._umlNotebook.currentProjectDossier
         umlProject:     UmlProject     = projectDossier.umlProject
 
         umlProjectIO:   UmlProjectIO   = UmlProjectIO(appPubSubEngine=self._appPubSubEngine)
 
         if umlProject.fileName == DEFAULT_PROJECT_PATH:
-            umlProjectIO.saveAsProject(umlProject=projectDossier.umlProject)
+            umlProjectIO.saveAsProject(umlProject=projectDossier.umlProject, documentFragments=projectDossier.documentFragments)
             self._projectHistory.AddFileToHistory(filename=str(projectDossier.umlProject.fileName))
         else:
             if projectDossier.modified is True:
-                umlProjectIO.saveProject(umlProject=umlProject)
+                umlProjectIO.saveProject(umlProject=umlProject, documentFragments=projectDossier.documentFragments)
             else:
                 self.SetStatusText(text='No save needed, project not modified')
 
@@ -368,12 +405,12 @@ class UmlDiagrammerAppFrame(SizedFrame):
         """
         Save As the current project
         """
-        projectDossier: ProjectDossier = self._umlNotebook.currentProject
+        projectDossier: ProjectDossier = self._umlNotebook.currentProjectDossier
 
         assert projectDossier.umlProject is not None, 'This is a developer error'
 
         umlProjectIO: UmlProjectIO = UmlProjectIO(appPubSubEngine=self._appPubSubEngine)
-        umlProjectIO.saveAsProject(umlProject=projectDossier.umlProject)
+        umlProjectIO.saveAsProject(umlProject=projectDossier.umlProject, documentFragments=projectDossier.documentFragments)
         self._projectHistory.AddFileToHistory(filename=str(projectDossier.umlProject.fileName))
 
     def _updateApplicationStatusListener(self, message: str):
@@ -409,6 +446,10 @@ class UmlDiagrammerAppFrame(SizedFrame):
         self._appPubSubEngine.subscribe(messageType=MessageType.SAVE_NAMED_PROJECT, uniqueId=APPLICATION_FRAME_ID, listener=self._saveNamedProjectListener)
         self._appPubSubEngine.subscribe(messageType=MessageType.NO_OPEN_PROJECTS,   uniqueId=APPLICATION_FRAME_ID, listener=self._noOpenProjectsListener)
 
+        self._appPubSubEngine.subscribe(messageType=MessageType.LOAD_PROJECT_FILE,   uniqueId=APPLICATION_FRAME_ID, listener=self._loadProjectFileListener)
+        self._appPubSubEngine.subscribe(messageType=MessageType.LOAD_PROJECT_FILES,  uniqueId=APPLICATION_FRAME_ID, listener=self._loadProjectFilesListener)
+        self._appPubSubEngine.subscribe(messageType=MessageType.CANCEL_PROJECT_LOAD, uniqueId=APPLICATION_FRAME_ID, listener=self._cancelProjectLoadListener)
+
     def _getFrameStyle(self) -> int:
         """
         wxPython 4.2.4 update:  using FRAME_TOOL_WINDOW causes the title to be above the toolbar
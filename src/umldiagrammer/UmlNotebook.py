@@ -21,6 +21,7 @@ from wx import MessageDialog
 from wx import Size
 
 from wx import CallLater
+from wx import CallAfter as wxCallAfter
 
 from wx.lib.sized_controls import SizedPanel
 
@@ -58,6 +59,8 @@ from umldiagrammer.DiagrammerTypes import EDIT_MENU_HANDLER_ID
 from umldiagrammer.DiagrammerTypes import UmlLinkGenre
 from umldiagrammer.DiagrammerTypes import UmlShapeGenre
 
+from umldiagrammer.BulkInsertion import BulkInsertion
+from umldiagrammer.LinkGeometry import LinkGeometry
 from umldiagrammer.UmlProjectIO import UmlProjectIO
 
 from umldiagrammer.UmlProjectPanel import UmlProjectPanel
@@ -65,6 +68,8 @@ from umldiagrammer.data.ProjectDossier import ProjectDossier
 from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
 from umldiagrammer.preferences.ProjectTabPosition import ProjectTabPosition
 
+from umldiagrammer.projectio.AutoSaver import AutoSaver
+
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 from umldiagrammer.pubsubengine.MessageType import MessageType
 
@@ -104,6 +109,8 @@ class UmlNotebook(Notebook):
         style: int = ProjectTabPosition.toWxNotebookPosition(self._preferences.projectTabPosition)
         super().__init__(sizedPanel, style=style)
 
+        self._autoSaver: AutoSaver = AutoSaver(owner=self)
+
         # noinspection PyUnresolvedReferences
         self.SetSizerProps(expand=True, proportion=1)
 
@@ -127,6 +134,22 @@ class UmlNotebook(Notebook):
                 modified=projectPanel.umlProjectModified
             )
 
+    @property
+    def currentProjectDossier(self) -> ProjectDossier:
+        """
+        Only for saving;  The diagrams modified since the last save are re-serialized
+
+        Returns:  The current project with its serialized documents
+        """
+        from umlio.IOTypes import UmlProject
+
+        projectPanel: Optional[UmlProjectPanel] = cast(UmlProjectPanel, self.GetCurrentPage())
+
+        if projectPanel is None:
+            return ProjectDossier(umlProject=cast(UmlProject, None), modified=False)
+        else:
+            return projectPanel.projectDossier
+
     def closeDefaultProject(self) -> bool:
         """
         Will close it if it is open
@@ -169,6 +192,12 @@ class UmlNotebook(Notebook):
             if projectPanel.umlProjectModified is True:
                 self._closeProject(projectPanel=projectPanel)
 
+    def stopAutoSave(self):
+        """
+        Call after the unsaved projects are handled;  Waits for pending recovery writes
+        """
+        self._autoSaver.stop()
+
     def _onNewProjectDisplayed(self, _event: BookCtrlEvent):
         """
         This fires when we add new projects.  Thus, we wind up sending the ACTIVE_DOCUMENT_CHANGED
@@ -197,25 +226,41 @@ class UmlNotebook(Notebook):
         """
         self._indicateCurrentProjectModified()
 
-    def _currentProjectSavedListener(self, projectPath: Path):
+    def _currentProjectSavedListener(self, projectPath: Path, snapshotTime: int):
         """
-        Will only be issued when the developer is on the current project
+        Saves complete in the background;  So the saved project may no longer be the
+        current one or may even have been closed.  If the developer kept editing after the save
+        snapshot was taken the project stays modified
 
         Args:
-            projectPath:
-
+            projectPath:    The file that was written
+            snapshotTime:   When the save snapshot was taken
         """
-        idx:              int = self.GetSelection()
-        projectTitle:     str = self._currentProjectTitle
-        modifiedTitleStr: str = projectTitle.strip(MODIFIED_INDICATOR)
+        for idx in range(self.GetPageCount()):
+            projectPanel: UmlProjectPanel = cast(UmlProjectPanel, self.GetPage(idx))
+            if projectPanel.umlProject.fileName == projectPath:
 
-        assert projectPath.stem == modifiedTitleStr, 'I guess my assumption was wrong'
+                projectPanel.savedSnapshot(snapshotTime=snapshotTime)
+                if projectPanel.umlProjectModified is False:
+                    self._autoSaver.discard(projectPanel=projectPanel)
+                    projectTitle:     str = self.GetPageText(idx)
+                    modifiedTitleStr: str = projectTitle.strip(MODIFIED_INDICATOR)
 
-        self.logger.debug(f'{modifiedTitleStr}')
-        self.SetPageText(idx, modifiedTitleStr)
+                    self.logger.debug(f'{modifiedTitleStr}')
+                    self.SetPageText(idx, modifiedTitleStr)
+                break
+        else:
+            self.logger.info(f'Saved project is no longer open: {projectPath}')
 
-        projectPanel: UmlProjectPanel = cast(UmlProjectPanel, self.GetCurrentPage())
-        projectPanel.umlProjectModified = False
+    def _currentProjectRecoveredListener(self, journalFile: Path):
+        """
+        The recovered project differs from the one on disk
+
+        Args:
+            journalFile:  The recovery snapshot it was restored from
+        """
+        self._autoSaver.recovered(projectPanel=self._currentProjectPanel, journalFile=journalFile)
+        self._indicateCurrentProjectModified()
 
     def _projectRenamedListener(self, oldName: str, newName: str):
         """
@@ -238,11 +283,22 @@ class UmlNotebook(Notebook):
         self._umlPubSubEngine.subscribe(messageType=UmlMessageType.FRAME_MODIFIED, frameId=frameId, listener=self._frameModifiedListener)
         self._indicateCurrentProjectModified()
 
+    def _registerNewFrameListener(self, frameId: FrameId):
+        """
+        A diagram frame was built the first time its document was displayed
+        """
+        self._umlPubSubEngine.subscribe(messageType=UmlMessageType.FRAME_MODIFIED, frameId=frameId, listener=self._frameModifiedListener)
+
     def _documentNameChangedListener(self, projectName: str):
-        currentProjectName: str = self.currentProject.umlProject.fileName.stem
+        currentProjectName: str = str(self._currentProjectPanel)
         assert currentProjectName == projectName, 'My assumption is wrong'
         self._indicateCurrentProjectModified()
 
+    def _paintStatisticsChangedListener(self, shown: bool):
+        for idx in range(self.GetPageCount()):
+            projectPanel: UmlProjectPanel = cast(UmlProjectPanel, self.GetPage(idx))
+            projectPanel.showPaintStatistics(shown=shown)
+
     def _closeProjectListener(self):
         projectPanel: UmlProjectPanel = cast(UmlProjectPanel, self.GetCurrentPage())
 
@@ -287,7 +343,7 @@ class UmlNotebook(Notebook):
         idx:              int = self.GetSelection()
         projectTitle:     str = self.GetPageText(idx)
         if projectTitle.endswith(MODIFIED_INDICATOR):
-            pass
+            self._currentProjectPanel.noteModification()
         else:
             modifiedTitleStr: str = f'{projectTitle}{MODIFIED_INDICATOR}'
 
@@ -297,6 +353,8 @@ class UmlNotebook(Notebook):
             projectPanel: UmlProjectPanel = self._currentProjectPanel
             projectPanel.umlProjectModified = True
 
+        self._autoSaver.projectModified(projectPanel=self._currentProjectPanel)
+
     def _closeProject(self, projectPanel: UmlProjectPanel):
         """
         Close the project named in the project panel
@@ -318,8 +376,9 @@ class UmlNotebook(Notebook):
             askDialog: MessageDialog = MessageDialog(parent=None, message=message, caption='Please confirm', style=YES_NO | ICON_QUESTION)
             ans: int = askDialog.ShowModal()
             if ans == ID_YES:
-                umlProjectIO: UmlProjectIO = UmlProjectIO(appPubSubEngine=self._appPubSubEngine)
-                umlProjectIO.saveProject(umlProject=projectPanel.umlProject)
+                projectDossier: ProjectDossier = projectPanel.projectDossier
+                umlProjectIO:   UmlProjectIO   = UmlProjectIO(appPubSubEngine=self._appPubSubEngine)
+                umlProjectIO.saveProject(umlProject=projectDossier.umlProject, documentFragments=projectDossier.documentFragments)
 
         projectName: str = str(projectPanel.umlProject.fileName)
         #
@@ -334,6 +393,8 @@ class UmlNotebook(Notebook):
         # If we found it close it
         #
         if pageIdx != -1:
+            self._autoSaver.discard(projectPanel=projectPanel)
+            projectPanel.releaseResidentFrames()
             self.DeletePage(pageIdx)
             self.logger.info(f'Project closed: {projectName}')
             if self.GetPageCount() == 0:
@@ -397,16 +458,36 @@ class UmlNotebook(Notebook):
         return documentType
 
     def _addShapeListener(self, umlShape: UmlShapeGenre | UmlLinkGenre):
+        """
+        Extensions add shapes in floods;  The first shape of a flood opens a bulk insertion
+        that commits once the extension returns to the event loop.  UML Shapes does not
+        report the additions as a modification;  The first shape of a flood does
+
+        Args:
+            umlShape:
+        """
         from umlshapes.frames.UmlFrame import UmlFrame
 
-        projectPanel: UmlProjectPanel = self._currentProjectPanel
-        currentFrame: UmlFrame        = projectPanel.currentFrame
+        projectPanel:  UmlProjectPanel = self._currentProjectPanel
+        currentFrame:  UmlFrame        = projectPanel.currentFrame
+        bulkInsertion: BulkInsertion   = projectPanel.currentBulkInsertion
+
+        if bulkInsertion.active is False:
+            bulkInsertion.begin()
+            wxCallAfter(bulkInsertion.commit)
+            currentFrame.frameModified = True
 
         currentFrame.umlDiagram.AddShape(umlShape)
         umlShape.Show(True)
 
     def _extensionModifiedProjectListener(self):
-        self._indicateCurrentProjectModified()
+        """
+        The extension changed the current diagram behind UML Shapes' back;  Mark it
+        modified so that it is serialized again.  That also marks the project modified
+        """
+        projectPanel: UmlProjectPanel = self._currentProjectPanel
+
+        projectPanel.currentFrame.frameModified = True
 
     def _refreshFrameListener(self):
         from umlshapes.frames.UmlFrame import UmlFrame
@@ -418,44 +499,20 @@ class UmlNotebook(Notebook):
 
     def _wiggleShapesListener(self):
         """
-        This is a hack work around to simulate moving the shapes so
-        that the links are visible.
-        I tried refresh, redraw, and .DrawLinks;  None of it worked
-
-
-        So much of a hack that it depends on the umlshapes diagram option
-        .snapToGrid to be True
+        An extension changed the diagram;  Make the links meet their shapes again.  The
+        recompute marks the frame modified when links moved;  Otherwise, mark it here
         """
-        from umlshapes.frames.UmlFrame import UmlFrame
-        from umlshapes.ShapeTypes import UmlShapes
-        from umlshapes.types.UmlPosition import UmlPosition
-        from umlshapes.UmlBaseEventHandler import UmlBaseEventHandler
-
         projectPanel: UmlProjectPanel = self._currentProjectPanel
-        currentFrame: UmlFrame        = projectPanel.currentFrame
-
-        umlShapes: UmlShapes = currentFrame.umlShapes
-
-        for shape in umlShapes:
-
-            if isinstance(shape, UmlShapeGenre) is True:
+        linkGeometry: LinkGeometry    = LinkGeometry(umlFrame=projectPanel.currentFrame, bulkInsertion=projectPanel.currentBulkInsertion)
 
-                umlShape: UmlShapeGenre = cast(UmlShapeGenre, shape)
-
-                oldPosition: UmlPosition = umlShape.position
-                newPosition: UmlPosition = UmlPosition(x=oldPosition.x + 10, y=oldPosition.y + 10)
-
-                eventHandler: UmlBaseEventHandler = umlShape.GetEventHandler()
-
-                eventHandler.OnDragLeft(draw=True, x=newPosition.x, y=newPosition.y)
-                eventHandler.OnDragLeft(draw=True, x=oldPosition.x, y=oldPosition.y)
+        if linkGeometry.recompute() == 0:
+            projectPanel.currentFrame.frameModified = True
 
     def _getShapBoundariesListener(self, callback: ObjectBoundaryCallback):
 
         projectPanel: UmlProjectPanel = self._currentProjectPanel
-        currentFrame: UmlFrame        = projectPanel.currentFrame
 
-        ltrb:   Ltrb       = currentFrame.shapeBoundaries
+        ltrb:   Ltrb            = projectPanel.currentShapeBoundaries
         bounds: ShapeBoundaries = ShapeBoundaries(
             minX=ltrb.left,
             minY=ltrb.top,
@@ -523,6 +580,10 @@ class UmlNotebook(Notebook):
                                         uniqueId=NOTEBOOK_ID,
                                         listener=self._currentProjectSavedListener
                                         )
+        self._appPubSubEngine.subscribe(messageType=MessageType.CURRENT_PROJECT_RECOVERED,
+                                        uniqueId=NOTEBOOK_ID,
+                                        listener=self._currentProjectRecoveredListener
+                                        )
         self._appPubSubEngine.subscribe(messageType=MessageType.PROJECT_RENAMED,
                                         uniqueId=NOTEBOOK_ID,
                                         listener=self._projectRenamedListener
@@ -548,6 +609,12 @@ class UmlNotebook(Notebook):
         self._appPubSubEngine.subscribe(messageType=MessageType.GET_OPEN_PROJECTS,
                                         uniqueId=NOTEBOOK_ID,
                                         listener=self._getOpenProjectListener)
+        self._appPubSubEngine.subscribe(messageType=MessageType.REGISTER_NEW_FRAME,
+                                        uniqueId=NOTEBOOK_ID,
+                                        listener=self._registerNewFrameListener)
+        self._appPubSubEngine.subscribe(messageType=MessageType.PAINT_STATISTICS_CHANGED,
+                                        uniqueId=NOTEBOOK_ID,
+                                        listener=self._paintStatisticsChangedListener)
 
     def _subscribeToExtensionsMessages(self):
         """
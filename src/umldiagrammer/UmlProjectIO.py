@@ -1,12 +1,24 @@
 
+from typing import Dict
 from typing import List
 from typing import cast
+from typing import Optional
+from typing import Callable
 
 from logging import Logger
 from logging import getLogger
 
+from dataclasses import field
+from dataclasses import dataclass
+
+from functools import partial
+
 from pathlib import Path
 
+from xml.etree.ElementTree import Element as XmlElement
+
+from untangle import Element
+
 from wx import OK
 from wx import FD_SAVE
 from wx import ICON_ERROR
@@ -16,21 +28,73 @@ from wx import FileSelector
 from wx import MessageDialog
 
 from umlio.IOTypes import UmlProject
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import XML_SUFFIX
 from umlio.IOTypes import PROJECT_SUFFIX
 from umlio.IOTypes import DEFAULT_PROJECT_PATH
 
-from umlio.Reader import Reader
-from umlio.Writer import Writer
+from umlio.XMLConstants import XmlConstants
 
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umldiagrammer.UiThreadCall import UiThreadCall
 from umldiagrammer.DiagrammerTypes import NOTEBOOK_ID
 
+from umldiagrammer.data.LazyUmlDocument import LazyUmlDocument
+
 from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
 
+from umldiagrammer.projectio.ImportMeter import ImportMeter
+from umldiagrammer.projectio.ImportMeter import ImportStatistics
+from umldiagrammer.projectio.ProjectSaver import ProjectSaver
+from umldiagrammer.projectio.SavedContent import SavedContent
+from umldiagrammer.projectio.XmlDiagramStream import XmlDiagramStream
+from umldiagrammer.projectio.XmlDiagramStream import untangleElement
+from umldiagrammer.projectio.ParsedProjectCache import ParsedProjectCache
+from umldiagrammer.projectio.ParsedProjectCache import ProjectDocuments
+from umldiagrammer.projectio.ParsedProjectCache import ProjectFingerprint
+from umldiagrammer.projectio.ProjectParser import ReadProject
+from umldiagrammer.projectio.ProjectParser import untangleProject
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+from umldiagrammer.projectio.ChunkedProjectContainer import ChunkedProjectReader
+from umldiagrammer.projectio.ChunkedProjectContainer import readProjectDocuments
+from umldiagrammer.projectio.UntangledXmlToUmlShapes import UntangledXmlToUmlShapes
+from umldiagrammer.projectio.FragmentedUmlShapesToXml import DocumentFragments
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+from umldiagrammer.performance.DocumentCounts import projectLinkCount
+from umldiagrammer.performance.DocumentCounts import projectShapeCount
+
 from umldiagrammer.pubsubengine.MessageType import MessageType
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 
 NO_SAVE_AS_FILENAME = cast(str, None)
 
+#
+# Called with a status message and a completion percentage;  Callers may raise
+# from the callback to abandon a read in progress
+#
+ProgressCallback = Callable[[str, int], None]
+
+
+def noProgress(message: str, percent: int):
+    pass
+
+
+@dataclass
+class ProjectSource:
+    """
+    A project as read on a worker thread.  Shapes create wx objects, so none are built
+    yet;  Either the project is untangled, or its documents are all LazyUmlDocuments.
+    UmlProjectIO.buildProject builds the shapes on the UI thread.  A streamed project
+    is the exception;  Its documents were built on the UI thread as they were read
+    """
+    fileName:       Path
+    root:           Optional[Element]    = None
+    umlProject:     Optional[UmlProject] = None
+    buildDocuments: bool                 = False    # Build the lazy documents' shapes now
+    readStatistics: ImportStatistics     = field(default_factory=ImportStatistics)
+
 
 class UmlProjectIO:
     """
@@ -45,51 +109,168 @@ class UmlProjectIO:
 
         self._appPubSubEngine: IAppPubSubEngine = appPubSubEngine
 
-        self.logger:       Logger                = getLogger(__name__)
-        self._preferences: DiagrammerPreferences = DiagrammerPreferences()
+        self.logger:        Logger                = getLogger(__name__)
+        self._preferences:  DiagrammerPreferences = DiagrammerPreferences()
+        self._projectSaver: ProjectSaver          = ProjectSaver(appPubSubEngine=appPubSubEngine)
 
         self._saveAsFileName:   str  = NO_SAVE_AS_FILENAME
         self._saveAsFileIsOpen: bool = False
 
-    def readProject(self, fileToOpen: str) -> UmlProject:
+    def readProject(self, fileToOpen: str, progressCallback: ProgressCallback = noProgress) -> ProjectSource:
+        """
+        Safe to call from a worker thread;  Progress is reported via the callback
+        and not via the application pub/sub engine.  Only the file is read;  No shapes
+        are built.  When diagrams are loaded lazily only the document index is built.
+        Otherwise, XML files at least as large as the streaming import threshold are
+        read a diagram at a time, and each diagram's shapes are built on the UI thread
+        before the next diagram is read
+
+        Args:
+            fileToOpen:         A PROJECT_SUFFIX, XML_SUFFIX or CHUNKED_PROJECT_SUFFIX file
+            progressCallback:   Receives the progress of the read
+
+        Returns:  What buildProject needs
         """
+        fileName: Path = Path(fileToOpen)
+        suffix:   str  = fileName.suffix
+
+        if suffix not in (PROJECT_SUFFIX, XML_SUFFIX, CHUNKED_PROJECT_SUFFIX):
+            raise UnsupportedFileTypeException(message=f'Only {PROJECT_SUFFIX}, {CHUNKED_PROJECT_SUFFIX} or {XML_SUFFIX} file types supported')
+
+        if self._preferences.lazyDiagramLoading is True:
+            importMode: str = 'indexed'
+        elif suffix == XML_SUFFIX and fileName.stat().st_size >= self._preferences.streamingImportThreshold:
+            importMode = 'streamed'
+        else:
+            importMode = 'parsed'
+
+        #
+        # XML files are saved under a new name
+        #
+        savedContent: Optional[SavedContent] = None
+        contentHash:  Optional[str]          = None
+        if suffix != XML_SUFFIX:
+            savedContent = SavedContent.fromProjectFile(fileName=fileName)
+            contentHash  = savedContent.contentHash
+
+        with TimingSpan('open', project=fileName.name, mode=importMode, fileBytes=fileName.stat().st_size) as openSpan:
+            with ImportMeter(traceMemory=self._preferences.traceImportMemory) as importMeter:
+                if importMode == 'indexed' and suffix == CHUNKED_PROJECT_SUFFIX:
+                    projectSource: ProjectSource = ProjectSource(fileName=fileName, umlProject=self._indexChunkedProject(fileName=fileName, progressCallback=progressCallback))
+                elif importMode == 'indexed':
+                    projectSource = ProjectSource(fileName=fileName, umlProject=self._indexProject(fileName=fileName, progressCallback=progressCallback, contentHash=contentHash))
+                elif importMode == 'streamed':
+                    projectSource = ProjectSource(fileName=fileName, umlProject=self._streamProject(fileName=fileName, progressCallback=progressCallback))
+                else:
+                    projectSource = ProjectSource(fileName=fileName, root=self._parseProject(fileName=fileName, progressCallback=progressCallback, contentHash=contentHash))
+
+            if projectSource.umlProject is not None:
+                openSpan.set(documents=len(projectSource.umlProject.umlDocuments))
+
+        projectSource.readStatistics = importMeter.statistics
+        self.logger.info(f'Project Read - {fileToOpen=} {importMode} in {importMeter.statistics}')
+
+        if savedContent is not None:
+            self._projectSaver.recordSavedContent(fileName=fileName, savedContent=savedContent)
+
+        return projectSource
+
+    def buildProject(self, projectSource: ProjectSource) -> UmlProject:
+        """
+        Call on the UI thread;  Builds the shapes of a project read by readProject.  Lazy
+        documents are left alone unless the source says to build them.  The build is
+        metered like the read
 
         Args:
-            fileToOpen:
+            projectSource:  What readProject read
 
         Returns:  The UML Project
         """
-        reader:     Reader    = Reader()
-        umlProject: UmlProject = reader.readProjectFile(fileName=Path(fileToOpen))
+        with ImportMeter(traceMemory=self._preferences.traceImportMemory) as importMeter:
+            umlProject: UmlProject = self._buildProject(projectSource=projectSource)
+
+        self.logger.info(f'Project Built - {projectSource.fileName} read in {projectSource.readStatistics};  built in {importMeter.statistics}')
+
+        return umlProject
+
+    def _buildProject(self, projectSource: ProjectSource) -> UmlProject:
+
+        if projectSource.root is not None:
+            return self._deserializeRoot(root=projectSource.root, fileName=projectSource.fileName)
+
+        umlProject: UmlProject = cast(UmlProject, projectSource.umlProject)
+        if projectSource.buildDocuments is True:
+            with TimingSpan('open.model', project=projectSource.fileName.name) as modelSpan:
+                xmlToUmlShapes: UntangledXmlToUmlShapes = UntangledXmlToUmlShapes()
+                for documentTitle, lazyUmlDocument in list(umlProject.umlDocuments.items()):
+                    #
+                    # The lazy document, and with it the diagram's XML, is let go as soon as its shapes are built
+                    #
+                    documentSource: Element     = untangleElement(xmlElement=cast(LazyUmlDocument, lazyUmlDocument).loadSource())
+                    umlDocument:    UmlDocument = xmlToUmlShapes.deserializeDocument(umlDiagramElement=documentSource)
 
-        self.logger.info(f'Project Opened - {fileToOpen=}')
+                    umlProject.umlDocuments[documentTitle] = umlDocument
+
+                modelSpan.set(shapes=projectShapeCount(umlProject), links=projectLinkCount(umlProject))
 
         return umlProject
 
-    def saveProject(self, umlProject: UmlProject):
+    def indexReadProject(self, readProject: ReadProject) -> ProjectSource:
+        """
+        Safe to call from a worker thread;  No shapes are built.  The documents are
+        LazyUmlDocuments.  Unless diagrams are loaded lazily, buildProject builds them all
+
+        Args:
+            readProject:  A project file read by ProjectParser;  Typically in a worker process
+
+        Returns:  What buildProject needs
+        """
+        fileName: Path = readProject.fileName
+
+        with TimingSpan('open', project=fileName.name, mode='batch', readMs=round(readProject.elapsedSeconds * 1000.0, 3)) as openSpan:
+            projectAttributes, documentElements = readProject.projectDocuments()
+
+            umlProject: UmlProject = self._indexProjectDocuments(fileName=fileName, projectAttributes=projectAttributes, documentElements=documentElements)
+            openSpan.set(documents=len(umlProject.umlDocuments))
+
+        if readProject.savedContent is not None:
+            self._projectSaver.recordSavedContent(fileName=fileName, savedContent=readProject.savedContent)
+
+        self.logger.info(f'Project Read - {fileName}')
+
+        return ProjectSource(fileName=fileName,
+                             umlProject=umlProject,
+                             buildDocuments=self._preferences.lazyDiagramLoading is False,
+                             readStatistics=ImportStatistics(elapsedSeconds=readProject.elapsedSeconds)
+                             )
+
+    def saveProject(self, umlProject: UmlProject, documentFragments: Optional[DocumentFragments] = None):
+        """
+        The write completes in the background;  CURRENT_PROJECT_SAVED is sent
+        when the file is safely on disk
+
+        Args:
+            umlProject:
+            documentFragments:  The serialized UML documents;  When not provided the
+                                project UML documents are serialized
+        """
 
         fileName: Path = umlProject.fileName
         if fileName == DEFAULT_PROJECT_PATH:
-            self.saveAsProject(umlProject=umlProject)
+            self.saveAsProject(umlProject=umlProject, documentFragments=documentFragments)
         else:
-            if fileName.suffix != PROJECT_SUFFIX:
+            if fileName.suffix not in (PROJECT_SUFFIX, CHUNKED_PROJECT_SUFFIX):
                 if self._preferences.saveOnlyWritesCompressed is True:
                     newFilename: Path = Path(fileName.with_suffix(PROJECT_SUFFIX))
                     umlProject.fileName = newFilename
                 else:
                     assert False, 'Write as XML not yet supported'
 
-            writer: Writer = Writer()
-            writer.writeFile(umlProject=umlProject, fileName=umlProject.fileName)
+            self._projectSaver.saveProject(umlProject=umlProject, fileName=umlProject.fileName, documentFragments=documentFragments)
 
-            self.logger.info(f'Project Saved - fileName: {str(fileName)}')
+            self.logger.info(f'Project save queued - fileName: {str(fileName)}')
 
-            self._appPubSubEngine.sendMessage(messageType=MessageType.CURRENT_PROJECT_SAVED,
-                                              uniqueId=NOTEBOOK_ID,
-                                              projectPath=umlProject.fileName
-                                              )
-
-    def saveAsProject(self, umlProject: UmlProject) -> str:
+    def saveAsProject(self, umlProject: UmlProject, documentFragments: Optional[DocumentFragments] = None) -> str:
         """
 
         May return a blank file name if the user cancelled out of the file selection or
@@ -97,12 +278,16 @@ class UmlProjectIO:
 
         Args:
             umlProject:
+            documentFragments:  The serialized UML documents
 
         Returns:   The name of the newly created project
         """
 
         defaultDir:        str = str(self._preferences.diagramsDirectory)
-        wildCard:          str = f'UML Diagrammer File (*{PROJECT_SUFFIX})|*{PROJECT_SUFFIX}'
+        wildCard:          str = (
+            f'UML Diagrammer File (*{PROJECT_SUFFIX})|*{PROJECT_SUFFIX}|'
+            f'UML Diagrammer Chunked File (*{CHUNKED_PROJECT_SUFFIX})|*{CHUNKED_PROJECT_SUFFIX}'
+        )
         defaultFile:       str = umlProject.fileName.name
         defaultExtension:  str  = PROJECT_SUFFIX.lstrip('.')
 
@@ -122,17 +307,18 @@ class UmlProjectIO:
                     dlg.ShowModal()
                 specifiedFileName = ''
             else:
-                self._saveAsProject(umlProject, specifiedFileName)
+                self._saveAsProject(umlProject, specifiedFileName, documentFragments)
 
         return specifiedFileName
 
-    def _saveAsProject(self, umlProject: UmlProject, specifiedFileName: str):
+    def _saveAsProject(self, umlProject: UmlProject, specifiedFileName: str, documentFragments: Optional[DocumentFragments]):
         """
         Actually do the file save as
 
         Args:
             umlProject:
             specifiedFileName:
+            documentFragments:
         """
         oldName: Path = umlProject.fileName
         newName: Path = Path(specifiedFileName)
@@ -143,14 +329,185 @@ class UmlProjectIO:
                                           oldName=oldName.stem,
                                           newName=newName.stem
                                           )
-        writer: Writer = Writer()
-        writer.writeFile(umlProject=umlProject, fileName=umlProject.fileName)
-        self._appPubSubEngine.sendMessage(messageType=MessageType.CURRENT_PROJECT_SAVED,
-                                          uniqueId=NOTEBOOK_ID,
-                                          projectPath=umlProject.fileName
-                                          )
+        self._projectSaver.saveProject(umlProject=umlProject, fileName=umlProject.fileName, documentFragments=documentFragments)
+
         self.logger.info(f'Project {oldName} saved as {newName}')
 
+    def _parseProject(self, fileName: Path, progressCallback: ProgressCallback, contentHash: Optional[str]) -> Element:
+        """
+        Builds the whole document
+
+        Args:
+            fileName:           A PROJECT_SUFFIX, XML_SUFFIX or CHUNKED_PROJECT_SUFFIX file
+            progressCallback:   Receives the progress of the read
+            contentHash:        The project file's hash if already known
+
+        Returns:  The untangled project
+        """
+        projectAttributes, documentElements = self._readProjectDocuments(fileName=fileName, progressCallback=progressCallback, contentHash=contentHash)
+
+        progressCallback(f'Parsing {fileName.name}', 100)
+
+        with TimingSpan('open.parse', documents=len(documentElements)):
+            root: Element = untangleProject(projectAttributes=projectAttributes, documentElements=documentElements)
+
+        return root
+
+    def _streamProject(self, fileName: Path, progressCallback: ProgressCallback) -> UmlProject:
+        """
+        Never holds more than one diagram;  The parsed project cache is not used, since
+        caching would hold them all
+
+        Args:
+            fileName:           An XML_SUFFIX file
+            progressCallback:   Receives the progress of the read
+
+        Returns:  A UML Project whose documents are built
+        """
+        xmlToUmlShapes:   UntangledXmlToUmlShapes = UntangledXmlToUmlShapes()
+        xmlDiagramStream: XmlDiagramStream        = XmlDiagramStream(fileName=fileName)
+
+        progressCallback(f'Reading {fileName.name}', 0)
+        with TimingSpan('open.stream') as streamSpan:
+            xmlToUmlShapes.deserializeStream(xmlDiagramStream=xmlDiagramStream,
+                                             fileName=fileName,
+                                             progressCallback=progressCallback,
+                                             documentBuilder=UiThreadCall(xmlToUmlShapes.deserializeDocument))
+
+            umlProject: UmlProject = xmlToUmlShapes.umlProject
+            streamSpan.set(documents=xmlDiagramStream.diagramCount, shapes=projectShapeCount(umlProject), links=projectLinkCount(umlProject))
+
+        return umlProject
+
+    def _readProjectDocuments(self, fileName: Path, progressCallback: ProgressCallback, contentHash: Optional[str]) -> ProjectDocuments:
+        """
+        The parsed project cache is consulted before the file is read;  What is read is cached
+
+        Args:
+            fileName:           A PROJECT_SUFFIX, XML_SUFFIX or CHUNKED_PROJECT_SUFFIX file
+            progressCallback:   Receives the progress of the read
+            contentHash:        The project file's hash if already known;  Otherwise, the cache computes it
+
+        Returns:  The UmlProject element attributes and the UMLDiagram elements in document order
+        """
+        parsedProjectCache: Optional[ParsedProjectCache] = None
+        projectFingerprint: Optional[ProjectFingerprint] = None
+
+        if self._preferences.parsedProjectCacheEnabled is True:
+            parsedProjectCache = ParsedProjectCache(cacheDirectory=self._preferences.parsedProjectCacheDirectory,
+                                                    maxBytes=self._preferences.parsedProjectCacheMaxBytes)
+            projectFingerprint = ProjectFingerprint.fromProjectFile(fileName=fileName)
+
+            with TimingSpan('open.cacheRead') as cacheSpan:
+                cachedDocuments: Optional[ProjectDocuments] = parsedProjectCache.get(projectFingerprint=projectFingerprint)
+                cacheSpan.set(hit=cachedDocuments is not None)
+            if cachedDocuments is not None:
+                progressCallback(f'Read cached {fileName.name}', 100)
+                self.logger.info(f'Using the parsed project cache for {fileName}')
+                return cachedDocuments
+
+        progressCallback(f'Reading {fileName.name}', 0)
+        with TimingSpan('open.read'):
+            if fileName.suffix == CHUNKED_PROJECT_SUFFIX:
+                projectAttributes, documentElements = readProjectDocuments(fileName=fileName)
+            else:
+                xmlDiagramStream: XmlDiagramStream = XmlDiagramStream(fileName=fileName)
+
+                documentElements  = list(xmlDiagramStream.diagramXmlElements(progressCallback=progressCallback))
+                projectAttributes = xmlDiagramStream.projectAttributes
+
+        if parsedProjectCache is not None and projectFingerprint is not None:
+            try:
+                parsedProjectCache.put(projectFingerprint=projectFingerprint,
+                                       projectAttributes=projectAttributes,
+                                       documentElements=documentElements,
+                                       contentHash=contentHash)
+            except OSError as e:
+                self.logger.warning(f'Unable to cache the parsed project {fileName}: {e}')
+
+        return projectAttributes, documentElements
+
+    def _deserializeRoot(self, root: Element, fileName: Path) -> UmlProject:
+
+        with TimingSpan('open.model') as modelSpan:
+            xmlToUmlShapes: UntangledXmlToUmlShapes = UntangledXmlToUmlShapes()
+            xmlToUmlShapes.deserializeRoot(root=root, fileName=fileName)
+
+            umlProject: UmlProject = xmlToUmlShapes.umlProject
+            modelSpan.set(shapes=projectShapeCount(umlProject), links=projectLinkCount(umlProject))
+
+        return umlProject
+
+    def _indexProject(self, fileName: Path, progressCallback: ProgressCallback, contentHash: Optional[str]) -> UmlProject:
+        """
+        Only reads the document attributes;  No shapes are built.  A document's shapes are
+        built the first time the document is displayed
+
+        Args:
+            fileName:           Either a PROJECT_SUFFIX or XML_SUFFIX file
+            progressCallback:   Receives the progress of the read
+            contentHash:        The project file's hash if already known
+
+        Returns:  A UML Project whose documents are all LazyUmlDocuments
+        """
+        with TimingSpan('open.index'):
+            projectAttributes, documentElements = self._readProjectDocuments(fileName=fileName, progressCallback=progressCallback, contentHash=contentHash)
+
+        return self._indexProjectDocuments(fileName=fileName, projectAttributes=projectAttributes, documentElements=documentElements)
+
+    def _indexProjectDocuments(self, fileName: Path, projectAttributes: Dict[str, str], documentElements: List[XmlElement]) -> UmlProject:
+        """
+
+        Args:
+            fileName:           The project file
+            projectAttributes:  The UmlProject element attributes
+            documentElements:   The UMLDiagram elements in document order
+
+        Returns:  A UML Project whose documents are all LazyUmlDocuments
+        """
+        umlProject: UmlProject = UmlProject(fileName=fileName)
+
+        for documentElement in documentElements:
+            lazyUmlDocument: LazyUmlDocument = LazyUmlDocument.fromDocumentSource(documentSource=documentElement)
+
+            umlProject.umlDocuments[lazyUmlDocument.documentTitle] = lazyUmlDocument
+
+        umlProject.version  = projectAttributes.get(XmlConstants.ATTRIBUTE_VERSION, '')
+        umlProject.codePath = projectAttributes.get(XmlConstants.ATTRIBUTE_CODE_PATH, '')
+
+        return umlProject
+
+    def _indexChunkedProject(self, fileName: Path, progressCallback: ProgressCallback) -> UmlProject:
+        """
+        Only reads the table of contents;  A document's chunk is read the first
+        time the document is displayed or saved
+
+        Args:
+            fileName:           A CHUNKED_PROJECT_SUFFIX file
+            progressCallback:   Receives the progress of the read
+
+        Returns:  A UML Project whose documents are all LazyUmlDocuments
+        """
+        progressCallback(f'Indexing {fileName.name}', 0)
+
+        with TimingSpan('open.index'):
+            chunkedProjectReader: ChunkedProjectReader = ChunkedProjectReader(fileName=fileName)
+        umlProject: UmlProject = UmlProject(fileName=fileName)
+
+        for chunkEntry in chunkedProjectReader.chunkEntries:
+            lazyUmlDocument: LazyUmlDocument = LazyUmlDocument.fromDocumentAttributes(
+                attributes=chunkEntry.attributes,
+                sourceLoader=partial(chunkedProjectReader.readDocument, chunkEntry=chunkEntry)
+            )
+            umlProject.umlDocuments[lazyUmlDocument.documentTitle] = lazyUmlDocument
+
+        umlProject.version  = chunkedProjectReader.projectAttributes.get(XmlConstants.ATTRIBUTE_VERSION, '')
+        umlProject.codePath = chunkedProjectReader.projectAttributes.get(XmlConstants.ATTRIBUTE_CODE_PATH, '')
+
+        progressCallback(f'Indexed {fileName.name}', 100)
+
+        return umlProject
+
     def _isProjectAlreadyOpen(self, fileName: str) -> bool:
         """
         Using a callback from the pub/sub engine message works because messages are not async.  The
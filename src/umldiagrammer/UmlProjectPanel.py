@@ -1,12 +1,18 @@
 
+from typing import List
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
+from time import monotonic_ns
+
 from wx import Menu
 from wx import Size
 from wx import Window
 from wx import SplitterWindow
 
+from umlshapes.frames.UmlFrame import Ltrb
 from umlshapes.frames.UmlFrame import UmlFrame
 from umlshapes.frames.DiagramFrame import FrameId
 
@@ -17,6 +23,7 @@ from umlio.IOTypes import UmlDocument
 from umlio.IOTypes import UmlDocumentTitle
 from umlio.IOTypes import UmlDocumentType
 
+from umldiagrammer.BulkInsertion import BulkInsertion
 from umldiagrammer.DiagrammerTypes import APPLICATION_FRAME_ID
 from umldiagrammer.DiagrammerTypes import EDIT_MENU_HANDLER_ID
 from umldiagrammer.DiagrammerTypes import FrameIdMap
@@ -26,11 +33,18 @@ from umldiagrammer.UmlDiagramManager import UmlDiagramManager
 from umldiagrammer.UmlProjectTree import TreeNodeData
 from umldiagrammer.UmlProjectTree import UmlProjectTree
 
+from umldiagrammer.data.ProjectDossier import ProjectDossier
+
+from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
+
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 from umldiagrammer.pubsubengine.IAppPubSubEngine import UniqueId
 from umldiagrammer.pubsubengine.IAppPubSubEngine import UniqueIds
 from umldiagrammer.pubsubengine.MessageType import MessageType
 
+from umldiagrammer.thumbnails.ThumbnailCache import ThumbnailCache
+from umldiagrammer.thumbnails.ThumbnailRenderer import ThumbnailRenderer
+
 
 class UmlProjectPanel(SplitterWindow):
     """
@@ -89,12 +103,37 @@ class UmlProjectPanel(SplitterWindow):
 
         self._umlProject:         UmlProject = umlProject
         self._umlProjectModified: bool       = False
+        self._lastModifiedTime:   int        = 0
+
+        self._preferences:       DiagrammerPreferences = DiagrammerPreferences()
+        self._thumbnailRenderer: ThumbnailRenderer     = cast(ThumbnailRenderer, None)
+        if self._preferences.diagramThumbnails is True:
+            self._thumbnailRenderer = ThumbnailRenderer(window=self._projectTree,
+                                                        fragmentSource=self._umlDiagramManager.documentFragment,
+                                                        thumbnailSink=self._projectTree.setDocumentThumbnail,
+                                                        thumbnailCache=ThumbnailCache(cacheDirectory=self._preferences.thumbnailCacheDirectory,
+                                                                                      maxBytes=self._preferences.thumbnailCacheMaxBytes)
+                                                        )
+            self._requestThumbnails(documentTitles=self._umlDiagramManager.documentTitles)
 
     @property
     def umlProject(self) -> UmlProject:
         self._umlProject.umlDocuments = self._umlDiagramManager.umlDocuments
         return self._umlProject
 
+    @property
+    def projectDossier(self) -> ProjectDossier:
+        """
+        What a save needs;  Unlike .umlProject the UML documents are not rebuilt;  Only
+        the diagrams modified since the last save are re-serialized
+
+        Returns:  The project with its serialized documents
+        """
+        return ProjectDossier(umlProject=self._umlProject,
+                              modified=self._umlProjectModified,
+                              documentFragments=self._umlDiagramManager.documentFragments
+                              )
+
     @property
     def umlProjectModified(self) -> bool:
         return self._umlProjectModified
@@ -107,6 +146,41 @@ class UmlProjectPanel(SplitterWindow):
         #
         if modified is False:
             self._umlDiagramManager.markFramesSaved()
+            self._requestThumbnails(documentTitles=self._umlDiagramManager.documentTitles)
+        else:
+            self.noteModification()
+
+    @property
+    def lastModifiedTime(self) -> int:
+        """
+        Returns: The monotonic time (ns) of the most recent modification
+        """
+        return self._lastModifiedTime
+
+    def noteModification(self):
+        """
+        Saves complete in the background;  We need to know whether the project was
+        modified after a save snapshot was taken
+        """
+        self._lastModifiedTime = monotonic_ns()
+
+    def savedSnapshot(self, snapshotTime: int):
+        """
+        Called when a background save commits
+
+        Args:
+            snapshotTime: The monotonic time (ns) when the saved snapshot was taken
+        """
+        if self._lastModifiedTime < snapshotTime:
+            self.umlProjectModified = False
+        else:
+            self.logger.info(f'{self} modified while saving;  It remains modified')
+
+    def releaseResidentFrames(self):
+        self._umlDiagramManager.releaseResidentFrames()
+
+    def showPaintStatistics(self, shown: bool):
+        self._umlDiagramManager.showPaintStatistics(shown=shown)
 
     @property
     def frameIdMap(self) -> FrameIdMap:
@@ -124,6 +198,17 @@ class UmlProjectPanel(SplitterWindow):
     def currentUmlFrameId(self) -> FrameId:
         return self._umlDiagramManager.currentUmlFrameId
 
+    @property
+    def currentBulkInsertion(self) -> BulkInsertion:
+        return self._umlDiagramManager.bulkInsertion(frameId=self._umlDiagramManager.currentUmlFrameId)
+
+    @property
+    def currentShapeBoundaries(self) -> Ltrb:
+        """
+        Includes the shapes a viewport culler keeps off the diagram
+        """
+        return self._umlDiagramManager.shapeBoundaries(frameId=self._umlDiagramManager.currentUmlFrameId)
+
     def createNewDocument(self, documentType: UmlDocumentType) -> FrameId:
         """
         Does too many things
@@ -165,6 +250,7 @@ class UmlProjectPanel(SplitterWindow):
                                         uniqueId=treeNodeTopicId,
                                         listener=self._diagramSelectionChangedListener)
         self.umlProjectModified = True
+        self._requestThumbnails(documentTitles=[umlDocument.documentTitle])
         self.logger.info(f'Diagram {umlDocument.documentTitle} added to {self._umlProject.fileName}')
 
         return frameId
@@ -193,6 +279,7 @@ class UmlProjectPanel(SplitterWindow):
 
         self.logger.debug(f'{oldDocumentTitle=} {newDocumentTitle=}')
         self._umlDiagramManager.renameDiagram(oldDocumentTitle=oldDocumentTitle, newDocumentTitle=newDocumentTitle)
+        self._requestThumbnails(documentTitles=[newDocumentTitle])
 
         self._appPubSubEngine.sendMessage(messageType=MessageType.DOCUMENT_NAME_CHANGED,
                                           uniqueId=NOTEBOOK_ID,
@@ -201,6 +288,16 @@ class UmlProjectPanel(SplitterWindow):
     def _deleteDiagramListener(self, diagramName: str):
         self._umlDiagramManager.deleteDiagram(diagramName=diagramName)
 
+    def _requestThumbnails(self, documentTitles: List[UmlDocumentTitle]):
+        """
+        Thumbnails are refreshed when a project is opened and saved, not on every edit
+
+        Args:
+            documentTitles:
+        """
+        if self._thumbnailRenderer is not None:
+            self._thumbnailRenderer.request(documentTitles=documentTitles)
+
     def __str__(self) -> str:
         return self._umlProject.fileName.stem
 
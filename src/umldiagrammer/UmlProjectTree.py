@@ -1,4 +1,5 @@
 
+from typing import Dict
 from typing import cast
 
 from logging import Logger
@@ -18,6 +19,8 @@ from wx import TR_HAS_BUTTONS
 from wx import TR_HIDE_ROOT
 from wx import EVT_TREE_ITEM_RIGHT_CLICK
 
+from wx import Bitmap
+from wx import ImageList
 from wx import TreeCtrl
 from wx import TreeEvent
 from wx import TreeItemId
@@ -43,6 +46,9 @@ from umldiagrammer.pubsubengine.IAppPubSubEngine import UniqueId
 from umldiagrammer.pubsubengine.IAppPubSubEngine import UniqueIds
 from umldiagrammer.pubsubengine.MessageType import MessageType
 
+from umldiagrammer.thumbnails.ThumbnailRenderer import THUMBNAIL_HEIGHT
+from umldiagrammer.thumbnails.ThumbnailRenderer import THUMBNAIL_WIDTH
+
 
 @dataclass
 class TreeNodeData:
@@ -77,6 +83,9 @@ class UmlProjectTree(TreeCtrl):
         self._documentPopupMenu:        Menu         = cast(Menu, None)
         self._rightClickedTreeNodeData: TreeNodeData = NO_TREE_NODE_DATA
 
+        self._thumbnails:       ImageList                   = cast(ImageList, None)
+        self._thumbnailIndices: Dict[UniqueId, int] = {}            # Keyed by node;  Survives renames
+
     @property
     def uniqueNodeIds(self) -> UniqueIds:
         """
@@ -114,6 +123,34 @@ class UmlProjectTree(TreeCtrl):
 
         return treeNodeTopicId
 
+    def setDocumentThumbnail(self, documentTitle: UmlDocumentTitle, bitmap: Bitmap):
+        """
+        Show a thumbnail next to the document's node;  Ignored if the document is gone
+
+        Args:
+            documentTitle:
+            bitmap:         A THUMBNAIL_WIDTH x THUMBNAIL_HEIGHT bitmap
+        """
+        documentNode: TreeItemId = self._findDocumentNode(documentTitle=documentTitle)
+        if documentNode.IsOk() is False:
+            self.logger.debug(f'No tree node for {documentTitle}')
+            return
+
+        if self._thumbnails is None:
+            # The tree control does not own an image list set with SetImageList;  Keep a reference
+            self._thumbnails = ImageList(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+            self.SetImageList(self._thumbnails)
+
+        treeData:   TreeNodeData = self.GetItemData(documentNode)
+        imageIndex: int          = self._thumbnailIndices.get(treeData.uniqueNodeId, -1)
+        if imageIndex == -1:
+            imageIndex = self._thumbnails.Add(bitmap)
+            self._thumbnailIndices[treeData.uniqueNodeId] = imageIndex
+        else:
+            self._thumbnails.Replace(imageIndex, bitmap)
+
+        self.SetItemImage(documentNode, imageIndex)
+
     def deleteCurrentProjectNode(self):
         """
         Delete the currently selected Tree node that represent the display diagram fram
@@ -124,6 +161,7 @@ class UmlProjectTree(TreeCtrl):
         #
         #
         self._uniqueIds.remove(treeData.uniqueNodeId)
+        self._thumbnailIndices.pop(treeData.uniqueNodeId, None)
         self.Delete(documentNode)
         wxCallAfter(self._selectItemAfterNodeDeleted)
 
@@ -142,6 +180,19 @@ class UmlProjectTree(TreeCtrl):
         for umlDocument in self._umlProject.umlDocuments.values():
             self.createTreeItem(umlDocument=umlDocument)
 
+    def _findDocumentNode(self, documentTitle: UmlDocumentTitle) -> TreeItemId:
+        """
+        Returns:  The document's node;  Not Ok if there is none
+        """
+        documentNode, cookie = self.GetFirstChild(self.root)
+        while documentNode.IsOk() is True:
+            treeData: TreeNodeData = self.GetItemData(documentNode)
+            if treeData is not None and treeData.umlDocument.documentTitle == documentTitle:
+                break
+            documentNode, cookie = self.GetNextChild(self.root, cookie)
+
+        return documentNode
+
     def _onDocumentSelectionChanged(self, treeEvent: TreeEvent):
 
         selectedItem: TreeItemId = treeEvent.GetItem()
@@ -214,6 +265,7 @@ class UmlProjectTree(TreeCtrl):
         diagramName: str = self.GetItemText(self._rightClickedTreeNodeData.treeNodeID)
 
         self._uniqueIds.remove(self._rightClickedTreeNodeData.uniqueNodeId)
+        self._thumbnailIndices.pop(self._rightClickedTreeNodeData.uniqueNodeId, None)
         self.Delete(self._rightClickedTreeNodeData.treeNodeID)
 
         self._appPubSubEngine.sendMessage(messageType=MessageType.DELETE_DIAGRAM,
@@ -0,0 +1,320 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from wx import EVT_SIZE
+from wx import EVT_MOUSEWHEEL
+from wx import EVT_SCROLLWIN
+
+from wx import Event
+
+from wx import CallAfter as wxCallAfter
+
+from umlshapes.frames.DiagramFrame import DiagramFrame
+
+from umlshapes.UmlBaseEventHandler import UmlBaseEventHandler
+
+from umlshapes.links.UmlLink import UmlLink
+from umlshapes.links.UmlLollipopInterface import UmlLollipopInterface
+
+from umlshapes.types.Common import Rectangle
+
+from umldiagrammer.BulkInsertion import BulkInsertion
+from umldiagrammer.DiagrammerTypes import UmlShapeGenre
+from umldiagrammer.LinkRealizers import linkEnds
+from umldiagrammer.SpatialIndex import Bounds
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+
+ShapeLayout    = Callable[..., None]      # Called with umlShape and eventHandlerClass
+LinkLayout     = Callable[[List[UmlLink]], None]
+LollipopLayout = Callable[[List[UmlLollipopInterface]], None]
+
+Region = Tuple[int, int, int, int]      # left, top, right, bottom
+
+
+@dataclass
+class CulledShape:
+    umlShape:          UmlShapeGenre
+    eventHandlerClass: type[UmlBaseEventHandler]
+    realized:          bool = False
+    wired:             bool = False     # Its event handler is wired;  It was realized before
+
+
+class ViewportCuller:
+    """
+    Keeps only the shapes near the visible part of a very large diagram on the frame.
+    The others stay as shapes that are not on the diagram, without event handlers, until
+    their bounding box intersects the visible scroll region plus a margin.  Shapes are
+    released again once they are well outside of it.
+
+    A link is added when either of its ends comes into view;  Its other end is realized
+    with it, so link ends are always on the diagram.  Shapes with links on the diagram,
+    and selected shapes, stay realized.  Lollipops are realized and released with the class
+    they are attached to.  The culled shapes, their lollipops and the links not yet added
+    are still part of the document;  See culledShapes, culledLollipops and pendingLinks.  A
+    realized shape that the developer cut or deleted is forgotten along with its pending
+    links and its lollipops
+    """
+    def __init__(self, diagramFrame: DiagramFrame, bulkInsertion: BulkInsertion, shapeLayout: ShapeLayout, linkLayout: LinkLayout, lollipopLayout: LollipopLayout, margin: int):
+        """
+
+        Args:
+            diagramFrame:   The frame with the large diagram
+            bulkInsertion:  The frame's bulk insertion;  Each cull repaints once
+            shapeLayout:    Adds a shape to the diagram the first time and wires its event handler
+            linkLayout:     Adds links to the diagram;  Both ends of each are on the diagram
+            lollipopLayout: Adds lollipops to the diagram the first time and wires their event handlers
+            margin:         Pixels around the visible region that are realized
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame:   DiagramFrame   = diagramFrame
+        self._bulkInsertion:  BulkInsertion  = bulkInsertion
+        self._shapeLayout:    ShapeLayout    = shapeLayout
+        self._linkLayout:     LinkLayout     = linkLayout
+        self._lollipopLayout: LollipopLayout = lollipopLayout
+        self._margin:         int            = margin
+
+        self._culledShapes: Dict[int, CulledShape]   = {}       # By Python id of the shape
+        self._pendingLinks: Dict[int, UmlLink]       = {}
+        self._shapeLinks:   Dict[int, List[UmlLink]] = {}       # The pending links of each shape
+
+        self._lollipops:      Dict[int, List[UmlLollipopInterface]] = {}    # By Python id of the class they are attached to
+        self._wiredLollipops: Set[int]                              = set()
+
+        self._cullPending: bool = False
+
+        diagramFrame.Bind(EVT_SCROLLWIN,  self._onViewportChanged)
+        diagramFrame.Bind(EVT_MOUSEWHEEL, self._onViewportChanged)
+        diagramFrame.Bind(EVT_SIZE,       self._onViewportChanged)
+
+    @property
+    def culledShapes(self) -> List[UmlShapeGenre]:
+        """
+        Returns:  The shapes that are not on the diagram
+        """
+        return [culledShape.umlShape for culledShape in self._culledShapes.values() if culledShape.realized is False]
+
+    @property
+    def culledLollipops(self) -> List[UmlLollipopInterface]:
+        """
+        Returns:  The lollipops that are not on the diagram;  Those of the culled shapes
+        """
+        return [umlLollipop for shapeKey, umlLollipops in self._lollipops.items() if self._culledShapes[shapeKey].realized is False for umlLollipop in umlLollipops]
+
+    @property
+    def culledExtent(self) -> Optional[Bounds]:
+        """
+        Returns:  The bounds of the shapes that are not on the diagram;  None if there are none
+        """
+        extent: Optional[Bounds] = None
+        for umlShape in self.culledShapes:
+            rectangle: Rectangle = umlShape.rectangle
+            bounds:    Bounds    = Bounds(left=round(rectangle.left), top=round(rectangle.top), right=round(rectangle.right), bottom=round(rectangle.bottom))
+
+            extent = bounds if extent is None else extent.union(bounds)
+
+        return extent
+
+    @property
+    def pendingLinks(self) -> List[UmlLink]:
+        """
+        A save may come before the next cull;  So the deleted shapes are forgotten first
+
+        Returns:  The links that are not on the diagram
+        """
+        self._forgetDeleted()
+
+        return list(self._pendingLinks.values())
+
+    def addShape(self, umlShape: UmlShapeGenre, eventHandlerClass: type[UmlBaseEventHandler]):
+        self._culledShapes[id(umlShape)] = CulledShape(umlShape=umlShape, eventHandlerClass=eventHandlerClass)
+
+    def addLollipop(self, umlLollipop: UmlLollipopInterface):
+        """
+        Add the class it is attached to first
+
+        Args:
+            umlLollipop:
+        """
+        self._lollipops.setdefault(id(umlLollipop.attachedTo), []).append(umlLollipop)
+
+    def addLink(self, umlLink: UmlLink):
+
+        self._pendingLinks[id(umlLink)] = umlLink
+        for endShape in linkEnds(umlLink=umlLink):
+            self._shapeLinks.setdefault(id(endShape), []).append(umlLink)
+
+    def cull(self):
+        """
+        Realize the shapes near the visible region;  Release those well outside of it
+        """
+        self._cullPending = False
+
+        visibleRegion: Region = self._visibleRegion(margin=self._margin)
+        releaseRegion: Region = self._visibleRegion(margin=self._margin * 2)
+
+        with TimingSpan('diagram.cull') as cullSpan, self._bulkInsertion:
+            realizedCount:     int                        = 0
+            releasedCount:     int                        = 0
+            realizedLinks:     List[UmlLink]              = []
+            realizedLollipops: List[UmlLollipopInterface] = []
+            forgotten:         int                        = self._forgetDeleted()
+            #
+            # Release first;  The ends realized below have no lines until their links go on
+            #
+            for culledShape in list(self._culledShapes.values()):
+                if culledShape.realized is True and _intersects(region=releaseRegion, rectangle=culledShape.umlShape.rectangle) is False:
+                    releasedCount += self._release(culledShape=culledShape)
+
+            for culledShape in list(self._culledShapes.values()):
+                intersects: bool = _intersects(region=visibleRegion, rectangle=culledShape.umlShape.rectangle)
+                if intersects is True and (culledShape.realized is False or id(culledShape.umlShape) in self._shapeLinks):
+                    realizedCount += self._realize(culledShape=culledShape, realizedLinks=realizedLinks, realizedLollipops=realizedLollipops)
+            #
+            # The links and the lollipops go on after all the shapes are placed
+            #
+            if len(realizedLinks) > 0:
+                self._linkLayout(realizedLinks)
+            if len(realizedLollipops) > 0:
+                self._lollipopLayout(realizedLollipops)
+
+            cullSpan.set(realized=realizedCount, released=releasedCount, forgotten=forgotten,
+                         links=len(realizedLinks), lollipops=len(realizedLollipops),
+                         culled=len(self.culledShapes), pendingLinks=len(self._pendingLinks))
+
+    def _forgetDeleted(self) -> int:
+        """
+        Only realized shapes can be cut or deleted;  Releasing one would bring it back.  The
+        same goes for the lollipops of realized classes;  The lollipops the developer added
+        to them since are adopted, so they are released with their class
+
+        Returns:  The number of shapes forgotten
+        """
+        shapeList: List      = self._diagramFrame.umlDiagram.GetShapeList()
+        onDiagram: Set[int]  = {id(umlShape) for umlShape in shapeList}
+        deleted:   List[int] = [shapeKey for shapeKey, culledShape in self._culledShapes.items() if culledShape.realized is True and shapeKey not in onDiagram]
+
+        for shapeKey in deleted:
+            del self._culledShapes[shapeKey]
+            for umlLink in self._shapeLinks.pop(shapeKey, []):
+                self._pendingLinks.pop(id(umlLink), None)
+            for umlLollipop in self._lollipops.pop(shapeKey, []):
+                self._wiredLollipops.discard(id(umlLollipop))
+
+        for shapeKey, umlLollipops in self._lollipops.items():
+            if self._culledShapes[shapeKey].realized is True:
+                umlLollipops[:] = [umlLollipop for umlLollipop in umlLollipops if id(umlLollipop) in onDiagram]
+
+        tracked: Set[int] = {id(umlLollipop) for umlLollipops in self._lollipops.values() for umlLollipop in umlLollipops}
+        for shape in shapeList:
+            if isinstance(shape, UmlLollipopInterface) and id(shape) not in tracked and id(shape.attachedTo) in self._culledShapes:
+                self._lollipops.setdefault(id(shape.attachedTo), []).append(shape)
+                self._wiredLollipops.add(id(shape))
+
+        return len(deleted)
+
+    def _onViewportChanged(self, event: Event):
+        """
+        Scroll and size events come in bursts;  Cull once after the burst
+        """
+        event.Skip(True)
+        if self._cullPending is False:
+            self._cullPending = True
+            wxCallAfter(self.cull)
+
+    def _realize(self, culledShape: CulledShape, realizedLinks: List[UmlLink], realizedLollipops: List[UmlLollipopInterface]) -> int:
+        """
+        Realize the shape and the other ends of its pending links;  Those links are added to
+        realizedLinks.  The shape may already be realized as the other end of a link.  The
+        lollipops laid out for the first time are added to realizedLollipops
+
+        Returns:  The number of shapes realized
+        """
+        realizedCount: int = 0
+        if culledShape.realized is False:
+            realizedCount += self._realizeShape(culledShape=culledShape, realizedLollipops=realizedLollipops)
+
+        for umlLink in self._shapeLinks.pop(id(culledShape.umlShape), []):
+            if id(umlLink) not in self._pendingLinks:
+                continue
+            for endShape in linkEnds(umlLink=umlLink):
+                endCulledShape: CulledShape = self._culledShapes.get(id(endShape), cast(CulledShape, None))
+                if endCulledShape is not None and endCulledShape.realized is False:
+                    realizedCount += self._realizeShape(culledShape=endCulledShape, realizedLollipops=realizedLollipops)
+
+            del self._pendingLinks[id(umlLink)]
+            realizedLinks.append(umlLink)
+
+        return realizedCount
+
+    def _realizeShape(self, culledShape: CulledShape, realizedLollipops: List[UmlLollipopInterface]) -> int:
+
+        umlShape: UmlShapeGenre = culledShape.umlShape
+        if culledShape.wired is False:
+            self._shapeLayout(umlShape=umlShape, eventHandlerClass=culledShape.eventHandlerClass)
+            culledShape.wired = True
+        else:
+            self._diagramFrame.umlDiagram.AddShape(umlShape)
+            umlShape.Show(True)
+
+        for umlLollipop in self._lollipops.get(id(umlShape), []):
+            if id(umlLollipop) in self._wiredLollipops:
+                self._diagramFrame.umlDiagram.AddShape(umlLollipop)
+                umlLollipop.Show(True)
+            else:
+                self._wiredLollipops.add(id(umlLollipop))
+                realizedLollipops.append(umlLollipop)
+
+        culledShape.realized = True
+
+        return 1
+
+    def _release(self, culledShape: CulledShape) -> int:
+        """
+        Returns:  The number of shapes released;  0 if the shape must stay realized
+        """
+        umlShape:     UmlShapeGenre              = culledShape.umlShape
+        umlLollipops: List[UmlLollipopInterface] = self._lollipops.get(id(umlShape), [])
+        if len(umlShape.GetLines()) > 0 or umlShape.Selected() is True or any(umlLollipop.Selected() for umlLollipop in umlLollipops):
+            return 0
+
+        for umlLollipop in umlLollipops:
+            umlLollipop.Show(False)
+            self._diagramFrame.umlDiagram.RemoveShape(umlLollipop)
+
+        umlShape.Show(False)
+        self._diagramFrame.umlDiagram.RemoveShape(umlShape)
+
+        culledShape.realized = False
+
+        return 1
+
+    def _visibleRegion(self, margin: int) -> Region:
+
+        startX, startY = self._diagramFrame.GetViewStart()
+        unitX,  unitY  = self._diagramFrame.GetScrollPixelsPerUnit()
+        width,  height = self._diagramFrame.GetClientSize()
+
+        left: int = startX * unitX
+        top:  int = startY * unitY
+
+        return left - margin, top - margin, left + width + margin, top + height + margin
+
+
+def _intersects(region: Region, rectangle: Rectangle) -> bool:
+
+    left, top, right, bottom = region
+
+    return rectangle.left <= right and rectangle.right >= left and rectangle.top <= bottom and rectangle.bottom >= top
@@ -0,0 +1,128 @@
+
+from typing import Tuple
+from typing import cast
+
+from logging import DEBUG
+from logging import Logger
+from logging import getLogger
+
+from wx import EVT_IDLE
+from wx import EVT_PAINT
+from wx import EVT_SCROLLWIN
+
+from wx import Bitmap
+from wx import Event
+from wx import IdleEvent
+from wx import PaintDC
+from wx import PaintEvent
+from wx import Rect
+
+from umlshapes.frames.DiagramFrame import DiagramFrame
+
+from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
+from umlshapes.pubsubengine.UmlMessageType import UmlMessageType
+
+from umldiagrammer.PaintOverlay import PaintOverlay
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+
+Viewport = Tuple[int, int, int, int]        # view start x, y;  width, height
+
+
+class ViewportSnapshot:
+    """
+    Keeps a copy of the last rendered viewport of a diagram frame.  When the diagram
+    manager switches back to the frame the first paint blits the copy;  The full repaint
+    happens at idle.
+
+    The copy is taken after every full paint from the frame's double buffering bitmap.
+    It is invalidated when the frame is modified or scrolled, and is not used if the
+    frame was resized since
+    """
+    def __init__(self, diagramFrame: DiagramFrame, paintOverlay: PaintOverlay, umlPubSubEngine: IUmlPubSubEngine):
+        """
+
+        Args:
+            diagramFrame:       The frame to keep a copy of
+            paintOverlay:       Told when a paint completes
+            umlPubSubEngine:    To learn when the frame is modified
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._diagramFrame: DiagramFrame = diagramFrame
+        self._paintOverlay: PaintOverlay = paintOverlay
+
+        self._bitmap:   Bitmap   = cast(Bitmap, None)
+        self._viewport: Viewport = (0, 0, 0, 0)
+
+        self._blitNext:       bool = False
+        self._repaintPending: bool = False
+
+        umlPubSubEngine.subscribe(messageType=UmlMessageType.FRAME_MODIFIED, frameId=diagramFrame.id, listener=self._frameModifiedListener)
+
+        diagramFrame.Bind(EVT_PAINT,     self._onPaint)
+        diagramFrame.Bind(EVT_SCROLLWIN, self._onScroll)
+        diagramFrame.Bind(EVT_IDLE,      self._onIdle)
+
+    @property
+    def valid(self) -> bool:
+        return self._bitmap is not None and self._viewport == self._currentViewport()
+
+    def switchingTo(self):
+        """
+        The frame is about to be displayed;  Its next paint may use the copy
+        """
+        self._blitNext = True
+
+    def invalidate(self):
+        self._bitmap = cast(Bitmap, None)
+
+    def _onPaint(self, event: PaintEvent):
+
+        if self._blitNext is True and self.valid is True:
+            self._blitNext       = False
+            self._repaintPending = True
+
+            with TimingSpan('frame.paint', logLevel=DEBUG, mode='snapshot') as paintSpan:
+                dc: PaintDC = PaintDC(self._diagramFrame)
+                dc.DrawBitmap(self._bitmap, 0, 0)
+        else:
+            self._blitNext = False
+            with TimingSpan('frame.paint', logLevel=DEBUG, mode='full', reason='paint') as paintSpan:
+                self._diagramFrame.OnPaint(event)
+            self._capture()
+
+        self._paintOverlay.paintComplete(seconds=paintSpan.elapsedSeconds, mode=paintSpan.fields['mode'])
+
+    def _onScroll(self, event: Event):
+        event.Skip(True)
+        self.invalidate()
+
+    def _onIdle(self, event: IdleEvent):
+
+        event.Skip(True)
+        if self._repaintPending is True:
+            self._repaintPending = False
+            self._diagramFrame.Refresh()
+
+    def _frameModifiedListener(self, modifiedFrameId):
+        self.invalidate()
+
+    def _capture(self):
+        """
+        The frame painted into its double buffering bitmap;  Pixel 0, 0 is the top left
+        of the viewport
+        """
+        workingBitmap: Bitmap = self._diagramFrame._workingBitmap       # noqa
+        width, height = self._diagramFrame.GetSize()
+
+        if workingBitmap.IsOk() is True and workingBitmap.GetSize() == (width, height):
+            self._bitmap   = workingBitmap.GetSubBitmap(Rect(0, 0, width, height))
+            self._viewport = self._currentViewport()
+
+    def _currentViewport(self) -> Viewport:
+
+        startX, startY = self._diagramFrame.GetViewStart()
+        width,  height = self._diagramFrame.GetSize()
+
+        return startX, startY, width, height
@@ -0,0 +1,198 @@
+
+from typing import Dict
+from typing import List
+from typing import Callable
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from enum import Enum
+
+from pathlib import Path
+
+from time import perf_counter
+
+from untangle import Element
+
+from umlio.XMLConstants import XmlConstants
+
+from umldiagrammer.projectio.ProjectParser import ParsedProject
+from umldiagrammer.projectio.ProjectParser import parseProjectFile
+
+from umldiagrammer.projectio.ProjectFileTypes import XML_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import PROJECT_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import CURRENT_XML_VERSION
+from umldiagrammer.projectio.ProjectFileTypes import PROJECT_FILE_SUFFIXES
+
+from umldiagrammer.projectio.SavedContent import projectContentHash
+
+from umldiagrammer.projectio.XmlDiagramStream import ELEMENT_UML_PROJECT
+from umldiagrammer.projectio.XmlDiagramStream import ELEMENT_UML_DIAGRAM
+
+from umldiagrammer.projectio.ChunkedProjectContainer import readProjectDocuments
+from umldiagrammer.projectio.ChunkedProjectContainer import writeProjectDocuments
+
+
+class BatchOperation(Enum):
+    CONVERT  = 'convert'
+    VALIDATE = 'validate'
+    RESAVE   = 'resave'
+
+
+@dataclass
+class BatchResult:
+    """
+    What happened to one file;  Returned from a worker process, so only plain data
+    """
+    fileName:       Path
+    operation:      BatchOperation
+    succeeded:      bool  = True
+    elapsedSeconds: float = 0.0
+    byteCount:      int   = 0           # Of the input file
+    diagramCount:   int   = 0
+    message:        str   = ''
+
+
+def collectProjectFiles(paths: List[Path], recursive: bool = False) -> List[Path]:
+    """
+    Directories are scanned for project files;  Files are taken as they are
+
+    Args:
+        paths:      Files and directories
+        recursive:  Also scan the directories in the directories
+
+    Returns:  The project files in a stable order without duplicates
+    """
+    projectFiles: Dict[Path, None] = {}
+    for path in paths:
+        if path.is_dir() is True:
+            candidates: List[Path] = sorted(path.rglob('*') if recursive is True else path.iterdir())
+            for candidate in candidates:
+                if candidate.is_file() is True and candidate.suffix in PROJECT_FILE_SUFFIXES:
+                    projectFiles[candidate] = None
+        else:
+            projectFiles[path] = None
+
+    return list(projectFiles.keys())
+
+
+def convertProject(fileName: Path, destinationSuffix: str = PROJECT_FILE_SUFFIX, outputDirectory: Optional[Path] = None) -> BatchResult:
+    """
+    The documents are copied as they are;  No shapes are built
+
+    Args:
+        fileName:           The project file to convert
+        destinationSuffix:  Selects the format of the converted file
+        outputDirectory:    Where the converted file goes;  Next to the source when not provided
+
+    Returns:  The result
+    """
+    destinationDirectory: Path = fileName.parent if outputDirectory is None else outputDirectory
+    destinationFileName:  Path = destinationDirectory / f'{fileName.stem}{destinationSuffix}'
+
+    def convert(batchResult: BatchResult):
+        if destinationFileName.resolve() == fileName.resolve():
+            raise ValueError(f'{fileName.name} is already a {destinationSuffix} file')
+
+        projectAttributes, documentElements = readProjectDocuments(fileName=fileName)
+        destinationDirectory.mkdir(parents=True, exist_ok=True)
+        writeProjectDocuments(fileName=destinationFileName, projectAttributes=projectAttributes, documentElements=documentElements)
+
+        batchResult.diagramCount = len(documentElements)
+        batchResult.message      = f'-> {destinationFileName}'
+
+    return _runOperation(fileName=fileName, operation=BatchOperation.CONVERT, work=convert)
+
+
+def validateProject(fileName: Path) -> BatchResult:
+    """
+    The file must parse and look like a project;  The chunks of chunked projects are
+    checked against their hashes as they are read
+
+    Args:
+        fileName:   The project file to check
+
+    Returns:  The result
+    """
+    def validate(batchResult: BatchResult):
+        parsedProject: ParsedProject = parseProjectFile(fileName=fileName)
+
+        projectElements: List[Element] = [child for child in parsedProject.root.children if child._name == ELEMENT_UML_PROJECT]
+        if len(projectElements) != 1:
+            raise ValueError(f'Expected one {ELEMENT_UML_PROJECT} element')
+
+        diagrams: List[Element] = projectElements[0].get_elements(ELEMENT_UML_DIAGRAM)
+        for diagram in diagrams:
+            if diagram[XmlConstants.ATTRIBUTE_TITLE] is None:
+                raise ValueError(f'{ELEMENT_UML_DIAGRAM} without a {XmlConstants.ATTRIBUTE_TITLE}')
+
+        batchResult.diagramCount = len(diagrams)
+        batchResult.message      = f'version {projectElements[0][XmlConstants.ATTRIBUTE_VERSION]}'
+
+    return _runOperation(fileName=fileName, operation=BatchOperation.VALIDATE, work=validate)
+
+
+def resaveProject(fileName: Path) -> BatchResult:
+    """
+    Rewrites the project the way the diagrammer writes it today.  XML_FILE_SUFFIX files are
+    written as PROJECT_FILE_SUFFIX files;  The others are rewritten in place.  The result
+    says whether the content changed
+
+    Args:
+        fileName:   The project file to re-save
+
+    Returns:  The result
+    """
+    def resave(batchResult: BatchResult):
+        projectAttributes, documentElements = readProjectDocuments(fileName=fileName)
+
+        projectAttributes = dict(projectAttributes)
+        projectAttributes[XmlConstants.ATTRIBUTE_VERSION] = CURRENT_XML_VERSION
+
+        destinationFileName: Path = fileName.with_suffix(PROJECT_FILE_SUFFIX) if fileName.suffix == XML_FILE_SUFFIX else fileName
+        projectAttributes[XmlConstants.ATTRIBUTE_FILENAME] = str(destinationFileName)
+
+        batchResult.diagramCount = len(documentElements)
+
+        originalHash: str = projectContentHash(fileName=fileName)
+        writeProjectDocuments(fileName=destinationFileName, projectAttributes=projectAttributes, documentElements=documentElements)
+
+        if destinationFileName != fileName:
+            batchResult.message = f'-> {destinationFileName}'
+        elif projectContentHash(fileName=destinationFileName) == originalHash:
+            batchResult.message = 'already current'
+        else:
+            batchResult.message = 'updated'
+
+    return _runOperation(fileName=fileName, operation=BatchOperation.RESAVE, work=resave)
+
+
+def _runOperation(fileName: Path, operation: BatchOperation, work: Callable[[BatchResult], None]) -> BatchResult:
+    """
+    Failures are reported in the result;  One bad file must not stop the batch
+
+    Args:
+        fileName:   The project file
+        operation:  What is being done
+        work:       Does it;  Fills in the result
+
+    Returns:  The result
+    """
+    logger:      Logger      = getLogger(__name__)
+    batchResult: BatchResult = BatchResult(fileName=fileName, operation=operation)
+    startTime:   float       = perf_counter()
+    try:
+        batchResult.byteCount = fileName.stat().st_size
+        work(batchResult)
+    except Exception as e:
+        logger.error(f'{operation.value} {fileName} failed: {e}')
+        batchResult.succeeded = False
+        batchResult.message   = f'{e.__class__.__name__}: {e}'
+
+    batchResult.elapsedSeconds = perf_counter() - startTime
+
+    return batchResult
+
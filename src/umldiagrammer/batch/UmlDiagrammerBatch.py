@@ -0,0 +1,167 @@
+
+from typing import List
+from typing import Callable
+from typing import Optional
+
+from logging import WARNING
+from logging import INFO
+from logging import Logger
+from logging import getLogger
+from logging import basicConfig
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from functools import partial
+
+from multiprocessing import get_context
+
+from os import cpu_count
+
+from pathlib import Path
+
+from sys import exit as sysExit
+
+from time import perf_counter
+
+from umldiagrammer.batch.BatchOperations import BatchResult
+from umldiagrammer.batch.BatchOperations import BatchOperation
+from umldiagrammer.batch.BatchOperations import resaveProject
+from umldiagrammer.batch.BatchOperations import convertProject
+from umldiagrammer.batch.BatchOperations import validateProject
+from umldiagrammer.batch.BatchOperations import collectProjectFiles
+
+from umldiagrammer.projectio.ProjectFileTypes import XML_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import PROJECT_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+
+PROGRAM_NAME: str = 'umldiagrammer-batch'
+
+MEGABYTE: int = 1024 * 1024
+
+BatchWork = Callable[[Path], BatchResult]
+
+
+class UmlDiagrammerBatch:
+    """
+    Converts, validates and re-saves project files without a UI.  The files fan out
+    across a process pool;  Each one is handled independently, so one bad file does not
+    stop the batch
+    """
+    def __init__(self, processCount: int = 0):
+        """
+
+        Args:
+            processCount:   The number of worker processes;  0 means one per CPU.  With 1 the
+                            files are handled in this process
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._processCount: int = processCount if processCount > 0 else (cpu_count() or 1)
+
+    def run(self, fileNames: List[Path], batchWork: BatchWork) -> List[BatchResult]:
+        """
+        Reports each file as soon as it is done
+
+        Args:
+            fileNames:  The project files
+            batchWork:  What to do to each file;  Must be picklable
+
+        Returns:  The results in completion order
+        """
+        batchResults: List[BatchResult] = []
+        startTime:    float             = perf_counter()
+
+        if self._processCount == 1 or len(fileNames) <= 1:
+            for fileName in fileNames:
+                batchResult: BatchResult = batchWork(fileName)
+                self._reportFile(batchResult=batchResult)
+                batchResults.append(batchResult)
+        else:
+            processCount: int = min(self._processCount, len(fileNames))
+            with ProcessPoolExecutor(max_workers=processCount, mp_context=get_context('spawn')) as processPool:
+                futures: List[Future] = [processPool.submit(batchWork, fileName) for fileName in fileNames]
+                for future in as_completed(futures):
+                    batchResult = future.result()
+                    self._reportFile(batchResult=batchResult)
+                    batchResults.append(batchResult)
+
+        self._reportSummary(batchResults=batchResults, wallSeconds=perf_counter() - startTime)
+
+        return batchResults
+
+    def _reportFile(self, batchResult: BatchResult):
+
+        status: str = 'OK' if batchResult.succeeded is True else 'FAILED'
+
+        print(f'{status:<7} {batchResult.elapsedSeconds:8.3f}s {batchResult.byteCount / MEGABYTE:9.2f} MB '
+              f'{batchResult.diagramCount:4d} diagram(s)  {batchResult.fileName}  {batchResult.message}')
+
+    def _reportSummary(self, batchResults: List[BatchResult], wallSeconds: float):
+
+        failedCount:    int   = len([batchResult for batchResult in batchResults if batchResult.succeeded is False])
+        totalBytes:     int   = sum(batchResult.byteCount for batchResult in batchResults)
+        workSeconds:    float = sum(batchResult.elapsedSeconds for batchResult in batchResults)
+        elapsedSeconds: float = max(wallSeconds, 1e-9)
+
+        print('')
+        print(f'Files:       {len(batchResults)} ({failedCount} failed)')
+        print(f'Elapsed:     {wallSeconds:.3f} seconds wall, {workSeconds:.3f} seconds of work across {self._processCount} process(es)')
+        print(f'Throughput:  {len(batchResults) / elapsedSeconds:.1f} files/second, {totalBytes / MEGABYTE / elapsedSeconds:.2f} MB/second')
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    The console script entry point
+
+    Args:
+        arguments:  The command line arguments;  sys.argv when not provided
+
+    Returns:  0 when every file succeeded, else 1
+    """
+    argumentParser: ArgumentParser = _createArgumentParser()
+    namespace:      Namespace      = argumentParser.parse_args(arguments)
+
+    basicConfig(level=INFO if namespace.verbose is True else WARNING, format='%(levelname)s: %(name)s: %(message)s')
+
+    fileNames: List[Path] = collectProjectFiles(paths=namespace.paths, recursive=namespace.recursive)
+    if len(fileNames) == 0:
+        print('No project files found')
+        return 0
+
+    operation: BatchOperation = BatchOperation(namespace.operation)
+    if operation == BatchOperation.CONVERT:
+        batchWork: BatchWork = partial(convertProject, destinationSuffix=namespace.to, outputDirectory=namespace.outputDirectory)
+    elif operation == BatchOperation.VALIDATE:
+        batchWork = validateProject
+    else:
+        batchWork = resaveProject
+
+    batchResults: List[BatchResult] = UmlDiagrammerBatch(processCount=namespace.processes).run(fileNames=fileNames, batchWork=batchWork)
+
+    return 0 if all(batchResult.succeeded for batchResult in batchResults) else 1
+
+
+def _createArgumentParser() -> ArgumentParser:
+
+    argumentParser: ArgumentParser = ArgumentParser(prog=PROGRAM_NAME, description='Convert, validate or re-save UML Diagrammer project files')
+
+    argumentParser.add_argument('operation', choices=[batchOperation.value for batchOperation in BatchOperation])
+    argumentParser.add_argument('paths', nargs='+', type=Path, help='Project files and directories of project files')
+    argumentParser.add_argument('-r', '--recursive', action='store_true', help='Scan directories recursively')
+    argumentParser.add_argument('-p', '--processes', type=int, default=0, help='Worker processes;  Default is one per CPU')
+    argumentParser.add_argument('-t', '--to', default=PROJECT_FILE_SUFFIX, choices=[PROJECT_FILE_SUFFIX, CHUNKED_PROJECT_SUFFIX, XML_FILE_SUFFIX],
+                                help='convert:  The format to convert to')
+    argumentParser.add_argument('-o', '--output-directory', dest='outputDirectory', type=Path, default=None,
+                                help='convert:  Where to put the converted files;  Default is next to each source file')
+    argumentParser.add_argument('-v', '--verbose', action='store_true', help='Log progress')
+
+    return argumentParser
+
+
+if __name__ == '__main__':
+    sysExit(main())
@@ -0,0 +1,28 @@
+
+from typing import Optional
+
+from dataclasses import dataclass
+
+from umldiagrammer.BulkInsertion import BulkInsertion
+from umldiagrammer.DamageTracker import DamageTracker
+from umldiagrammer.DetailRenderer import DetailRenderer
+from umldiagrammer.PaintOverlay import PaintOverlay
+from umldiagrammer.ResizeWatcher import ResizeWatcher
+from umldiagrammer.ShapeLocator import ShapeLocator
+from umldiagrammer.ViewportCuller import ViewportCuller
+from umldiagrammer.ViewportSnapshot import ViewportSnapshot
+
+
+@dataclass
+class FrameServices:
+    """
+    The helpers the diagram manager attaches to a diagram frame;  They live and die with the frame
+    """
+    resizeWatcher:    ResizeWatcher                     # UML Shapes does not report resizes as modifications;  This does
+    bulkInsertion:    BulkInsertion                     # Adding shapes in bulk repaints the frame once;  Not once per shape
+    shapeLocator:     ShapeLocator                      # Finding the shape under the mouse and the diagram boundaries use a spatial index
+    paintOverlay:     PaintOverlay                      # The debug overlay of paint times;  Hidden unless turned on from the Help menu
+    viewportSnapshot: ViewportSnapshot                  # Switching back to the frame first shows a copy of its last rendered viewport
+    detailRenderer:   DetailRenderer                    # Shapes too small on screen to read are drawn in outline
+    damageTracker:    DamageTracker                     # Dragging shapes only repaints what they damaged
+    viewportCuller:   Optional[ViewportCuller] = None   # Only for very large diagrams;  Keeps the shapes near the visible region
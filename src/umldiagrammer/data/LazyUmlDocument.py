@@ -0,0 +1,80 @@
+
+from typing import Dict
+from typing import Callable
+from typing import cast
+
+from dataclasses import dataclass
+
+from xml.etree.ElementTree import Element
+
+from codeallybasic.SecureConversions import SecureConversions
+
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import UmlDocumentType
+from umlio.IOTypes import UmlDocumentTitle
+
+from umlio.XMLConstants import XmlConstants
+
+SourceLoader = Callable[[], Element]
+
+
+@dataclass
+class LazyUmlDocument(UmlDocument):
+    """
+    A UML document whose shapes have not been built yet;  Only the document
+    attributes are known.  The document source is the UMLDiagram element exactly
+    as it was read, so a document that is never opened is saved as it was read.
+
+    Containers that can read a single document leave the source unread until
+    it is needed.
+
+    A document whose diagram frame was evicted is its own fragment;  Rebuilding it
+    restores the scroll position
+    """
+    documentSource: Element      = cast(Element, None)
+    sourceLoader:   SourceLoader = cast(SourceLoader, None)
+    evicted:        bool         = False
+
+    def loadSource(self) -> Element:
+        """
+        Returns:  The document source;  Read on the first request
+        """
+        if self.documentSource is None:
+            self.documentSource = self.sourceLoader()
+
+        return self.documentSource
+
+    @classmethod
+    def fromDocumentSource(cls, documentSource: Element) -> 'LazyUmlDocument':
+        """
+
+        Args:
+            documentSource:  A UMLDiagram element
+
+        Returns:  The document index entry
+        """
+        lazyUmlDocument: LazyUmlDocument = LazyUmlDocument.fromDocumentAttributes(attributes=documentSource.attrib, sourceLoader=cast(SourceLoader, None))
+
+        lazyUmlDocument.documentSource = documentSource
+
+        return lazyUmlDocument
+
+    @classmethod
+    def fromDocumentAttributes(cls, attributes: Dict[str, str], sourceLoader: SourceLoader) -> 'LazyUmlDocument':
+        """
+
+        Args:
+            attributes:     The UMLDiagram element attributes
+            sourceLoader:   Reads the UMLDiagram element
+
+        Returns:  The document index entry
+        """
+        return LazyUmlDocument(
+            documentType=UmlDocumentType(attributes.get(XmlConstants.ATTRIBUTE_DOCUMENT_TYPE)),
+            documentTitle=UmlDocumentTitle(attributes.get(XmlConstants.ATTRIBUTE_TITLE)),
+            scrollPositionX=SecureConversions.secureInteger(attributes.get(XmlConstants.ATTRIBUTE_SCROLL_POSITION_X)),
+            scrollPositionY=SecureConversions.secureInteger(attributes.get(XmlConstants.ATTRIBUTE_SCROLL_POSITION_Y)),
+            pixelsPerUnitX=SecureConversions.secureInteger(attributes.get(XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_X)),
+            pixelsPerUnitY=SecureConversions.secureInteger(attributes.get(XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_Y)),
+            sourceLoader=sourceLoader
+        )
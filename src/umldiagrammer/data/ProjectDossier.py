@@ -1,10 +1,19 @@
 
+from typing import cast
+
 from dataclasses import dataclass
 
 from umlio.IOTypes import UmlProject
 
+from umldiagrammer.projectio.FragmentedUmlShapesToXml import DocumentFragments
+
 
 @dataclass
 class ProjectDossier:
-    umlProject: UmlProject
-    modified:   bool = False
+    """
+    When the document fragments are present they are the up-to-date serialized
+    UML documents;  The UML project documents may then be stale
+    """
+    umlProject:        UmlProject
+    modified:          bool              = False
+    documentFragments: DocumentFragments = cast(DocumentFragments, None)
@@ -14,16 +14,13 @@ from wx import OK
 from wx import FileDropTarget
 from wx import MessageDialog
 
-from wx import Yield as wxYield
-
 from umlio.IOTypes import XML_SUFFIX
 from umlio.IOTypes import PROJECT_SUFFIX
-from umlio.IOTypes import UmlProject
-
-from umlio.Reader import Reader
 
 from umldiagrammer.DiagrammerTypes import APPLICATION_FRAME_ID
 
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 from umldiagrammer.pubsubengine.MessageType import MessageType
 
@@ -55,7 +52,7 @@ class DiagrammerFileDropTarget(FileDropTarget):
 
         for fileName in filenames:
             self.logger.info(f'You dropped: {fileName}')
-            if fileName.endswith(XML_SUFFIX) or fileName.endswith(PROJECT_SUFFIX):
+            if fileName.endswith(XML_SUFFIX) or fileName.endswith(PROJECT_SUFFIX) or fileName.endswith(CHUNKED_PROJECT_SUFFIX):
                 fileNameList.append(fileName)
             else:
                 badFileNameList.append(fileName)
@@ -63,7 +60,7 @@ class DiagrammerFileDropTarget(FileDropTarget):
         self._loadFiles(fileNameList)
 
         if len(badFileNameList) > 0:
-            message: str    = f'Only {PROJECT_SUFFIX} and {XML_SUFFIX} files are supported'
+            message: str    = f'Only {PROJECT_SUFFIX}, {CHUNKED_PROJECT_SUFFIX} and {XML_SUFFIX} files are supported'
             caption: str    = 'Unsupported File Type'
             booBoo: MessageDialog = MessageDialog(parent=None, message=message, caption=caption, style=OK | ICON_ERROR)
             booBoo.ShowModal()
@@ -72,33 +69,22 @@ class DiagrammerFileDropTarget(FileDropTarget):
         return True
 
     def _loadFiles(self, filenames: FileNames):
-
-        for filename in filenames:
-            wxYield()
-            self._loadDroppedFile(filename=filename)
-
-        return True
-
-    def _loadDroppedFile(self, filename: str):
         """
+        The application frame reads the files in parallel in the background;  So, no
+        need to yield between files
 
         Args:
-            filename:  Should end with either PROJECT_SUFFIX or XML_SUFFIX
+            filenames:  Should end with PROJECT_SUFFIX, CHUNKED_PROJECT_SUFFIX or XML_SUFFIX
         """
+        fileNamePaths: List[Path] = [Path(filename) for filename in filenames]
 
-        fileNamePath: Path   = Path(filename)
-        suffix:       str    = fileNamePath.suffix
-        reader:       Reader = Reader()
-        if suffix == XML_SUFFIX:
-            umlProject: UmlProject = reader.readXmlFile(fileName=Path(fileNamePath))
-            self._appPubSubEngine.sendMessage(messageType=MessageType.OPEN_PROJECT, uniqueId=APPLICATION_FRAME_ID, umlProject=umlProject)
+        for fileNamePath in fileNamePaths:
+            assert fileNamePath.suffix in (XML_SUFFIX, PROJECT_SUFFIX, CHUNKED_PROJECT_SUFFIX), 'We should not get files with bad suffixes'
 
-        elif suffix == PROJECT_SUFFIX:
-            umlProject = reader.readProjectFile(fileName=fileNamePath)
-            self._appPubSubEngine.sendMessage(messageType=MessageType.OPEN_PROJECT, uniqueId=APPLICATION_FRAME_ID, umlProject=umlProject)
+        if len(fileNamePaths) > 0:
+            self._appPubSubEngine.sendMessage(messageType=MessageType.LOAD_PROJECT_FILES, uniqueId=APPLICATION_FRAME_ID, fileNames=fileNamePaths)
 
-        else:
-            assert False, 'We should not get files with bad suffixes'
+        return True
 
     def _displayError(self, message: str):
 
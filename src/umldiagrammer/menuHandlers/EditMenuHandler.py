@@ -77,9 +77,7 @@ class EditMenuHandler(BaseMenuHandler):
             case wx.ID_COPY:
                 self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.COPY_SHAPES, frameId=self._activeFrameId)
             case wx.ID_PASTE:
-                self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.PASTE_SHAPES, frameId=self._activeFrameId)
-            case wx.ID_PASTE:
-                self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.PASTE_SHAPES, frameId=self._activeFrameId)
+                self._appPubSubEngine.sendMessage(MessageType.PASTE_SHAPES, uniqueId=cast(UniqueId, self._activeFrameId), frameId=self._activeFrameId)
             case wx.ID_SELECTALL:
                 self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.SELECT_ALL_SHAPES, frameId=self._activeFrameId)
             case _:
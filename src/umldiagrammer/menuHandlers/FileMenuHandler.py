@@ -8,7 +8,6 @@ from logging import getLogger
 
 from pathlib import Path
 
-from wx import OK
 from wx import ID_EXIT
 from wx import EVT_MENU
 from wx import FD_OPEN
@@ -17,7 +16,6 @@ from wx import ID_FILE9
 from wx import ID_OPEN
 from wx import ID_SAVE
 from wx import ID_SAVEAS
-from wx import ICON_ERROR
 from wx import FD_CHANGE_DIR
 from wx import ID_PREFERENCES
 from wx import EVT_MENU_RANGE
@@ -26,21 +24,16 @@ from wx import FD_FILE_MUST_EXIST
 from wx import FileSelector
 from wx import CommandEvent
 from wx import Menu
-from wx import MessageDialog
 from wx import Notebook
 from wx import FileHistory
 
 from wx.lib.sized_controls import SizedFrame
 
-from umlio.Reader import Reader
-
 from umlio.IOTypes import UmlProject
 from umlio.IOTypes import UmlDocumentType
 from umlio.IOTypes import XML_SUFFIX
 from umlio.IOTypes import PROJECT_SUFFIX
 
-from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
-
 from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
 
 from umldiagrammer.dialogs.DlgEditProjectHistory import DlgEditProjectHistory
@@ -55,11 +48,13 @@ from umldiagrammer.UIIdentifiers import UIIdentifiers
 from umldiagrammer.menuHandlers.BaseMenuHandler import BaseMenuHandler
 from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
 
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
 from umldiagrammer.pubsubengine.MessageType import MessageType
 
 
-PROJECT_WILDCARD: str = f'UML Diagrammer files (*.{PROJECT_SUFFIX})|*{PROJECT_SUFFIX}'
+PROJECT_WILDCARD: str = f'UML Diagrammer files (*{PROJECT_SUFFIX};*{CHUNKED_PROJECT_SUFFIX})|*{PROJECT_SUFFIX};*{CHUNKED_PROJECT_SUFFIX}'
 XML_WILDCARD:     str = f'Extensible Markup Language (*.{XML_SUFFIX})|*{XML_SUFFIX}'
 
 FileNames = NewType('FileNames', List[str])
@@ -108,6 +103,7 @@ class FileMenuHandler(BaseMenuHandler):
         sizedFrame.Bind(EVT_MENU, self.onNewSequenceDiagram, id=UIIdentifiers.ID_MENU_FILE_NEW_SEQUENCE_DIAGRAM)
 
         sizedFrame.Bind(EVT_MENU, self._onOpenXmlFile,       id=UIIdentifiers.ID_FILE_MENU_OPEN_XML_PROJECT)
+        sizedFrame.Bind(EVT_MENU, self._onCancelProjectLoad, id=UIIdentifiers.ID_MENU_FILE_CANCEL_PROJECT_LOAD)
         sizedFrame.Bind(EVT_MENU, self.onFileSave, id=ID_SAVE)
         sizedFrame.Bind(EVT_MENU, self._onFileSaveAs,        id=ID_SAVEAS)
         sizedFrame.Bind(EVT_MENU, self._onCloseProject,      id=UIIdentifiers.ID_MENU_FILE_PROJECT_CLOSE)
@@ -128,10 +124,7 @@ class FileMenuHandler(BaseMenuHandler):
     def onOpenProject(self, _event: CommandEvent):
         selectedFile: str = FileSelector("Choose a project file to load", wildcard=PROJECT_WILDCARD, flags=FD_OPEN | FD_FILE_MUST_EXIST | FD_CHANGE_DIR)
         if selectedFile != '':
-            reader: Reader = Reader()
-
-            umlProject: UmlProject = reader.readProjectFile(fileName=Path(selectedFile))
-            self._loadProject(umlProject)
+            self._loadProjectFile(fileName=Path(selectedFile))
 
     def onNewProject(self, _event: CommandEvent):
         """
@@ -156,10 +149,10 @@ class FileMenuHandler(BaseMenuHandler):
 
         selectedFile: str = FileSelector("Choose a XML file to load", wildcard=XML_WILDCARD, flags=FD_OPEN | FD_FILE_MUST_EXIST | FD_CHANGE_DIR)
         if selectedFile != '':
-            reader: Reader = Reader()
-            umlProject: UmlProject = reader.readXmlFile(fileName=Path(selectedFile))
-            self.logger.debug(f'{umlProject=}')
-            self._loadProject(umlProject)
+            self._loadProjectFile(fileName=Path(selectedFile))
+
+    def _onCancelProjectLoad(self, _event: CommandEvent):
+        self._appPubSubEngine.sendMessage(messageType=MessageType.CANCEL_PROJECT_LOAD, uniqueId=APPLICATION_FRAME_ID)
 
     def _onFileSaveAs(self, _event: CommandEvent):
         self._appPubSubEngine.sendMessage(messageType=MessageType.SAVE_AS_PROJECT, uniqueId=APPLICATION_FRAME_ID)
@@ -181,6 +174,15 @@ class FileMenuHandler(BaseMenuHandler):
     def _loadProject(self, umlProject: UmlProject):
         self._appPubSubEngine.sendMessage(messageType=MessageType.OPEN_PROJECT, uniqueId=APPLICATION_FRAME_ID, umlProject=umlProject)
 
+    def _loadProjectFile(self, fileName: Path):
+        """
+        The application frame reads the file in the background and then opens the project
+
+        Args:
+            fileName:  Either a PROJECT_SUFFIX or XML_SUFFIX file
+        """
+        self._appPubSubEngine.sendMessage(messageType=MessageType.LOAD_PROJECT_FILE, uniqueId=APPLICATION_FRAME_ID, fileName=fileName)
+
     def _onPreferences(self, _event: CommandEvent):
 
         with DlgPreferences(parent=self._sizedFrame, appPubSubEngine=self._appPubSubEngine) as dlg:
@@ -197,18 +199,7 @@ class FileMenuHandler(BaseMenuHandler):
         fileName: str = self._fileHistory.GetHistoryFile(fileNum)
 
         self.logger.debug(f'filename: {fileName}')
-        filePath: Path = Path(fileName)
-        suffix:   str  = filePath.suffix
-        reader: Reader = Reader()
-        try:
-            if suffix == PROJECT_SUFFIX:
-                umlProject: UmlProject = reader.readProjectFile(fileName=filePath)
-            elif suffix == XML_SUFFIX:
-                umlProject = reader.readXmlFile(fileName=filePath)
-            else:
-                raise UnsupportedFileTypeException(message=f'Only {PROJECT_SUFFIX} or {XML_SUFFIX} file types supported')
-
-            self._loadProject(umlProject)
-        except FileNotFoundError:
-            booBoo: MessageDialog = MessageDialog(parent=None, message='That project no longer exists', caption='Error', style=OK | ICON_ERROR)
-            booBoo.ShowModal()
+        #
+        # The loader reports missing files and unsupported file types
+        #
+        self._loadProjectFile(fileName=Path(fileName))
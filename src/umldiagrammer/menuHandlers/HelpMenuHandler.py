@@ -21,9 +21,13 @@ from wx.lib.sized_controls import SizedFrame
 from umldiagrammer.menuHandlers.BaseMenuHandler import BaseMenuHandler
 from umldiagrammer.pubsubengine.AppPubSubEngine import AppPubSubEngine
 from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
+from umldiagrammer.pubsubengine.MessageType import MessageType
 
 from umldiagrammer.dialogs.DlgAbout import DlgAbout
 
+from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
+
+from umldiagrammer.DiagrammerTypes import NOTEBOOK_ID
 from umldiagrammer.UIIdentifiers import UIIdentifiers
 
 
@@ -35,6 +39,7 @@ class HelpMenuHandler(BaseMenuHandler):
         super().__init__(sizedFrame=sizedFrame, menu=menu, appPubSubEngine=appPubSubEngine, umlPubSubEngine=umlPubSubEngine)
 
         sizedFrame.Bind(EVT_MENU, self._onDebugAppPubSub, id=UIIdentifiers.ID_MENU_HELP_PUB_SUB_ENGINE)
+        sizedFrame.Bind(EVT_MENU, self._onDebugPaintStatistics, id=UIIdentifiers.ID_MENU_HELP_PAINT_STATISTICS)
         sizedFrame.Bind(EVT_MENU, self._onAbout, id=ID_ABOUT)
 
         self._topicCount: Dict[str, int] = {}
@@ -63,6 +68,19 @@ class HelpMenuHandler(BaseMenuHandler):
         # self.logger.info(f'\n{gorgeousStr}')
         print(f'\n{gorgeousStr}')
 
+    def _onDebugPaintStatistics(self, event: CommandEvent):
+        """
+        Show or hide the paint statistics overlay of the diagram frames;  While shown
+        the statistics are also logged
+
+        Args:
+            event:
+        """
+        shown: bool = event.IsChecked()
+
+        DiagrammerPreferences().paintStatistics = shown
+        self._appPubSubEngine.sendMessage(messageType=MessageType.PAINT_STATISTICS_CHANGED, uniqueId=NOTEBOOK_ID, shown=shown)
+
     # noinspection PyUnusedLocal
     def _snoop(self, opaqueTopicStr=pub.AUTO_TOPIC, **kwargs):
 
@@ -0,0 +1,35 @@
+
+from umlio.IOTypes import UmlProject
+from umlio.IOTypes import UmlDocument
+
+
+def shapeCount(umlDocument: UmlDocument) -> int:
+    """
+    Documents that are loaded lazily have no shapes until they are displayed
+
+    Args:
+        umlDocument:
+
+    Returns:  The number of shapes;  Not links
+    """
+    return (len(umlDocument.umlClasses) + len(umlDocument.umlNotes) + len(umlDocument.umlTexts) +
+            len(umlDocument.umlActors) + len(umlDocument.umlUseCases))
+
+
+def linkCount(umlDocument: UmlDocument) -> int:
+    """
+
+    Args:
+        umlDocument:
+
+    Returns:  The number of links including lollipop interfaces
+    """
+    return len(umlDocument.umlLinks) + len(umlDocument.umlLollipopInterfaces)
+
+
+def projectShapeCount(umlProject: UmlProject) -> int:
+    return sum(shapeCount(umlDocument=umlDocument) for umlDocument in umlProject.umlDocuments.values())
+
+
+def projectLinkCount(umlProject: UmlProject) -> int:
+    return sum(linkCount(umlDocument=umlDocument) for umlDocument in umlProject.umlDocuments.values())
@@ -0,0 +1,130 @@
+
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from collections import deque
+
+from dataclasses import dataclass
+
+from time import monotonic
+
+DEFAULT_WINDOW_SECONDS: float = 5.0
+
+
+@dataclass(frozen=True)
+class PaintSample:
+    at:          float      # monotonic seconds
+    paintMs:     float
+    shapesDrawn: int
+    linksDrawn:  int
+    mode:        str        # 'full', 'damaged' or 'snapshot'
+
+
+class PaintStatistics:
+    """
+    Rolling statistics of how a diagram frame paints:  How long paints take, how much
+    they draw, and how many paints and input events there are per second.  Only the
+    samples of the last few seconds are kept.
+
+    Drawing code counts what it draws with countDrawn;  The counts go to the next paint
+    recorded
+    """
+    def __init__(self, windowSeconds: float = DEFAULT_WINDOW_SECONDS):
+        """
+
+        Args:
+            windowSeconds:  How far back the statistics look
+        """
+        self._windowSeconds: float = windowSeconds
+
+        self._paints: Deque[PaintSample] = deque()
+        self._events: Deque[float]       = deque()
+
+        self._shapesDrawn: int = 0       # Since the last paint was recorded
+        self._linksDrawn:  int = 0
+
+    def countDrawn(self, shapes: int = 0, links: int = 0):
+        """
+        Args:
+            shapes: Drawn in the current paint
+            links:  Drawn in the current paint
+        """
+        self._shapesDrawn += shapes
+        self._linksDrawn  += links
+
+    def recordPaint(self, seconds: float, mode: str, at: Optional[float] = None):
+        """
+        The current paint is complete
+
+        Args:
+            seconds:    How long it took
+            mode:       How it painted
+            at:         When it completed;  Now if not given
+        """
+        now: float = monotonic() if at is None else at
+
+        self._paints.append(PaintSample(at=now, paintMs=seconds * 1000.0, shapesDrawn=self._shapesDrawn, linksDrawn=self._linksDrawn, mode=mode))
+        self._shapesDrawn = 0
+        self._linksDrawn  = 0
+
+        self._expire(now=now)
+
+    def recordEvent(self, at: Optional[float] = None):
+        """
+        Args:
+            at:     When an input event arrived;  Now if not given
+        """
+        now: float = monotonic() if at is None else at
+
+        self._events.append(now)
+        self._expire(now=now)
+
+    @property
+    def lastPaint(self) -> Optional[PaintSample]:
+        if len(self._paints) == 0:
+            return None
+        return self._paints[-1]
+
+    def summary(self, at: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Args:
+            at:     The end of the window;  Now if not given
+
+        Returns:  The statistics of the window
+        """
+        now: float = monotonic() if at is None else at
+        self._expire(now=now)
+
+        paintTimes: List[float] = sorted(sample.paintMs for sample in self._paints)
+        paintCount: int         = len(paintTimes)
+
+        summary: Dict[str, Any] = {
+            'windowSeconds':   self._windowSeconds,
+            'paints':          paintCount,
+            'paintsPerSecond': round(paintCount / self._windowSeconds, 2),
+            'eventsPerSecond': round(len(self._events) / self._windowSeconds, 2),
+        }
+        if paintCount > 0:
+            lastPaint: PaintSample = self._paints[-1]
+            summary.update({
+                'lastPaintMs':   round(lastPaint.paintMs, 2),
+                'meanPaintMs':   round(sum(paintTimes) / paintCount, 2),
+                'p95PaintMs':    round(paintTimes[min(paintCount - 1, int(paintCount * 0.95))], 2),
+                'maxPaintMs':    round(paintTimes[-1], 2),
+                'shapesDrawn':   lastPaint.shapesDrawn,
+                'linksDrawn':    lastPaint.linksDrawn,
+                'lastPaintMode': lastPaint.mode,
+            })
+
+        return summary
+
+    def _expire(self, now: float):
+
+        oldest: float = now - self._windowSeconds
+        while len(self._paints) > 0 and self._paints[0].at < oldest:
+            self._paints.popleft()
+        while len(self._events) > 0 and self._events[0] < oldest:
+            self._events.popleft()
@@ -0,0 +1,155 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import INFO
+from logging import Logger
+from logging import getLogger
+
+from json import dumps as jsonDumps
+
+from threading import local
+
+from time import time
+from time import perf_counter
+
+PERFORMANCE_LOGGER_NAME: str = 'umldiagrammer.performance'
+
+KEY_PHASE:      str = 'phase'
+KEY_PARENT:     str = 'parent'
+KEY_STARTED_AT: str = 'startedAt'
+KEY_ELAPSED_MS: str = 'elapsedMs'
+KEY_FAILED:     str = 'failed'
+
+
+class _SpanStack(local):
+    """
+    Each thread nests its own spans
+    """
+    def __init__(self):
+        self.spans: List['TimingSpan'] = []
+
+
+_spanStack: _SpanStack = _SpanStack()
+
+
+class TimingSpan:
+    """
+    Times a phase of work and writes it to the performance logger as a single line JSON
+    record.  Use it as a context manager.  Spans nest per thread;  A record names the phase
+    of the span it ran in.
+
+    The fields are free form;  Typically shape and link counts.  Durations of work spread
+    across the span, such as the event handler wiring of each shape, can be added up
+    with addDuration.
+
+    Spans that run many times a second, such as paints, log at DEBUG so that they
+    are only written when asked for
+    """
+    def __init__(self, phase: str, logLevel: int = INFO, **fields: Any):
+        """
+
+        Args:
+            phase:      What is being timed;  Dotted names group related phases
+            logLevel:   The record is written at this level
+            **fields:   Added to the record
+        """
+        self._logger: Logger = getLogger(PERFORMANCE_LOGGER_NAME)
+
+        self._phase:     str                    = phase
+        self._logLevel:  int                    = logLevel
+        self._fields:    Dict[str, Any]         = dict(fields)
+        self._parent:    Optional[TimingSpan]   = None
+        self._startedAt: float                  = 0.0
+        self._startTime: float                  = 0.0
+        self._elapsed:   float                  = 0.0
+
+    @classmethod
+    def current(cls) -> Optional['TimingSpan']:
+        """
+        Returns:  The innermost span of this thread;  None when no span is running
+        """
+        if len(_spanStack.spans) == 0:
+            return None
+        return _spanStack.spans[-1]
+
+    @property
+    def phase(self) -> str:
+        return self._phase
+
+    @property
+    def elapsedSeconds(self) -> float:
+        """
+        Complete when the span exits
+        """
+        return self._elapsed
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        return self._fields
+
+    def set(self, **fields: Any):
+        """
+        Add fields that are only known once the work is underway
+        """
+        self._fields.update(fields)
+
+    def addDuration(self, field: str, seconds: float):
+        """
+
+        Args:
+            field:      Accumulates milliseconds
+            seconds:    The duration to add
+        """
+        self._fields[field] = self._fields.get(field, 0.0) + seconds * 1000.0
+
+    def __enter__(self) -> 'TimingSpan':
+
+        self._parent = TimingSpan.current()
+        _spanStack.spans.append(self)
+
+        self._startedAt = time()
+        self._startTime = perf_counter()
+
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+
+        self._elapsed = perf_counter() - self._startTime
+
+        if len(_spanStack.spans) > 0 and _spanStack.spans[-1] is self:
+            _spanStack.spans.pop()
+
+        if self._logger.isEnabledFor(self._logLevel):
+            self._logger.log(self._logLevel, jsonDumps(self.toRecord(failed=exceptionType is not None), default=str))
+
+        return False
+
+    def toRecord(self, failed: bool = False) -> Dict[str, Any]:
+
+        record: Dict[str, Any] = {
+            KEY_PHASE:      self._phase,
+            KEY_PARENT:     None if self._parent is None else self._parent.phase,
+            KEY_STARTED_AT: round(self._startedAt, 3),
+            KEY_ELAPSED_MS: round(self._elapsed * 1000.0, 3),
+            KEY_FAILED:     failed,
+        }
+        for name, value in self._fields.items():
+            record[name] = round(value, 3) if isinstance(value, float) else value
+
+        return record
+
+
+def addSpanDuration(field: str, seconds: float):
+    """
+    Adds to the innermost span of this thread;  Does nothing when no span is running
+
+    Args:
+        field:      Accumulates milliseconds
+        seconds:    The duration to add
+    """
+    timingSpan: Optional[TimingSpan] = TimingSpan.current()
+    if timingSpan is not None:
+        timingSpan.addDuration(field=field, seconds=seconds)
@@ -34,6 +34,27 @@ DEFAULT_PROJECT_TAB_POSITION: str = ProjectTabPosition.TOP.value
 
 DEFAULT_OPEN_FILE_PATH:     Path = Path('/Users/humberto.a.sanchez.ii/UmlDiagramProjects/OpenFileEventTest.udt')
 DEFAULT_DIAGRAMS_DIRECTORY: Path = Path('/tmp')
+DEFAULT_RECOVERY_DIRECTORY: Path = Path.home() / '.umlDiagrammer' / 'recovery'
+
+DEFAULT_AUTO_SAVE_INTERVAL:      str = '60'                  # seconds
+DEFAULT_AUTO_SAVE_BYTES_PER_SEC: str = str(1024 * 1024)
+
+DEFAULT_STREAMING_IMPORT_THRESHOLD: str = str(32 * 1024 * 1024)     # XML files at least this big are streamed
+
+DEFAULT_PARSED_PROJECT_CACHE_DIRECTORY: Path = Path.home() / '.umlDiagrammer' / 'parsedProjects'
+DEFAULT_PARSED_PROJECT_CACHE_MAX_BYTES: str  = str(256 * 1024 * 1024)
+
+DEFAULT_RESIDENT_FRAME_LIMIT: str = '16'                       # 0 keeps every diagram frame
+DEFAULT_RESIDENT_BYTES_LIMIT: str = str(512 * 1024 * 1024)     # Estimated;  0 for no limit
+
+DEFAULT_VIEWPORT_CULLING_THRESHOLD: str = '2000'    # Shapes;  0 never culls
+DEFAULT_VIEWPORT_CULLING_MARGIN:    str = '400'     # Pixels
+
+DEFAULT_READABLE_TEXT_HEIGHT: str = '6'     # Pixels;  0 always draws text
+DEFAULT_MINIMUM_DETAIL_SIZE:  str = '16'    # Pixels;  0 never outlines small shapes
+
+DEFAULT_THUMBNAIL_CACHE_DIRECTORY: Path = Path.home() / '.umlDiagrammer' / 'thumbnails'
+DEFAULT_THUMBNAIL_CACHE_MAX_BYTES: str  = str(16 * 1024 * 1024)
 
 SECTION_GENERAL: ValueDescriptions = ValueDescriptions(
     {
@@ -69,14 +90,61 @@ SECTION_DEBUG: ValueDescriptions = ValueDescriptions(
         KeyName('testSize'):       ValueDescription(defaultValue=TEST_SIZE,              deserializer=Dimensions.deSerialize),
         KeyName('debugOpenFiles'): ValueDescription(defaultValue='False',                deserializer=SecureConversions.secureBoolean),
         KeyName('debugOpenFilePath'):   ValueDescription(defaultValue=str(DEFAULT_OPEN_FILE_PATH), deserializer=Path),
+        KeyName('paintStatistics'):     ValueDescription(defaultValue='False',                deserializer=SecureConversions.secureBoolean),
+
+    }
+)
+SECTION_AUTO_SAVE: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('autoSaveEnabled'):           ValueDescription(defaultValue='True',                          deserializer=SecureConversions.secureBoolean),
+        KeyName('autoSaveInterval'):          ValueDescription(defaultValue=DEFAULT_AUTO_SAVE_INTERVAL,      deserializer=SecureConversions.secureInteger),
+        KeyName('autoSaveMaxBytesPerSecond'): ValueDescription(defaultValue=DEFAULT_AUTO_SAVE_BYTES_PER_SEC, deserializer=SecureConversions.secureInteger),
+        KeyName('recoveryDirectory'):         ValueDescription(defaultValue=str(DEFAULT_RECOVERY_DIRECTORY), deserializer=Path),
+    }
+)
+SECTION_IMPORT: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('streamingImportThreshold'): ValueDescription(defaultValue=DEFAULT_STREAMING_IMPORT_THRESHOLD, deserializer=SecureConversions.secureInteger),
+        KeyName('traceImportMemory'):        ValueDescription(defaultValue='False',                            deserializer=SecureConversions.secureBoolean),
+        KeyName('lazyDiagramLoading'):       ValueDescription(defaultValue='True',                             deserializer=SecureConversions.secureBoolean),
+
+        KeyName('parsedProjectCacheEnabled'):   ValueDescription(defaultValue='True',                                      deserializer=SecureConversions.secureBoolean),
+        KeyName('parsedProjectCacheDirectory'): ValueDescription(defaultValue=str(DEFAULT_PARSED_PROJECT_CACHE_DIRECTORY), deserializer=Path),
+        KeyName('parsedProjectCacheMaxBytes'):  ValueDescription(defaultValue=DEFAULT_PARSED_PROJECT_CACHE_MAX_BYTES,      deserializer=SecureConversions.secureInteger),
+    }
+)
+SECTION_MEMORY: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('residentFrameLimit'): ValueDescription(defaultValue=DEFAULT_RESIDENT_FRAME_LIMIT, deserializer=SecureConversions.secureInteger),
+        KeyName('residentBytesLimit'): ValueDescription(defaultValue=DEFAULT_RESIDENT_BYTES_LIMIT, deserializer=SecureConversions.secureInteger),
 
+        KeyName('viewportCullingThreshold'): ValueDescription(defaultValue=DEFAULT_VIEWPORT_CULLING_THRESHOLD, deserializer=SecureConversions.secureInteger),
+        KeyName('viewportCullingMargin'):    ValueDescription(defaultValue=DEFAULT_VIEWPORT_CULLING_MARGIN,    deserializer=SecureConversions.secureInteger),
+    }
+)
+SECTION_RENDERING: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('readableTextHeight'): ValueDescription(defaultValue=DEFAULT_READABLE_TEXT_HEIGHT, deserializer=SecureConversions.secureInteger),
+        KeyName('minimumDetailSize'):  ValueDescription(defaultValue=DEFAULT_MINIMUM_DETAIL_SIZE,  deserializer=SecureConversions.secureInteger),
+    }
+)
+SECTION_THUMBNAILS: ValueDescriptions = ValueDescriptions(
+    {
+        KeyName('diagramThumbnails'):       ValueDescription(defaultValue='True',                                 deserializer=SecureConversions.secureBoolean),
+        KeyName('thumbnailCacheDirectory'): ValueDescription(defaultValue=str(DEFAULT_THUMBNAIL_CACHE_DIRECTORY), deserializer=Path),
+        KeyName('thumbnailCacheMaxBytes'):  ValueDescription(defaultValue=DEFAULT_THUMBNAIL_CACHE_MAX_BYTES,      deserializer=SecureConversions.secureInteger),
     }
 )
 DIAGRAMMER_SECTIONS: Sections = Sections(
     {
-        SectionName('General'): SECTION_GENERAL,
-        SectionName('Startup'): SECTION_STARTUP,
-        SectionName('Debug'):   SECTION_DEBUG,
+        SectionName('General'):    SECTION_GENERAL,
+        SectionName('Startup'):    SECTION_STARTUP,
+        SectionName('AutoSave'):   SECTION_AUTO_SAVE,
+        SectionName('Import'):     SECTION_IMPORT,
+        SectionName('Memory'):     SECTION_MEMORY,
+        SectionName('Rendering'):  SECTION_RENDERING,
+        SectionName('Thumbnails'): SECTION_THUMBNAILS,
+        SectionName('Debug'):      SECTION_DEBUG,
     }
 )
 
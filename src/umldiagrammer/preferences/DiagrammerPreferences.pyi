@@ -25,8 +25,28 @@ class DiagrammerPreferences:
     startupPosition: Position
     toolBarPosition: ToolBarPosition
     projectTabPosition: ProjectTabPosition
+    autoSaveEnabled: bool
+    autoSaveInterval: int
+    autoSaveMaxBytesPerSecond: int
+    recoveryDirectory: Path
+    streamingImportThreshold: int
+    traceImportMemory: bool
+    lazyDiagramLoading: bool
+    parsedProjectCacheEnabled: bool
+    parsedProjectCacheDirectory: Path
+    parsedProjectCacheMaxBytes: int
+    residentFrameLimit: int
+    residentBytesLimit: int
+    viewportCullingThreshold: int
+    viewportCullingMargin: int
+    readableTextHeight: int
+    minimumDetailSize: int
+    diagramThumbnails: bool
+    thumbnailCacheDirectory: Path
+    thumbnailCacheMaxBytes: int
     inTestMode: bool
     testPosition: Position
     testSize: Dimensions
     debugOpenFiles: bool
     debugOpenFilePath: Path
+    paintStatistics: bool
@@ -0,0 +1,84 @@
+from os import open as osOpen
+from os import chmod
+from os import close
+from os import fsync
+from os import write
+from os import O_EXCL
+from os import O_CREAT
+from os import O_RDONLY
+from os import O_WRONLY
+from os import replace as osReplace
+
+from pathlib import Path
+
+from secrets import token_hex
+
+from stat import S_IMODE
+
+try:
+    from os import O_BINARY         # type: ignore[attr-defined]
+except ImportError:
+    O_BINARY = 0                    # Only Windows has it
+
+TEMPORARY_SUFFIX: str = '.saving'
+
+NEW_FILE_MODE: int = 0o666      # Less the umask, as for any new file
+
+
+def atomicWrite(fileName: Path, contents: bytes):
+    """
+    Write to a temporary file in the destination directory, flush it to disk and then rename
+    it over the destination.  Readers see either the old file or the new one, never a partial one.
+    The temporary file has to live in the destination directory;  Otherwise, the rename is not
+    guaranteed to be atomic.
+
+    A symbolic link is written through, so the link stays a link.  The file keeps its permissions;
+    A new file gets the usual permissions.  The directory is flushed after the rename so that the
+    rename itself survives a crash
+
+    Args:
+        fileName:   The final file name
+        contents:   The bytes to write
+    """
+    targetName:    Path = fileName.resolve()
+    temporaryName: Path = targetName.parent / f'.{targetName.stem}-{token_hex(4)}{TEMPORARY_SUFFIX}'
+
+    try:
+        fileDescriptor: int = osOpen(temporaryName, O_WRONLY | O_CREAT | O_EXCL | O_BINARY, NEW_FILE_MODE)
+        try:
+            view: memoryview = memoryview(contents)
+            while len(view) > 0:
+                view = view[write(fileDescriptor, view):]
+            fsync(fileDescriptor)
+        finally:
+            close(fileDescriptor)
+
+        if targetName.exists() is True:
+            chmod(temporaryName, S_IMODE(targetName.stat().st_mode))
+
+        osReplace(temporaryName, targetName)
+    except OSError:
+        temporaryName.unlink(missing_ok=True)
+        raise
+
+    _syncDirectory(directory=targetName.parent)
+
+
+def _syncDirectory(directory: Path):
+    """
+    Not every platform can open a directory;  There the rename is as durable as the platform makes it
+
+    Args:
+        directory:  The directory that holds the renamed file
+    """
+    try:
+        directoryDescriptor: int = osOpen(directory, O_RDONLY)
+    except OSError:
+        return
+    try:
+        fsync(directoryDescriptor)
+    except OSError:
+        pass
+    finally:
+        close(directoryDescriptor)
+
@@ -0,0 +1,169 @@
+
+from typing import List
+from typing import NewType
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from datetime import datetime
+
+from hashlib import sha1
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from pathlib import Path
+
+from zlib import compress
+
+from umldiagrammer.projectio.IOBudget import IOBudget
+from umldiagrammer.projectio.AtomicWrite import atomicWrite
+from umldiagrammer.projectio.ProjectFileTypes import PROJECT_FILE_SUFFIX
+
+MANIFEST_SUFFIX: str = '.json'
+SNAPSHOT_SUFFIX: str = PROJECT_FILE_SUFFIX      # So that snapshots load like any project file
+
+KEY_PROJECT_PATH: str = 'projectPath'
+KEY_SAVED_AT:     str = 'savedAt'
+
+
+@dataclass
+class JournalEntry:
+    projectPath: Path       # Where the project really lives
+    journalFile: Path       # The recovery snapshot;  A compressed project file
+    savedAt:     str = ''
+
+
+JournalEntries = NewType('JournalEntries', List[JournalEntry])
+
+
+class AutoSaveJournal:
+    """
+    Keeps crash recovery snapshots of projects in the recovery directory.  Each project
+    has a compressed snapshot and a small JSON manifest that remembers where the project
+    really lives.  The manifest is written after the snapshot, so a manifest always
+    points to a complete snapshot.
+
+    Writes are blocking and rate limited;  Only call .write() from a worker thread
+    """
+    def __init__(self, recoveryDirectory: Path, ioBudget: Optional[IOBudget] = None):
+        """
+
+        Args:
+            recoveryDirectory:  Where the snapshots live;  Created when needed
+            ioBudget:           Caps the write rate;  No cap if not provided
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._recoveryDirectory: Path               = recoveryDirectory
+        self._ioBudget:          Optional[IOBudget] = ioBudget
+
+    @property
+    def recoveryDirectory(self) -> Path:
+        return self._recoveryDirectory
+
+    def write(self, projectPath: Path, rawXml: str, instance: str = '') -> int:
+        """
+        Replace the recovery snapshot of a project
+
+        Args:
+            projectPath:    The real project file name
+            rawXml:         The serialized project
+            instance:       Tells apart projects that share a file name;  e.g. untitled ones
+
+        Returns:  The number of bytes written
+        """
+        self._recoveryDirectory.mkdir(parents=True, exist_ok=True)
+
+        compressedBytes: bytes = compress(rawXml.encode())
+        manifestBytes:   bytes = jsonDumps({
+            KEY_PROJECT_PATH: str(projectPath),
+            KEY_SAVED_AT:     datetime.now().isoformat(timespec='seconds'),
+        }).encode()
+
+        byteCount: int = len(compressedBytes) + len(manifestBytes)
+        if self._ioBudget is not None:
+            self._ioBudget.throttle(byteCount=byteCount)
+
+        journalFile: Path = self.journalFile(projectPath=projectPath, instance=instance)
+
+        atomicWrite(fileName=journalFile, contents=compressedBytes)
+        atomicWrite(fileName=journalFile.with_suffix(MANIFEST_SUFFIX), contents=manifestBytes)
+
+        self.logger.debug(f'Journaled {projectPath} - {byteCount} bytes')
+
+        return byteCount
+
+    def discard(self, projectPath: Path, instance: str = ''):
+        """
+        The project was saved or deliberately closed;  Nothing to recover
+
+        Args:
+            projectPath:  The real project file name
+            instance:     As given to .write()
+        """
+        self.discardSnapshot(journalFile=self.journalFile(projectPath=projectPath, instance=instance))
+
+    def discardSnapshot(self, journalFile: Path):
+        """
+        Discard by snapshot;  For projects restored from a JournalEntry
+
+        Args:
+            journalFile:  The snapshot
+        """
+        journalFile.with_suffix(MANIFEST_SUFFIX).unlink(missing_ok=True)
+        journalFile.unlink(missing_ok=True)
+
+    def entries(self) -> JournalEntries:
+        """
+        Unreadable manifests and manifests without a snapshot are ignored
+
+        Returns:  The recoverable projects
+        """
+        journalEntries: JournalEntries = JournalEntries([])
+
+        if self._recoveryDirectory.is_dir() is False:
+            return journalEntries
+
+        for manifestFile in sorted(self._recoveryDirectory.glob(f'*{MANIFEST_SUFFIX}')):
+            journalFile: Path = manifestFile.with_suffix(SNAPSHOT_SUFFIX)
+            try:
+                manifest = jsonLoads(manifestFile.read_text())
+                if journalFile.exists() is True:
+                    journalEntries.append(JournalEntry(projectPath=Path(manifest[KEY_PROJECT_PATH]),
+                                                       journalFile=journalFile,
+                                                       savedAt=manifest.get(KEY_SAVED_AT, ''))
+                                          )
+            except (OSError, ValueError, KeyError) as e:
+                self.logger.warning(f'Ignoring recovery manifest {manifestFile.name}: {e}')
+
+        return journalEntries
+
+    def journalFile(self, projectPath: Path, instance: str = '') -> Path:
+        """
+        Args:
+            projectPath:    The real project file name
+            instance:       As given to .write()
+
+        Returns:  Where the project's snapshot lives;  Its manifest sits beside it
+        """
+        return self._recoveryDirectory / f'{self._journalKey(projectPath=projectPath, instance=instance)}{SNAPSHOT_SUFFIX}'
+
+    def _journalKey(self, projectPath: Path, instance: str) -> str:
+        """
+        Projects in different directories may share a name
+
+        Args:
+            projectPath:
+            instance:
+
+        Returns:  A file name safe key that is stable across runs
+        """
+        digest: str = sha1(str(projectPath).encode()).hexdigest()[:12]
+
+        if instance == '':
+            return f'{projectPath.stem}-{digest}'
+        return f'{projectPath.stem}-{digest}-{instance}'
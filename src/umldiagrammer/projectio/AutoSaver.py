@@ -0,0 +1,172 @@
+
+from typing import Dict
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from uuid import uuid4
+
+from concurrent.futures import ThreadPoolExecutor
+
+from wx import EVT_TIMER
+
+from wx import Timer
+from wx import Window
+from wx import TimerEvent
+
+from umlio.IOTypes import DEFAULT_PROJECT_PATH
+
+from umldiagrammer.UmlProjectPanel import UmlProjectPanel
+
+from umldiagrammer.data.ProjectDossier import ProjectDossier
+
+from umldiagrammer.preferences.DiagrammerPreferences import DiagrammerPreferences
+
+from umldiagrammer.projectio.IOBudget import IOBudget
+from umldiagrammer.projectio.AutoSaveJournal import AutoSaveJournal
+from umldiagrammer.projectio.FragmentedUmlShapesToXml import FragmentedUmlShapesToXml
+
+
+class AutoSaver:
+    """
+    Periodically writes crash recovery snapshots of the modified projects.  Modifications are
+    only noted;  The snapshots are taken when the timer fires.  Taking the snapshot has to happen on the
+    UI thread, but since only the modified diagrams are re-serialized it is cheap.  The
+    write happens on a worker thread and is rate limited by the preferences.
+
+    A project's recovery snapshot is discarded when it is saved or closed.  That includes
+    a project restored from a snapshot that is saved or closed before the next timer tick.
+    Untitled projects all share a file name;  So each one gets its own snapshot
+    """
+    def __init__(self, owner: Window):
+        """
+
+        Args:
+            owner:  Receives the timer events
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._preferences: DiagrammerPreferences = DiagrammerPreferences()
+
+        ioBudget: IOBudget = IOBudget(bytesPerSecond=self._preferences.autoSaveMaxBytesPerSecond)
+
+        self._journal:  AutoSaveJournal    = AutoSaveJournal(recoveryDirectory=self._preferences.recoveryDirectory, ioBudget=ioBudget)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='AutoSaver')
+        #
+        # Keyed by id() of the project panel
+        #
+        self._modifiedPanels:    Dict[int, UmlProjectPanel] = {}
+        self._journalFiles:      Dict[int, Path]            = {}
+        self._untitledInstances: Dict[int, str]             = {}
+
+        self._timer: Timer = Timer(owner)
+
+        if self._preferences.autoSaveEnabled is True:
+            owner.Bind(EVT_TIMER, self._onTimer, source=self._timer)
+            self._timer.Start(milliseconds=self._preferences.autoSaveInterval * 1000)
+            self.logger.info(f'Auto save every {self._preferences.autoSaveInterval} seconds to {self._journal.recoveryDirectory}')
+
+    def projectModified(self, projectPanel: UmlProjectPanel):
+        """
+        Note the project for the next snapshot;  Cheap enough to call on every modification
+
+        Args:
+            projectPanel:
+        """
+        if self._preferences.autoSaveEnabled is True:
+            self._modifiedPanels[id(projectPanel)] = projectPanel
+
+    def recovered(self, projectPanel: UmlProjectPanel, journalFile: Path):
+        """
+        The project was restored from a recovery snapshot;  Its snapshot goes away
+        with the project's next save or close
+
+        Args:
+            projectPanel:
+            journalFile:    The snapshot it was restored from
+        """
+        self._journalFiles[id(projectPanel)] = journalFile
+
+    def discard(self, projectPanel: UmlProjectPanel):
+        """
+        The project was saved or closed
+
+        Args:
+            projectPanel:
+        """
+        panelKey: int = id(projectPanel)
+
+        self._modifiedPanels.pop(panelKey, None)
+        self._untitledInstances.pop(panelKey, None)
+        journalFile: Optional[Path] = self._journalFiles.pop(panelKey, None)
+        if journalFile is not None:
+            #
+            # Queue behind any pending write of the same project
+            #
+            self._executor.submit(self._journal.discardSnapshot, journalFile)
+
+    def stop(self):
+        """
+        Stop the timer and let the queued writes and discards complete
+        """
+        self._timer.Stop()
+        self._executor.shutdown(wait=True)
+
+    # noinspection PyUnusedLocal
+    def _onTimer(self, event: TimerEvent):
+
+        modifiedPanels: Dict[int, UmlProjectPanel] = self._modifiedPanels
+        self._modifiedPanels = {}
+
+        for panelKey, projectPanel in modifiedPanels.items():
+            if projectPanel.umlProjectModified is False:
+                continue
+            projectDossier: ProjectDossier = projectPanel.projectDossier
+            projectPath:    Path           = projectDossier.umlProject.fileName
+
+            umlShapesToXml: FragmentedUmlShapesToXml = FragmentedUmlShapesToXml(projectFileName=projectPath, projectCodePath=projectDossier.umlProject.codePath)
+            umlShapesToXml.prettyPrint = False
+            umlShapesToXml.addFragments(documentFragments=projectDossier.documentFragments)
+            instance:    str  = self._instance(panelKey=panelKey, projectPath=projectPath)
+            journalFile: Path = self._journal.journalFile(projectPath=projectPath, instance=instance)
+            #
+            # A save as renames the project;  Do not leave the old snapshot behind
+            #
+            previousFile: Optional[Path] = self._journalFiles.get(panelKey)
+            if previousFile is not None and previousFile != journalFile:
+                self._executor.submit(self._journal.discardSnapshot, previousFile)
+
+            self._journalFiles[panelKey] = journalFile
+            self._executor.submit(self._write, projectPath, instance, umlShapesToXml)
+
+    def _instance(self, panelKey: int, projectPath: Path) -> str:
+        """
+        Args:
+            panelKey:
+            projectPath:
+
+        Returns:  Only untitled projects need telling apart
+        """
+        if projectPath == DEFAULT_PROJECT_PATH:
+            return self._untitledInstances.setdefault(panelKey, uuid4().hex[:8])
+
+        self._untitledInstances.pop(panelKey, None)
+        return ''
+
+    def _write(self, projectPath: Path, instance: str, umlShapesToXml: FragmentedUmlShapesToXml):
+        """
+        Runs on the worker thread
+
+        Args:
+            projectPath:    The real project file name
+            instance:       Tells apart the untitled projects
+            umlShapesToXml: The project snapshot
+        """
+        try:
+            byteCount: int = self._journal.write(projectPath=projectPath, rawXml=umlShapesToXml.xml, instance=instance)
+            self.logger.info(f'Auto saved {projectPath.stem} - {byteCount} bytes')
+        except Exception as e:
+            self.logger.error(f'Auto save of {projectPath} failed: {e}')
@@ -0,0 +1,476 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from hashlib import sha256
+
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+
+from os import fsync
+
+from pathlib import Path
+
+from struct import calcsize
+from struct import pack
+from struct import unpack
+
+from zlib import compress
+from zlib import decompress
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import indent as xmlIndent
+from xml.etree.ElementTree import tostring as xmlToString
+from xml.etree.ElementTree import fromstring as xmlFromString
+
+from umldiagrammer.projectio.AtomicWrite import atomicWrite
+from umldiagrammer.projectio.ProjectFileTypes import XML_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import PROJECT_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+from umldiagrammer.projectio.XmlDiagramStream import ELEMENT_UML_PROJECT
+from umldiagrammer.projectio.XmlDiagramStream import XmlDiagramStream
+
+FILE_MAGIC:     bytes = b'UDTCHNK1'
+TRAILER_MAGIC:  bytes = b'UDTCTOC1'
+TRAILER_FORMAT: str   = '>QI8s'                 # table of contents offset, length, magic
+TRAILER_SIZE:   int   = calcsize(TRAILER_FORMAT)
+
+FORMAT_VERSION: int = 1
+#
+# Unchanged chunks are left in place and changed ones are appended;  Compact the file
+# when more than this fraction of it is no longer referenced
+#
+COMPACTION_RATIO: float = 0.5
+
+INDENT_SPACES: str = '    '
+
+KEY_FORMAT_VERSION: str = 'formatVersion'
+KEY_PROJECT:        str = 'project'
+KEY_DOCUMENTS:      str = 'documents'
+KEY_ATTRIBUTES:     str = 'attributes'
+KEY_OFFSET:         str = 'offset'
+KEY_LENGTH:         str = 'length'
+KEY_HASH:           str = 'hash'
+
+
+class ChunkedProjectError(Exception):
+    pass
+
+
+@dataclass
+class ChunkEntry:
+    """
+    Where a document lives in the container;  The attributes are the UMLDiagram element
+    attributes so the documents can be listed without reading any chunk
+    """
+    attributes:  Dict[str, str]
+    offset:      int
+    length:      int        # Compressed
+    contentHash: str        # Of the uncompressed chunk
+
+    def toJson(self) -> Dict:
+        return {KEY_ATTRIBUTES: self.attributes, KEY_OFFSET: self.offset, KEY_LENGTH: self.length, KEY_HASH: self.contentHash}
+
+    @classmethod
+    def fromJson(cls, jsonEntry: Dict) -> 'ChunkEntry':
+        return ChunkEntry(attributes=jsonEntry[KEY_ATTRIBUTES], offset=jsonEntry[KEY_OFFSET], length=jsonEntry[KEY_LENGTH], contentHash=jsonEntry[KEY_HASH])
+
+
+def documentToChunk(documentElement: Element) -> bytes:
+    """
+    Pretty prints the same way the project serializer does;  So a chunk read and written
+    back is unchanged
+
+    Args:
+        documentElement:  A UMLDiagram element
+
+    Returns:  The uncompressed chunk
+    """
+    elementCopy: Element = xmlFromString(xmlToString(documentElement))
+    xmlIndent(elementCopy, space=INDENT_SPACES, level=0)
+
+    return xmlToString(elementCopy, encoding='utf-8')
+
+
+def chunkToDocument(chunk: bytes) -> Element:
+    return xmlFromString(chunk)
+
+
+def documentChunks(documentElements: List[Element]) -> List[bytes]:
+    return [documentToChunk(documentElement=documentElement) for documentElement in documentElements]
+
+
+def chunkedContentHash(projectAttributes: Dict[str, str], documentAttributes: List[Dict[str, str]], chunkHashes: List[str]) -> str:
+    """
+    Where the chunks live does not matter;  Only what is in them
+
+    Args:
+        projectAttributes:  The UmlProject element attributes
+        documentAttributes: The UMLDiagram element attributes in document order
+        chunkHashes:        The content hashes of the document chunks in document order
+
+    Returns:  The content hash of the project
+    """
+    contents: str = jsonDumps([projectAttributes, list(zip(documentAttributes, chunkHashes))], sort_keys=True)
+
+    return sha256(contents.encode()).hexdigest()
+
+
+class ChunkedProjectReader:
+    """
+    Reads the table of contents when created;  Each document is read with a single seek
+    """
+    def __init__(self, fileName: Path):
+        """
+
+        Args:
+            fileName:   A CHUNKED_PROJECT_SUFFIX file
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileName: Path = fileName
+
+        self._projectAttributes: Dict[str, str]  = {}
+        self._chunkEntries:      List[ChunkEntry] = []
+        self._fileSize:          int              = 0
+
+        self._readTableOfContents()
+
+    @property
+    def projectAttributes(self) -> Dict[str, str]:
+        return self._projectAttributes
+
+    @property
+    def chunkEntries(self) -> List[ChunkEntry]:
+        """
+        In document order
+        """
+        return self._chunkEntries
+
+    @property
+    def fileSize(self) -> int:
+        return self._fileSize
+
+    @property
+    def contentHash(self) -> str:
+        return chunkedContentHash(projectAttributes=self._projectAttributes,
+                                  documentAttributes=[chunkEntry.attributes for chunkEntry in self._chunkEntries],
+                                  chunkHashes=[chunkEntry.contentHash for chunkEntry in self._chunkEntries]
+                                  )
+
+    def readChunk(self, chunkEntry: ChunkEntry) -> bytes:
+        """
+
+        Args:
+            chunkEntry:  One of our chunk entries
+
+        Returns:  The uncompressed chunk
+        """
+        with open(self._fileName, 'rb') as containerFile:
+            containerFile.seek(chunkEntry.offset)
+            compressedChunk: bytes = containerFile.read(chunkEntry.length)
+
+        chunk: bytes = decompress(compressedChunk)
+        if sha256(chunk).hexdigest() != chunkEntry.contentHash:
+            raise ChunkedProjectError(f'Damaged document chunk at offset {chunkEntry.offset} in {self._fileName.name}')
+
+        return chunk
+
+    def readDocument(self, chunkEntry: ChunkEntry) -> Element:
+        """
+
+        Args:
+            chunkEntry:  One of our chunk entries
+
+        Returns:  The UMLDiagram element
+        """
+        return chunkToDocument(self.readChunk(chunkEntry=chunkEntry))
+
+    def _readTableOfContents(self):
+
+        with open(self._fileName, 'rb') as containerFile:
+            if containerFile.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                raise ChunkedProjectError(f'{self._fileName.name} is not a chunked project')
+
+            self._fileSize = containerFile.seek(0, 2)
+            containerFile.seek(max(self._fileSize - TRAILER_SIZE, 0))
+
+            tableOfContents: Optional[Dict] = self._parseTrailer(containerFile=containerFile, trailer=containerFile.read(TRAILER_SIZE))
+
+        if tableOfContents is None:
+            tableOfContents = self._recoverTableOfContents()
+
+        self._projectAttributes = tableOfContents[KEY_PROJECT]
+        self._chunkEntries      = [ChunkEntry.fromJson(jsonEntry) for jsonEntry in tableOfContents[KEY_DOCUMENTS]]
+
+    def _parseTrailer(self, containerFile, trailer: bytes) -> Optional[Dict]:
+        """
+
+        Args:
+            containerFile:  The open container
+            trailer:        What should be a trailer
+
+        Returns:  The table of contents or None if the trailer is not valid
+        """
+        if len(trailer) != TRAILER_SIZE:
+            return None
+
+        tocOffset, tocLength, magic = unpack(TRAILER_FORMAT, trailer)
+        if magic != TRAILER_MAGIC or tocOffset + tocLength > self._fileSize:
+            return None
+
+        containerFile.seek(tocOffset)
+        try:
+            tableOfContents: Dict = jsonLoads(containerFile.read(tocLength))
+        except ValueError:
+            return None
+
+        if tableOfContents.get(KEY_FORMAT_VERSION) != FORMAT_VERSION:
+            return None
+
+        return tableOfContents
+
+    def _recoverTableOfContents(self) -> Dict:
+        """
+        An update appends its chunks and then a new table of contents.  If it was cut short the
+        previous trailer is still in the file
+
+        Returns:  The most recent complete table of contents
+        """
+        contents:  bytes = self._fileName.read_bytes()
+        searchEnd: int   = len(contents)
+        with open(self._fileName, 'rb') as containerFile:
+            while True:
+                magicIndex: int = contents.rfind(TRAILER_MAGIC, 0, searchEnd)
+                if magicIndex < 0:
+                    raise ChunkedProjectError(f'{self._fileName.name} has no table of contents')
+
+                trailerStart:    int            = magicIndex + len(TRAILER_MAGIC) - TRAILER_SIZE
+                tableOfContents: Optional[Dict] = None
+                if trailerStart >= 0:
+                    tableOfContents = self._parseTrailer(containerFile=containerFile, trailer=contents[trailerStart:magicIndex + len(TRAILER_MAGIC)])
+                if tableOfContents is not None:
+                    self.logger.warning(f'{self._fileName.name} was not completely written;  Using its previous contents')
+                    return tableOfContents
+                searchEnd = magicIndex
+
+
+class ChunkedProjectWriter:
+    """
+    Writes a chunked project.  When the file already exists only the documents whose chunks
+    changed are written;  They are appended along with a new table of contents.  The file is
+    rewritten from scratch when too much of it is no longer referenced
+    """
+    def __init__(self, fileName: Path):
+        """
+
+        Args:
+            fileName:   A CHUNKED_PROJECT_SUFFIX file
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileName: Path = fileName
+
+    def write(self, projectAttributes: Dict[str, str], documentElements: List[Element], chunks: Optional[List[bytes]] = None, compact: bool = False) -> int:
+        """
+
+        Args:
+            projectAttributes:  The UmlProject element attributes
+            documentElements:   The UMLDiagram elements in document order
+            chunks:             The document chunks if the caller already has them
+            compact:            When True the file is always rewritten from scratch
+
+        Returns:  The number of chunks written
+        """
+        if chunks is None:
+            chunks = documentChunks(documentElements=documentElements)
+
+        existingReader: Optional[ChunkedProjectReader] = None
+        if compact is False:
+            existingReader = self._existingReader()
+        if existingReader is None:
+            return self._rewrite(projectAttributes=projectAttributes, documentElements=documentElements, chunks=chunks)
+
+        existingEntries: Dict[str, ChunkEntry] = {chunkEntry.contentHash: chunkEntry for chunkEntry in existingReader.chunkEntries}
+        chunkHashes:     List[str]             = [sha256(chunk).hexdigest() for chunk in chunks]
+        changedChunks:   Dict[str, bytes]      = {
+            chunkHash: compress(chunk) for chunk, chunkHash in zip(chunks, chunkHashes) if chunkHash not in existingEntries
+        }
+        #
+        # Would the file be mostly garbage after the update?
+        #
+        appendedBytes:   int = sum(len(compressedChunk) for compressedChunk in changedChunks.values())
+        referencedBytes: int = appendedBytes + sum(existingEntries[chunkHash].length for chunkHash in set(chunkHashes) if chunkHash in existingEntries)
+        if referencedBytes < (existingReader.fileSize + appendedBytes) * COMPACTION_RATIO:
+            return self._rewrite(projectAttributes=projectAttributes, documentElements=documentElements, chunks=chunks)
+
+        return self._update(projectAttributes=projectAttributes,
+                            documentElements=documentElements,
+                            chunkHashes=chunkHashes,
+                            existingEntries=existingEntries,
+                            changedChunks=changedChunks,
+                            fileSize=existingReader.fileSize
+                            )
+
+    def _existingReader(self) -> Optional[ChunkedProjectReader]:
+
+        if self._fileName.exists() is False:
+            return None
+        try:
+            return ChunkedProjectReader(fileName=self._fileName)
+        except (OSError, ChunkedProjectError) as e:
+            self.logger.warning(f'Rewriting {self._fileName.name}: {e}')
+            return None
+
+    def _rewrite(self, projectAttributes: Dict[str, str], documentElements: List[Element], chunks: List[bytes]) -> int:
+
+        contents:     bytearray        = bytearray(FILE_MAGIC)
+        chunkEntries: List[ChunkEntry] = []
+
+        for documentElement, chunk in zip(documentElements, chunks):
+            compressedChunk: bytes = compress(chunk)
+            chunkEntries.append(ChunkEntry(attributes=dict(documentElement.attrib),
+                                           offset=len(contents),
+                                           length=len(compressedChunk),
+                                           contentHash=sha256(chunk).hexdigest())
+                                )
+            contents.extend(compressedChunk)
+
+        contents.extend(self._tableOfContents(projectAttributes=projectAttributes, chunkEntries=chunkEntries, tocOffset=len(contents)))
+
+        atomicWrite(fileName=self._fileName, contents=bytes(contents))
+        self.logger.info(f'Wrote {len(chunks)} chunk(s) to {self._fileName.name}')
+
+        return len(chunks)
+
+    def _update(self,
+                projectAttributes: Dict[str, str],
+                documentElements:  List[Element],
+                chunkHashes:       List[str],
+                existingEntries:   Dict[str, ChunkEntry],
+                changedChunks:     Dict[str, bytes],
+                fileSize:          int) -> int:
+        """
+        Appends the changed chunks and a new table of contents;  Nothing already in the file is touched
+
+        Args:
+            projectAttributes:  The UmlProject element attributes
+            documentElements:   The UMLDiagram elements in document order
+            chunkHashes:        The content hashes of the document chunks
+            existingEntries:    The chunks already in the file by content hash
+            changedChunks:      The compressed chunks that are not in the file by content hash
+            fileSize:           Where to append
+
+        Returns:  The number of chunks written
+        """
+        appended:     bytearray        = bytearray()
+        chunkEntries: List[ChunkEntry] = []
+        #
+        # Identical documents share a chunk
+        #
+        writtenEntries: Dict[str, ChunkEntry] = dict(existingEntries)
+
+        for documentElement, chunkHash in zip(documentElements, chunkHashes):
+            writtenEntry: Optional[ChunkEntry] = writtenEntries.get(chunkHash)
+            if writtenEntry is None:
+                compressedChunk: bytes = changedChunks[chunkHash]
+                writtenEntry = ChunkEntry(attributes={}, offset=fileSize + len(appended), length=len(compressedChunk), contentHash=chunkHash)
+                writtenEntries[chunkHash] = writtenEntry
+                appended.extend(compressedChunk)
+
+            chunkEntries.append(ChunkEntry(attributes=dict(documentElement.attrib),
+                                           offset=writtenEntry.offset,
+                                           length=writtenEntry.length,
+                                           contentHash=chunkHash)
+                                )
+        writtenCount: int = len(changedChunks)
+
+        appended.extend(self._tableOfContents(projectAttributes=projectAttributes, chunkEntries=chunkEntries, tocOffset=fileSize + len(appended)))
+
+        with open(self._fileName, 'r+b') as containerFile:
+            containerFile.seek(fileSize)
+            containerFile.write(appended)
+            containerFile.flush()
+            fsync(containerFile.fileno())
+
+        self.logger.info(f'Updated {self._fileName.name}: wrote {writtenCount} chunk(s), kept {len(chunkEntries) - writtenCount}')
+
+        return writtenCount
+
+    def _tableOfContents(self, projectAttributes: Dict[str, str], chunkEntries: List[ChunkEntry], tocOffset: int) -> bytes:
+
+        tableOfContents: bytes = jsonDumps({
+            KEY_FORMAT_VERSION: FORMAT_VERSION,
+            KEY_PROJECT:        projectAttributes,
+            KEY_DOCUMENTS:      [chunkEntry.toJson() for chunkEntry in chunkEntries],
+        }).encode()
+
+        return tableOfContents + pack(TRAILER_FORMAT, tocOffset, len(tableOfContents), TRAILER_MAGIC)
+
+
+def convertProjectFile(sourceFileName: Path, destinationFileName: Path):
+    """
+    Converts between the chunked format and the PROJECT_FILE_SUFFIX or XML_FILE_SUFFIX
+    formats.  The documents are copied as they are;  No shapes are built
+
+    Args:
+        sourceFileName:         The file to convert
+        destinationFileName:    The converted file;  Its suffix selects the format
+    """
+    projectAttributes, documentElements = readProjectDocuments(fileName=sourceFileName)
+
+    writeProjectDocuments(fileName=destinationFileName, projectAttributes=projectAttributes, documentElements=documentElements)
+
+
+def readProjectDocuments(fileName: Path) -> Tuple[Dict[str, str], List[Element]]:
+    """
+
+    Args:
+        fileName:   A project file in any of the formats
+
+    Returns:  The UmlProject element attributes and the UMLDiagram elements in document order
+    """
+    if fileName.suffix == CHUNKED_PROJECT_SUFFIX:
+        chunkedProjectReader: ChunkedProjectReader = ChunkedProjectReader(fileName=fileName)
+
+        projectAttributes: Dict[str, str] = chunkedProjectReader.projectAttributes
+        documentElements:  List[Element]  = [chunkedProjectReader.readDocument(chunkEntry) for chunkEntry in chunkedProjectReader.chunkEntries]
+    else:
+        xmlDiagramStream: XmlDiagramStream = XmlDiagramStream(fileName=fileName)
+
+        documentElements  = list(xmlDiagramStream.diagramXmlElements())
+        projectAttributes = xmlDiagramStream.projectAttributes
+
+    return projectAttributes, documentElements
+
+
+def writeProjectDocuments(fileName: Path, projectAttributes: Dict[str, str], documentElements: List[Element]):
+    """
+    The write is atomic;  So the file may be the one the documents were read from
+
+    Args:
+        fileName:           Its suffix selects the format
+        projectAttributes:  The UmlProject element attributes
+        documentElements:   The UMLDiagram elements in document order
+    """
+    if fileName.suffix == CHUNKED_PROJECT_SUFFIX:
+        ChunkedProjectWriter(fileName=fileName).write(projectAttributes=projectAttributes, documentElements=documentElements, compact=True)
+    elif fileName.suffix in (PROJECT_FILE_SUFFIX, XML_FILE_SUFFIX):
+        projectElement: Element = Element(ELEMENT_UML_PROJECT, attrib=projectAttributes)
+        projectElement.extend(documentElements)
+        xmlIndent(projectElement, space=INDENT_SPACES, level=0)
+
+        rawXml: bytes = xmlToString(projectElement, encoding='iso-8859-1', xml_declaration=True)
+        if fileName.suffix == PROJECT_FILE_SUFFIX:
+            atomicWrite(fileName=fileName, contents=compress(rawXml))
+        else:
+            atomicWrite(fileName=fileName, contents=rawXml)
+    else:
+        raise ChunkedProjectError(f'Cannot write {fileName.suffix} files')
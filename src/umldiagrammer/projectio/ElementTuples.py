@@ -0,0 +1,68 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from marshal import dumps as marshalDumps
+from marshal import loads as marshalLoads
+
+from xml.etree.ElementTree import Element as XmlElement
+
+#
+# (tag, attributes, text, tail, children);  marshal only handles the built-in types
+#
+ElementTuple = Tuple
+
+
+def elementToTuple(xmlElement: XmlElement) -> ElementTuple:
+    """
+
+    Args:
+        xmlElement:  An element tree element
+
+    Returns:  The element and its children as built-in types
+    """
+    return xmlElement.tag, dict(xmlElement.attrib), xmlElement.text, xmlElement.tail, [elementToTuple(xmlElement=child) for child in xmlElement]
+
+
+def tupleToElement(elementTuple: ElementTuple) -> XmlElement:
+    """
+
+    Args:
+        elementTuple:  As built by elementToTuple
+
+    Returns:  The element tree element
+    """
+    tag, attributes, text, tail, children = elementTuple
+
+    xmlElement: XmlElement = XmlElement(tag, attributes)
+    xmlElement.text = text
+    xmlElement.tail = tail
+    xmlElement.extend([tupleToElement(elementTuple=child) for child in children])
+
+    return xmlElement
+
+
+def marshalProjectDocuments(projectAttributes: Dict[str, str], documentElements: List[XmlElement]) -> bytes:
+    """
+    Marshal is a lot cheaper than pickle, both ways
+
+    Args:
+        projectAttributes:  The UmlProject element attributes
+        documentElements:   The UMLDiagram elements in document order
+
+    Returns:  The project documents as bytes
+    """
+    return marshalDumps((projectAttributes, [elementToTuple(xmlElement=documentElement) for documentElement in documentElements]))
+
+
+def unmarshalProjectDocuments(marshaled: bytes) -> Tuple[Dict[str, str], List[XmlElement]]:
+    """
+
+    Args:
+        marshaled:  As built by marshalProjectDocuments
+
+    Returns:  The UmlProject element attributes and the UMLDiagram elements in document order
+    """
+    projectAttributes, documentTuples = marshalLoads(marshaled)
+
+    return projectAttributes, [tupleToElement(elementTuple=documentTuple) for documentTuple in documentTuples]
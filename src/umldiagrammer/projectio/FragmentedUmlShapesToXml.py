@@ -0,0 +1,122 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+
+from pathlib import Path
+
+from xml.etree.ElementTree import Element
+
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import DEFAULT_PROJECT_PATH
+
+from umlio.XMLConstants import XmlConstants
+
+from umlio.serializer.UmlShapesToXml import UmlShapesToXml
+
+from umldiagrammer.data.LazyUmlDocument import LazyUmlDocument
+
+#
+# The serialized UMLDiagram elements of a project in page order
+#
+DocumentFragments = NewType('DocumentFragments', List[Element])
+
+
+class FragmentedUmlShapesToXml(UmlShapesToXml):
+    """
+    Serializes UML documents into detached XML fragments that can be cached
+    and later spliced into a project element
+    """
+    def __init__(self, projectFileName: Path = DEFAULT_PROJECT_PATH, projectCodePath: Path = Path('')):
+        """
+        The project attributes only matter when the fragments are added back for writing
+
+        Args:
+            projectFileName:
+            projectCodePath:
+        """
+        super().__init__(projectFileName=projectFileName, projectCodePath=projectCodePath)
+
+    @property
+    def projectAttributes(self) -> Dict[str, str]:
+        return dict(self._xmlProjectElement.attrib)
+
+    @property
+    def documentElements(self) -> List[Element]:
+        """
+        The UMLDiagram elements in page order;  For containers that store the documents separately
+        """
+        return list(self._xmlProjectElement)
+
+    def serializeFragment(self, umlDocument: UmlDocument) -> Element:
+        """
+        Serialize a single document;  The fragment is not left attached to the project element
+
+        Args:
+            umlDocument:  The fully populated UML Document
+
+        Returns:  The UMLDiagram element
+        """
+        self.serialize(umlDiagram=umlDocument)
+
+        documentFragment: Element = self._xmlProjectElement[-1]
+        self._xmlProjectElement.remove(documentFragment)
+
+        return documentFragment
+
+    def refreshFragment(self, documentFragment: Element, umlDocument: UmlDocument) -> Element:
+        """
+        The shapes in a cached fragment are current, but the document title, scroll
+        position, and scale may not be.  The cached fragment is not modified
+
+        Args:
+            documentFragment:   A previously serialized fragment
+            umlDocument:        Only needs the document attributes;  No shapes
+
+        Returns:  A new fragment that shares its children with the cached one
+        """
+        attributesElement: Element = self._umlDocumentAttributesToXml(umlDiagram=umlDocument)
+        self._xmlProjectElement.remove(attributesElement)
+
+        refreshedFragment: Element = Element(documentFragment.tag, attrib=dict(attributesElement.attrib))
+
+        refreshedFragment.text = documentFragment.text
+        refreshedFragment.tail = documentFragment.tail
+        refreshedFragment.extend(list(documentFragment))
+
+        return refreshedFragment
+
+    def sourceFragment(self, lazyUmlDocument: LazyUmlDocument) -> Element:
+        """
+        A document that was never opened is written exactly as it was read;  Only
+        a rename changes it.  The document source is not modified
+
+        Args:
+            lazyUmlDocument:  A document whose shapes were never built
+
+        Returns:  The fragment to write
+        """
+        documentSource: Element = lazyUmlDocument.loadSource()
+
+        if documentSource.get(XmlConstants.ATTRIBUTE_TITLE) == lazyUmlDocument.documentTitle:
+            return documentSource
+
+        attributes: Dict[str, str] = dict(documentSource.attrib)
+        attributes[XmlConstants.ATTRIBUTE_TITLE] = lazyUmlDocument.documentTitle
+
+        renamedFragment: Element = Element(documentSource.tag, attrib=attributes)
+
+        renamedFragment.text = documentSource.text
+        renamedFragment.tail = documentSource.tail
+        renamedFragment.extend(list(documentSource))
+
+        return renamedFragment
+
+    def addFragments(self, documentFragments: DocumentFragments):
+        """
+        Splice previously serialized documents into the project element
+
+        Args:
+            documentFragments:
+        """
+        self._xmlProjectElement.extend(documentFragments)
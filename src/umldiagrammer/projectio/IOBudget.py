@@ -0,0 +1,81 @@
+
+from typing import Callable
+
+from logging import Logger
+from logging import getLogger
+
+from threading import Lock
+
+from time import sleep
+from time import monotonic
+
+Clock   = Callable[[], float]
+Sleeper = Callable[[float], None]
+
+
+class IOBudget:
+    """
+    A token bucket that caps the rate at which a background writer touches the disk.
+    The bucket holds at most one second's worth of bytes;  A write larger than the
+    bucket is allowed, but the writer then pays the debt by sleeping.
+
+    Only call .throttle() from a worker thread
+    """
+    def __init__(self, bytesPerSecond: int, clock: Clock = monotonic, sleeper: Sleeper = sleep):
+        """
+
+        Args:
+            bytesPerSecond: The sustained write rate
+            clock:          Returns seconds;  Replaceable for unit tests
+            sleeper:        Sleeps for seconds;  Replaceable for unit tests
+        """
+        assert bytesPerSecond > 0, 'The I/O budget must be positive'
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._bytesPerSecond: int     = bytesPerSecond
+        self._clock:          Clock   = clock
+        self._sleeper:        Sleeper = sleeper
+
+        self._lock:           Lock  = Lock()
+        self._available:      float = float(bytesPerSecond)
+        self._lastRefill:     float = clock()
+
+    @property
+    def bytesPerSecond(self) -> int:
+        return self._bytesPerSecond
+
+    def reserve(self, byteCount: int) -> float:
+        """
+        Take the bytes out of the budget
+
+        Args:
+            byteCount:  The number of bytes about to be written
+
+        Returns:  How many seconds the writer has to wait before writing
+        """
+        with self._lock:
+            now: float = self._clock()
+
+            self._available  = min(float(self._bytesPerSecond), self._available + (now - self._lastRefill) * self._bytesPerSecond)
+            self._lastRefill = now
+            self._available -= byteCount
+
+            if self._available >= 0:
+                delay: float = 0.0
+            else:
+                delay = -self._available / self._bytesPerSecond
+
+        return delay
+
+    def throttle(self, byteCount: int):
+        """
+        Blocks until the budget allows the write
+
+        Args:
+            byteCount:  The number of bytes about to be written
+        """
+        delay: float = self.reserve(byteCount=byteCount)
+        if delay > 0:
+            self.logger.debug(f'Throttling {byteCount} bytes for {delay:.3f} seconds')
+            self._sleeper(delay)
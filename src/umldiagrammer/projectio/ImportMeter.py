@@ -0,0 +1,83 @@
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from time import perf_counter
+
+from tracemalloc import stop as stopTracing
+from tracemalloc import start as startTracing
+from tracemalloc import is_tracing
+from tracemalloc import reset_peak
+from tracemalloc import get_traced_memory
+
+NOT_TRACED: int = -1
+
+
+@dataclass
+class ImportStatistics:
+    elapsedSeconds:  float = 0.0
+    peakMemoryBytes: int   = NOT_TRACED     # Python allocations made during the import
+
+    def __str__(self) -> str:
+        if self.peakMemoryBytes == NOT_TRACED:
+            peakMemory: str = 'not traced'
+        else:
+            peakMemory = f'{self.peakMemoryBytes / (1024 * 1024):.1f} MB'
+
+        return f'{self.elapsedSeconds:.3f} seconds, peak memory {peakMemory}'
+
+
+class ImportMeter:
+    """
+    Measures the elapsed time and the peak memory of an import.  Use it as a context manager.
+
+    Memory tracing slows the import down;  So it can be turned off.  The peak is process wide and
+    includes allocations that other threads make while the import runs.
+    """
+    def __init__(self, traceMemory: bool = True):
+        """
+
+        Args:
+            traceMemory:  When False only the elapsed time is measured
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._traceMemory:      bool             = traceMemory
+        self._startedTracing:   bool             = False
+        self._startTime:        float            = 0.0
+        self._statistics:       ImportStatistics = ImportStatistics()
+
+    @property
+    def statistics(self) -> ImportStatistics:
+        """
+        Complete when the context exits
+        """
+        return self._statistics
+
+    def __enter__(self) -> 'ImportMeter':
+
+        if self._traceMemory is True:
+            if is_tracing() is True:
+                reset_peak()
+            else:
+                startTracing()
+                self._startedTracing = True
+
+        self._startTime = perf_counter()
+
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+
+        self._statistics.elapsedSeconds = perf_counter() - self._startTime
+
+        if self._traceMemory is True:
+            current, peak = get_traced_memory()
+            self._statistics.peakMemoryBytes = peak
+            if self._startedTracing is True:
+                stopTracing()
+                self._startedTracing = False
+
+        return False
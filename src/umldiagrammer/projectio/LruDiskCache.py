@@ -0,0 +1,199 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from os import utime
+
+from pathlib import Path
+
+from threading import Lock
+
+from umldiagrammer.projectio.AtomicWrite import atomicWrite
+
+
+class _DirectoryIndex:
+    """
+    The entries of one cache directory in use order, oldest first, and their total size
+    """
+    def __init__(self):
+
+        self.lock:       Lock                   = Lock()
+        self.scanned:    bool                   = False
+        self.entrySizes: OrderedDict[str, int]  = OrderedDict()
+        self.totalBytes: int                    = 0
+
+    def record(self, entryName: str, entrySize: int):
+
+        self.forget(entryName=entryName)
+        self.entrySizes[entryName] = entrySize
+        self.totalBytes += entrySize
+
+    def forget(self, entryName: str):
+        self.totalBytes -= self.entrySizes.pop(entryName, 0)
+
+
+class LruDiskCache:
+    """
+    A size bounded directory of cache entries, one file per key.  The least recently used
+    entries are evicted first.  An entry's modification time is its last use, so the use
+    order survives a restart.
+
+    The directory is only scanned the first time a process uses it.  From then on the use
+    order and a running byte total are kept in memory and shared by every cache on that
+    directory;  A put does not stat the other entries.  Entries that another process adds
+    are picked up on the next start
+    """
+    _directoryIndexes: Dict[Tuple[Path, str], _DirectoryIndex] = {}
+    _indexesLock:      Lock                                     = Lock()
+
+    def __init__(self, cacheDirectory: Path, suffix: str, maxBytes: int):
+        """
+
+        Args:
+            cacheDirectory: Where the entries live;  Created when needed
+            suffix:         Of the entry files
+            maxBytes:       The total size of the entries is kept below this
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheDirectory: Path = cacheDirectory
+        self._suffix:         str  = suffix
+        self._maxBytes:       int  = maxBytes
+
+        with LruDiskCache._indexesLock:
+            indexKey: Tuple[Path, str] = (cacheDirectory.absolute(), suffix)
+            self._directoryIndex: _DirectoryIndex = LruDiskCache._directoryIndexes.setdefault(indexKey, _DirectoryIndex())
+
+    @property
+    def cacheDirectory(self) -> Path:
+        return self._cacheDirectory
+
+    @property
+    def totalBytes(self) -> int:
+        with self._directoryIndex.lock:
+            self._scan()
+            return self._directoryIndex.totalBytes
+
+    def entryFile(self, key: str) -> Path:
+        return self._cacheDirectory / f'{key}{self._suffix}'
+
+    def read(self, key: str) -> Optional[bytes]:
+        """
+        A hit is a use
+
+        Args:
+            key:
+
+        Returns:  The entry or None if it is not cached
+        """
+        entryFile: Path = self.entryFile(key=key)
+        try:
+            contents: bytes = entryFile.read_bytes()
+        except OSError:
+            return None
+
+        self.touch(key=key)
+
+        return contents
+
+    def touch(self, key: str):
+        """
+        Record a use of an entry that the caller read itself
+
+        Args:
+            key:
+        """
+        entryFile: Path = self.entryFile(key=key)
+        with self._directoryIndex.lock:
+            self._scan()
+            try:
+                utime(entryFile)
+            except OSError:
+                self._directoryIndex.forget(entryName=entryFile.name)
+                return
+            if entryFile.name in self._directoryIndex.entrySizes:
+                self._directoryIndex.entrySizes.move_to_end(entryFile.name)
+
+    def write(self, key: str, contents: bytes):
+        """
+        Replaces any previous entry for the key, then evicts the least recently used
+        entries until the cache fits
+
+        Args:
+            key:
+            contents:   The entry
+        """
+        self._cacheDirectory.mkdir(parents=True, exist_ok=True)
+
+        entryFile: Path = self.entryFile(key=key)
+        atomicWrite(fileName=entryFile, contents=contents)
+
+        with self._directoryIndex.lock:
+            self._scan()
+            self._directoryIndex.record(entryName=entryFile.name, entrySize=len(contents))
+            self._evict()
+
+    def discard(self, key: str):
+        """
+        Drop a stale or unreadable entry
+
+        Args:
+            key:
+        """
+        entryFile: Path = self.entryFile(key=key)
+        with self._directoryIndex.lock:
+            entryFile.unlink(missing_ok=True)
+            self._directoryIndex.forget(entryName=entryFile.name)
+
+    def clear(self):
+
+        with self._directoryIndex.lock:
+            for entryFile in self._entryFiles():
+                entryFile.unlink(missing_ok=True)
+            self._directoryIndex.entrySizes.clear()
+            self._directoryIndex.totalBytes = 0
+            self._directoryIndex.scanned    = True
+
+    def _evict(self):
+
+        directoryIndex: _DirectoryIndex = self._directoryIndex
+        while directoryIndex.totalBytes > self._maxBytes and len(directoryIndex.entrySizes) > 0:
+            oldestName, oldestSize = directoryIndex.entrySizes.popitem(last=False)
+            directoryIndex.totalBytes -= oldestSize
+            (self._cacheDirectory / oldestName).unlink(missing_ok=True)
+            self.logger.debug(f'Evicted cache entry {oldestName}')
+
+    def _scan(self):
+        """
+        Only once per directory;  The caller holds the index lock
+        """
+        directoryIndex: _DirectoryIndex = self._directoryIndex
+        if directoryIndex.scanned is True:
+            return
+
+        entries: List[Tuple[int, str, int]] = []
+        for entryFile in self._entryFiles():
+            try:
+                statResult = entryFile.stat()
+            except OSError:
+                continue
+            entries.append((statResult.st_mtime_ns, entryFile.name, statResult.st_size))
+
+        for _, entryName, entrySize in sorted(entries):
+            directoryIndex.record(entryName=entryName, entrySize=entrySize)
+
+        directoryIndex.scanned = True
+
+    def _entryFiles(self) -> List[Path]:
+
+        if self._cacheDirectory.is_dir() is False:
+            return []
+
+        return list(self._cacheDirectory.glob(f'*{self._suffix}'))
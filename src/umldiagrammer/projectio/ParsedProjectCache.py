@@ -0,0 +1,202 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from gc import enable as enableGarbageCollection
+from gc import disable as disableGarbageCollection
+from gc import isenabled as isGarbageCollectionEnabled
+
+from hashlib import sha1
+
+from marshal import dump as marshalDump
+from marshal import load as marshalLoad
+from marshal import version as marshalVersion
+
+from io import BytesIO
+
+from pathlib import Path
+
+from sys import version_info
+
+from xml.etree.ElementTree import Element as XmlElement
+
+from umldiagrammer.projectio.LruDiskCache import LruDiskCache
+from umldiagrammer.projectio.SavedContent import projectContentHash
+from umldiagrammer.projectio.ElementTuples import elementToTuple
+from umldiagrammer.projectio.ElementTuples import tupleToElement
+
+CACHE_SUFFIX: str = '.parsed'
+#
+# marshal output is only readable by the Python version that wrote it
+#
+FORMAT_VERSION: str = f'2-{version_info.major}.{version_info.minor}-{marshalVersion}'
+
+#
+# The UmlProject element attributes and the UMLDiagram elements in document order
+#
+ProjectDocuments = Tuple[Dict[str, str], List[XmlElement]]
+
+
+@dataclass(frozen=True)
+class ProjectFingerprint:
+    projectPath:  str       # Absolute
+    modifiedTime: int       # ns
+    fileSize:     int
+
+    @classmethod
+    def fromProjectFile(cls, fileName: Path) -> 'ProjectFingerprint':
+        """
+        Only stats the file;  The content is hashed when the stat alone cannot tell
+
+        Args:
+            fileName:   A project file
+
+        Returns:  The fingerprint
+        """
+        statResult = fileName.stat()
+
+        return ProjectFingerprint(projectPath=str(fileName.resolve()),
+                                  modifiedTime=statResult.st_mtime_ns,
+                                  fileSize=statResult.st_size
+                                  )
+
+    def contentHash(self) -> str:
+        """
+        Returns:  The hash of the project file as it is now
+        """
+        return projectContentHash(fileName=Path(self.projectPath))
+
+
+class ParsedProjectCache:
+    """
+    An on disk cache of the documents of project files.  An entry is used when the project's
+    path, modification time and size match.  When only the modification time differs
+    (e.g. the file was copied back) the content hash decides.  The entries are
+    written with marshal, which loads a lot faster than the XML parses.
+
+    The cache is bounded by size;  The least recently used entries are evicted first.  An
+    entry's modification time is its last use
+    """
+    def __init__(self, cacheDirectory: Path, maxBytes: int):
+        """
+
+        Args:
+            cacheDirectory: Where the entries live;  Created when needed
+            maxBytes:       The total size of the entries is kept below this
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._lruDiskCache: LruDiskCache = LruDiskCache(cacheDirectory=cacheDirectory, suffix=CACHE_SUFFIX, maxBytes=maxBytes)
+
+    @property
+    def cacheDirectory(self) -> Path:
+        return self._lruDiskCache.cacheDirectory
+
+    def get(self, projectFingerprint: ProjectFingerprint) -> Optional[ProjectDocuments]:
+        """
+
+        Args:
+            projectFingerprint:  The project file as it is now
+
+        Returns:  The project documents or None if they are not cached
+        """
+        entryKey:  str  = self._entryKey(projectFingerprint=projectFingerprint)
+        entryFile: Path = self._lruDiskCache.entryFile(key=entryKey)
+        if entryFile.exists() is False:
+            return None
+
+        try:
+            with open(entryFile, 'rb') as entry:
+                header: Tuple = marshalLoad(entry)
+                if self._isCurrent(header=header, projectFingerprint=projectFingerprint) is False:
+                    self.logger.info(f'Stale parsed project: {projectFingerprint.projectPath}')
+                    self._lruDiskCache.discard(key=entryKey)
+                    return None
+                projectDocuments: ProjectDocuments = self._load(entry=entry)
+        except (OSError, EOFError, ValueError, TypeError, IndexError) as e:
+            self.logger.warning(f'Discarding unreadable parsed project {entryFile.name}: {e}')
+            self._lruDiskCache.discard(key=entryKey)
+            return None
+
+        self._lruDiskCache.touch(key=entryKey)
+
+        return projectDocuments
+
+    def put(self, projectFingerprint: ProjectFingerprint, projectAttributes: Dict[str, str], documentElements: List[XmlElement], contentHash: Optional[str] = None):
+        """
+        Replaces any previous entry for the project
+
+        Args:
+            projectFingerprint: The project file that was read
+            projectAttributes:  The UmlProject element attributes
+            documentElements:   The UMLDiagram elements in document order
+            contentHash:        The project file's hash if the caller already has it
+        """
+        if contentHash is None:
+            contentHash = projectFingerprint.contentHash()
+
+        contents: BytesIO = BytesIO()
+        marshalDump(self._header(projectFingerprint=projectFingerprint, contentHash=contentHash), contents)
+        marshalDump((projectAttributes, [elementToTuple(xmlElement=documentElement) for documentElement in documentElements]), contents)
+
+        self._lruDiskCache.write(key=self._entryKey(projectFingerprint=projectFingerprint), contents=contents.getvalue())
+
+    def clear(self):
+        self._lruDiskCache.clear()
+
+    def _isCurrent(self, header: Tuple, projectFingerprint: ProjectFingerprint) -> bool:
+        """
+        The content is only hashed when the sizes match but the times do not
+
+        Args:
+            header:                 The entry header
+            projectFingerprint:     The project file as it is now
+
+        Returns:  True if the entry holds the project as it is now
+        """
+        formatVersion, projectPath, modifiedTime, fileSize, contentHash = header
+
+        if (formatVersion, projectPath, fileSize) != (FORMAT_VERSION, projectFingerprint.projectPath, projectFingerprint.fileSize):
+            return False
+        if modifiedTime == projectFingerprint.modifiedTime:
+            return True
+
+        return contentHash == projectFingerprint.contentHash()
+
+    def _load(self, entry) -> ProjectDocuments:
+        """
+        Building many small objects triggers the cyclic garbage collector over and over;
+        None of them is garbage
+
+        Args:
+            entry:  Positioned at the payload
+
+        Returns:  The project documents
+        """
+        wasEnabled: bool = isGarbageCollectionEnabled()
+        disableGarbageCollection()
+        try:
+            projectAttributes, documentTuples = marshalLoad(entry)
+            documentElements: List[XmlElement] = [tupleToElement(elementTuple=documentTuple) for documentTuple in documentTuples]
+        finally:
+            if wasEnabled is True:
+                enableGarbageCollection()
+
+        return projectAttributes, documentElements
+
+    def _entryKey(self, projectFingerprint: ProjectFingerprint) -> str:
+        return sha1(projectFingerprint.projectPath.encode()).hexdigest()
+
+    def _header(self, projectFingerprint: ProjectFingerprint, contentHash: str) -> Tuple:
+        return (FORMAT_VERSION,
+                projectFingerprint.projectPath,
+                projectFingerprint.modifiedTime,
+                projectFingerprint.fileSize,
+                contentHash
+                )
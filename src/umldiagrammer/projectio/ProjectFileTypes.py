@@ -0,0 +1,19 @@
+
+from typing import Tuple
+
+#
+# The same as the umlio IOTypes suffixes;  Not imported from there since IOTypes drags in
+# the UI layer and these have to import cleanly in worker processes and command line tools
+#
+PROJECT_FILE_SUFFIX: str = '.udt'
+XML_FILE_SUFFIX:     str = '.xml'
+#
+# Each document compressed independently with a table of contents;  See ChunkedProjectContainer
+#
+CHUNKED_PROJECT_SUFFIX: str = '.udtc'
+
+PROJECT_FILE_SUFFIXES: Tuple[str, ...] = (PROJECT_FILE_SUFFIX, XML_FILE_SUFFIX, CHUNKED_PROJECT_SUFFIX)
+#
+# The same as umlio IOTypes XML_VERSION;  The format the project serializer writes
+#
+CURRENT_XML_VERSION: str = '14.0'
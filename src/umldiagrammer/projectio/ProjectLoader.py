@@ -0,0 +1,332 @@
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from os import cpu_count
+
+from pathlib import Path
+
+from threading import Lock
+
+from multiprocessing import get_context
+
+from concurrent.futures import Future
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+
+from wx import OK
+from wx import ICON_ERROR
+
+from wx import MessageDialog
+
+from wx import CallAfter as wxCallAfter
+
+from umlio.IOTypes import UmlProject
+
+from umldiagrammer.DiagrammerTypes import NOTEBOOK_ID
+from umldiagrammer.DiagrammerTypes import APPLICATION_FRAME_ID
+
+from umldiagrammer.UmlProjectIO import UmlProjectIO
+from umldiagrammer.UmlProjectIO import ProjectSource
+
+from umldiagrammer.projectio.ProjectParser import ReadProject
+from umldiagrammer.projectio.ProjectParser import readProjectFile
+
+from umldiagrammer.pubsubengine.MessageType import MessageType
+from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
+
+PROGRESS_REPORT_STEP: int = 5       # Only update the status bar on this percentage change
+MAX_PARSE_PROCESSES:  int = 8
+
+
+class ProjectLoadCancelled(Exception):
+    """
+    Raised from inside the progress callback to abandon a read in progress
+    """
+    pass
+
+
+@dataclass
+class LoadRequest:
+    fileName:        Path
+    generation:      int
+    lastPercentSent: int            = -PROGRESS_REPORT_STEP
+    projectFileName: Optional[Path] = None      # Set when fileName is a recovery snapshot
+
+
+@dataclass
+class LoadFailure:
+    fileName:  Path
+    exception: Exception
+
+
+LoadFailures = NewType('LoadFailures', List[LoadFailure])
+
+
+@dataclass
+class LoadBatch:
+    fileNames:   List[Path]
+    generation:  int
+    loadedCount: int          = 0
+    failures:    LoadFailures = field(default_factory=lambda: LoadFailures([]))
+
+
+class ProjectLoader:
+    """
+    Decompresses and parses project files on a worker thread so that the UI does not freeze.
+    The parsed project is handed back to the UI thread which builds its shapes, since they
+    create wx objects, and then posts it as an OPEN_PROJECT message.
+
+    Loads are serialized on a single worker.  A cancellation abandons the load in progress
+    and all the loads that are queued behind it.  Every request remembers the generation
+    it was submitted in;  Cancelling bumps the generation, so stale requests notice
+    the next time they report progress
+
+    Multiple files (drag and drop, files passed by the OS) are read concurrently in a
+    process pool.  The projects are opened in the order the reads complete and
+    all the failures are reported in a single dialog
+    """
+    def __init__(self, appPubSubEngine: IAppPubSubEngine):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._appPubSubEngine: IAppPubSubEngine = appPubSubEngine
+
+        self._executor:        ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ProjectLoader')
+        self._generationLock:  Lock = Lock()
+        self._generation:      int  = 0
+        self._pendingCount:    int  = 0
+
+    @property
+    def loadInProgress(self) -> bool:
+        return self._pendingCount > 0
+
+    def loadProject(self, fileName: Path, projectFileName: Optional[Path] = None):
+        """
+        Queue a project for loading;  Returns immediately
+
+        Args:
+            fileName:           Either a PROJECT_SUFFIX or XML_SUFFIX file
+            projectFileName:    When loading a crash recovery snapshot, where the project really lives
+        """
+        with self._generationLock:
+            loadRequest: LoadRequest = LoadRequest(fileName=fileName, generation=self._generation, projectFileName=projectFileName)
+
+        self._pendingCount += 1
+        self._executor.submit(self._load, loadRequest)
+        self.logger.info(f'Queued project load: {fileName}')
+
+    def loadProjects(self, fileNames: List[Path]):
+        """
+        Queue a batch of projects for loading;  Returns immediately
+
+        Args:
+            fileNames:  PROJECT_SUFFIX or XML_SUFFIX files
+        """
+        if len(fileNames) == 1:
+            self.loadProject(fileName=fileNames[0])
+        elif len(fileNames) > 1:
+            with self._generationLock:
+                loadBatch: LoadBatch = LoadBatch(fileNames=list(fileNames), generation=self._generation)
+
+            self._pendingCount += 1
+            self._executor.submit(self._loadBatch, loadBatch)
+            self.logger.info(f'Queued {len(fileNames)} project loads')
+
+    def cancel(self):
+        """
+        Abandon the current load and any queued ones
+        """
+        if self.loadInProgress is True:
+            with self._generationLock:
+                self._generation += 1
+            self._sendStatus(message='Cancelling project open')
+            self.logger.info('Project loads cancelled')
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load(self, loadRequest: LoadRequest):
+        """
+        Runs on the worker thread;  Never touch the UI from here
+
+        Args:
+            loadRequest:  What to load
+        """
+        def progressCallback(message: str, percent: int):
+            self._checkCancelled(generation=loadRequest.generation)
+            if percent - loadRequest.lastPercentSent >= PROGRESS_REPORT_STEP:
+                loadRequest.lastPercentSent = percent
+                wxCallAfter(self._sendStatus, message=f'{message} - {percent}%')
+
+        try:
+            self._checkCancelled(generation=loadRequest.generation)
+
+            umlProjectIO:  UmlProjectIO  = UmlProjectIO(appPubSubEngine=self._appPubSubEngine)
+            projectSource: ProjectSource = umlProjectIO.readProject(fileToOpen=str(loadRequest.fileName), progressCallback=progressCallback)
+
+            wxCallAfter(self._loadCompleted, loadRequest=loadRequest, projectSource=projectSource)
+        except ProjectLoadCancelled:
+            wxCallAfter(self._loadCancelled, loadRequest=loadRequest)
+        except Exception as e:
+            wxCallAfter(self._loadFailed, loadRequest=loadRequest, exception=e)
+
+    def _loadBatch(self, loadBatch: LoadBatch):
+        """
+        Runs on the worker thread;  The reads happen in the process pool and come back in
+        marshal form.  Only the document index is built here;  The shapes are built
+        on the UI thread
+
+        Args:
+            loadBatch:  What to load
+        """
+        processCount:  int                           = min(len(loadBatch.fileNames), cpu_count() or 1, MAX_PARSE_PROCESSES)
+        umlProjectIO:  UmlProjectIO                  = UmlProjectIO(appPubSubEngine=self._appPubSubEngine)
+        unreadFiles:   List[Path]                    = list(loadBatch.fileNames)
+        processPool:   Optional[ProcessPoolExecutor] = None
+        try:
+            #
+            # Never fork a process that is running a UI
+            #
+            processPool = ProcessPoolExecutor(max_workers=processCount, mp_context=get_context('spawn'))
+
+            futures: Dict[Future, Path] = {processPool.submit(readProjectFile, fileName): fileName for fileName in loadBatch.fileNames}
+
+            for future in as_completed(futures):
+                self._checkCancelled(generation=loadBatch.generation)
+                fileName: Path = futures[future]
+                unreadFiles.remove(fileName)
+                try:
+                    readProject:   ReadProject   = future.result()
+                    projectSource: ProjectSource = umlProjectIO.indexReadProject(readProject=readProject)
+
+                    wxCallAfter(self._batchProjectLoaded, loadBatch=loadBatch, projectSource=projectSource)
+                except Exception as e:
+                    loadBatch.failures.append(LoadFailure(fileName=fileName, exception=e))
+
+            wxCallAfter(self._batchCompleted, loadBatch=loadBatch)
+
+        except ProjectLoadCancelled:
+            wxCallAfter(self._batchCancelled, loadBatch=loadBatch)
+        except Exception as e:
+            #
+            # e.g. the pool could not start;  Still report and complete the batch
+            #
+            loadBatch.failures.extend([LoadFailure(fileName=fileName, exception=e) for fileName in unreadFiles])
+            wxCallAfter(self._batchCompleted, loadBatch=loadBatch)
+        finally:
+            if processPool is not None:
+                processPool.shutdown(wait=False, cancel_futures=True)
+
+    def _checkCancelled(self, generation: int):
+
+        with self._generationLock:
+            if generation != self._generation:
+                raise ProjectLoadCancelled()
+
+    def _loadCompleted(self, loadRequest: LoadRequest, projectSource: ProjectSource):
+        """
+        Back on the UI thread;  The user may have cancelled while the completion was in flight.
+        The shapes are built here
+
+        Args:
+            loadRequest:
+            projectSource:  What the worker read
+        """
+        if loadRequest.generation != self._generation:
+            self._loadCancelled(loadRequest=loadRequest)
+            return
+        try:
+            umlProject: UmlProject = UmlProjectIO(appPubSubEngine=self._appPubSubEngine).buildProject(projectSource=projectSource)
+        except Exception as e:
+            self._loadFailed(loadRequest=loadRequest, exception=e)
+            return
+
+        self._pendingCount -= 1
+        if loadRequest.projectFileName is not None:
+            umlProject.fileName = loadRequest.projectFileName
+
+            self._sendStatus(message=f'Recovered {umlProject.fileName.stem}')
+            self._appPubSubEngine.sendMessage(messageType=MessageType.OPEN_PROJECT, uniqueId=APPLICATION_FRAME_ID, umlProject=umlProject)
+            self._appPubSubEngine.sendMessage(messageType=MessageType.CURRENT_PROJECT_RECOVERED, uniqueId=NOTEBOOK_ID, journalFile=loadRequest.fileName)
+        else:
+            self._sendStatus(message=f'Opened {loadRequest.fileName.stem}')
+            self._appPubSubEngine.sendMessage(messageType=MessageType.OPEN_PROJECT, uniqueId=APPLICATION_FRAME_ID, umlProject=umlProject)
+
+    def _loadCancelled(self, loadRequest: LoadRequest):
+
+        self._pendingCount -= 1
+        self.logger.info(f'Project load cancelled: {loadRequest.fileName}')
+        self._sendStatus(message=f'Cancelled opening {loadRequest.fileName.stem}')
+
+    def _loadFailed(self, loadRequest: LoadRequest, exception: Exception):
+
+        self._pendingCount -= 1
+        self._sendStatus(message='')
+        self._reportFailures(failures=LoadFailures([LoadFailure(fileName=loadRequest.fileName, exception=exception)]))
+
+    def _batchProjectLoaded(self, loadBatch: LoadBatch, projectSource: ProjectSource):
+        """
+        Back on the UI thread;  The shapes are built here.  A failure is reported
+        with the rest of the batch
+
+        Args:
+            loadBatch:
+            projectSource:  What the worker read
+        """
+        if loadBatch.generation == self._generation:
+            try:
+                umlProject: UmlProject = UmlProjectIO(appPubSubEngine=self._appPubSubEngine).buildProject(projectSource=projectSource)
+            except Exception as e:
+                loadBatch.failures.append(LoadFailure(fileName=projectSource.fileName, exception=e))
+                return
+
+            loadBatch.loadedCount += 1
+            self._sendStatus(message=f'Opened {umlProject.fileName.stem} ({loadBatch.loadedCount} of {len(loadBatch.fileNames)})')
+            self._appPubSubEngine.sendMessage(messageType=MessageType.OPEN_PROJECT, uniqueId=APPLICATION_FRAME_ID, umlProject=umlProject)
+
+    def _batchCompleted(self, loadBatch: LoadBatch):
+
+        self._pendingCount -= 1
+        self.logger.info(f'Opened {loadBatch.loadedCount} of {len(loadBatch.fileNames)} projects')
+        if len(loadBatch.failures) > 0:
+            self._sendStatus(message=f'Opened {loadBatch.loadedCount} of {len(loadBatch.fileNames)} projects')
+            self._reportFailures(failures=loadBatch.failures)
+
+    def _batchCancelled(self, loadBatch: LoadBatch):
+
+        self._pendingCount -= 1
+        self.logger.info(f'Batch load cancelled after {loadBatch.loadedCount} of {len(loadBatch.fileNames)} projects')
+        self._sendStatus(message='Cancelled opening projects')
+
+    def _reportFailures(self, failures: LoadFailures):
+        """
+        One dialog no matter how many files failed
+
+        Args:
+            failures:
+        """
+        lines: List[str] = []
+        for failure in failures:
+            self.logger.error(f'Project load failed: {failure.fileName} - {failure.exception}')
+            if isinstance(failure.exception, FileNotFoundError):
+                lines.append(f'That project no longer exists: {failure.fileName}')
+            else:
+                lines.append(f'Unable to open {failure.fileName.name}: {failure.exception}')
+
+        message: str = '\n'.join(lines)
+
+        booBoo: MessageDialog = MessageDialog(parent=None, message=message, caption='Error', style=OK | ICON_ERROR)
+        booBoo.ShowModal()
+
+    def _sendStatus(self, message: str):
+        self._appPubSubEngine.sendMessage(messageType=MessageType.UPDATE_APPLICATION_STATUS_MSG, uniqueId=APPLICATION_FRAME_ID, message=message)
@@ -0,0 +1,188 @@
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from copyreg import pickle as registerPickler
+
+from dataclasses import dataclass
+
+from pathlib import Path
+
+from time import perf_counter
+
+from zlib import decompress
+
+from xml.etree.ElementTree import Element as XmlElement
+
+from untangle import Element
+from untangle import parse
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umldiagrammer.projectio.ProjectFileTypes import XML_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import PROJECT_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+
+from umldiagrammer.projectio.XmlDiagramStream import ELEMENT_UML_PROJECT
+from umldiagrammer.projectio.XmlDiagramStream import untangleElement
+
+from umldiagrammer.projectio.SavedContent import SavedContent
+from umldiagrammer.projectio.ElementTuples import marshalProjectDocuments
+from umldiagrammer.projectio.ElementTuples import unmarshalProjectDocuments
+from umldiagrammer.projectio.ChunkedProjectContainer import ChunkedProjectReader
+from umldiagrammer.projectio.ChunkedProjectContainer import readProjectDocuments
+
+
+@dataclass
+class ParsedProject:
+    """
+    The untangled XML of a project file;  Picklable so that it can be returned
+    from a worker process
+    """
+    fileName:       Path
+    root:           Element
+    elapsedSeconds: float                  = 0.0
+    savedContent:   Optional[SavedContent] = None      # Not for XML_FILE_SUFFIX files;  They are saved under a new name
+
+
+@dataclass
+class ReadProject:
+    """
+    The documents of a project file in marshal form;  Cheap to return from a worker
+    process, unlike an untangled tree.  Nothing is untangled yet
+    """
+    fileName:       Path
+    marshaled:      bytes
+    elapsedSeconds: float                  = 0.0
+    savedContent:   Optional[SavedContent] = None      # Not for XML_FILE_SUFFIX files;  They are saved under a new name
+
+    def projectDocuments(self) -> Tuple[Dict[str, str], List[XmlElement]]:
+        """
+        Returns:  The UmlProject element attributes and the UMLDiagram elements in document order
+        """
+        return unmarshalProjectDocuments(marshaled=self.marshaled)
+
+
+def readProjectFile(fileName: Path) -> ReadProject:
+    """
+    Reads and decompresses a project file into its documents.  Does not touch the
+    UI;  So it can run in a worker process
+
+    Args:
+        fileName:   A PROJECT_FILE_SUFFIX, XML_FILE_SUFFIX or CHUNKED_PROJECT_SUFFIX file
+
+    Returns:  The project documents
+    """
+    logger:    Logger = getLogger(__name__)
+    startTime: float  = perf_counter()
+
+    if fileName.suffix not in (PROJECT_FILE_SUFFIX, XML_FILE_SUFFIX, CHUNKED_PROJECT_SUFFIX):
+        raise UnsupportedFileTypeException(message=f'Only {PROJECT_FILE_SUFFIX}, {CHUNKED_PROJECT_SUFFIX} or {XML_FILE_SUFFIX} file types supported')
+
+    savedContent: Optional[SavedContent] = None
+    if fileName.suffix != XML_FILE_SUFFIX:
+        savedContent = SavedContent.fromProjectFile(fileName=fileName)
+
+    projectAttributes, documentElements = readProjectDocuments(fileName=fileName)
+
+    marshaled:      bytes = marshalProjectDocuments(projectAttributes=projectAttributes, documentElements=documentElements)
+    elapsedSeconds: float = perf_counter() - startTime
+    logger.info(f'Read {fileName.name} in {elapsedSeconds:.3f} seconds')
+
+    return ReadProject(fileName=fileName, marshaled=marshaled, elapsedSeconds=elapsedSeconds, savedContent=savedContent)
+
+
+def parseProjectFile(fileName: Path) -> ParsedProject:
+    """
+    Reads, decompresses and untangles a project file.  This is the CPU bound part of
+    opening a project and does not touch the UI;  So it can run in a worker process
+
+    Args:
+        fileName:   A PROJECT_FILE_SUFFIX, XML_FILE_SUFFIX or CHUNKED_PROJECT_SUFFIX file
+
+    Returns:  The parsed project
+    """
+    logger:    Logger = getLogger(__name__)
+    startTime: float  = perf_counter()
+
+    savedContent: Optional[SavedContent] = None
+    if fileName.suffix != XML_FILE_SUFFIX:
+        savedContent = SavedContent.fromProjectFile(fileName=fileName)
+
+    if fileName.suffix == PROJECT_FILE_SUFFIX:
+        root: Element = parse(decompress(fileName.read_bytes()).decode())
+    elif fileName.suffix == XML_FILE_SUFFIX:
+        root = parse(fileName.read_text())
+    elif fileName.suffix == CHUNKED_PROJECT_SUFFIX:
+        root = parseChunkedProject(fileName=fileName)
+    else:
+        raise UnsupportedFileTypeException(message=f'Only {PROJECT_FILE_SUFFIX}, {CHUNKED_PROJECT_SUFFIX} or {XML_FILE_SUFFIX} file types supported')
+
+    elapsedSeconds: float = perf_counter() - startTime
+    logger.info(f'Parsed {fileName.name} in {elapsedSeconds:.3f} seconds')
+
+    return ParsedProject(fileName=fileName, root=root, elapsedSeconds=elapsedSeconds, savedContent=savedContent)
+
+
+def parseChunkedProject(fileName: Path) -> Element:
+    """
+    Reassembles the documents under a project element
+
+    Args:
+        fileName:   A CHUNKED_PROJECT_SUFFIX file
+
+    Returns:  The same untangled document as the equivalent PROJECT_FILE_SUFFIX file
+    """
+    chunkedProjectReader: ChunkedProjectReader = ChunkedProjectReader(fileName=fileName)
+
+    documentElements: List[XmlElement] = [chunkedProjectReader.readDocument(chunkEntry=chunkEntry) for chunkEntry in chunkedProjectReader.chunkEntries]
+
+    return untangleProject(projectAttributes=chunkedProjectReader.projectAttributes, documentElements=documentElements)
+
+
+def untangleProject(projectAttributes: Dict[str, str], documentElements: List[XmlElement]) -> Element:
+    """
+
+    Args:
+        projectAttributes:  The UmlProject element attributes
+        documentElements:   The UMLDiagram elements in document order
+
+    Returns:  The same untangled document as parsing the project file
+    """
+    projectElement: XmlElement = XmlElement(ELEMENT_UML_PROJECT, attrib=projectAttributes)
+    projectElement.extend(documentElements)
+
+    root: Element = Element(None, None)
+    root.is_root = True
+    root.add_child(untangleElement(xmlElement=projectElement))
+
+    return root
+
+
+def _reduceElement(element: Element):
+    """
+    untangle elements answer every unknown attribute lookup with a child search;  That
+    recurses forever when pickle probes a half built element.  So pickle just the state
+    """
+    state: Dict = element.__dict__
+
+    return _rebuildElement, (state['_name'], state['_attributes'], state['children'], state['is_root'], state['cdata'])
+
+
+def _rebuildElement(name: str, attributes: Dict[str, str], children: List[Element], isRoot: bool, cdata: str) -> Element:
+
+    element: Element = Element(name, attributes)
+
+    element.children = children
+    element.is_root  = isRoot
+    element.cdata    = cdata
+
+    return element
+
+
+registerPickler(Element, _reduceElement)
@@ -0,0 +1,277 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from pathlib import Path
+
+from time import monotonic_ns
+
+from hashlib import sha256
+
+from zlib import compress
+
+from xml.etree.ElementTree import Element
+
+from concurrent.futures import ThreadPoolExecutor
+
+from wx import OK
+from wx import ICON_ERROR
+
+from wx import MessageDialog
+
+from wx import CallAfter as wxCallAfter
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+from umlio.IOTypes import UmlProject
+
+from umldiagrammer.data.LazyUmlDocument import LazyUmlDocument
+
+from umldiagrammer.projectio.AtomicWrite import atomicWrite
+from umldiagrammer.projectio.SavedContent import SavedContent
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+from umldiagrammer.projectio.ChunkedProjectContainer import ChunkedProjectWriter
+from umldiagrammer.projectio.ChunkedProjectContainer import documentChunks
+from umldiagrammer.projectio.ChunkedProjectContainer import chunkedContentHash
+from umldiagrammer.projectio.FragmentedUmlShapesToXml import DocumentFragments
+from umldiagrammer.projectio.FragmentedUmlShapesToXml import FragmentedUmlShapesToXml
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+
+from umldiagrammer.DiagrammerTypes import NOTEBOOK_ID
+from umldiagrammer.DiagrammerTypes import APPLICATION_FRAME_ID
+
+from umldiagrammer.pubsubengine.MessageType import MessageType
+from umldiagrammer.pubsubengine.IAppPubSubEngine import IAppPubSubEngine
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """
+    Everything the worker needs to write a project.  The XML element tree is freshly
+    built and owned only by the snapshot, so the UI is free to keep editing the shapes
+    """
+    fileName:       Path
+    umlShapesToXml: FragmentedUmlShapesToXml
+    snapshotTime:   int
+
+
+class ProjectSaver(metaclass=SingletonV3):
+    """
+    Saves projects in two steps.  The snapshot of the UML documents is taken on the UI
+    thread since it has to walk the shapes.  The pretty printing, compression and the file write
+    happen on a worker thread.
+
+    The write is atomic;  We write to a temporary file in the destination directory, flush it to
+    disk and then rename it over the project file.  CURRENT_PROJECT_SAVED is only sent after the
+    rename commits
+
+    Nothing is written when the serialized project hashes the same as what the file held when
+    it was last read or written;  For example, when edits were undone back to the saved state
+    """
+    def __init__(self, appPubSubEngine: IAppPubSubEngine):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._appPubSubEngine: IAppPubSubEngine = appPubSubEngine
+        #
+        # A single worker means saves of the same project are written in the order they were requested
+        #
+        self._executor:     ThreadPoolExecutor          = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ProjectSaver')
+        self._pendingSaves: Dict[Path, ProjectSnapshot] = {}
+        self._savedContent: Dict[Path, SavedContent]    = {}
+
+    @property
+    def saveInProgress(self) -> bool:
+        return len(self._pendingSaves) > 0
+
+    def snapshot(self, umlProject: UmlProject, fileName: Path, documentFragments: Optional[DocumentFragments] = None) -> ProjectSnapshot:
+        """
+        Must be called on the UI thread
+
+        Args:
+            umlProject:         The project to capture
+            fileName:           Where the snapshot will be written
+            documentFragments:  The already serialized documents;  If not provided the
+                                project UML documents are serialized
+
+        Returns:  An immutable snapshot of the project
+        """
+        snapshotTime:   int                      = monotonic_ns()
+        umlShapesToXml: FragmentedUmlShapesToXml = FragmentedUmlShapesToXml(projectFileName=fileName, projectCodePath=umlProject.codePath)
+
+        with TimingSpan('save.snapshot', project=fileName.name, prebuilt=documentFragments is not None):
+            if documentFragments is None:
+                for umlDocument in umlProject.umlDocuments.values():
+                    if isinstance(umlDocument, LazyUmlDocument):
+                        umlShapesToXml.addFragments(documentFragments=DocumentFragments([umlShapesToXml.sourceFragment(lazyUmlDocument=umlDocument)]))
+                    else:
+                        umlShapesToXml.serialize(umlDiagram=umlDocument)
+            else:
+                umlShapesToXml.addFragments(documentFragments=documentFragments)
+
+        return ProjectSnapshot(fileName=fileName, umlShapesToXml=umlShapesToXml, snapshotTime=snapshotTime)
+
+    def saveProject(self, umlProject: UmlProject, fileName: Path, documentFragments: Optional[DocumentFragments] = None):
+        """
+        Snapshot the project and queue it for writing;  Returns as soon as the snapshot is taken
+
+        Args:
+            umlProject:         The project to save
+            fileName:           A fully qualified PROJECT_SUFFIX or CHUNKED_PROJECT_SUFFIX file name
+            documentFragments:  The already serialized documents
+        """
+        projectSnapshot: ProjectSnapshot = self.snapshot(umlProject=umlProject, fileName=fileName, documentFragments=documentFragments)
+
+        self._pendingSaves[fileName] = projectSnapshot
+        self._executor.submit(self._write, projectSnapshot)
+
+        self._sendStatus(message=f'Saving {fileName.stem}')
+
+    def recordSavedContent(self, fileName: Path, savedContent: SavedContent):
+        """
+        Called when a project is read;  Safe to call from a worker thread
+
+        Args:
+            fileName:       The project file
+            savedContent:   What it holds
+        """
+        self._savedContent[fileName] = savedContent
+
+    def waitForPendingSaves(self):
+        """
+        Called at shutdown so that we do not exit with a half written project
+        """
+        if self.saveInProgress is True:
+            self.logger.info(f'Waiting for {len(self._pendingSaves)} project save(s) to complete')
+
+        self._executor.shutdown(wait=True)
+
+    def _write(self, projectSnapshot: ProjectSnapshot):
+        """
+        Runs on the worker thread;  Never touch the UI from here
+
+        Args:
+            projectSnapshot:  What to write
+        """
+        fileName: Path = projectSnapshot.fileName
+        try:
+            with TimingSpan('save', project=fileName.name) as saveSpan:
+                if fileName.suffix == CHUNKED_PROJECT_SUFFIX:
+                    umlShapesToXml:    FragmentedUmlShapesToXml = projectSnapshot.umlShapesToXml
+                    projectAttributes: Dict[str, str]           = umlShapesToXml.projectAttributes
+                    documentElements:  List[Element]            = umlShapesToXml.documentElements
+
+                    with TimingSpan('save.serialize', documents=len(documentElements)):
+                        chunks: List[bytes] = documentChunks(documentElements=documentElements)
+
+                        contentHash: str = chunkedContentHash(projectAttributes=projectAttributes,
+                                                              documentAttributes=[dict(documentElement.attrib) for documentElement in documentElements],
+                                                              chunkHashes=[sha256(chunk).hexdigest() for chunk in chunks]
+                                                              )
+                    unchanged: bool = self._isUnchanged(fileName=fileName, contentHash=contentHash)
+                    if unchanged is False:
+                        with TimingSpan('save.write') as writeSpan:
+                            chunkCount: int = ChunkedProjectWriter(fileName=fileName).write(projectAttributes=projectAttributes, documentElements=documentElements, chunks=chunks)
+                            writeSpan.set(chunks=chunkCount)
+                else:
+                    with TimingSpan('save.serialize') as serializeSpan:
+                        rawXml:          str   = projectSnapshot.umlShapesToXml.xml
+                        compressedBytes: bytes = compress(rawXml.encode())
+
+                        contentHash = sha256(compressedBytes).hexdigest()
+                        serializeSpan.set(xmlCharacters=len(rawXml), compressedBytes=len(compressedBytes))
+
+                    unchanged = self._isUnchanged(fileName=fileName, contentHash=contentHash)
+                    if unchanged is False:
+                        with TimingSpan('save.write'):
+                            atomicWrite(fileName=fileName, contents=compressedBytes)
+
+                saveSpan.set(skipped=unchanged)
+
+            if unchanged is False:
+                wxCallAfter(self._saveCompleted, projectSnapshot=projectSnapshot, savedContent=SavedContent.fromProjectFile(fileName=fileName, contentHash=contentHash))
+            else:
+                wxCallAfter(self._saveSkipped, projectSnapshot=projectSnapshot)
+        except Exception as e:
+            wxCallAfter(self._saveFailed, projectSnapshot=projectSnapshot, exception=e)
+
+    def _isUnchanged(self, fileName: Path, contentHash: str) -> bool:
+        """
+        Runs on the worker thread
+
+        Args:
+            fileName:       Where the project is about to be written
+            contentHash:    The hash of what would be written
+
+        Returns:  True if the file already holds exactly this content
+        """
+        savedContent: Optional[SavedContent] = self._savedContent.get(fileName)
+        if savedContent is None:
+            return False
+
+        return savedContent.isCurrent(fileName=fileName, contentHash=contentHash)
+
+    def _saveCompleted(self, projectSnapshot: ProjectSnapshot, savedContent: SavedContent):
+
+        fileName: Path = projectSnapshot.fileName
+
+        self._savedContent[fileName] = savedContent
+        self._removePending(projectSnapshot=projectSnapshot)
+        self.logger.info(f'Project Saved - fileName: {fileName}')
+
+        self._sendStatus(message=f'Saved {fileName.stem}')
+        self._sendProjectSaved(projectSnapshot=projectSnapshot)
+
+    def _saveSkipped(self, projectSnapshot: ProjectSnapshot):
+        """
+        The project is still saved as far as everyone else is concerned
+
+        Args:
+            projectSnapshot:
+        """
+        fileName: Path = projectSnapshot.fileName
+
+        self._removePending(projectSnapshot=projectSnapshot)
+        self.logger.info(f'Project unchanged;  Not written - fileName: {fileName}')
+
+        self._sendStatus(message=f'{fileName.stem} unchanged;  Nothing written')
+        self._sendProjectSaved(projectSnapshot=projectSnapshot)
+
+    def _sendProjectSaved(self, projectSnapshot: ProjectSnapshot):
+        self._appPubSubEngine.sendMessage(messageType=MessageType.CURRENT_PROJECT_SAVED,
+                                          uniqueId=NOTEBOOK_ID,
+                                          projectPath=projectSnapshot.fileName,
+                                          snapshotTime=projectSnapshot.snapshotTime
+                                          )
+
+    def _saveFailed(self, projectSnapshot: ProjectSnapshot, exception: Exception):
+
+        fileName: Path = projectSnapshot.fileName
+
+        self._removePending(projectSnapshot=projectSnapshot)
+        self.logger.error(f'Project save failed: {fileName} - {exception}')
+        self._sendStatus(message='')
+
+        message: str = f'Unable to save {fileName.name}\n{exception}'
+        booBoo: MessageDialog = MessageDialog(parent=None, message=message, caption='Error', style=OK | ICON_ERROR)
+        booBoo.ShowModal()
+
+    def _removePending(self, projectSnapshot: ProjectSnapshot):
+        """
+        A newer save of the same project may have replaced our snapshot
+
+        Args:
+            projectSnapshot:
+        """
+        if self._pendingSaves.get(projectSnapshot.fileName) is projectSnapshot:
+            del self._pendingSaves[projectSnapshot.fileName]
+
+    def _sendStatus(self, message: str):
+        self._appPubSubEngine.sendMessage(messageType=MessageType.UPDATE_APPLICATION_STATUS_MSG, uniqueId=APPLICATION_FRAME_ID, message=message)
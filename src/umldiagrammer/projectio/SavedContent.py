@@ -0,0 +1,74 @@
+
+from typing import Optional
+
+from dataclasses import dataclass
+
+from hashlib import sha256
+
+from pathlib import Path
+
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+
+from umldiagrammer.projectio.ChunkedProjectContainer import ChunkedProjectReader
+
+
+@dataclass(frozen=True)
+class SavedContent:
+    """
+    What a project file held when we last read or wrote it.  A save whose content hash
+    matches does not need to touch the disk;  Unless someone else changed the file since
+    """
+    contentHash:  str
+    modifiedTime: int       # ns
+    fileSize:     int
+
+    @classmethod
+    def fromProjectFile(cls, fileName: Path, contentHash: Optional[str] = None) -> 'SavedContent':
+        """
+        Stat the file before hashing it;  If it changes in between the next save writes it
+
+        Args:
+            fileName:       A project file
+            contentHash:    The hash of what was just written;  When not provided the file is hashed
+
+        Returns:  The saved content
+        """
+        statResult = fileName.stat()
+        if contentHash is None:
+            contentHash = projectContentHash(fileName=fileName)
+
+        return SavedContent(contentHash=contentHash, modifiedTime=statResult.st_mtime_ns, fileSize=statResult.st_size)
+
+    def isCurrent(self, fileName: Path, contentHash: str) -> bool:
+        """
+
+        Args:
+            fileName:       The project file about to be saved
+            contentHash:    The hash of what would be written
+
+        Returns:  True if the file already holds exactly that content
+        """
+        if contentHash != self.contentHash:
+            return False
+        try:
+            statResult = fileName.stat()
+        except OSError:
+            return False
+
+        return statResult.st_mtime_ns == self.modifiedTime and statResult.st_size == self.fileSize
+
+
+def projectContentHash(fileName: Path) -> str:
+    """
+    A chunked project is updated in place so its bytes depend on its history;  Its hash
+    is the hash of its table of contents.  Any other project is hashed as is
+
+    Args:
+        fileName:   A project file
+
+    Returns:  The content hash
+    """
+    if fileName.suffix == CHUNKED_PROJECT_SUFFIX:
+        return ChunkedProjectReader(fileName=fileName).contentHash
+
+    return sha256(fileName.read_bytes()).hexdigest()
@@ -0,0 +1,127 @@
+
+from typing import Callable
+from typing import Optional
+
+from pathlib import Path
+
+from untangle import Element
+
+from codeallybasic.SecureConversions import SecureConversions
+
+from umlshapes.ShapeTypes import LinkableUmlShapes
+
+from umlio.IOTypes import UmlDocument
+from umlio.IOTypes import UmlDocumentType
+from umlio.IOTypes import UmlDocumentTitle
+
+from umlio.XMLConstants import XmlConstants
+
+from umlio.deserializer.XmlToUmlShapes import XmlToUmlShapes
+
+from umldiagrammer.projectio.XmlDiagramStream import XmlDiagramStream
+from umldiagrammer.projectio.XmlDiagramStream import StreamProgressCallback
+from umldiagrammer.projectio.XmlDiagramStream import noStreamProgress
+
+DocumentBuilder = Callable[..., UmlDocument]     # Called with umlDiagramElement
+
+
+class UntangledXmlToUmlShapes(XmlToUmlShapes):
+    """
+    Builds the UML shapes from XML that has already been untangled;  Lets the
+    expensive XML parse happen somewhere else, for example in a worker process
+    """
+    def deserializeRoot(self, root: Element, fileName: Path):
+        """
+
+        Args:
+            root:       The untangled document root
+            fileName:   The file name the XML came from
+        """
+        umlProject: Element = root.UmlProject
+
+        self._umlProject.fileName = fileName
+        self._umlProject.version  = umlProject[XmlConstants.ATTRIBUTE_VERSION]
+        self._umlProject.codePath = umlProject[XmlConstants.ATTRIBUTE_CODE_PATH]
+
+        for umlDiagramElement in umlProject.get_elements(XmlConstants.ELEMENT_UML_DIAGRAM):
+
+            umlDocument: UmlDocument = self.deserializeDocument(umlDiagramElement=umlDiagramElement)
+
+            self._umlProject.umlDocuments[umlDocument.documentTitle] = umlDocument
+
+    def deserializeStream(self, xmlDiagramStream: XmlDiagramStream, fileName: Path,
+                          progressCallback: StreamProgressCallback = noStreamProgress,
+                          documentBuilder: Optional[DocumentBuilder] = None):
+        """
+        Builds the UML documents one diagram at a time;  Each diagram's XML is released
+        as soon as its shapes are built
+
+        Args:
+            xmlDiagramStream:   The project file to stream
+            fileName:           The file name the XML came from
+            progressCallback:   Receives the read progress
+            documentBuilder:    Builds each document, e.g. on the UI thread;  Defaults to deserializeDocument
+        """
+        if documentBuilder is None:
+            documentBuilder = self.deserializeDocument
+
+        self._umlProject.fileName = fileName
+
+        for umlDiagramElement in xmlDiagramStream.diagramElements(progressCallback=progressCallback):
+
+            umlDocument: UmlDocument = documentBuilder(umlDiagramElement=umlDiagramElement)
+
+            self._umlProject.umlDocuments[umlDocument.documentTitle] = umlDocument
+
+        self._umlProject.version  = xmlDiagramStream.projectAttributes.get(XmlConstants.ATTRIBUTE_VERSION, '')
+        self._umlProject.codePath = xmlDiagramStream.projectAttributes.get(XmlConstants.ATTRIBUTE_CODE_PATH, '')
+
+    def deserializeDocument(self, umlDiagramElement: Element) -> UmlDocument:
+        """
+        Args:
+            umlDiagramElement:  An untangled UMLDiagram element
+
+        Returns:  The UML document with its shapes
+        """
+        umlDocument: UmlDocument = UmlDocument(
+            documentTitle=UmlDocumentTitle(umlDiagramElement[XmlConstants.ATTRIBUTE_TITLE]),
+            scrollPositionX=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_SCROLL_POSITION_X]),
+            scrollPositionY=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_SCROLL_POSITION_Y]),
+            pixelsPerUnitX=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_X]),
+            pixelsPerUnitY=SecureConversions.secureInteger(umlDiagramElement[XmlConstants.ATTRIBUTE_PIXELS_PER_UNIT_Y])
+        )
+        documentType: str = umlDiagramElement[XmlConstants.ATTRIBUTE_DOCUMENT_TYPE]
+
+        if documentType == UmlDocumentType.CLASS_DOCUMENT.value:
+
+            umlDocument.documentType = UmlDocumentType.CLASS_DOCUMENT
+            umlDocument.umlClasses = self._deserializeUmlClassElements(umlDiagramElement=umlDiagramElement)
+            umlDocument.umlNotes   = self._deserializeUmlNoteElements(umlDiagramElement=umlDiagramElement)
+            umlDocument.umlTexts   = self._deserializeUmlTextElements(umlDiagramElement=umlDiagramElement)
+
+            linkableUmlShapes: LinkableUmlShapes = self._buildLinkableUmlShapes(umlDocument=umlDocument)
+
+            umlDocument.umlLinks              = self._deserializeUmlLinkElements(umlDiagramElement=umlDiagramElement, linkableUmlShapes=linkableUmlShapes)
+            umlDocument.umlLollipopInterfaces = self._deserializeLollipopInterfaces(umlDiagramElement=umlDiagramElement, linkableUmlShapes=linkableUmlShapes)
+
+        elif documentType == UmlDocumentType.USE_CASE_DOCUMENT.value:
+
+            umlDocument.documentType = UmlDocumentType.USE_CASE_DOCUMENT
+            umlDocument.umlNotes    = self._deserializeUmlNoteElements(umlDiagramElement=umlDiagramElement)
+            umlDocument.umlActors   = self._deserializeUmlActorElements(umlDiagramElement=umlDiagramElement)
+            umlDocument.umlUseCases = self._deserializeUmlUseCaseElements(umlDiagramElement=umlDiagramElement)
+
+            linkableUmlShapes = self._buildLinkableUmlShapes(umlDocument=umlDocument)
+
+            umlDocument.umlLinks = self._deserializeUmlLinkElements(umlDiagramElement=umlDiagramElement, linkableUmlShapes=linkableUmlShapes)
+
+        elif documentType == UmlDocumentType.SEQUENCE_DOCUMENT.value:
+
+            umlDocument.documentType = UmlDocumentType.SEQUENCE_DOCUMENT
+            umlDocument.umlTexts = self._deserializeUmlTextElements(umlDiagramElement=umlDiagramElement)
+            umlDocument.umlNotes = self._deserializeUmlNoteElements(umlDiagramElement=umlDiagramElement)
+
+        else:
+            assert False, 'Unknown diagram Type - Perhaps corrupted fle'
+
+        return umlDocument
@@ -0,0 +1,181 @@
+
+from typing import Dict
+from typing import List
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from keyword import iskeyword
+
+from pathlib import Path
+
+from zlib import decompressobj
+
+from xml.etree.ElementTree import Element as XmlElement
+from xml.etree.ElementTree import XMLPullParser
+
+from untangle import Element
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umldiagrammer.projectio.ProjectFileTypes import XML_FILE_SUFFIX
+from umldiagrammer.projectio.ProjectFileTypes import PROJECT_FILE_SUFFIX
+
+ELEMENT_UML_PROJECT: str = 'UmlProject'
+ELEMENT_UML_DIAGRAM: str = 'UMLDiagram'
+
+STREAM_CHUNK_SIZE: int = 1024 * 1024
+
+StreamProgressCallback = Callable[[str, int], None]
+
+
+def noStreamProgress(message: str, percent: int):
+    pass
+
+
+class XmlDiagramStream:
+    """
+    Iterates the UMLDiagram elements of a project file without ever holding the whole
+    document.  The file is fed to the XML parser a chunk at a time, and each diagram is
+    released as soon as the consumer is done with it.  So memory use is bounded by the
+    largest diagram and not by the size of the file.
+
+    The diagrams are handed out as untangle elements so that they look exactly like
+    the ones that the document parser produces
+    """
+    def __init__(self, fileName: Path, chunkSize: int = STREAM_CHUNK_SIZE):
+        """
+
+        Args:
+            fileName:   Either a PROJECT_FILE_SUFFIX or XML_FILE_SUFFIX file
+            chunkSize:  The number of bytes read from the file at a time
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if fileName.suffix not in (PROJECT_FILE_SUFFIX, XML_FILE_SUFFIX):
+            raise UnsupportedFileTypeException(message=f'Only {PROJECT_FILE_SUFFIX} or {XML_FILE_SUFFIX} file types supported')
+
+        self._fileName:  Path = fileName
+        self._chunkSize: int  = chunkSize
+
+        self._projectAttributes: Dict[str, str] = {}
+        self._diagramCount:      int            = 0
+
+    @property
+    def projectAttributes(self) -> Dict[str, str]:
+        """
+        Available as soon as the first diagram is handed out
+        """
+        return self._projectAttributes
+
+    @property
+    def diagramCount(self) -> int:
+        return self._diagramCount
+
+    def diagramElements(self, progressCallback: StreamProgressCallback = noStreamProgress) -> Iterator[Element]:
+        """
+        The consumer must be done with a diagram before asking for the next one
+
+        Args:
+            progressCallback:   Receives the read progress;  May raise to abandon the stream
+
+        Returns:  The untangled UMLDiagram elements in document order
+        """
+        for xmlElement in self.diagramXmlElements(progressCallback=progressCallback):
+            yield untangleElement(xmlElement=xmlElement)
+            #
+            # Let go of the diagram
+            #
+            xmlElement.clear()
+
+    def diagramXmlElements(self, progressCallback: StreamProgressCallback = noStreamProgress) -> Iterator[XmlElement]:
+        """
+        The element tree elements exactly as parsed;  Each one is detached from the project
+        element, so it lives only as long as the consumer keeps it
+
+        Args:
+            progressCallback:   Receives the read progress;  May raise to abandon the stream
+
+        Returns:  The UMLDiagram elements in document order
+        """
+        parser:         XMLPullParser        = XMLPullParser(events=('start', 'end'))
+        projectElement: Optional[XmlElement] = None
+        depth:          int                  = 0
+
+        for chunk in self._chunks(progressCallback=progressCallback):
+            parser.feed(chunk)
+            for event, xmlElement in parser.read_events():
+                if event == 'start':
+                    depth += 1
+                    if depth == 1 and xmlElement.tag == ELEMENT_UML_PROJECT:
+                        projectElement = xmlElement
+                        self._projectAttributes = dict(xmlElement.attrib)
+                else:
+                    depth -= 1
+                    if depth == 1 and xmlElement.tag == ELEMENT_UML_DIAGRAM:
+                        if projectElement is not None:
+                            projectElement.remove(xmlElement)
+                        self._diagramCount += 1
+                        yield xmlElement
+
+        parser.close()
+
+    def _chunks(self, progressCallback: StreamProgressCallback) -> Iterator[bytes]:
+        """
+        Compressed files are inflated a chunk at a time as well
+
+        Args:
+            progressCallback:
+
+        Returns:  Raw XML bytes
+        """
+        fileSize:   int = max(self._fileName.stat().st_size, 1)
+        consumed:   int = 0
+        statusText: str = f'Importing {self._fileName.name}'
+
+        decompressor = decompressobj() if self._fileName.suffix == PROJECT_FILE_SUFFIX else None
+
+        with open(self._fileName, 'rb') as streamFile:
+            while True:
+                chunk: bytes = streamFile.read(self._chunkSize)
+                if len(chunk) == 0:
+                    break
+                consumed += len(chunk)
+                if decompressor is None:
+                    yield chunk
+                else:
+                    yield decompressor.decompress(chunk)
+                progressCallback(statusText, (consumed * 100) // fileSize)
+
+        if decompressor is not None:
+            yield decompressor.flush()
+
+
+def untangleElement(xmlElement: XmlElement) -> Element:
+    """
+    Mirrors what the untangle SAX handler builds;  Element names are made
+    attribute friendly, and the character data is the text plus the tails
+    of the children
+
+    Args:
+        xmlElement:  An element tree element
+
+    Returns:  The equivalent untangle element
+    """
+    name: str = xmlElement.tag.replace('-', '_').replace('.', '_').replace(':', '_')
+    if iskeyword(name):
+        name = f'{name}_'
+
+    element:     Element   = Element(name, dict(xmlElement.attrib))
+    cdataPieces: List[str] = [xmlElement.text or '']
+
+    for child in xmlElement:
+        element.add_child(untangleElement(xmlElement=child))
+        cdataPieces.append(child.tail or '')
+
+    element.cdata = ''.join(cdataPieces)
+
+    return element
@@ -28,6 +28,11 @@ class AppPubSubEngine(IAppPubSubEngine, BasePubSubEngine):
     def sendMessage(self, messageType: MessageType, uniqueId: UniqueId, **kwargs):
         self._sendMessage(topic=self._toTopic(messageType, uniqueId), **kwargs)
 
+    def deleteTopics(self, uniqueId: UniqueId):
+
+        for messageType in MessageType:
+            self._publisher.getTopicMgr().delTopic(self._toTopic(messageType, uniqueId))
+
     def debugSubscribeAllTopics(self, listener):
         self._subscribe(Topic(pub.ALL_TOPICS), listener=listener)
 
@@ -0,0 +1,21 @@
+
+from umlshapes.frames.DiagramFrame import FrameId
+
+from umlshapes.pubsubengine.UmlMessageType import UmlMessageType
+from umlshapes.pubsubengine.UmlPubSubEngine import UmlPubSubEngine
+
+
+class DiagrammerUmlPubSubEngine(UmlPubSubEngine):
+    """
+    UML Shapes never drops a frame's topics;  The diagrammer destroys frames and builds
+    them again, each time with a new frame ID
+    """
+    def deleteFrameTopics(self, frameId: FrameId):
+        """
+        Drop every listener subscribed for the frame
+
+        Args:
+            frameId:    A destroyed frame
+        """
+        for messageType in UmlMessageType:
+            self._publisher.getTopicMgr().delTopic(self._toTopic(messageType, frameId))
@@ -20,3 +20,13 @@ class IAppPubSubEngine(ABC):
     @abstractmethod
     def sendMessage(self, messageType: MessageType, uniqueId: UniqueId, **kwargs):
         pass
+
+    @abstractmethod
+    def deleteTopics(self, uniqueId: UniqueId):
+        """
+        Drop every listener subscribed with the unique ID;  For IDs that go away, e.g. a destroyed frame's
+
+        Args:
+            uniqueId:
+        """
+        pass
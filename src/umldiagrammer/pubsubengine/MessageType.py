@@ -19,6 +19,10 @@ class MessageType(Enum):
     PROJECT_RENAMED                = 'Project Renamed'
     LOLLIPOP_CREATION_REQUEST      = 'Lollipop Creation Request'
     UPDATE_EDIT_MENU               = 'Update Edit Menu'
+    #
+    # Sent to a diagram frame's unique id;  The diagram manager pastes in a single bulk insertion
+    #
+    PASTE_SHAPES                   = 'Paste Shapes'
 
     CREATE_NEW_DIAGRAM    = 'Create New Diagram'
     DELETE_DIAGRAM        = 'Delete Diagram'
@@ -32,6 +36,7 @@ class MessageType(Enum):
     #
     # The diagram needs to send messages
     # The applications needs to listen for messages from the frame
+    # Also sent to the notebook when a diagram frame is built on first display
     #
     REGISTER_NEW_FRAME  = 'Register New Frame'
     #
@@ -44,5 +49,21 @@ class MessageType(Enum):
     # So, probably good idea to 'grey' out some items, including the tool bar
     #
     NO_OPEN_PROJECTS = 'No Open Projects'
+    #
+    # Project files are read on a background thread;  Senders provide the file name
+    # The loader posts OPEN_PROJECT when the project is ready
+    #
+    LOAD_PROJECT_FILE    = 'Load Project File'
+    LOAD_PROJECT_FILES   = 'Load Project Files'
+    CANCEL_PROJECT_LOAD  = 'Cancel Project Load'
+    #
+    # Sent to the notebook after a project is restored from its crash recovery snapshot
+    # The restored project is the current one and is not saved yet;  Senders provide journalFile
+    #
+    CURRENT_PROJECT_RECOVERED = 'Current Project Recovered'
+    #
+    # Sent to the notebook when the paint statistics overlay is turned on or off;  Senders provide shown
+    #
+    PAINT_STATISTICS_CHANGED = 'Paint Statistics Changed'
 
     NO_EVENT = 'NoEvent'
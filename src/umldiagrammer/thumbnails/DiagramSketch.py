@@ -0,0 +1,115 @@
+
+from typing import List
+from typing import Tuple
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from hashlib import sha1
+
+from xml.etree.ElementTree import Element
+
+from codeallybasic.SecureConversions import SecureConversions
+
+from umlio.XMLConstants import XmlConstants
+
+#
+# Change when the way a sketch is drawn changes;  Cached thumbnails of the old format are not used
+#
+SKETCH_FORMAT: str = '1'
+
+SHAPE_ELEMENTS: Tuple[str, ...] = (
+    XmlConstants.ELEMENT_UML_CLASS,
+    XmlConstants.ELEMENT_UML_NOTE,
+    XmlConstants.ELEMENT_UML_TEXT,
+    XmlConstants.ELEMENT_UML_ACTOR,
+    XmlConstants.ELEMENT_UML_USE_CASE,
+)
+
+Box  = Tuple[int, int, int, int]        # x, y, width, height
+Line = List[Tuple[int, int]]            # From end, control points, to end
+
+
+@dataclass
+class DiagramSketch:
+    """
+    Only the geometry of a diagram;  Its shapes as boxes and its links as poly lines.
+    Thumbnails are drawn from sketches
+    """
+    boxes: List[Box]  = field(default_factory=list)
+    lines: List[Line] = field(default_factory=list)
+
+    @classmethod
+    def fromDocumentFragment(cls, documentFragment: Element) -> 'DiagramSketch':
+        """
+
+        Args:
+            documentFragment:  A UMLDiagram element
+
+        Returns:  The sketch of the diagram
+        """
+        sketch: DiagramSketch = DiagramSketch()
+        for element in documentFragment:
+            if element.tag in SHAPE_ELEMENTS:
+                sketch.boxes.append((_integer(element, XmlConstants.ATTRIBUTE_X),
+                                     _integer(element, XmlConstants.ATTRIBUTE_Y),
+                                     _integer(element, XmlConstants.ATTRIBUTE_WIDTH),
+                                     _integer(element, XmlConstants.ATTRIBUTE_HEIGHT))
+                                    )
+            elif element.tag == XmlConstants.ELEMENT_UML_LINK:
+                line: Line = [(_integer(element, XmlConstants.ATTRIBUTE_LINK_FROM_X), _integer(element, XmlConstants.ATTRIBUTE_LINK_FROM_Y))]
+                for controlPoint in element.iter(XmlConstants.ELEMENT_MODEL_LINE_CONTROL_POINT):
+                    line.append((_integer(controlPoint, XmlConstants.ATTRIBUTE_X), _integer(controlPoint, XmlConstants.ATTRIBUTE_Y)))
+                line.append((_integer(element, XmlConstants.ATTRIBUTE_LINK_TO_X), _integer(element, XmlConstants.ATTRIBUTE_LINK_TO_Y)))
+
+                sketch.lines.append(line)
+
+        return sketch
+
+    @property
+    def empty(self) -> bool:
+        return len(self.boxes) == 0 and len(self.lines) == 0
+
+    @property
+    def contentHash(self) -> str:
+        """
+        Diagrams that look the same share a thumbnail;  Moving a shape changes the hash,
+        editing its text does not
+
+        Returns:  The hash of the sketch
+        """
+        digest = sha1(SKETCH_FORMAT.encode())
+        for box in self.boxes:
+            digest.update(repr(box).encode())
+        digest.update(b'|')
+        for line in self.lines:
+            digest.update(repr(line).encode())
+
+        return digest.hexdigest()
+
+    @property
+    def extent(self) -> Box:
+        """
+        Returns:  The bounding box of the sketch;  All zero when it is empty
+        """
+        if self.empty is True:
+            return 0, 0, 0, 0
+
+        xs: List[int] = []
+        ys: List[int] = []
+        for x, y, width, height in self.boxes:
+            xs.extend((x, x + width))
+            ys.extend((y, y + height))
+        for line in self.lines:
+            for x, y in line:
+                xs.append(x)
+                ys.append(y)
+
+        left: int = min(xs)
+        top:  int = min(ys)
+
+        return left, top, max(xs) - left, max(ys) - top
+
+
+def _integer(element: Element, attributeName: str) -> int:
+    return SecureConversions.secureInteger(element.get(attributeName, '0'))
@@ -0,0 +1,58 @@
+
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from pathlib import Path
+
+from umldiagrammer.projectio.LruDiskCache import LruDiskCache
+
+THUMBNAIL_SUFFIX: str = '.png'
+
+
+class ThumbnailCache:
+    """
+    An on disk cache of rendered diagram thumbnails keyed by the content hash of the
+    diagram sketch.  Diagrams that did not change since they were last rendered, in this
+    project or any other, reuse their thumbnail.
+
+    The cache is bounded by size;  The least recently used entries are evicted first.  An
+    entry's modification time is its last use
+    """
+    def __init__(self, cacheDirectory: Path, maxBytes: int):
+        """
+
+        Args:
+            cacheDirectory: Where the entries live;  Created when needed
+            maxBytes:       The total size of the entries is kept below this
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._lruDiskCache: LruDiskCache = LruDiskCache(cacheDirectory=cacheDirectory, suffix=THUMBNAIL_SUFFIX, maxBytes=maxBytes)
+
+    @property
+    def cacheDirectory(self) -> Path:
+        return self._lruDiskCache.cacheDirectory
+
+    def get(self, contentHash: str) -> Optional[bytes]:
+        """
+
+        Args:
+            contentHash:  The hash of the diagram sketch
+
+        Returns:  The encoded thumbnail or None if it is not cached
+        """
+        return self._lruDiskCache.read(key=contentHash)
+
+    def put(self, contentHash: str, contents: bytes):
+        """
+
+        Args:
+            contentHash:    The hash of the diagram sketch
+            contents:       The encoded thumbnail
+        """
+        self._lruDiskCache.write(key=contentHash, contents=contents)
+
+    def clear(self):
+        self._lruDiskCache.clear()
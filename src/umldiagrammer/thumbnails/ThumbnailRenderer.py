@@ -0,0 +1,226 @@
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from concurrent.futures import ThreadPoolExecutor
+
+from xml.etree.ElementTree import Element
+
+from wx import BITMAP_TYPE_PNG
+from wx import EVT_IDLE
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import IdleEvent
+from wx import Image
+from wx import MemoryDC
+from wx import NullBitmap
+from wx import Pen
+from wx import Point
+from wx import Window
+
+from wx import CallAfter as wxCallAfter
+
+from umlio.IOTypes import UmlDocumentTitle
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+
+from umldiagrammer.thumbnails.DiagramSketch import Box
+from umldiagrammer.thumbnails.DiagramSketch import DiagramSketch
+from umldiagrammer.thumbnails.ThumbnailCache import ThumbnailCache
+
+THUMBNAIL_WIDTH:  int = 64
+THUMBNAIL_HEIGHT: int = 48
+THUMBNAIL_MARGIN: int = 3
+
+SHAPE_COLOUR: Colour = Colour(160, 190, 220)
+LINE_COLOUR:  Colour = Colour(90, 90, 90)
+
+FragmentSource = Callable[[UmlDocumentTitle], Element]          # Returns None for a document that is gone
+ThumbnailSink  = Callable[[UmlDocumentTitle, Bitmap], None]
+
+#
+# Shared by every project;  The thumbnail cache is only used from this thread
+#
+_sketchExecutor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ThumbnailRenderer')
+
+
+class ThumbnailRenderer:
+    """
+    Renders small thumbnails of diagrams in the background, so selection and editing are
+    never held up.  While the application is idle, one diagram at a time is serialized on
+    the UI thread, since that reads its shapes.  A worker thread sketches the serialized
+    diagram, hashes the sketch and looks it up in the on disk cache.  Only the thumbnail
+    itself is drawn back on the UI thread, since it is a wx bitmap.  Thumbnails are cached by
+    the content hash of the diagram's geometry
+    """
+    def __init__(self, window: Window, fragmentSource: FragmentSource, thumbnailSink: ThumbnailSink, thumbnailCache: ThumbnailCache):
+        """
+
+        Args:
+            window:         Its idle events drive the rendering
+            fragmentSource: Serializes a diagram
+            thumbnailSink:  Receives each thumbnail
+            thumbnailCache: The on disk cache
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._window:         Window         = window
+        self._fragmentSource: FragmentSource = fragmentSource
+        self._thumbnailSink:  ThumbnailSink  = thumbnailSink
+        self._thumbnailCache: ThumbnailCache = thumbnailCache
+
+        self._pending:        Dict[UmlDocumentTitle, None] = {}     # In request order
+        self._renderedHashes: Dict[UmlDocumentTitle, str]  = {}     # Of the thumbnails sent
+        self._sketching:      bool                         = False  # Only one diagram at a time is on the worker
+
+        window.Bind(EVT_IDLE, self._onIdle)
+
+    def request(self, documentTitles: List[UmlDocumentTitle]):
+        """
+        Queue the documents for rendering;  A document whose geometry did not change since
+        its last thumbnail is not sent again
+
+        Args:
+            documentTitles:
+        """
+        for documentTitle in documentTitles:
+            self._pending[documentTitle] = None
+
+    def _onIdle(self, event: IdleEvent):
+
+        event.Skip(True)
+        if self._sketching is True or len(self._pending) == 0:
+            return
+
+        documentTitle: UmlDocumentTitle = next(iter(self._pending))
+        del self._pending[documentTitle]
+
+        with TimingSpan('thumbnail.fragment', document=documentTitle):
+            documentFragment: Element = self._fragmentSource(documentTitle)
+
+        if documentFragment is None:
+            self.logger.debug(f'{documentTitle} is gone;  No thumbnail')
+            if len(self._pending) > 0:
+                event.RequestMore(True)
+            return
+
+        self._sketching = True
+        _sketchExecutor.submit(self._sketchThumbnail,
+                               documentTitle=documentTitle,
+                               documentFragment=documentFragment,
+                               renderedHash=self._renderedHashes.get(documentTitle))
+
+    def _sketchThumbnail(self, documentTitle: UmlDocumentTitle, documentFragment: Element, renderedHash: Optional[str]):
+        """
+        Runs on the worker thread;  No wx calls except to hand the result back
+
+        Args:
+            documentTitle:      The diagram
+            documentFragment:   Its serialized shapes
+            renderedHash:       Of the thumbnail last sent for it, if any
+        """
+        sketch:      Optional[DiagramSketch] = None
+        contentHash: Optional[str]           = None
+        contents:    Optional[bytes]         = None
+        try:
+            with TimingSpan('thumbnail.sketch', document=documentTitle) as sketchSpan:
+                sketch      = DiagramSketch.fromDocumentFragment(documentFragment=documentFragment)
+                contentHash = sketch.contentHash
+                if contentHash == renderedHash:
+                    sketchSpan.set(unchanged=True)
+                    sketch = None
+                else:
+                    contents = self._thumbnailCache.get(contentHash=contentHash)
+                    sketchSpan.set(cached=contents is not None)
+        except Exception as e:
+            self.logger.error(f'Could not sketch {documentTitle}: {e}')
+            sketch = None
+        finally:
+            wxCallAfter(self._drawThumbnail, documentTitle=documentTitle, sketch=sketch, contentHash=contentHash, contents=contents)
+
+    def _drawThumbnail(self, documentTitle: UmlDocumentTitle, sketch: Optional[DiagramSketch], contentHash: Optional[str], contents: Optional[bytes]):
+        """
+        Back on the UI thread;  Draws or decodes the thumbnail.  A newly drawn one is
+        written to the cache on the worker thread
+
+        Args:
+            documentTitle:  The diagram
+            sketch:         None when the thumbnail is unchanged or could not be sketched
+            contentHash:    Of the sketch
+            contents:       The cached thumbnail, if any
+        """
+        self._sketching = False
+        if not self._window:                # The project was closed
+            return
+        if sketch is None or contentHash is None:
+            return
+
+        with TimingSpan('thumbnail.render', document=documentTitle) as renderSpan:
+            if contents is None:
+                bitmap: Bitmap = drawSketch(sketch=sketch)
+                _sketchExecutor.submit(self._thumbnailCache.put, contentHash=contentHash, contents=_encode(bitmap=bitmap))
+                renderSpan.set(cached=False)
+            else:
+                bitmap = _decode(contents=contents)
+                renderSpan.set(cached=True)
+
+        self._renderedHashes[documentTitle] = contentHash
+        self._thumbnailSink(documentTitle, bitmap)
+
+
+def drawSketch(sketch: DiagramSketch) -> Bitmap:
+    """
+    Scale the sketch to fit the thumbnail and keep its aspect ratio
+
+    Args:
+        sketch:
+
+    Returns:  The thumbnail
+    """
+    bitmap: Bitmap   = Bitmap(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+    dc:     MemoryDC = MemoryDC(bitmap)
+
+    dc.SetBackground(WHITE_BRUSH)
+    dc.Clear()
+
+    if sketch.empty is False:
+        extent: Box   = sketch.extent
+        left, top, width, height = extent
+        scale:  float = min((THUMBNAIL_WIDTH - 2 * THUMBNAIL_MARGIN) / max(width, 1), (THUMBNAIL_HEIGHT - 2 * THUMBNAIL_MARGIN) / max(height, 1))
+
+        def toPoint(x: int, y: int) -> Point:
+            return Point(THUMBNAIL_MARGIN + round((x - left) * scale), THUMBNAIL_MARGIN + round((y - top) * scale))
+
+        dc.SetPen(Pen(LINE_COLOUR))
+        for line in sketch.lines:
+            dc.DrawLines([toPoint(x, y) for x, y in line])
+
+        dc.SetBrush(Brush(SHAPE_COLOUR))
+        for x, y, boxWidth, boxHeight in sketch.boxes:
+            dc.DrawRectangle(toPoint(x, y), (max(1, round(boxWidth * scale)), max(1, round(boxHeight * scale))))
+
+    dc.SelectObject(NullBitmap)
+
+    return bitmap
+
+
+def _encode(bitmap: Bitmap) -> bytes:
+
+    stream: BytesIO = BytesIO()
+    bitmap.ConvertToImage().SaveFile(stream, BITMAP_TYPE_PNG)
+
+    return stream.getvalue()
+
+
+def _decode(contents: bytes) -> Bitmap:
+    return Bitmap(Image(BytesIO(contents), BITMAP_TYPE_PNG))
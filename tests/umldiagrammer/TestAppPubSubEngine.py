@@ -0,0 +1,59 @@
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.pubsubengine.IAppPubSubEngine import UniqueId
+from umldiagrammer.pubsubengine.MessageType import MessageType
+from umldiagrammer.pubsubengine.AppPubSubEngine import AppPubSubEngine
+
+EVICTED_ID: UniqueId = UniqueId('evictedFrame')
+RESIDENT_ID: UniqueId = UniqueId('residentFrame')
+
+
+class TestAppPubSubEngine(UnitTestBase):
+    """
+    Deleting a unique ID's topics drops only that ID's listeners
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._appPubSubEngine: AppPubSubEngine = AppPubSubEngine()
+        self._received:        List[UniqueId]  = []
+
+    def testDeleteTopics(self):
+
+        self._appPubSubEngine.subscribe(MessageType.PASTE_SHAPES, uniqueId=EVICTED_ID,  listener=self._evictedListener)
+        self._appPubSubEngine.subscribe(MessageType.PASTE_SHAPES, uniqueId=RESIDENT_ID, listener=self._residentListener)
+
+        self._appPubSubEngine.deleteTopics(uniqueId=EVICTED_ID)
+
+        self._appPubSubEngine.sendMessage(MessageType.PASTE_SHAPES, uniqueId=EVICTED_ID)
+        self._appPubSubEngine.sendMessage(MessageType.PASTE_SHAPES, uniqueId=RESIDENT_ID)
+
+        self.assertEqual([RESIDENT_ID], self._received, 'Only the resident listener should remain')
+
+    def testDeleteUnknownTopics(self):
+        self._appPubSubEngine.deleteTopics(uniqueId=UniqueId('neverSubscribed'))
+
+    def _evictedListener(self):
+        self._received.append(EVICTED_ID)
+
+    def _residentListener(self):
+        self._received.append(RESIDENT_ID)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAppPubSubEngine))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
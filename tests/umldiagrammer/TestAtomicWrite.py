@@ -0,0 +1,99 @@
+from typing import List
+
+from os import umask
+
+from pathlib import Path
+
+from stat import S_IMODE
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import skipIf
+from unittest import main as unitTestMain
+
+from sys import platform
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.AtomicWrite import atomicWrite
+from umldiagrammer.projectio.AtomicWrite import TEMPORARY_SUFFIX
+
+IS_WINDOWS: bool = platform == 'win32'
+
+
+class TestAtomicWrite(UnitTestBase):
+    """
+    A save replaces the content and nothing else about the file
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directory:          Path               = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testReplacesContent(self):
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(b'old')
+
+        atomicWrite(fileName=projectFile, contents=b'new')
+
+        self.assertEqual(b'new', projectFile.read_bytes(), 'Should be replaced')
+
+        leftovers: List[Path] = list(self._directory.glob(f'*{TEMPORARY_SUFFIX}'))
+        self.assertEqual([], leftovers, 'No temporary files should be left behind')
+
+    @skipIf(IS_WINDOWS, 'POSIX permissions')
+    def testKeepsPermissions(self):
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(b'old')
+        projectFile.chmod(0o644)
+
+        atomicWrite(fileName=projectFile, contents=b'new')
+
+        self.assertEqual(0o644, S_IMODE(projectFile.stat().st_mode), 'The permissions should not change')
+
+    @skipIf(IS_WINDOWS, 'POSIX permissions')
+    def testNewFileHonorsUmask(self):
+
+        previousMask: int = umask(0o022)
+        try:
+            projectFile: Path = self._directory / 'Ozzee.udt'
+            atomicWrite(fileName=projectFile, contents=b'new')
+        finally:
+            umask(previousMask)
+
+        self.assertEqual(0o644, S_IMODE(projectFile.stat().st_mode), 'A new file gets the usual permissions')
+
+    @skipIf(IS_WINDOWS, 'Symbolic links need privileges')
+    def testWritesThroughSymbolicLink(self):
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(b'old')
+        linkFile: Path = self._directory / 'Link.udt'
+        linkFile.symlink_to(projectFile)
+
+        atomicWrite(fileName=linkFile, contents=b'new')
+
+        self.assertTrue(linkFile.is_symlink(), 'The link should stay a link')
+        self.assertEqual(b'new', projectFile.read_bytes(), 'The link target should be written')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAtomicWrite))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,95 @@
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.AttributeShadow import AttributeShadow
+
+
+class Frame:
+    """
+    Stands in for a diagram frame
+    """
+    def __init__(self):
+        self.calls: List[str] = []
+
+    def refresh(self):
+        self.calls.append('frame')
+
+
+class TestAttributeShadow(UnitTestBase):
+    """
+    A bulk insertion shadows a refresh that a damage tracker may already shadow
+    """
+    def testShadowThenRestore(self):
+
+        frame:         Frame           = Frame()
+        refreshShadow: AttributeShadow = AttributeShadow(owner=frame, name='refresh')
+
+        refreshShadow.shadow(replacement=lambda: frame.calls.append('deferred'))
+        frame.refresh()
+        refreshShadow.restore()
+        frame.refresh()
+
+        self.assertEqual(['deferred', 'frame'], frame.calls, 'The class method answers again')
+        self.assertNotIn('refresh', frame.__dict__, 'No instance attribute left behind')
+
+    def testNestedShadowRestored(self):
+
+        frame: Frame = Frame()
+        #
+        # The damage tracker's shadow lives as long as the frame
+        #
+        frame.refresh = lambda: frame.calls.append('damage')     # type: ignore
+
+        refreshShadow: AttributeShadow = AttributeShadow(owner=frame, name='refresh')
+
+        refreshShadow.shadow(replacement=lambda: frame.calls.append('deferred'))
+        frame.refresh()
+        refreshShadow.restore()
+        frame.refresh()
+
+        self.assertEqual(['deferred', 'damage'], frame.calls, 'The earlier shadow should answer again')
+
+    def testShadowsNest(self):
+
+        frame:       Frame           = Frame()
+        outerShadow: AttributeShadow = AttributeShadow(owner=frame, name='refresh')
+        innerShadow: AttributeShadow = AttributeShadow(owner=frame, name='refresh')
+
+        outerShadow.shadow(replacement=lambda: frame.calls.append('outer'))
+        innerShadow.shadow(replacement=lambda: frame.calls.append('inner'))
+        frame.refresh()
+        innerShadow.restore()
+        frame.refresh()
+        outerShadow.restore()
+        frame.refresh()
+
+        self.assertEqual(['inner', 'outer', 'frame'], frame.calls, 'Each restore uncovers the previous shadow')
+
+    def testRestoreWithoutShadow(self):
+
+        frame:         Frame           = Frame()
+        refreshShadow: AttributeShadow = AttributeShadow(owner=frame, name='refresh')
+
+        refreshShadow.restore()
+        frame.refresh()
+
+        self.assertFalse(refreshShadow.shadowed, 'Never shadowed')
+        self.assertEqual(['frame'], frame.calls, 'Nothing to restore')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAttributeShadow))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,116 @@
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from zlib import decompress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.AutoSaveJournal import JournalEntries
+from umldiagrammer.projectio.AutoSaveJournal import AutoSaveJournal
+
+PROJECT_PATH:   Path = Path('/Users/ozzee/UmlDiagramProjects/Ozzee.udt')
+OTHER_PATH:     Path = Path('/Users/ozzee/Other/Ozzee.udt')
+RAW_XML:        str  = '<UmlProject fileName="Ozzee.udt" version="14.0" codePath=""/>'
+
+
+class TestAutoSaveJournal(UnitTestBase):
+    """
+    Writes to a temporary recovery directory
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._recoveryDirectory:  Path               = Path(self._temporaryDirectory.name) / 'recovery'
+
+        self._journal: AutoSaveJournal = AutoSaveJournal(recoveryDirectory=self._recoveryDirectory)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testNoRecoveryDirectory(self):
+
+        journalEntries: JournalEntries = self._journal.entries()
+
+        self.assertEqual(0, len(journalEntries), 'Nothing to recover')
+
+    def testWriteThenRecover(self):
+
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML)
+
+        journalEntries: JournalEntries = self._journal.entries()
+
+        self.assertEqual(1, len(journalEntries), 'Should have one snapshot')
+        self.assertEqual(PROJECT_PATH, journalEntries[0].projectPath, 'Should remember the real project')
+        self.assertEqual(RAW_XML, decompress(journalEntries[0].journalFile.read_bytes()).decode(), 'Snapshot should round trip')
+
+    def testRewriteReplaces(self):
+
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML)
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML)
+
+        self.assertEqual(1, len(self._journal.entries()), 'Should replace, not accumulate')
+        self.assertEqual(2, len(list(self._recoveryDirectory.iterdir())), 'No temporary files left behind')
+
+    def testSameNameDifferentDirectories(self):
+
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML)
+        self._journal.write(projectPath=OTHER_PATH,   rawXml=RAW_XML)
+
+        self.assertEqual(2, len(self._journal.entries()), 'Projects with the same name should not collide')
+
+    def testDiscard(self):
+
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML)
+        self._journal.discard(projectPath=PROJECT_PATH)
+
+        self.assertEqual(0, len(self._journal.entries()), 'Discarded snapshot should be gone')
+
+    def testInstancesDoNotCollide(self):
+
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML, instance='first')
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML, instance='second')
+
+        self.assertEqual(2, len(self._journal.entries()), 'Projects with the same path should not collide')
+
+        self._journal.discard(projectPath=PROJECT_PATH, instance='first')
+
+        journalEntries: JournalEntries = self._journal.entries()
+        self.assertEqual(1, len(journalEntries), 'Only the discarded instance should be gone')
+        self.assertEqual(PROJECT_PATH, journalEntries[0].projectPath, 'Should still remember the real project')
+
+    def testDiscardRecoveredSnapshot(self):
+
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML)
+
+        journalEntries: JournalEntries = self._journal.entries()
+        self._journal.discardSnapshot(journalFile=journalEntries[0].journalFile)
+
+        self.assertEqual(0, len(list(self._recoveryDirectory.iterdir())), 'Snapshot and manifest should be gone')
+
+    def testIgnoresCorruptManifest(self):
+
+        self._journal.write(projectPath=PROJECT_PATH, rawXml=RAW_XML)
+        (self._recoveryDirectory / 'Broken-123.json').write_text('{not json')
+
+        self.assertEqual(1, len(self._journal.entries()), 'Corrupt manifests should be skipped')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestAutoSaveJournal))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,128 @@
+
+from typing import List
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from zlib import decompress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.batch.BatchOperations import BatchResult
+from umldiagrammer.batch.BatchOperations import resaveProject
+from umldiagrammer.batch.BatchOperations import convertProject
+from umldiagrammer.batch.BatchOperations import validateProject
+from umldiagrammer.batch.BatchOperations import collectProjectFiles
+
+from umldiagrammer.batch.UmlDiagrammerBatch import main as batchMain
+
+from umldiagrammer.projectio.ProjectFileTypes import CURRENT_XML_VERSION
+from umldiagrammer.projectio.ProjectFileTypes import CHUNKED_PROJECT_SUFFIX
+
+RAW_XML: str = (
+    "<?xml version='1.0' encoding='iso-8859-1'?>\n"
+    '<UmlProject fileName="Ozzee.xml" version="12.0" codePath="">\n'
+    '    <UMLDiagram documentType="CLASS_DOCUMENT" title="Class Diagram">\n'
+    '        <UmlClass id="1" width="100" height="50" />\n'
+    '    </UMLDiagram>\n'
+    '    <UMLDiagram documentType="USE_CASE_DOCUMENT" title="Use Cases" />\n'
+    '</UmlProject>\n'
+)
+
+
+class TestBatchOperations(UnitTestBase):
+    """
+    The batch operations never build shapes;  So they run without a UI
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directory:          Path               = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testCollectProjectFiles(self):
+
+        subDirectory: Path = self._directory / 'sub'
+        subDirectory.mkdir()
+
+        (self._directory / 'Ozzee.xml').write_text(RAW_XML)
+        (self._directory / 'Notes.txt').write_text('Not a project')
+        (subDirectory / 'Fran.xml').write_text(RAW_XML)
+
+        self.assertEqual([self._directory / 'Ozzee.xml'], collectProjectFiles(paths=[self._directory]), 'Should only find projects')
+        self.assertEqual(2, len(collectProjectFiles(paths=[self._directory], recursive=True)), 'Should find nested projects')
+
+    def testConvertAndValidate(self):
+
+        xmlFile: Path = self._directory / 'Ozzee.xml'
+        xmlFile.write_text(RAW_XML)
+
+        convertResult: BatchResult = convertProject(fileName=xmlFile, destinationSuffix=CHUNKED_PROJECT_SUFFIX)
+
+        self.assertTrue(convertResult.succeeded, convertResult.message)
+        self.assertEqual(2, convertResult.diagramCount, 'Incorrect diagram count')
+
+        validateResult: BatchResult = validateProject(fileName=xmlFile.with_suffix(CHUNKED_PROJECT_SUFFIX))
+
+        self.assertTrue(validateResult.succeeded, validateResult.message)
+        self.assertEqual(2, validateResult.diagramCount, 'Conversion lost diagrams')
+
+    def testBadFile(self):
+
+        badFile: Path = self._directory / 'Bad.udt'
+        badFile.write_bytes(b'Not compressed')
+
+        validateResult: BatchResult = validateProject(fileName=badFile)
+
+        self.assertFalse(validateResult.succeeded, 'Should not validate')
+        self.assertNotEqual('', validateResult.message, 'Should say why')
+
+    def testResave(self):
+
+        xmlFile: Path = self._directory / 'Ozzee.xml'
+        xmlFile.write_text(RAW_XML)
+
+        self.assertTrue(resaveProject(fileName=xmlFile).succeeded, 'Re-save failed')
+
+        projectFile: Path = xmlFile.with_suffix('.udt')
+        rawXml:      str  = decompress(projectFile.read_bytes()).decode('iso-8859-1')
+
+        self.assertIn(f'version="{CURRENT_XML_VERSION}"', rawXml, 'Should be in the current format')
+
+        self.assertEqual('already current', resaveProject(fileName=projectFile).message, 'Nothing should have changed')
+
+    def testMain(self):
+
+        for name in ('Ozzee', 'Fran', 'Opie'):
+            (self._directory / f'{name}.xml').write_text(RAW_XML)
+
+        self.assertEqual(0, batchMain(['convert', str(self._directory), '--processes', '1']), 'All should convert')
+
+        projectFiles: List[Path] = sorted(self._directory.glob('*.udt'))
+        self.assertEqual(3, len(projectFiles), 'Missing converted files')
+
+        (self._directory / 'Bad.xml').write_text('<UmlProject')
+
+        self.assertEqual(1, batchMain(['validate', str(self._directory), '--processes', '1']), 'Bad file should fail the batch')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBatchOperations))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,173 @@
+
+from typing import List
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from zlib import compress
+from zlib import decompress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import SubElement
+from xml.etree.ElementTree import indent as xmlIndent
+from xml.etree.ElementTree import tostring as xmlToString
+from xml.etree.ElementTree import fromstring as xmlFromString
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.ProjectParser import ParsedProject
+from umldiagrammer.projectio.ProjectParser import parseProjectFile
+
+from umldiagrammer.projectio.ChunkedProjectContainer import ChunkedProjectReader
+from umldiagrammer.projectio.ChunkedProjectContainer import ChunkedProjectWriter
+from umldiagrammer.projectio.ChunkedProjectContainer import convertProjectFile
+
+PROJECT_ATTRIBUTES: dict = {'fileName': 'Ozzee.udtc', 'version': '14.0', 'codePath': ''}
+
+DIAGRAM_TITLES: List[str] = ['Class Diagram', 'Use Cases', 'Sequence']
+
+CLASSES_PER_DOCUMENT: int = 200
+
+
+class TestChunkedProjectContainer(UnitTestBase):
+    """
+    Any document can be read on its own, and an update only writes the documents that changed
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directory:          Path               = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testReadAnyDocument(self):
+
+        chunkedFile: Path = self._directory / 'Ozzee.udtc'
+
+        ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=self._documentElements())
+
+        chunkedProjectReader: ChunkedProjectReader = ChunkedProjectReader(fileName=chunkedFile)
+
+        self.assertEqual(PROJECT_ATTRIBUTES, chunkedProjectReader.projectAttributes, 'Incorrect project attributes')
+        self.assertEqual(DIAGRAM_TITLES, [chunkEntry.attributes['title'] for chunkEntry in chunkedProjectReader.chunkEntries], 'Incorrect index')
+
+        lastDocument: Element = chunkedProjectReader.readDocument(chunkEntry=chunkedProjectReader.chunkEntries[-1])
+
+        self.assertEqual('Sequence', lastDocument.get('title'), 'Read the wrong document')
+        self.assertEqual('return "<Sequence> & perro"', lastDocument.find('UmlClass/Code').text, 'Document content not preserved')
+
+    def testUpdateWritesOnlyChangedDocuments(self):
+
+        chunkedFile:      Path          = self._directory / 'Ozzee.udtc'
+        documentElements: List[Element] = self._documentElements()
+
+        self.assertEqual(3, ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=documentElements))
+        originalSize: int = chunkedFile.stat().st_size
+
+        documentElements[1].find('UmlClass').set('x', '42')
+
+        self.assertEqual(1, ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=documentElements))
+        self.assertGreater(chunkedFile.stat().st_size, originalSize, 'The update should have been appended')
+
+        chunkedProjectReader: ChunkedProjectReader = ChunkedProjectReader(fileName=chunkedFile)
+        updatedDocument:      Element              = chunkedProjectReader.readDocument(chunkEntry=chunkedProjectReader.chunkEntries[1])
+
+        self.assertEqual('42', updatedDocument.find('UmlClass').get('x'), 'Update not read back')
+
+    def testInterruptedUpdate(self):
+        """
+        The previous table of contents is still in the file
+        """
+        chunkedFile:      Path          = self._directory / 'Ozzee.udtc'
+        documentElements: List[Element] = self._documentElements()
+
+        ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=documentElements)
+        originalSize: int = chunkedFile.stat().st_size
+
+        documentElements[0].find('UmlClass').set('x', '42')
+        ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=documentElements)
+
+        with open(chunkedFile, 'r+b') as containerFile:
+            containerFile.truncate(chunkedFile.stat().st_size - 5)
+
+        chunkedProjectReader: ChunkedProjectReader = ChunkedProjectReader(fileName=chunkedFile)
+        recoveredDocument:    Element              = chunkedProjectReader.readDocument(chunkEntry=chunkedProjectReader.chunkEntries[0])
+
+        self.assertEqual('1', recoveredDocument.find('UmlClass').get('x'), 'Should have the previous contents')
+        self.assertLess(originalSize, chunkedFile.stat().st_size, 'Test did not truncate the update')
+
+    def testConvertRoundTrip(self):
+
+        projectElement: Element = Element('UmlProject', attrib=PROJECT_ATTRIBUTES)
+        projectElement.extend(self._documentElements())
+
+        originalXml: bytes = self._toPrettyBytes(projectElement)
+
+        projectFile:   Path = self._directory / 'Ozzee.udt'
+        chunkedFile:   Path = self._directory / 'Ozzee.udtc'
+        convertedFile: Path = self._directory / 'Converted.udt'
+
+        projectFile.write_bytes(compress(originalXml))
+
+        convertProjectFile(sourceFileName=projectFile, destinationFileName=chunkedFile)
+        convertProjectFile(sourceFileName=chunkedFile, destinationFileName=convertedFile)
+
+        self.assertEqual(originalXml, decompress(convertedFile.read_bytes()), 'Conversion should not change the project')
+
+    def testParseChunkedProject(self):
+
+        chunkedFile: Path = self._directory / 'Ozzee.udtc'
+
+        ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=self._documentElements())
+
+        parsedProject: ParsedProject = parseProjectFile(fileName=chunkedFile)
+
+        titles: List[str] = [diagram['title'] for diagram in parsedProject.root.UmlProject.get_elements('UMLDiagram')]
+
+        self.assertEqual(DIAGRAM_TITLES, titles, 'Incorrect diagrams')
+
+    def _documentElements(self) -> List[Element]:
+
+        documentElements: List[Element] = []
+        for title in DIAGRAM_TITLES:
+            diagramElement: Element = Element('UMLDiagram', attrib={'documentType': 'Class Document', 'title': title})
+            classElement:   Element = SubElement(diagramElement, 'UmlClass', attrib={'id': title, 'x': '1', 'y': '2'})
+            codeElement:    Element = SubElement(classElement, 'Code')
+            codeElement.text = f'return "<{title}> & perro"'
+            #
+            # Documents are much larger than the table of contents;  Otherwise every update compacts
+            #
+            for classId in range(CLASSES_PER_DOCUMENT):
+                SubElement(diagramElement, 'UmlClass', attrib={'id': f'{title}{classId}', 'x': str(classId * 7), 'y': str(classId * 13)})
+
+            documentElements.append(diagramElement)
+
+        return documentElements
+
+    def _toPrettyBytes(self, projectElement: Element) -> bytes:
+
+        elementCopy: Element = xmlFromString(xmlToString(projectElement))
+        xmlIndent(elementCopy, space='    ', level=0)
+
+        return xmlToString(elementCopy, encoding='iso-8859-1', xml_declaration=True)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestChunkedProjectContainer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
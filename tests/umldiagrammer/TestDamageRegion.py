@@ -0,0 +1,89 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.DamageRegion import DamageRegion
+from umldiagrammer.SpatialIndex import Bounds
+
+
+class TestDamageRegion(UnitTestBase):
+    """
+    The rectangles stand in for the old and new bounds of dragged shapes
+    """
+    def testEmpty(self):
+
+        damageRegion: DamageRegion = DamageRegion()
+
+        self.assertTrue(damageRegion.empty, 'Nothing damaged yet')
+        self.assertEqual(0, damageRegion.area, 'No area')
+        self.assertIsNone(damageRegion.extent, 'No extent')
+
+    def testSeparateRectanglesKept(self):
+
+        damageRegion: DamageRegion = DamageRegion()
+
+        damageRegion.add(Bounds(left=0,   top=0,   right=10,  bottom=10))
+        damageRegion.add(Bounds(left=100, top=100, right=110, bottom=110))
+
+        self.assertEqual(2, len(damageRegion.rectangles), 'Far apart;  Not merged')
+        self.assertEqual(200, damageRegion.area, 'Only the damaged area')
+        self.assertEqual(Bounds(left=0, top=0, right=110, bottom=110), damageRegion.extent, 'Bounds both')
+
+    def testOverlappingMerged(self):
+
+        damageRegion: DamageRegion = DamageRegion()
+
+        damageRegion.add(Bounds(left=0,  top=0, right=10, bottom=10))
+        damageRegion.add(Bounds(left=50, top=0, right=60, bottom=10))
+        damageRegion.add(Bounds(left=5,  top=5, right=55, bottom=8))
+
+        self.assertEqual([Bounds(left=0, top=0, right=60, bottom=10)], damageRegion.rectangles, 'The last one bridges the first two')
+
+    def testRectangleCountBounded(self):
+
+        damageRegion: DamageRegion = DamageRegion(maxRectangles=3)
+
+        for i in range(10):
+            damageRegion.add(Bounds(left=i * 100, top=0, right=i * 100 + 10, bottom=10))
+
+        rectangles = damageRegion.rectangles
+        self.assertLessEqual(len(rectangles), 3, 'Too many rectangles')
+        for i in range(10):
+            self.assertTrue(any(rectangle.contains(x=i * 100 + 5, y=5) for rectangle in rectangles), f'Damage {i} was lost')
+
+        for i, first in enumerate(rectangles):
+            for second in rectangles[i + 1:]:
+                self.assertFalse(first.intersects(second), 'Rectangles should not overlap')
+
+    def testClear(self):
+
+        damageRegion: DamageRegion = DamageRegion()
+
+        damageRegion.add(Bounds(left=0, top=0, right=10, bottom=10))
+        damageRegion.clear()
+
+        self.assertTrue(damageRegion.empty, 'Should be cleared')
+
+    def testBoundsArithmetic(self):
+
+        bounds: Bounds = Bounds(left=10, top=20, right=30, bottom=60)
+
+        self.assertEqual(800, bounds.area, 'Width times height')
+        self.assertEqual(Bounds(left=5, top=15, right=35, bottom=65), bounds.inflate(margin=5), 'Grows on every side')
+        self.assertEqual(Bounds(left=0, top=20, right=30, bottom=70), bounds.union(Bounds(left=0, top=50, right=5, bottom=70)), 'Covers both')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDamageRegion))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,65 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.DetailLevel import DetailLevel
+from umldiagrammer.DetailLevel import DetailThresholds
+from umldiagrammer.DetailLevel import shapeDetailLevel
+from umldiagrammer.DetailLevel import textDetailLevel
+
+FONT_SIZE: int = 14
+
+
+class TestDetailLevel(UnitTestBase):
+    """
+    A class shape is about 150 by 100 on the diagram
+    """
+    def setUp(self):
+        super().setUp()
+        self._detailThresholds: DetailThresholds = DetailThresholds(readableTextHeight=6, minimumShapeSize=16)
+
+    def testNaturalSizeIsFull(self):
+
+        detailLevel: DetailLevel = shapeDetailLevel(width=150, height=100, fontSize=FONT_SIZE, scale=1.0, detailThresholds=self._detailThresholds)
+
+        self.assertEqual(DetailLevel.FULL, detailLevel, 'Everything can be read')
+
+    def testZoomedOutIsOutline(self):
+
+        detailLevel: DetailLevel = shapeDetailLevel(width=150, height=100, fontSize=FONT_SIZE, scale=0.25, detailThresholds=self._detailThresholds)
+
+        self.assertEqual(DetailLevel.OUTLINE, detailLevel, '3.5 pixel text cannot be read')
+
+    def testTinyShapeIsOutline(self):
+
+        detailLevel: DetailLevel = shapeDetailLevel(width=150, height=10, fontSize=FONT_SIZE, scale=1.0, detailThresholds=self._detailThresholds)
+
+        self.assertEqual(DetailLevel.OUTLINE, detailLevel, 'Too thin to hold any text')
+
+    def testText(self):
+
+        self.assertEqual(DetailLevel.FULL,    textDetailLevel(fontSize=FONT_SIZE, scale=0.5, detailThresholds=self._detailThresholds), '7 pixels is readable')
+        self.assertEqual(DetailLevel.OUTLINE, textDetailLevel(fontSize=FONT_SIZE, scale=0.4, detailThresholds=self._detailThresholds), '5.6 pixels is not')
+
+    def testThresholdsOff(self):
+
+        detailThresholds: DetailThresholds = DetailThresholds(readableTextHeight=0, minimumShapeSize=0)
+        detailLevel:      DetailLevel      = shapeDetailLevel(width=150, height=10, fontSize=FONT_SIZE, scale=0.01, detailThresholds=detailThresholds)
+
+        self.assertEqual(DetailLevel.FULL, detailLevel, 'Always full detail')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDetailLevel))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
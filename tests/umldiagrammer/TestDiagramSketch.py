@@ -0,0 +1,77 @@
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import fromstring
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.thumbnails.DiagramSketch import DiagramSketch
+
+DIAGRAM_XML: str = (
+    '<UMLDiagram documentType="Class Document" title="Class Diagram">'
+    '<UmlClass id="1" x="100" y="50" width="150" height="75"><ModelClass name="Ozzee"/></UmlClass>'
+    '<UmlNote id="2" x="400" y="300" width="100" height="50"/>'
+    '<UmlLink fromX="175" fromY="125" toX="450" toY="300">'
+    '<LineControlPoint x="175" y="200"/>'
+    '</UmlLink>'
+    '</UMLDiagram>'
+)
+
+
+class TestDiagramSketch(UnitTestBase):
+    """
+    The sketches are made from hand written diagram fragments
+    """
+    def testShapesAndLinks(self):
+
+        sketch: DiagramSketch = self._sketch(DIAGRAM_XML)
+
+        self.assertEqual([(100, 50, 150, 75), (400, 300, 100, 50)], sketch.boxes, 'Each shape is a box')
+        self.assertEqual([[(175, 125), (175, 200), (450, 300)]], sketch.lines, 'A link runs through its control points')
+
+    def testExtent(self):
+
+        sketch: DiagramSketch = self._sketch(DIAGRAM_XML)
+
+        self.assertEqual((100, 50, 400, 300), sketch.extent, 'Should bound every box and line')
+
+    def testEmpty(self):
+
+        sketch: DiagramSketch = self._sketch('<UMLDiagram documentType="Class Document" title="Empty"/>')
+
+        self.assertTrue(sketch.empty, 'Nothing on the diagram')
+        self.assertEqual((0, 0, 0, 0), sketch.extent, 'An empty sketch has no extent')
+
+    def testHashIgnoresText(self):
+
+        renamed: str = DIAGRAM_XML.replace('Ozzee', 'Fran').replace('Class Diagram', 'Renamed')
+
+        self.assertEqual(self._sketch(DIAGRAM_XML).contentHash, self._sketch(renamed).contentHash, 'Only the geometry counts')
+
+    def testHashChangesWhenMoved(self):
+
+        moved: str = DIAGRAM_XML.replace('x="400"', 'x="410"')
+
+        self.assertNotEqual(self._sketch(DIAGRAM_XML).contentHash, self._sketch(moved).contentHash, 'Moving a shape changes the thumbnail')
+
+    def _sketch(self, rawXml: str) -> DiagramSketch:
+
+        documentFragment: Element = fromstring(rawXml)
+
+        return DiagramSketch.fromDocumentFragment(documentFragment=documentFragment)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDiagramSketch))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
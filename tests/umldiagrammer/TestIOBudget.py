@@ -0,0 +1,83 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.IOBudget import IOBudget
+
+BYTES_PER_SECOND: int = 1000
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIOBudget(UnitTestBase):
+    """
+    Uses a fake clock and records the sleeps instead of sleeping
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._clock:  FakeClock   = FakeClock()
+        self._sleeps: List[float] = []
+
+        self._ioBudget: IOBudget = IOBudget(bytesPerSecond=BYTES_PER_SECOND, clock=self._clock, sleeper=self._sleeps.append)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testWithinBudgetDoesNotWait(self):
+
+        self._ioBudget.throttle(byteCount=BYTES_PER_SECOND // 2)
+
+        self.assertEqual([], self._sleeps, 'Half the bucket should not wait')
+
+    def testOverBudgetWaits(self):
+
+        self._ioBudget.throttle(byteCount=BYTES_PER_SECOND)
+        self._ioBudget.throttle(byteCount=BYTES_PER_SECOND // 2)
+
+        self.assertEqual([0.5], self._sleeps, 'Empty bucket should wait for the refill')
+
+    def testLargeWritePaysItsDebt(self):
+
+        delay: float = self._ioBudget.reserve(byteCount=BYTES_PER_SECOND * 3)
+
+        self.assertAlmostEqual(2.0, delay, msg='Writes larger than the bucket pay the difference')
+
+    def testBudgetRefills(self):
+
+        self._ioBudget.throttle(byteCount=BYTES_PER_SECOND)
+        self._clock.now = 1.0
+        self._ioBudget.throttle(byteCount=BYTES_PER_SECOND)
+
+        self.assertEqual([], self._sleeps, 'A full second should refill the bucket')
+
+    def testBucketDoesNotOverfill(self):
+
+        self._clock.now = 10.0
+        delay: float = self._ioBudget.reserve(byteCount=BYTES_PER_SECOND * 2)
+
+        self.assertAlmostEqual(1.0, delay, msg='Idle time should not accumulate more than one second of budget')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIOBudget))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
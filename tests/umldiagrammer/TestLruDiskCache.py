@@ -0,0 +1,95 @@
+from os import utime
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.LruDiskCache import LruDiskCache
+
+ENTRY_SUFFIX: str   = '.entry'
+ENTRY_BYTES:  bytes = bytes(100)
+
+
+class TestLruDiskCache(UnitTestBase):
+    """
+    The cache lives in a temporary directory
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._cacheDirectory:     Path               = Path(self._temporaryDirectory.name) / 'cache'
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testRunningTotal(self):
+
+        lruDiskCache: LruDiskCache = LruDiskCache(cacheDirectory=self._cacheDirectory, suffix=ENTRY_SUFFIX, maxBytes=1024)
+
+        lruDiskCache.write(key='ozzee', contents=ENTRY_BYTES)
+        lruDiskCache.write(key='fran',  contents=ENTRY_BYTES)
+        lruDiskCache.write(key='ozzee', contents=ENTRY_BYTES[:40])
+        self.assertEqual(140, lruDiskCache.totalBytes, 'A rewritten entry replaces its size')
+
+        lruDiskCache.discard(key='fran')
+        self.assertEqual(40, lruDiskCache.totalBytes, 'A discarded entry no longer counts')
+
+    def testExistingEntriesScannedInUseOrder(self):
+
+        self._cacheDirectory.mkdir(parents=True)
+        for seconds, key in enumerate(('fran', 'ozzee', 'opie'), start=1):
+            entryFile: Path = self._cacheDirectory / f'{key}{ENTRY_SUFFIX}'
+            entryFile.write_bytes(ENTRY_BYTES)
+            utime(entryFile, ns=(seconds * 1_000_000_000, seconds * 1_000_000_000))
+
+        lruDiskCache: LruDiskCache = LruDiskCache(cacheDirectory=self._cacheDirectory, suffix=ENTRY_SUFFIX, maxBytes=3 * len(ENTRY_BYTES))
+
+        self.assertEqual(3 * len(ENTRY_BYTES), lruDiskCache.totalBytes, 'Existing entries count')
+
+        lruDiskCache.write(key='gato', contents=ENTRY_BYTES)
+
+        self.assertIsNone(lruDiskCache.read(key='fran'),     'The oldest existing entry is evicted')
+        self.assertIsNotNone(lruDiskCache.read(key='ozzee'), 'Newer entries are kept')
+
+    def testCachesShareTheirDirectory(self):
+
+        firstCache:  LruDiskCache = LruDiskCache(cacheDirectory=self._cacheDirectory, suffix=ENTRY_SUFFIX, maxBytes=2 * len(ENTRY_BYTES))
+        secondCache: LruDiskCache = LruDiskCache(cacheDirectory=self._cacheDirectory, suffix=ENTRY_SUFFIX, maxBytes=2 * len(ENTRY_BYTES))
+
+        firstCache.write(key='ozzee', contents=ENTRY_BYTES)
+        secondCache.write(key='fran', contents=ENTRY_BYTES)
+        secondCache.write(key='opie', contents=ENTRY_BYTES)
+
+        self.assertIsNone(firstCache.read(key='ozzee'), 'The other cache evicted it')
+        self.assertEqual(2 * len(ENTRY_BYTES), firstCache.totalBytes, 'Both caches see one total')
+
+    def testClear(self):
+
+        lruDiskCache: LruDiskCache = LruDiskCache(cacheDirectory=self._cacheDirectory, suffix=ENTRY_SUFFIX, maxBytes=1024)
+
+        lruDiskCache.write(key='ozzee', contents=ENTRY_BYTES)
+        lruDiskCache.clear()
+
+        self.assertIsNone(lruDiskCache.read(key='ozzee'), 'Should be gone')
+        self.assertEqual(0, lruDiskCache.totalBytes, 'Nothing left to count')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestLruDiskCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,98 @@
+
+from typing import Any
+from typing import Dict
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.performance.PaintStatistics import PaintStatistics
+
+
+class TestPaintStatistics(UnitTestBase):
+    """
+    Times are given explicitly;  The window is 5 seconds
+    """
+    def testNoPaints(self):
+
+        paintStatistics: PaintStatistics = PaintStatistics()
+        summary:         Dict[str, Any]  = paintStatistics.summary(at=100.0)
+
+        self.assertEqual(0, summary['paints'], 'Nothing painted')
+        self.assertEqual(0, summary['paintsPerSecond'], 'No rate')
+        self.assertNotIn('lastPaintMs', summary, 'No paint to report')
+        self.assertIsNone(paintStatistics.lastPaint, 'No last paint')
+
+    def testCountsGoToTheNextPaint(self):
+
+        paintStatistics: PaintStatistics = PaintStatistics()
+
+        paintStatistics.countDrawn(shapes=3)
+        paintStatistics.countDrawn(links=2)
+        paintStatistics.countDrawn(shapes=1)
+        paintStatistics.recordPaint(seconds=0.010, mode='full', at=100.0)
+
+        summary: Dict[str, Any] = paintStatistics.summary(at=100.0)
+        self.assertEqual(4, summary['shapesDrawn'], 'Shapes of the paint')
+        self.assertEqual(2, summary['linksDrawn'], 'Links of the paint')
+        self.assertEqual('full', summary['lastPaintMode'], 'How it painted')
+        self.assertEqual(10.0, summary['lastPaintMs'], 'In milliseconds')
+
+        paintStatistics.recordPaint(seconds=0.002, mode='damaged', at=100.5)
+
+        summary = paintStatistics.summary(at=100.5)
+        self.assertEqual(0, summary['shapesDrawn'], 'Counts start over with each paint')
+        self.assertEqual(0, summary['linksDrawn'], 'Counts start over with each paint')
+
+    def testPaintTimes(self):
+
+        paintStatistics: PaintStatistics = PaintStatistics()
+
+        for i in range(1, 21):
+            paintStatistics.recordPaint(seconds=i / 1000.0, mode='full', at=100.0 + i * 0.1)
+
+        summary: Dict[str, Any] = paintStatistics.summary(at=102.0)
+        self.assertEqual(20, summary['paints'], 'All within the window')
+        self.assertEqual(4.0, summary['paintsPerSecond'], '20 paints in 5 seconds')
+        self.assertEqual(10.5, summary['meanPaintMs'], 'Mean of 1 to 20')
+        self.assertEqual(20.0, summary['p95PaintMs'], '95th percentile')
+        self.assertEqual(20.0, summary['maxPaintMs'], 'Slowest')
+
+    def testWindowExpires(self):
+
+        paintStatistics: PaintStatistics = PaintStatistics()
+
+        paintStatistics.recordPaint(seconds=0.050, mode='full', at=100.0)
+        paintStatistics.recordPaint(seconds=0.001, mode='damaged', at=104.0)
+
+        summary: Dict[str, Any] = paintStatistics.summary(at=106.0)
+        self.assertEqual(1, summary['paints'], 'The first paint is too old')
+        self.assertEqual(1.0, summary['maxPaintMs'], 'The slow paint no longer counts')
+
+        summary = paintStatistics.summary(at=110.0)
+        self.assertEqual(0, summary['paints'], 'Every paint is too old')
+
+    def testEventsPerSecond(self):
+
+        paintStatistics: PaintStatistics = PaintStatistics(windowSeconds=2.0)
+
+        for i in range(30):
+            paintStatistics.recordEvent(at=100.0 + i * 0.1)
+
+        summary: Dict[str, Any] = paintStatistics.summary(at=103.0)
+        self.assertEqual(10.0, summary['eventsPerSecond'], '20 events in the last 2 seconds')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPaintStatistics))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
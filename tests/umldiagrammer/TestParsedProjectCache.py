@@ -0,0 +1,177 @@
+
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from os import utime
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from xml.etree.ElementTree import Element as XmlElement
+from xml.etree.ElementTree import fromstring
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.ParsedProjectCache import CACHE_SUFFIX
+from umldiagrammer.projectio.ParsedProjectCache import ProjectDocuments
+from umldiagrammer.projectio.ParsedProjectCache import ParsedProjectCache
+from umldiagrammer.projectio.ParsedProjectCache import ProjectFingerprint
+
+RAW_XML: str = (
+    '<UmlProject fileName="Ozzee.xml" version="14.0" codePath="/tmp">'
+    '<UMLDiagram documentType="Class Document" title="Class Diagram">'
+    '<UmlClass id="1"><Code>def gato():</Code></UmlClass>'
+    '</UMLDiagram>'
+    '</UmlProject>'
+)
+LARGE_CACHE: int = 1024 * 1024
+
+
+class TestParsedProjectCache(UnitTestBase):
+    """
+    The cache and the projects live in a temporary directory
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directory:          Path               = Path(self._temporaryDirectory.name)
+        self._cacheDirectory:     Path               = self._directory / 'cache'
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testMissThenHit(self):
+
+        projectFile:        Path               = self._writeProject(name='Ozzee.xml')
+        parsedProjectCache: ParsedProjectCache = ParsedProjectCache(cacheDirectory=self._cacheDirectory, maxBytes=LARGE_CACHE)
+        projectFingerprint: ProjectFingerprint = ProjectFingerprint.fromProjectFile(fileName=projectFile)
+
+        self.assertIsNone(parsedProjectCache.get(projectFingerprint=projectFingerprint), 'Nothing cached yet')
+
+        self._put(parsedProjectCache=parsedProjectCache, projectFingerprint=projectFingerprint)
+
+        projectDocuments: Optional[ProjectDocuments] = parsedProjectCache.get(projectFingerprint=projectFingerprint)
+
+        assert projectDocuments is not None
+        projectAttributes, documentElements = projectDocuments
+
+        self.assertEqual('/tmp', projectAttributes['codePath'], 'Attributes not preserved')
+        self.assertEqual(1, len(documentElements), 'Should have the diagram')
+        self.assertEqual('def gato():', documentElements[0].find('UmlClass/Code').text, 'Character data not preserved')    # type: ignore
+
+    def testModifiedProjectIsStale(self):
+
+        projectFile:        Path               = self._writeProject(name='Ozzee.xml')
+        parsedProjectCache: ParsedProjectCache = ParsedProjectCache(cacheDirectory=self._cacheDirectory, maxBytes=LARGE_CACHE)
+
+        self._put(parsedProjectCache=parsedProjectCache, projectFingerprint=ProjectFingerprint.fromProjectFile(fileName=projectFile))
+        #
+        # Same size;  Only the content hash tells them apart
+        #
+        statResult = projectFile.stat()
+        projectFile.write_text(RAW_XML.replace('gato', 'pato'))
+        utime(projectFile, ns=(statResult.st_atime_ns, statResult.st_mtime_ns + 1_000_000_000))
+
+        projectFingerprint: ProjectFingerprint = ProjectFingerprint.fromProjectFile(fileName=projectFile)
+
+        self.assertIsNone(parsedProjectCache.get(projectFingerprint=projectFingerprint), 'Should be stale')
+        self.assertEqual(0, len(list(self._cacheDirectory.glob(f'*{CACHE_SUFFIX}'))), 'Stale entry should be discarded')
+
+    def testTouchedProjectIsCurrent(self):
+
+        projectFile:        Path               = self._writeProject(name='Ozzee.xml')
+        parsedProjectCache: ParsedProjectCache = ParsedProjectCache(cacheDirectory=self._cacheDirectory, maxBytes=LARGE_CACHE)
+
+        self._put(parsedProjectCache=parsedProjectCache, projectFingerprint=ProjectFingerprint.fromProjectFile(fileName=projectFile))
+
+        statResult = projectFile.stat()
+        utime(projectFile, ns=(statResult.st_atime_ns, statResult.st_mtime_ns + 1_000_000_000))
+
+        projectFingerprint: ProjectFingerprint = ProjectFingerprint.fromProjectFile(fileName=projectFile)
+
+        self.assertIsNotNone(parsedProjectCache.get(projectFingerprint=projectFingerprint), 'Same content;  Should still be used')
+
+    def testStatMatchDoesNotHash(self):
+
+        projectFile:        Path               = self._writeProject(name='Ozzee.xml')
+        parsedProjectCache: ParsedProjectCache = ParsedProjectCache(cacheDirectory=self._cacheDirectory, maxBytes=LARGE_CACHE)
+        projectFingerprint: ProjectFingerprint = ProjectFingerprint.fromProjectFile(fileName=projectFile)
+
+        self._put(parsedProjectCache=parsedProjectCache, projectFingerprint=projectFingerprint)
+        projectFile.unlink()
+
+        self.assertIsNotNone(parsedProjectCache.get(projectFingerprint=projectFingerprint), 'Path, size and time match;  The file is never read')
+
+    def testLeastRecentlyUsedEvicted(self):
+
+        firstFile:  Path = self._writeProject(name='First.xml')
+        secondFile: Path = self._writeProject(name='Second.xml')
+
+        measuringCache: ParsedProjectCache = ParsedProjectCache(cacheDirectory=self._directory / 'measure', maxBytes=LARGE_CACHE)
+        self._put(parsedProjectCache=measuringCache, projectFingerprint=ProjectFingerprint.fromProjectFile(fileName=firstFile))
+        entrySize: int = next((self._directory / 'measure').glob(f'*{CACHE_SUFFIX}')).stat().st_size
+        #
+        # Room for a single entry
+        #
+        parsedProjectCache: ParsedProjectCache = ParsedProjectCache(cacheDirectory=self._cacheDirectory, maxBytes=entrySize + entrySize // 2)
+
+        firstFingerprint:  ProjectFingerprint = ProjectFingerprint.fromProjectFile(fileName=firstFile)
+        secondFingerprint: ProjectFingerprint = ProjectFingerprint.fromProjectFile(fileName=secondFile)
+
+        self._put(parsedProjectCache=parsedProjectCache, projectFingerprint=firstFingerprint)
+        for entryFile in self._cacheDirectory.glob(f'*{CACHE_SUFFIX}'):
+            utime(entryFile, ns=(0, 0))
+        self._put(parsedProjectCache=parsedProjectCache, projectFingerprint=secondFingerprint)
+
+        self.assertIsNone(parsedProjectCache.get(projectFingerprint=firstFingerprint), 'Oldest should be evicted')
+        self.assertIsNotNone(parsedProjectCache.get(projectFingerprint=secondFingerprint), 'Newest should be kept')
+
+    def testCorruptEntryIsAMiss(self):
+
+        projectFile:        Path               = self._writeProject(name='Ozzee.xml')
+        parsedProjectCache: ParsedProjectCache = ParsedProjectCache(cacheDirectory=self._cacheDirectory, maxBytes=LARGE_CACHE)
+        projectFingerprint: ProjectFingerprint = ProjectFingerprint.fromProjectFile(fileName=projectFile)
+
+        self._put(parsedProjectCache=parsedProjectCache, projectFingerprint=projectFingerprint)
+
+        entryFile: Path = next(self._cacheDirectory.glob(f'*{CACHE_SUFFIX}'))
+        entryFile.write_bytes(entryFile.read_bytes()[:-10])
+
+        self.assertIsNone(parsedProjectCache.get(projectFingerprint=projectFingerprint), 'Truncated entry should be a miss')
+        self.assertFalse(entryFile.exists(), 'Truncated entry should be discarded')
+
+    def _put(self, parsedProjectCache: ParsedProjectCache, projectFingerprint: ProjectFingerprint):
+
+        projectElement:    XmlElement       = fromstring(RAW_XML)
+        projectAttributes: Dict[str, str]   = dict(projectElement.attrib)
+        documentElements:  List[XmlElement] = list(projectElement)
+
+        parsedProjectCache.put(projectFingerprint=projectFingerprint, projectAttributes=projectAttributes, documentElements=documentElements)
+
+    def _writeProject(self, name: str) -> Path:
+
+        projectFile: Path = self._directory / name
+        projectFile.write_text(RAW_XML)
+
+        return projectFile
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestParsedProjectCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,117 @@
+
+from pathlib import Path
+
+from pickle import dumps
+from pickle import loads
+
+from tempfile import TemporaryDirectory
+
+from zlib import compress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlio.exceptions.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from umldiagrammer.projectio.ProjectParser import ReadProject
+from umldiagrammer.projectio.ProjectParser import ParsedProject
+from umldiagrammer.projectio.ProjectParser import readProjectFile
+from umldiagrammer.projectio.ProjectParser import parseProjectFile
+
+RAW_XML: str = (
+    '<UmlProject fileName="Ozzee.udt" version="14.0" codePath="/tmp">'
+    '<UMLDiagram documentType="CLASS_DOCUMENT" title="Class Diagram"/>'
+    '<UMLDiagram documentType="USE_CASE_DOCUMENT" title="Use Cases"/>'
+    '</UmlProject>'
+)
+
+
+class TestProjectParser(UnitTestBase):
+    """
+    The parse is what runs in the worker processes
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directory:          Path               = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testParseXmlFile(self):
+
+        xmlFile: Path = self._directory / 'Ozzee.xml'
+        xmlFile.write_text(RAW_XML)
+
+        parsedProject: ParsedProject = parseProjectFile(fileName=xmlFile)
+
+        self.assertEqual('14.0', parsedProject.root.UmlProject['version'], 'Incorrect version')
+
+    def testParseCompressedFile(self):
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(compress(RAW_XML.encode()))
+
+        parsedProject: ParsedProject = parseProjectFile(fileName=projectFile)
+
+        self.assertEqual(2, len(parsedProject.root.UmlProject.get_elements('UMLDiagram')), 'Should have both diagrams')
+
+    def testUnsupportedFileType(self):
+
+        textFile: Path = self._directory / 'Ozzee.txt'
+        textFile.write_text(RAW_XML)
+
+        self.assertRaises(UnsupportedFileTypeException, lambda: parseProjectFile(fileName=textFile))
+
+    def testPickleRoundTrip(self):
+
+        xmlFile: Path = self._directory / 'Ozzee.xml'
+        xmlFile.write_text(RAW_XML)
+
+        parsedProject:   ParsedProject = parseProjectFile(fileName=xmlFile)
+        unpickled:       ParsedProject = loads(dumps(parsedProject))
+
+        umlDiagrams = unpickled.root.UmlProject.get_elements('UMLDiagram')
+
+        self.assertEqual(xmlFile, unpickled.fileName, 'File name not preserved')
+        self.assertEqual('/tmp', unpickled.root.UmlProject['codePath'], 'Attributes not preserved')
+        self.assertEqual('Use Cases', umlDiagrams[1]['title'], 'Children not preserved')
+
+    def testReadRoundTrip(self):
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(compress(RAW_XML.encode()))
+
+        readProject: ReadProject = loads(dumps(readProjectFile(fileName=projectFile)))
+
+        projectAttributes, documentElements = readProject.projectDocuments()
+
+        self.assertEqual('/tmp', projectAttributes['codePath'], 'Project attributes not preserved')
+        self.assertEqual(2, len(documentElements), 'Should have both diagrams')
+        self.assertEqual('Use Cases', documentElements[1].get('title'), 'Document attributes not preserved')
+        self.assertIsNotNone(readProject.savedContent, 'Compressed files remember what was saved')
+
+    def testReadUnsupportedFileType(self):
+
+        textFile: Path = self._directory / 'Ozzee.txt'
+        textFile.write_text(RAW_XML)
+
+        self.assertRaises(UnsupportedFileTypeException, lambda: readProjectFile(fileName=textFile))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectParser))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,107 @@
+
+from typing import List
+from typing import Set
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.ResidentFrames import NO_LIMIT
+from umldiagrammer.ResidentFrames import FRAME_BYTES
+from umldiagrammer.ResidentFrames import ResidentFrames
+from umldiagrammer.ResidentFrames import estimateFrameBytes
+
+
+class TestResidentFrames(UnitTestBase):
+    """
+    The resident frames are shared by all the diagram managers;  Each test removes its frames
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._residentFrames:   ResidentFrames = ResidentFrames()
+        self._frameIds:         List[str]      = []
+        self._modifiedFrameIds: Set[str]       = set()
+        self._evictedFrameIds:  List[str]      = []
+
+    def tearDown(self):
+        super().tearDown()
+        for frameId in self._frameIds:
+            self._residentFrames.remove(frameId=frameId)
+
+    def testLeastRecentlyViewedEvicted(self):
+
+        self._view('Ozzee', frameLimit=2)
+        self._view('Fran',  frameLimit=2)
+        self._view('Ozzee', frameLimit=2)
+        self._view('Opie',  frameLimit=2)
+
+        self.assertEqual(['Fran'], self._evictedFrameIds, 'Fran was viewed least recently')
+        self.assertEqual(2, self._residentFrames.frameCount, 'Should be within budget')
+
+    def testModifiedFrameStaysResident(self):
+
+        self._modifiedFrameIds.add('Ozzee')
+
+        self._view('Ozzee', frameLimit=1)
+        self._view('Fran',  frameLimit=1)
+
+        self.assertEqual([], self._evictedFrameIds, 'A modified frame is never evicted')
+        self.assertEqual(2, self._residentFrames.frameCount, 'Over budget until Ozzee is saved')
+
+        self._modifiedFrameIds.clear()
+        self._view('Fran',  frameLimit=1)
+
+        self.assertEqual(['Ozzee'], self._evictedFrameIds, 'Saved frames can go')
+
+    def testByteBudget(self):
+
+        byteLimit: int = estimateFrameBytes(shapeCount=100) + FRAME_BYTES
+
+        self._view('Ozzee', shapeCount=100, byteLimit=byteLimit)
+        self._view('Fran',  shapeCount=0,   byteLimit=byteLimit)
+        self.assertEqual([], self._evictedFrameIds, 'Exactly at the budget')
+
+        self._view('Opie', shapeCount=1, byteLimit=byteLimit)
+        self.assertEqual(['Ozzee'], self._evictedFrameIds, 'Should evict until within budget')
+
+    def testNoLimit(self):
+
+        for frameId in ('Ozzee', 'Fran', 'Opie'):
+            self._view(frameId)
+
+        self.assertEqual([], self._evictedFrameIds, 'Nothing evicted without a budget')
+
+    def _view(self, frameId: str, shapeCount: int = 0, frameLimit: int = NO_LIMIT, byteLimit: int = NO_LIMIT):
+
+        if frameId not in self._frameIds:
+            self._frameIds.append(frameId)
+
+        self._residentFrames.viewed(frameId=frameId,
+                                    estimatedBytes=estimateFrameBytes(shapeCount=shapeCount),
+                                    evictor=self._evictor,
+                                    frameLimit=frameLimit,
+                                    byteLimit=byteLimit)
+
+    def _evictor(self, frameId: str) -> bool:
+
+        if frameId in self._modifiedFrameIds:
+            return False
+
+        self._evictedFrameIds.append(frameId)
+        return True
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestResidentFrames))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,120 @@
+
+from typing import Dict
+from typing import List
+
+from hashlib import sha256
+
+from os import utime
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from zlib import compress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import SubElement
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.SavedContent import SavedContent
+from umldiagrammer.projectio.SavedContent import projectContentHash
+
+from umldiagrammer.projectio.ChunkedProjectContainer import ChunkedProjectWriter
+from umldiagrammer.projectio.ChunkedProjectContainer import documentChunks
+from umldiagrammer.projectio.ChunkedProjectContainer import chunkedContentHash
+
+PROJECT_ATTRIBUTES: Dict[str, str] = {'fileName': 'Ozzee.udtc', 'version': '14.0', 'codePath': ''}
+
+RAW_XML: bytes = b'<UmlProject fileName="Ozzee.udt"><UMLDiagram title="Class Diagram"/></UmlProject>'
+
+
+class TestSavedContent(UnitTestBase):
+    """
+    A save is skipped only when the file holds exactly what would be written
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directory:          Path               = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testSameContentIsCurrent(self):
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(compress(RAW_XML))
+
+        savedContent: SavedContent = SavedContent.fromProjectFile(fileName=projectFile)
+
+        self.assertTrue(savedContent.isCurrent(fileName=projectFile, contentHash=sha256(compress(RAW_XML)).hexdigest()), 'Should not need a write')
+        self.assertFalse(savedContent.isCurrent(fileName=projectFile, contentHash=sha256(RAW_XML).hexdigest()), 'Different content')
+
+    def testChangedOnDisk(self):
+        """
+        Someone else wrote the file since we read it
+        """
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(compress(RAW_XML))
+
+        savedContent: SavedContent = SavedContent.fromProjectFile(fileName=projectFile)
+
+        modifiedTime: int = projectFile.stat().st_mtime_ns + 1_000_000_000
+        utime(projectFile, ns=(modifiedTime, modifiedTime))
+
+        self.assertFalse(savedContent.isCurrent(fileName=projectFile, contentHash=savedContent.contentHash), 'File changed on disk')
+
+        projectFile.unlink()
+
+        self.assertFalse(savedContent.isCurrent(fileName=projectFile, contentHash=savedContent.contentHash), 'File is gone')
+
+    def testChunkedHashIgnoresLayout(self):
+        """
+        An update appends to the file;  The content hash must not change when the content did not
+        """
+        chunkedFile:      Path          = self._directory / 'Ozzee.udtc'
+        documentElements: List[Element] = []
+        for title in ('Class Diagram', 'Use Cases'):
+            diagramElement: Element = Element('UMLDiagram', attrib={'title': title})
+            SubElement(diagramElement, 'UmlClass', attrib={'id': title})
+            documentElements.append(diagramElement)
+
+        ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=documentElements)
+        originalHash: str = projectContentHash(fileName=chunkedFile)
+
+        documentElements[0].set('scrollPositionX', '10')
+        ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=documentElements)
+
+        self.assertNotEqual(originalHash, projectContentHash(fileName=chunkedFile), 'Document attributes are content')
+
+        documentElements[0].attrib.pop('scrollPositionX')
+        ChunkedProjectWriter(fileName=chunkedFile).write(projectAttributes=PROJECT_ATTRIBUTES, documentElements=documentElements)
+
+        self.assertEqual(originalHash, projectContentHash(fileName=chunkedFile), 'Undone back to the original content')
+
+        chunks:       List[bytes] = documentChunks(documentElements=documentElements)
+        computedHash: str         = chunkedContentHash(projectAttributes=PROJECT_ATTRIBUTES,
+                                                       documentAttributes=[dict(documentElement.attrib) for documentElement in documentElements],
+                                                       chunkHashes=[sha256(chunk).hexdigest() for chunk in chunks]
+                                                       )
+        self.assertEqual(originalHash, computedHash, 'The writer and the reader should agree')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSavedContent))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
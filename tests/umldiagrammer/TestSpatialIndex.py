@@ -0,0 +1,125 @@
+
+from typing import Dict
+from typing import List
+
+from random import Random
+
+from time import perf_counter
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.SpatialIndex import Bounds
+from umldiagrammer.SpatialIndex import SpatialIndex
+
+BENCHMARK_SHAPE_COUNT: int = 10000
+BENCHMARK_QUERY_COUNT: int = 1000
+
+
+class TestSpatialIndex(UnitTestBase):
+    """
+    The keys stand in for the shapes on a diagram
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._spatialIndex: SpatialIndex[str] = SpatialIndex[str](cellSize=100)
+
+        self._spatialIndex.insert(key='Ozzee', bounds=Bounds(left=10,  top=10,  right=90,  bottom=60))
+        self._spatialIndex.insert(key='Fran',  bounds=Bounds(left=50,  top=40,  right=250, bottom=120))
+        self._spatialIndex.insert(key='Opie',  bounds=Bounds(left=400, top=400, right=450, bottom=430))
+
+    def testPoint(self):
+
+        self.assertEqual(['Ozzee'], self._spatialIndex.queryPoint(x=20, y=20), 'Only Ozzee is there')
+        self.assertEqual({'Ozzee', 'Fran'}, set(self._spatialIndex.queryPoint(x=60, y=50)), 'They overlap there')
+        self.assertEqual(['Fran'], self._spatialIndex.queryPoint(x=240, y=110), 'Fran spans several cells')
+        self.assertEqual([], self._spatialIndex.queryPoint(x=300, y=300), 'Nobody is there')
+
+    def testRectangle(self):
+
+        found: List[str] = self._spatialIndex.queryRectangle(bounds=Bounds(left=200, top=100, right=410, bottom=410))
+
+        self.assertEqual({'Fran', 'Opie'}, set(found), 'Should find the shapes the rectangle touches')
+
+    def testExtent(self):
+
+        self.assertEqual(Bounds(left=10, top=10, right=450, bottom=430), self._spatialIndex.extent(), 'Bad extent')
+
+    def testUpdate(self):
+
+        moved: bool = self._spatialIndex.update(key='Opie', bounds=Bounds(left=500, top=0, right=520, bottom=20))
+
+        self.assertTrue(moved, 'Opie moved')
+        self.assertEqual([], self._spatialIndex.queryPoint(x=410, y=410), 'Opie is no longer there')
+        self.assertEqual(['Opie'], self._spatialIndex.queryPoint(x=510, y=10), 'Opie is here now')
+        self.assertEqual(Bounds(left=10, top=0, right=520, bottom=120), self._spatialIndex.extent(), 'The extent follows Opie')
+
+        self.assertFalse(self._spatialIndex.update(key='Opie', bounds=Bounds(left=500, top=0, right=520, bottom=20)), 'Opie did not move')
+
+    def testRemove(self):
+
+        self._spatialIndex.remove(key='Opie')
+
+        self.assertNotIn('Opie', self._spatialIndex, 'Opie was removed')
+        self.assertEqual(Bounds(left=10, top=10, right=250, bottom=120), self._spatialIndex.extent(), 'The extent shrinks')
+
+        self._spatialIndex.remove(key='Opie')
+        self._spatialIndex.remove(key='Ozzee')
+        self._spatialIndex.remove(key='Fran')
+
+        self.assertIsNone(self._spatialIndex.extent(), 'Nothing is indexed')
+
+    def testBenchmark(self):
+        """
+        A 10,000 shape diagram;  The index answers point queries by examining a few shapes instead of
+        scanning all of them.  The timings are only logged;  They depend on the machine
+        """
+        random:       Random            = Random(42)
+        entries:      Dict[int, Bounds] = {}
+        spatialIndex: SpatialIndex[int] = SpatialIndex[int]()
+
+        for key in range(BENCHMARK_SHAPE_COUNT):
+            left: int = random.randrange(0, 20000)
+            top:  int = random.randrange(0, 20000)
+            entries[key] = Bounds(left=left, top=top, right=left + random.randrange(50, 300), bottom=top + random.randrange(50, 200))
+
+        startTime: float = perf_counter()
+        for key, bounds in entries.items():
+            spatialIndex.insert(key=key, bounds=bounds)
+        insertSeconds: float = perf_counter() - startTime
+
+        points = [(random.randrange(0, 20000), random.randrange(0, 20000)) for _ in range(BENCHMARK_QUERY_COUNT)]
+
+        startTime = perf_counter()
+        scanned: List[List[int]] = [[key for key, bounds in entries.items() if bounds.contains(x, y)] for x, y in points]
+        scanSeconds: float = perf_counter() - startTime
+
+        startTime = perf_counter()
+        indexed: List[List[int]] = [spatialIndex.queryPoint(x=x, y=y) for x, y in points]
+        indexSeconds: float = perf_counter() - startTime
+
+        candidateCount: int = sum(spatialIndex.candidateCount(x=x, y=y) for x, y in points)
+        scannedCount:   int = BENCHMARK_SHAPE_COUNT * BENCHMARK_QUERY_COUNT
+
+        self.logger.info(f'{BENCHMARK_SHAPE_COUNT} shapes;  insert: {insertSeconds:.3f}s, {BENCHMARK_QUERY_COUNT} points scanned: {scanSeconds:.3f}s indexed: {indexSeconds:.4f}s')
+        self.logger.info(f'Shapes examined;  scanned: {scannedCount} indexed: {candidateCount}')
+
+        self.assertEqual([sorted(keys) for keys in scanned], [sorted(keys) for keys in indexed], 'The index should find the same shapes')
+        self.assertLess(candidateCount * 100, scannedCount, 'The index should examine at most 1% of the shapes a scan does')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSpatialIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
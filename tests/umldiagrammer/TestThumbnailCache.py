@@ -0,0 +1,82 @@
+
+from os import utime
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.thumbnails.ThumbnailCache import ThumbnailCache
+
+THUMBNAIL_BYTES: bytes = b'\x89PNG' + bytes(96)        # Stands in for an encoded thumbnail
+
+
+class TestThumbnailCache(UnitTestBase):
+    """
+    The cache lives in a temporary directory
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._cacheDirectory:     Path               = Path(self._temporaryDirectory.name) / 'thumbnails'
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testMissThenHit(self):
+
+        thumbnailCache: ThumbnailCache = ThumbnailCache(cacheDirectory=self._cacheDirectory, maxBytes=1024)
+
+        self.assertIsNone(thumbnailCache.get(contentHash='ozzee'), 'Nothing cached yet')
+
+        thumbnailCache.put(contentHash='ozzee', contents=THUMBNAIL_BYTES)
+
+        self.assertEqual(THUMBNAIL_BYTES, thumbnailCache.get(contentHash='ozzee'), 'Should be the same thumbnail')
+
+    def testLeastRecentlyUsedEvicted(self):
+
+        thumbnailCache: ThumbnailCache = ThumbnailCache(cacheDirectory=self._cacheDirectory, maxBytes=2 * len(THUMBNAIL_BYTES))
+
+        thumbnailCache.put(contentHash='ozzee', contents=THUMBNAIL_BYTES)
+        thumbnailCache.put(contentHash='fran',  contents=THUMBNAIL_BYTES)
+        #
+        # Make ozzee the older entry, then use it;  fran becomes the least recently used
+        #
+        utime(self._cacheDirectory / 'ozzee.png', ns=(0, 0))
+        utime(self._cacheDirectory / 'fran.png',  ns=(1_000_000_000, 1_000_000_000))
+        self.assertIsNotNone(thumbnailCache.get(contentHash='ozzee'), 'Should still be cached')
+
+        thumbnailCache.put(contentHash='opie', contents=THUMBNAIL_BYTES)
+
+        self.assertIsNone(thumbnailCache.get(contentHash='fran'),     'The least recently used is evicted')
+        self.assertIsNotNone(thumbnailCache.get(contentHash='ozzee'), 'Recently used is kept')
+        self.assertIsNotNone(thumbnailCache.get(contentHash='opie'),  'The newest is kept')
+
+    def testClear(self):
+
+        thumbnailCache: ThumbnailCache = ThumbnailCache(cacheDirectory=self._cacheDirectory, maxBytes=1024)
+
+        thumbnailCache.put(contentHash='ozzee', contents=THUMBNAIL_BYTES)
+        thumbnailCache.clear()
+
+        self.assertIsNone(thumbnailCache.get(contentHash='ozzee'), 'Should be gone')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestThumbnailCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
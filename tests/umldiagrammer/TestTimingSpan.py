@@ -0,0 +1,92 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from logging import DEBUG
+
+from json import loads as jsonLoads
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.performance.TimingSpan import TimingSpan
+from umldiagrammer.performance.TimingSpan import addSpanDuration
+from umldiagrammer.performance.TimingSpan import PERFORMANCE_LOGGER_NAME
+
+
+class TestTimingSpan(UnitTestBase):
+    """
+    The records have to stay machine-readable;  They are charted
+    """
+    def testNestedRecords(self):
+
+        with self.assertLogs(PERFORMANCE_LOGGER_NAME, level='INFO') as capturedLogs:
+            with TimingSpan('open', project='Ozzee.udt') as openSpan:
+                with TimingSpan('open.parse'):
+                    pass
+                openSpan.set(shapes=42, links=7)
+
+        records: List[Dict[str, Any]] = [jsonLoads(logRecord.getMessage()) for logRecord in capturedLogs.records]
+
+        self.assertEqual(['open.parse', 'open'], [record['phase'] for record in records], 'Inner spans finish first')
+        self.assertEqual('open', records[0]['parent'], 'Should name the enclosing phase')
+        self.assertIsNone(records[1]['parent'], 'Outermost span')
+        self.assertEqual(42, records[1]['shapes'], 'Missing shape count')
+        self.assertEqual('Ozzee.udt', records[1]['project'], 'Missing project')
+        self.assertFalse(records[1]['failed'], 'Did not fail')
+
+    def testAccumulatedDuration(self):
+
+        with self.assertLogs(PERFORMANCE_LOGGER_NAME, level='INFO') as capturedLogs:
+            with TimingSpan('layout.shapes'):
+                for _ in range(3):
+                    addSpanDuration(field='eventWiringMs', seconds=0.002)
+
+        record: Dict[str, Any] = jsonLoads(capturedLogs.records[0].getMessage())
+
+        self.assertAlmostEqual(6.0, record['eventWiringMs'], places=3, msg='Durations should add up in milliseconds')
+        self.assertIsNone(TimingSpan.current(), 'The span should be gone')
+
+    def testFailedSpan(self):
+
+        with self.assertLogs(PERFORMANCE_LOGGER_NAME, level='INFO') as capturedLogs:
+            with self.assertRaises(ValueError):
+                with TimingSpan('save.write'):
+                    raise ValueError('Disk full')
+
+        record: Dict[str, Any] = jsonLoads(capturedLogs.records[0].getMessage())
+
+        self.assertTrue(record['failed'], 'Should record the failure')
+
+    def testDebugSpan(self):
+
+        with self.assertLogs(PERFORMANCE_LOGGER_NAME, level='DEBUG') as capturedLogs:
+            with TimingSpan('frame.paint', logLevel=DEBUG, mode='damaged'):
+                pass
+            with TimingSpan('open'):
+                pass
+
+        self.assertEqual(['DEBUG', 'INFO'], [logRecord.levelname for logRecord in capturedLogs.records], 'Each span logs at its own level')
+        self.assertEqual('damaged', jsonLoads(capturedLogs.records[0].getMessage())['mode'], 'The level is not a field')
+
+    def testNoSpanRunning(self):
+        addSpanDuration(field='eventWiringMs', seconds=1.0)
+
+        self.assertIsNone(TimingSpan.current(), 'Nothing should be running')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTimingSpan))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,163 @@
+
+from typing import List
+from typing import Tuple
+
+from pathlib import Path
+
+from tempfile import TemporaryDirectory
+
+from zlib import compress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from xml.etree.ElementTree import Element as XmlElement
+from xml.etree.ElementTree import SubElement
+from xml.etree.ElementTree import indent as xmlIndent
+from xml.etree.ElementTree import tostring as xmlToString
+from xml.etree.ElementTree import fromstring as xmlFromString
+
+from untangle import Element
+from untangle import parse
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umldiagrammer.projectio.ImportMeter import NOT_TRACED
+from umldiagrammer.projectio.ImportMeter import ImportMeter
+from umldiagrammer.projectio.XmlDiagramStream import XmlDiagramStream
+
+RAW_XML: str = (
+    '<?xml version="1.0" encoding="iso-8859-1"?>\n'
+    '<UmlProject fileName="Ozzee.xml" version="14.0" codePath="/tmp">\n'
+    '    <UMLDiagram documentType="CLASS_DOCUMENT" title="Class Diagram">\n'
+    '        <UmlClass id="1" width="100" height="50">\n'
+    '            <ModelClass name="Ozzee">\n'
+    '                <SourceCode>\n'
+    '                    <Code>def gato():</Code>\n'
+    '                    <Code>    pass</Code>\n'
+    '                </SourceCode>\n'
+    '            </ModelClass>\n'
+    '        </UmlClass>\n'
+    '    </UMLDiagram>\n'
+    '    <UMLDiagram documentType="USE_CASE_DOCUMENT" title="Use Cases"/>\n'
+    '</UmlProject>\n'
+)
+
+ElementSummary = Tuple[str, dict, str, List]
+
+
+class TestXmlDiagramStream(UnitTestBase):
+    """
+    The streamed diagrams must be indistinguishable from the parsed ones
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+        self._directory:          Path               = Path(self._temporaryDirectory.name)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testSameAsParsed(self):
+
+        xmlFile: Path = self._directory / 'Ozzee.xml'
+        xmlFile.write_text(RAW_XML)
+        #
+        # A small chunk size so that elements straddle chunks
+        #
+        xmlDiagramStream: XmlDiagramStream = XmlDiagramStream(fileName=xmlFile, chunkSize=16)
+
+        streamed: List[ElementSummary] = [self._summarize(e) for e in xmlDiagramStream.diagramElements()]
+        parsed:   List[ElementSummary] = [self._summarize(e) for e in parse(RAW_XML).UmlProject.get_elements('UMLDiagram')]
+
+        self.assertEqual(parsed, streamed, 'Streamed diagrams differ from the parsed ones')
+        self.assertEqual(2, xmlDiagramStream.diagramCount, 'Incorrect diagram count')
+
+    def testCompressedProjectAttributes(self):
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(compress(RAW_XML.encode()))
+
+        xmlDiagramStream: XmlDiagramStream = XmlDiagramStream(fileName=projectFile, chunkSize=32)
+
+        titles: List[str] = [e['title'] for e in xmlDiagramStream.diagramElements()]
+
+        self.assertEqual(['Class Diagram', 'Use Cases'], titles, 'Incorrect titles')
+        self.assertEqual('/tmp', xmlDiagramStream.projectAttributes['codePath'], 'Incorrect code path')
+
+    def testUnopenedDiagramsRoundTrip(self):
+        """
+        Written the way the project serializer pretty prints
+        """
+        projectElement: XmlElement = XmlElement('UmlProject', attrib={'fileName': 'Ozzee.udt', 'version': '14.0', 'codePath': ''})
+        for title in ('Class Diagram', 'Use Cases'):
+            diagramElement: XmlElement = SubElement(projectElement, 'UMLDiagram', attrib={'documentType': 'Class Document', 'title': title})
+            classElement:   XmlElement = SubElement(diagramElement, 'UmlClass', attrib={'id': title, 'x': '1', 'y': '2'})
+            codeElement:    XmlElement = SubElement(classElement, 'Code')
+            codeElement.text = 'return "<gato> & perro"'
+
+        originalXml: bytes = self._toPrettyBytes(projectElement)
+
+        projectFile: Path = self._directory / 'Ozzee.udt'
+        projectFile.write_bytes(compress(originalXml))
+
+        xmlDiagramStream: XmlDiagramStream = XmlDiagramStream(fileName=projectFile, chunkSize=40)
+        documentSources:  List[XmlElement] = list(xmlDiagramStream.diagramXmlElements())
+
+        savedElement: XmlElement = XmlElement('UmlProject', attrib=xmlDiagramStream.projectAttributes)
+        savedElement.extend(documentSources)
+
+        self.assertEqual(originalXml, self._toPrettyBytes(savedElement), 'Unopened diagrams should be saved as read')
+
+    def testProgress(self):
+
+        xmlFile: Path = self._directory / 'Ozzee.xml'
+        xmlFile.write_text(RAW_XML)
+
+        percentages: List[int] = []
+
+        xmlDiagramStream: XmlDiagramStream = XmlDiagramStream(fileName=xmlFile, chunkSize=64)
+        for _ in xmlDiagramStream.diagramElements(progressCallback=lambda message, percent: percentages.append(percent)):
+            pass
+
+        self.assertEqual(100, percentages[-1], 'Should end at 100%')
+        self.assertEqual(sorted(percentages), percentages, 'Progress should not go backwards')
+
+    def testImportMeter(self):
+
+        with ImportMeter() as importMeter:
+            bigList: List[int] = list(range(100_000))
+
+        self.assertGreater(importMeter.statistics.peakMemoryBytes, len(bigList), 'Peak memory not traced')
+        self.assertGreaterEqual(importMeter.statistics.elapsedSeconds, 0.0, 'Elapsed time not measured')
+
+        with ImportMeter(traceMemory=False) as untracedMeter:
+            pass
+
+        self.assertEqual(NOT_TRACED, untracedMeter.statistics.peakMemoryBytes, 'Should not trace')
+
+    def _toPrettyBytes(self, projectElement: XmlElement) -> bytes:
+
+        elementCopy: XmlElement = xmlFromString(xmlToString(projectElement))
+        xmlIndent(elementCopy, space='    ', level=0)
+
+        return xmlToString(elementCopy, encoding='iso-8859-1', xml_declaration=True)
+
+    def _summarize(self, element: Element) -> ElementSummary:
+        return element._name, element._attributes, element.cdata, [self._summarize(child) for child in element.children]
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestXmlDiagramStream))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()